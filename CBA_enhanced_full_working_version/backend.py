@@ -51,6 +51,9 @@ from multi_source_data_service import multi_source_aggregator, LiveDataPoint, Ma
 # Import market holiday system
 from market_holidays import MarketHolidayCalendar, get_all_market_holidays_summary
 
+# Non-blocking, coalesced and cached yfinance access for the async endpoints
+from market_data_gateway import market_data
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -68,6 +71,11 @@ app = FastAPI(
 LIVE_DATA_ENABLED = os.getenv('LIVE_DATA_ENABLED', 'true').lower() == 'true'
 REQUIRE_LIVE_DATA = os.getenv('REQUIRE_LIVE_DATA', 'true').lower() == 'true'
 
+# Multi-symbol fan-out (batch predictions, 48h previous-day data)
+MAX_BATCH_SYMBOLS = int(os.getenv('MAX_BATCH_SYMBOLS', 50))
+FAN_OUT_CONCURRENCY = int(os.getenv('FAN_OUT_CONCURRENCY', 8))
+FAN_OUT_SYMBOL_TIMEOUT = float(os.getenv('FAN_OUT_SYMBOL_TIMEOUT', 20))
+
 # Document Upload Configuration
 DOCUMENT_STORAGE_PATH = os.path.join(os.path.dirname(__file__), "document_storage")
 DOCUMENT_DB_PATH = os.path.join(os.path.dirname(__file__), "documents.db")
@@ -2126,11 +2134,9 @@ async def get_cba_prediction():
     """🏦 CBA Real-time Prediction using Phase 4 GNN Models"""
     try:
         # Use real CBA prediction system
-        import yfinance as yf
         from datetime import datetime, timezone
         
-        cba_ticker = yf.Ticker("CBA.AX")
-        data = cba_ticker.history(period="2d", interval="1d")
+        data = await market_data.history("CBA.AX", period="2d", interval="1d")
         
         if len(data) >= 2:
             current_price = float(data['Close'].iloc[-1])
@@ -2170,9 +2176,7 @@ async def get_enhanced_prediction(request: Request):
             raise ValueError("Symbol is required")
         
         # Get real market data for the symbol
-        import yfinance as yf
-        ticker = yf.Ticker(symbol)
-        data = ticker.history(period="5d", interval="1d")
+        data = await market_data.history(symbol, period="5d", interval="1d")
         
         if len(data) >= 2:
             current_price = float(data['Close'].iloc[-1])
@@ -2226,18 +2230,16 @@ async def click_test():
 async def get_mobile_market_status():
     """🔄 Mobile-optimized market data with CORRECT calculation - bypasses all caching"""
     try:
-        import yfinance as yf
         from datetime import datetime, timezone
         import pytz
         
-        # Get AORD data with correct calculation
-        aord_ticker = yf.Ticker("^AORD")
-        
-        # Get 5 days of daily data for proper percentage calculation (handles weekends)
-        daily_data = aord_ticker.history(period="5d", interval="1d")
-        
-        # Get current intraday data
-        intraday_data = aord_ticker.history(period="1d", interval="1h")
+        # Get AORD data with correct calculation (uncached - concurrent requests still share one fetch)
+        # 5 days of daily data for proper percentage calculation (handles weekends),
+        # plus current intraday data
+        daily_data, intraday_data = await asyncio.gather(
+            market_data.history("^AORD", period="5d", interval="1d", ttl=0),
+            market_data.history("^AORD", period="1d", interval="1h", ttl=0)
+        )
         
         if len(daily_data) >= 2:
             prev_close = float(daily_data['Close'].iloc[-2])  # Previous day close
@@ -2291,14 +2293,14 @@ async def get_mobile_market_status():
 async def debug_market_data():
     """🔍 Simple debug page showing current market data - for troubleshooting mobile issues"""
     try:
-        import yfinance as yf
         from datetime import datetime, timezone
         import pytz
         
         # Get AORD data
-        aord_ticker = yf.Ticker("^AORD")
-        daily_data = aord_ticker.history(period="2d", interval="1d")
-        intraday_data = aord_ticker.history(period="1d", interval="1h")
+        daily_data, intraday_data = await asyncio.gather(
+            market_data.history("^AORD", period="2d", interval="1d", ttl=0),
+            market_data.history("^AORD", period="1d", interval="1h", ttl=0)
+        )
         
         html_content = """
         <!DOCTYPE html>
@@ -2671,11 +2673,8 @@ async def get_stock_data(
     try:
         logger.info(f"📈 Fetching stock data for {symbol} (period={period}, interval={interval})")
         
-        # Use yfinance to get real market data
-        import yfinance as yf
-        
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period, interval=interval)
+        # Use yfinance to get real market data (off the event loop)
+        hist = await market_data.history(symbol, period=period, interval=interval)
         
         if hist.empty:
             raise HTTPException(status_code=404, detail=f"No data found for symbol {symbol}")
@@ -2771,6 +2770,34 @@ async def search_symbols(query: str, limit: int = Query(default=20, ge=1, le=50)
         "total_found": len(results)
     }
 
+async def fan_out_symbols(symbols: List[str], fetch, concurrency: int = FAN_OUT_CONCURRENCY,
+                          timeout: float = FAN_OUT_SYMBOL_TIMEOUT) -> Dict[str, Any]:
+    """
+    Run fetch(symbol) for every symbol concurrently with bounded parallelism
+    
+    Args:
+        symbols: Symbols to process (duplicates are fetched once)
+        fetch: Coroutine function taking a symbol
+        concurrency: Maximum fetches in flight
+        timeout: Per-symbol timeout in seconds
+        
+    Returns:
+        Dictionary mapping symbol -> result, or the exception it failed with
+        (asyncio.TimeoutError on timeout), in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def run(symbol: str):
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(fetch(symbol), timeout=timeout)
+            except Exception as e:
+                return e
+    
+    unique_symbols = list(dict.fromkeys(symbols))
+    results = await asyncio.gather(*(run(symbol) for symbol in unique_symbols))
+    return dict(zip(unique_symbols, results))
+
 async def get_previous_day_data(symbol: str, chart_type: ChartType, interval_minutes: int = 60) -> List[MarketDataPoint]:
     """Get REAL previous trading day's data for Asian/Australian markets - NO SYNTHETIC DATA ALLOWED"""
     try:
@@ -3115,23 +3142,29 @@ async def analyze_symbols(request: AnalysisRequest):
         # For 48h mode, add previous day data for Asian/Australian markets
         if request.time_period == "48h":
             asian_australian_markets = ['Japan', 'Hong Kong', 'China', 'South Korea', 'Australia']
-            for symbol in request.symbols:
-                if symbol in SYMBOLS_DB and SYMBOLS_DB[symbol].market in asian_australian_markets:
-                    prev_day_data = await get_previous_day_data(symbol, chart_type_enum, interval_minutes)
-                    if prev_day_data:
-                        # Add previous day data with a prefix to distinguish it
-                        prev_day_symbol = f"{symbol}_prev_day"
-                        symbol_data[prev_day_symbol] = prev_day_data
-                        # Add metadata for the previous day series
-                        prev_day_metadata = SymbolInfo(
-                            symbol=prev_day_symbol,
-                            name=f"{SYMBOLS_DB[symbol].name} (Previous Day)", 
-                            market=SYMBOLS_DB[symbol].market,
-                            category=SYMBOLS_DB[symbol].category,
-                            currency=getattr(SYMBOLS_DB[symbol], 'currency', 'USD')
-                        )
-                        symbol_metadata[prev_day_symbol] = prev_day_metadata
-                        logger.info(f"📈 Added previous day data for {symbol} ({SYMBOLS_DB[symbol].market} market)")
+            prev_day_symbols = [symbol for symbol in request.symbols
+                                if symbol in SYMBOLS_DB and SYMBOLS_DB[symbol].market in asian_australian_markets]
+            prev_day_results = await fan_out_symbols(
+                prev_day_symbols,
+                lambda symbol: get_previous_day_data(symbol, chart_type_enum, interval_minutes)
+            )
+            for symbol, prev_day_data in prev_day_results.items():
+                if isinstance(prev_day_data, Exception):
+                    logger.warning(f"⚠️ Previous day data unavailable for {symbol}: {type(prev_day_data).__name__} {prev_day_data}")
+                elif prev_day_data:
+                    # Add previous day data with a prefix to distinguish it
+                    prev_day_symbol = f"{symbol}_prev_day"
+                    symbol_data[prev_day_symbol] = prev_day_data
+                    # Add metadata for the previous day series
+                    prev_day_metadata = SymbolInfo(
+                        symbol=prev_day_symbol,
+                        name=f"{SYMBOLS_DB[symbol].name} (Previous Day)", 
+                        market=SYMBOLS_DB[symbol].market,
+                        category=SYMBOLS_DB[symbol].category,
+                        currency=getattr(SYMBOLS_DB[symbol], 'currency', 'USD')
+                    )
+                    symbol_metadata[prev_day_symbol] = prev_day_metadata
+                    logger.info(f"📈 Added previous day data for {symbol} ({SYMBOLS_DB[symbol].market} market)")
         
         # Add data source information
         data_source = "live" if LIVE_DATA_ENABLED else "demo"
@@ -3232,6 +3265,7 @@ async def get_data_status():
             "cache_duration_minutes": int(os.getenv('DATA_CACHE_MINUTES', 3)),
             "rate_limit_per_minute": int(os.getenv('MAX_API_CALLS_PER_MINUTE', 10))
         },
+        "market_data_gateway": market_data.get_stats(),
         "setup_instructions": {
             "alpha_vantage": "Get free API key at https://www.alphavantage.co/support/#api-key",
             "twelve_data": "Get free API key at https://twelvedata.com/",
@@ -3534,7 +3568,7 @@ async def analyze_historical_symbols(request: AnalysisRequest, target_date: str
             successful_symbols = 0
             
             for symbol in request.symbols:
-                historical_data = get_real_historical_data(symbol, parsed_date, interval_minutes)
+                historical_data = await market_data.run(get_real_historical_data, symbol, parsed_date, interval_minutes)
                 if historical_data:
                     all_symbol_data[symbol] = historical_data
                     successful_symbols += 1
@@ -3974,35 +4008,47 @@ async def get_batch_predictions(
     timeframe: str = Query("5d", description="Prediction timeframe: 1d, 5d, 30d, 90d"),
     include_factors: bool = Query(True, description="Include market factors analysis")
 ):
-    """Get batch predictions for multiple symbols"""
+    """Get batch predictions for multiple symbols (fetched concurrently; failed symbols reported per symbol)"""
     
     try:
-        if len(symbols) > 10:
-            raise HTTPException(status_code=400, detail="Maximum 10 symbols allowed per batch request")
+        if len(symbols) > MAX_BATCH_SYMBOLS:
+            raise HTTPException(status_code=400, detail=f"Maximum {MAX_BATCH_SYMBOLS} symbols allowed per batch request")
         
-        predictions = {}
+        async def predict(symbol: str):
+            request = PredictionRequest(
+                symbol=symbol,
+                timeframe=timeframe,
+                include_factors=include_factors
+            )
+            return await prediction_service.get_market_prediction(request)
         
-        for symbol in symbols:
-            try:
-                request = PredictionRequest(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    include_factors=include_factors
-                )
-                
-                prediction_response = await prediction_service.get_market_prediction(request)
-                predictions[symbol] = prediction_response.dict()
-                
-            except Exception as e:
-                logger.error(f"Error predicting {symbol}: {e}")
+        results = await fan_out_symbols(symbols, predict)
+        
+        predictions = {}
+        failed_symbols = []
+        for symbol, result in results.items():
+            if isinstance(result, asyncio.TimeoutError):
+                logger.error(f"Prediction for {symbol} timed out after {FAN_OUT_SYMBOL_TIMEOUT:.0f}s")
+                predictions[symbol] = {
+                    "success": False,
+                    "error": f"Prediction timed out after {FAN_OUT_SYMBOL_TIMEOUT:.0f}s"
+                }
+                failed_symbols.append(symbol)
+            elif isinstance(result, Exception):
+                logger.error(f"Error predicting {symbol}: {result}")
                 predictions[symbol] = {
                     "success": False,
-                    "error": f"Prediction failed: {str(e)}"
+                    "error": f"Prediction failed: {str(result)}"
                 }
+                failed_symbols.append(symbol)
+            else:
+                predictions[symbol] = result.dict()
         
         return {
             "success": True,
             "predictions": predictions,
+            "successful_symbols": len(predictions) - len(failed_symbols),
+            "failed_symbols": failed_symbols,
             "timeframe": timeframe,
             "generated_at": datetime.now(timezone.utc).isoformat()
         }
@@ -4047,11 +4093,9 @@ async def get_fast_market_prediction(
             # Fallback to simple statistical prediction if service fails or returns null
             logger.warning(f"Fast prediction service failed for {symbol}, using statistical fallback")
             
-            ticker = yf.Ticker(symbol)
-            
             # Try to get most recent intraday data first, fallback to daily
             try:
-                recent_data = ticker.history(period="1d", interval="1m")
+                recent_data = await market_data.history(symbol, period="1d", interval="1m")
                 if not recent_data.empty:
                     current_price = float(recent_data['Close'].iloc[-1])
                     # Use last 30 minutes for trend analysis
@@ -4061,7 +4105,7 @@ async def get_fast_market_prediction(
                     raise ValueError("No intraday data")
             except:
                 # Fallback to daily data
-                hist_data = ticker.history(period="30d")
+                hist_data = await market_data.history(symbol, period="30d")
                 if hist_data.empty:
                     raise HTTPException(status_code=404, detail=f"No data available for {symbol}")
                 current_price = float(hist_data['Close'].iloc[-1])
@@ -4228,8 +4272,7 @@ async def get_advanced_prediction(
             logger.info(f"📊 Using statistical fallback prediction for {symbol} ({timeframe})")
             
             # Get current stock data using yfinance
-            ticker = yf.Ticker(symbol)
-            hist_data = ticker.history(period="30d")
+            hist_data = await market_data.history(symbol, period="30d")
             
             if hist_data.empty:
                 raise HTTPException(status_code=404, detail=f"No historical data available for {symbol}")
@@ -4290,9 +4333,9 @@ async def get_advanced_prediction(
         horizon = horizon_map.get(timeframe, PredictionHorizon.SHORT_TERM)
         
         # Gather real-time data
-        market_data = await multi_source_aggregator.get_live_data(symbol)
+        live_data = await multi_source_aggregator.get_live_data(symbol)
         
-        if not market_data or not market_data.data_points:
+        if not live_data or not live_data.data_points:
             raise HTTPException(status_code=404, detail=f"No live market data available for {symbol}")
         
         # Get geopolitical threats if requested
@@ -4365,7 +4408,7 @@ async def get_advanced_prediction(
         }
         
         market_data_dict = None
-        if market_data and market_data.data_points:
+        if live_data and live_data.data_points:
             market_data_dict = {
                 "data_points": [
                     {
@@ -4376,7 +4419,7 @@ async def get_advanced_prediction(
                         "close": dp.close,
                         "volume": dp.volume
                     }
-                    for dp in market_data.data_points
+                    for dp in live_data.data_points
                 ]
             }
         
@@ -4412,8 +4455,8 @@ async def get_advanced_prediction(
                 "geopolitical_analysis": geopolitical_details if include_conflicts else None,
                 "social_media_analysis": social_details if include_social else None,
                 "market_data_quality": {
-                    "data_points": len(market_data.data_points) if market_data and market_data.data_points else 0,
-                    "latest_timestamp": market_data.data_points[-1].timestamp if market_data and market_data.data_points else None,
+                    "data_points": len(live_data.data_points) if live_data and live_data.data_points else 0,
+                    "latest_timestamp": live_data.data_points[-1].timestamp if live_data and live_data.data_points else None,
                     "source": "Multi-source aggregator"
                 }
             },
@@ -5147,11 +5190,8 @@ async def get_intraday_prediction(
             # Use statistical fallback for intraday predictions
             logger.info(f"📊 Using statistical fallback for {symbol} intraday {timeframe} prediction")
             
-            # Get recent intraday data
-            ticker = yf.Ticker(symbol)
-            
             # Get 5-day data with 1-minute intervals for intraday analysis
-            hist_data = ticker.history(period="5d", interval="1m")
+            hist_data = await market_data.history(symbol, period="5d", interval="1m")
             
             if hist_data.empty:
                 raise HTTPException(status_code=404, detail=f"No intraday data available for {symbol}")
@@ -5233,8 +5273,7 @@ async def get_intraday_prediction(
             logger.warning(f"⚠️ Intraday predictor returned invalid data for {symbol}, using statistical fallback")
             
             # Use yfinance statistical fallback
-            ticker = yf.Ticker(symbol)
-            hist_data = ticker.history(period="5d", interval="1m")
+            hist_data = await market_data.history(symbol, period="5d", interval="1m")
             
             if not hist_data.empty:
                 current_price = float(hist_data['Close'].iloc[-1])
@@ -5347,8 +5386,7 @@ async def get_historical_prediction_data(
         start_date = end_date - timedelta(days=days_back)
         
         # Get historical price data
-        ticker = yf.Ticker(symbol)
-        hist_data = ticker.history(start=start_date, end=end_date)
+        hist_data = await market_data.history(symbol, start=start_date.date())
         
         if hist_data.empty:
             raise HTTPException(status_code=404, detail=f"No historical data found for {symbol}")
@@ -5409,7 +5447,7 @@ async def get_historical_prediction_data(
                 })
         
         # Get current real-time data
-        current_data = ticker.history(period="1d", interval="1m")
+        current_data = await market_data.history(symbol, period="1d", interval="1m")
         current_price = float(current_data['Close'].iloc[-1]) if not current_data.empty else hist_data['Close'].iloc[-1]
         
         # Generate a fast current prediction for chart data (skip slow enhanced prediction)
@@ -5510,11 +5548,10 @@ async def get_future_prediction_timeline(
         horizon_days = {"1d": 1, "5d": 5, "15d": 15, "30d": 30}.get(timeframe, 5)
         
         # Get current price
-        ticker = yf.Ticker(symbol)
-        current_data = ticker.history(period="1d", interval="1m")
+        current_data = await market_data.history(symbol, period="1d", interval="1m")
         if current_data.empty:
             # Fallback to daily data
-            current_data = ticker.history(period="5d")
+            current_data = await market_data.history(symbol, period="5d")
         current_price = float(current_data['Close'].iloc[-1])
         
         # Generate future prediction timeline
@@ -5646,12 +5683,9 @@ async def get_realtime_prediction(
         
         start_time = datetime.now()
         
-        # Get the most recent price data
-        ticker = yf.Ticker(symbol)
-        
-        # Try intraday data first for real-time accuracy
+        # Get the most recent price data - intraday first for real-time accuracy
         try:
-            recent_data = ticker.history(period="1d", interval="5m")  # 5-minute intervals for balance of speed and accuracy
+            recent_data = await market_data.history(symbol, period="1d", interval="5m")  # 5-minute intervals for balance of speed and accuracy
             if not recent_data.empty:
                 current_price = float(recent_data['Close'].iloc[-1])
                 price_data = recent_data['Close'].tail(20)  # Last 20 periods (1h 40min of data)
@@ -5660,7 +5694,7 @@ async def get_realtime_prediction(
                 raise ValueError("No intraday data")
         except:
             # Fallback to daily data
-            daily_data = ticker.history(period="10d")
+            daily_data = await market_data.history(symbol, period="10d")
             if daily_data.empty:
                 raise HTTPException(status_code=404, detail=f"No data available for {symbol}")
             current_price = float(daily_data['Close'].iloc[-1])
@@ -5891,6 +5925,10 @@ async def startup_event():
     
     if cba_predictor:
         logger.info("   • CBA Enhanced Prediction System: ✅ LOADED")
+        # Models are trained in the background; predictions only run inference
+        cba_predictor.start_retraining_scheduler(
+            interval_seconds=float(os.getenv('CBA_RETRAIN_CHECK_SECONDS', 1800))
+        )
     else:
         logger.info("   • CBA Enhanced Prediction System: ❌ NOT AVAILABLE")
     
@@ -5911,11 +5949,10 @@ async def startup_event():
 async def get_enhanced_market_info(symbol: str):
     """Get enhanced market information including market cap and percentage movements"""
     try:
-        import yfinance as yf
-        
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        hist = ticker.history(period="5d")
+        info, hist = await asyncio.gather(
+            market_data.info(symbol),
+            market_data.history(symbol, period="5d")
+        )
         
         if hist.empty:
             raise HTTPException(status_code=404, detail=f"No data available for {symbol}")
@@ -8346,12 +8383,9 @@ async def get_phase4_gnn_prediction(
         # Get current price using real market data
         current_price = None
         try:
-            import yfinance as yf
-            ticker = yf.Ticker(symbol)
-            
             # Try to get recent 1-minute data first
             try:
-                recent_data = ticker.history(period="1d", interval="1m")
+                recent_data = await market_data.history(symbol, period="1d", interval="1m")
                 if not recent_data.empty:
                     current_price = float(recent_data['Close'].iloc[-1])
                     logger.info(f"📊 Got real-time current price for {symbol}: ${current_price:.2f}")
@@ -8359,7 +8393,7 @@ async def get_phase4_gnn_prediction(
                     raise ValueError("No intraday data")
             except:
                 # Fallback to daily data
-                hist_data = ticker.history(period="5d")
+                hist_data = await market_data.history(symbol, period="5d")
                 if not hist_data.empty:
                     current_price = float(hist_data['Close'].iloc[-1])
                     logger.info(f"📊 Using daily data current price for {symbol}: ${current_price:.2f}")
@@ -9172,8 +9206,6 @@ async def get_candlestick_data_for_technical_analysis(
 ):
     """Get candlestick data for technical analysis module using yfinance"""
     try:
-        import yfinance as yf
-        
         # Check if symbol is in our predefined database first
         if symbol in SYMBOLS_DB:
             symbol_info = SYMBOLS_DB[symbol]
@@ -9187,9 +9219,8 @@ async def get_candlestick_data_for_technical_analysis(
             )
         logger.info(f"📊 Fetching candlestick data for {symbol} ({period}, {interval})")
         
-        # Fetch data using yfinance
-        ticker = yf.Ticker(symbol)
-        hist_data = ticker.history(period=period, interval=interval)
+        # Fetch data using yfinance (off the event loop)
+        hist_data = await market_data.history(symbol, period=period, interval=interval)
         
         if hist_data.empty:
             raise HTTPException(status_code=404, detail=f"No historical data available for {symbol}")
@@ -9664,8 +9695,7 @@ async def upload_document(
         if stock_symbol:
             try:
                 # Get basic stock info
-                ticker = yf.Ticker(stock_symbol)
-                info = ticker.info
+                info = await market_data.info(stock_symbol)
                 stock_context = StockContext(
                     symbol=stock_symbol,
                     company_name=info.get('longName', stock_symbol),
@@ -10,6 +10,8 @@ Features:
 - Financial reports parsing and key metrics extraction
 - Regulatory announcements impact assessment
 - Banking sector correlation analysis
+- Versioned model store with background retraining (inference-only predictions)
+- Concurrent multi-source news collection with a persistent article cache
 """
 
 import asyncio
@@ -18,15 +20,17 @@ import json
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Tuple, Any, Union, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
 import yfinance as yf
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler, RobustScaler
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 import re
+from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 import warnings
 warnings.filterwarnings('ignore')
@@ -40,10 +44,28 @@ from central_bank_rate_integration import (
     InterestRateAnnouncement
 )
 
+from cba_model_store import CBAModelStore, ModelVersion
+from market_data_gateway import market_data
+from news_feature_builder import articles_to_frame, build_decay_features
+from news_collection import HostRateLimiter, NewsArticleCache, collect_news_page, resolve_publication_date
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Raw/target columns excluded from the model's feature set
+NON_FEATURE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume', 'cba_close']
+
+# News collection: shared request headers and per-host request spacing (seconds)
+NEWS_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+NEWS_HOST_INTERVALS = {
+    'www.reuters.com': 1.0,
+    'www.bloomberg.com': 2.0,  # Conservative rate limiting for Bloomberg
+    'www.afr.com': 1.5
+}
+
 class PublicationType(Enum):
     """Types of CBA publications to analyze"""
     ANNUAL_REPORT = "annual_report"
@@ -110,12 +132,24 @@ class CBAAnalysisResult:
 class CBAEnhancedPredictionSystem:
     """Enhanced prediction system specifically for CBA with publications and news analysis"""
     
-    def __init__(self):
+    def __init__(self, model_store: Optional[CBAModelStore] = None,
+                 news_cache: Optional[NewsArticleCache] = None):
         self.symbol = "CBA.AX"
         self.models = {}
         self.scalers = {}
         self.feature_columns = []
         
+        # Predictions are served from published clones, so backtests refitting
+        # self.models in place never touch a live model
+        self.model_store = model_store if model_store is not None else CBAModelStore()
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._retraining_task: Optional[asyncio.Task] = None
+        
+        # Persistent URL-keyed article cache and per-host limits for news collection
+        self.news_cache = news_cache if news_cache is not None else NewsArticleCache()
+        self._news_rate_limiter = HostRateLimiter(default_interval=1.0, intervals=NEWS_HOST_INTERVALS)
+        
         # CBA-specific data sources
         self.cba_investor_base_url = "https://www.commbank.com.au/about-us/investors"
         self.asx_announcements_url = "https://www.asx.com.au/asxpdf"
@@ -502,7 +536,12 @@ class CBAEnhancedPredictionSystem:
         return documents
     
     def _extract_date_from_text(self, text: str) -> datetime:
-        """Enhanced date extraction from text"""
+        """Enhanced date extraction from text (falls back to 30 days ago)"""
+        pub_date = self._parse_date_from_text(text)
+        return pub_date if pub_date is not None else datetime.now() - timedelta(days=30)
+    
+    def _parse_date_from_text(self, text: str) -> Optional[datetime]:
+        """Date found in text, or None"""
         try:
             import re
             from dateutil import parser
@@ -542,12 +581,11 @@ class CBAEnhancedPredictionSystem:
                     except:
                         continue
             
-            # Fallback to current date minus some days based on content freshness
-            return datetime.now() - timedelta(days=30)
+            return None
             
         except Exception as e:
             logger.warning(f"Date extraction error: {e}")
-            return datetime.now() - timedelta(days=30)
+            return None
     
     def _extract_surrounding_context(self, element, soup: BeautifulSoup, max_chars: int = 1500) -> str:
         """Extract meaningful context around an element"""
@@ -847,13 +885,12 @@ class CBAEnhancedPredictionSystem:
     async def retrieve_cba_news_articles(self, 
                                        start_date: datetime, 
                                        end_date: datetime) -> List[CBANewsArticle]:
-        """REAL NEWS INTEGRATION: Retrieve actual CBA-related news from multiple sources"""
+        """REAL NEWS INTEGRATION: Retrieve actual CBA-related news from multiple sources concurrently"""
         try:
             logger.info(f"📰 REAL NEWS: Retrieving CBA news from multiple sources {start_date.date()} to {end_date.date()}")
             
-            news_articles = []
-            
-            # Try multiple real news sources in priority order
+            # All sources run concurrently over one session; the per-host rate
+            # limiter keeps requests to each site spaced out
             news_sources = [
                 self._fetch_reuters_news,
                 self._fetch_bloomberg_news,
@@ -863,15 +900,27 @@ class CBAEnhancedPredictionSystem:
                 self._fetch_asx_news_direct
             ]
             
-            # Fetch from each source
-            for source_func in news_sources:
-                try:
-                    source_articles = await source_func(start_date, end_date)
-                    news_articles.extend(source_articles)
-                    logger.info(f"✅ {source_func.__name__}: {len(source_articles)} articles")
-                except Exception as e:
-                    logger.warning(f"⚠️ {source_func.__name__} failed: {e}")
+            connector = aiohttp.TCPConnector(limit=20, limit_per_host=2)
+            async with aiohttp.ClientSession(headers=NEWS_HEADERS, timeout=aiohttp.ClientTimeout(total=15),
+                                             connector=connector) as session:
+                results = await asyncio.gather(*(source_func(session) for source_func in news_sources),
+                                               return_exceptions=True)
+            
+            candidates = []
+            for source_func, source_candidates in zip(news_sources, results):
+                if isinstance(source_candidates, Exception):
+                    logger.warning(f"⚠️ {source_func.__name__} failed: {source_candidates}")
                     continue
+                candidates.extend(source_candidates)
+                logger.info(f"✅ {source_func.__name__}: {len(source_candidates)} articles")
+            
+            # Cached pages may hold items outside the requested range
+            # (undated items are resolved now, not when their page was parsed)
+            candidates = [candidate for candidate in candidates
+                          if start_date <= resolve_publication_date(candidate) <= end_date]
+            
+            # One batched scoring pass at the end (known articles reuse their cached scores)
+            news_articles = await self._score_news_candidates(candidates)
             
             # Remove duplicates based on headline similarity
             unique_articles = self._deduplicate_news_articles(news_articles)
@@ -891,374 +940,221 @@ class CBAEnhancedPredictionSystem:
             logger.warning("⚠️ Falling back to limited simulated news due to real source failures")
             return await self._limited_fallback_news(start_date, end_date)
     
-    async def _fetch_reuters_news(self, start_date: datetime, end_date: datetime) -> List[CBANewsArticle]:
+    def _news_candidate(self, headline: str, pub_date: Optional[datetime], source: NewsSource,
+                        content: str, url: str, page_url: str) -> Dict[str, Any]:
+        """
+        Unscored news item (JSON-ready); keyed by article URL, or page URL + headline without a link
+        
+        Undated items keep publication_date None (see resolve_publication_date)
+        """
+        return {
+            'key': url if url != page_url else f"{page_url}#{headline}",
+            'headline': headline,
+            'publication_date': pub_date.isoformat() if pub_date is not None else None,
+            'source': source.value,
+            'content': content,
+            'url': url
+        }
+    
+    def _news_link(self, element, page_url: str) -> str:
+        """Absolute article link of a headline element, or the page URL"""
+        link = element if element.name == 'a' else element.find('a')
+        href = link.get('href') if link is not None else None
+        return urljoin(page_url, href) if href else page_url
+    
+    async def _collect_news_page(self, session: aiohttp.ClientSession, url: str,
+                                 parse: Callable[[BeautifulSoup, str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Fetch a listing page (conditional GET against the news cache) and parse its news items"""
+        return await collect_news_page(
+            session, url, lambda content, page_url: parse(BeautifulSoup(content, 'html.parser'), page_url),
+            self.news_cache, self._news_rate_limiter
+        )
+    
+    async def _collect_news_pages(self, session: aiohttp.ClientSession, urls: List[str],
+                                  parse: Callable[[BeautifulSoup, str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        pages = await asyncio.gather(*(self._collect_news_page(session, url, parse) for url in urls))
+        return [item for items in pages for item in items]
+    
+    def _parse_headline_elements(self, elements, source: NewsSource, page_url: str,
+                                 headline_tags: List[str]) -> List[Dict[str, Any]]:
+        """News items from story elements holding a headline tag"""
+        items = []
+        for element in elements:
+            headline_elem = element.find(headline_tags)
+            if not headline_elem:
+                continue
+            
+            headline = headline_elem.get_text(strip=True)
+            if not self._is_cba_relevant(headline):
+                continue
+            
+            # Extract date and content
+            pub_date = self._parse_date_from_text(element.get_text())
+            items.append(self._news_candidate(headline, pub_date, source, element.get_text(strip=True),
+                                              self._news_link(headline_elem, page_url), page_url))
+        return items
+    
+    async def _fetch_reuters_news(self, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
         """Fetch CBA news from Reuters"""
-        try:
-            import aiohttp
-            from bs4 import BeautifulSoup
-            
-            articles = []
-            
-            # Reuters search URLs for CBA
-            reuters_urls = [
-                "https://www.reuters.com/companies/CBA.AX",
-                "https://www.reuters.com/markets/companies/CBA.AX",
-                "https://www.reuters.com/business/finance/search?q=Commonwealth+Bank+Australia"
-            ]
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            async with aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as session:
-                for url in reuters_urls:
-                    try:
-                        async with session.get(url) as response:
-                            if response.status == 200:
-                                content = await response.text()
-                                soup = BeautifulSoup(content, 'html.parser')
-                                
-                                # Parse Reuters article structure
-                                article_elements = soup.find_all(['article', 'div'], class_=re.compile(r'story|article|news', re.I))
-                                
-                                for element in article_elements[:5]:
-                                    headline_elem = element.find(['h1', 'h2', 'h3', 'a'])
-                                    if not headline_elem:
-                                        continue
-                                        
-                                    headline = headline_elem.get_text(strip=True)
-                                    if not self._is_cba_relevant(headline):
-                                        continue
-                                    
-                                    # Extract date and content
-                                    pub_date = self._extract_date_from_text(element.get_text())
-                                    if not (start_date <= pub_date <= end_date):
-                                        continue
-                                    
-                                    content_text = element.get_text(strip=True)
-                                    sentiment = await self._analyze_news_sentiment(content_text)
-                                    
-                                    articles.append(CBANewsArticle(
-                                        headline=headline,
-                                        publication_date=pub_date,
-                                        source=NewsSource.REUTERS,
-                                        content_summary=content_text[:400] + "...",
-                                        sentiment_score=sentiment,
-                                        regulatory_impact=self._assess_regulatory_impact(content_text),
-                                        market_relevance=self._assess_market_relevance(content_text),
-                                        url=url
-                                    ))
-                        
-                        await asyncio.sleep(1)  # Rate limiting
-                        
-                    except Exception as e:
-                        logger.warning(f"Reuters URL {url} failed: {e}")
-                        continue
-            
-            return articles
-            
-        except Exception as e:
-            logger.error(f"Reuters news fetch error: {e}")
-            return []
+        def parse(soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+            # Parse Reuters article structure
+            article_elements = soup.find_all(['article', 'div'], class_=re.compile(r'story|article|news', re.I))
+            return self._parse_headline_elements(article_elements[:5], NewsSource.REUTERS, page_url,
+                                                 ['h1', 'h2', 'h3', 'a'])
+        
+        # Reuters search URLs for CBA
+        return await self._collect_news_pages(session, [
+            "https://www.reuters.com/companies/CBA.AX",
+            "https://www.reuters.com/markets/companies/CBA.AX",
+            "https://www.reuters.com/business/finance/search?q=Commonwealth+Bank+Australia"
+        ], parse)
     
-    async def _fetch_bloomberg_news(self, start_date: datetime, end_date: datetime) -> List[CBANewsArticle]:
+    async def _fetch_bloomberg_news(self, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
         """Fetch CBA news from Bloomberg"""
-        try:
-            import aiohttp
-            from bs4 import BeautifulSoup
-            
-            articles = []
-            
-            # Bloomberg search for CBA
-            bloomberg_urls = [
-                "https://www.bloomberg.com/quote/CBA:AU",
-                "https://www.bloomberg.com/search?query=Commonwealth%20Bank%20Australia"
-            ]
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            async with aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as session:
-                for url in bloomberg_urls:
-                    try:
-                        async with session.get(url) as response:
-                            if response.status == 200:
-                                content = await response.text()
-                                soup = BeautifulSoup(content, 'html.parser')
-                                
-                                # Parse Bloomberg article structure
-                                news_elements = soup.find_all(['div', 'article'], class_=re.compile(r'story|headline|news', re.I))
-                                
-                                for element in news_elements[:3]:
-                                    headline_elem = element.find(['a', 'h1', 'h2', 'h3'])
-                                    if not headline_elem:
-                                        continue
-                                    
-                                    headline = headline_elem.get_text(strip=True)
-                                    if not self._is_cba_relevant(headline):
-                                        continue
-                                    
-                                    pub_date = self._extract_date_from_text(element.get_text())
-                                    if not (start_date <= pub_date <= end_date):
-                                        continue
-                                    
-                                    content_text = element.get_text(strip=True)
-                                    sentiment = await self._analyze_news_sentiment(content_text)
-                                    
-                                    articles.append(CBANewsArticle(
-                                        headline=headline,
-                                        publication_date=pub_date,
-                                        source=NewsSource.BLOOMBERG,
-                                        content_summary=content_text[:400] + "...",
-                                        sentiment_score=sentiment,
-                                        regulatory_impact=self._assess_regulatory_impact(content_text),
-                                        market_relevance=self._assess_market_relevance(content_text),
-                                        url=url
-                                    ))
-                        
-                        await asyncio.sleep(2)  # Conservative rate limiting for Bloomberg
-                        
-                    except Exception as e:
-                        logger.warning(f"Bloomberg URL {url} failed: {e}")
-                        continue
-            
-            return articles
-            
-        except Exception as e:
-            logger.error(f"Bloomberg news fetch error: {e}")
-            return []
+        def parse(soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+            # Parse Bloomberg article structure
+            news_elements = soup.find_all(['div', 'article'], class_=re.compile(r'story|headline|news', re.I))
+            return self._parse_headline_elements(news_elements[:3], NewsSource.BLOOMBERG, page_url,
+                                                 ['a', 'h1', 'h2', 'h3'])
+        
+        # Bloomberg search for CBA
+        return await self._collect_news_pages(session, [
+            "https://www.bloomberg.com/quote/CBA:AU",
+            "https://www.bloomberg.com/search?query=Commonwealth%20Bank%20Australia"
+        ], parse)
     
-    async def _fetch_afr_news(self, start_date: datetime, end_date: datetime) -> List[CBANewsArticle]:
+    async def _fetch_afr_news(self, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
         """Fetch CBA news from Australian Financial Review"""
-        try:
-            import aiohttp
-            from bs4 import BeautifulSoup
-            
-            articles = []
-            
-            # AFR URLs for CBA coverage
-            afr_urls = [
-                "https://www.afr.com/companies/financial-services",
-                "https://www.afr.com/search?query=Commonwealth%20Bank"
-            ]
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            async with aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as session:
-                for url in afr_urls:
-                    try:
-                        async with session.get(url) as response:
-                            if response.status == 200:
-                                content = await response.text()
-                                soup = BeautifulSoup(content, 'html.parser')
-                                
-                                # Parse AFR article structure
-                                article_links = soup.find_all('a', href=re.compile(r'/companies/|/markets/'))
-                                
-                                for link in article_links[:4]:
-                                    headline = link.get_text(strip=True)
-                                    if not self._is_cba_relevant(headline):
-                                        continue
-                                    
-                                    # Get article date from surrounding context
-                                    pub_date = self._extract_date_from_text(str(link.parent))
-                                    if not (start_date <= pub_date <= end_date):
-                                        continue
-                                    
-                                    content_text = link.parent.get_text(strip=True) if link.parent else headline
-                                    sentiment = await self._analyze_news_sentiment(content_text)
-                                    
-                                    articles.append(CBANewsArticle(
-                                        headline=headline,
-                                        publication_date=pub_date,
-                                        source=NewsSource.AFR,
-                                        content_summary=content_text[:400] + "...",
-                                        sentiment_score=sentiment,
-                                        regulatory_impact=self._assess_regulatory_impact(content_text),
-                                        market_relevance=self._assess_market_relevance(content_text),
-                                        url=url
-                                    ))
-                        
-                        await asyncio.sleep(1.5)
-                        
-                    except Exception as e:
-                        logger.warning(f"AFR URL {url} failed: {e}")
-                        continue
-            
-            return articles
-            
-        except Exception as e:
-            logger.error(f"AFR news fetch error: {e}")
-            return []
+        def parse(soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+            # Parse AFR article structure
+            items = []
+            for link in soup.find_all('a', href=re.compile(r'/companies/|/markets/'))[:4]:
+                headline = link.get_text(strip=True)
+                if not self._is_cba_relevant(headline):
+                    continue
+                
+                # Get article date from surrounding context
+                pub_date = self._parse_date_from_text(str(link.parent))
+                content_text = link.parent.get_text(strip=True) if link.parent else headline
+                items.append(self._news_candidate(headline, pub_date, NewsSource.AFR, content_text,
+                                                  self._news_link(link, page_url), page_url))
+            return items
+        
+        # AFR URLs for CBA coverage
+        return await self._collect_news_pages(session, [
+            "https://www.afr.com/companies/financial-services",
+            "https://www.afr.com/search?query=Commonwealth%20Bank"
+        ], parse)
     
-    async def _fetch_yahoo_finance_news(self, start_date: datetime, end_date: datetime) -> List[CBANewsArticle]:
+    async def _fetch_yahoo_finance_news(self, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
         """Fetch CBA news from Yahoo Finance - often has good financial news"""
-        try:
-            import aiohttp
-            
-            articles = []
-            
-            # Use yfinance to get news data
-            ticker = yf.Ticker("CBA.AX")
-            try:
-                news_data = ticker.news
-                
-                for item in news_data[:8]:
-                    # Parse Yahoo Finance news item
-                    headline = item.get('title', '')
-                    if not self._is_cba_relevant(headline):
-                        continue
-                    
-                    # Convert timestamp to datetime
-                    timestamp = item.get('providerPublishTime', 0)
-                    pub_date = datetime.fromtimestamp(timestamp) if timestamp else datetime.now()
-                    
-                    if not (start_date <= pub_date <= end_date):
-                        continue
-                    
-                    content_text = item.get('summary', headline)
-                    sentiment = await self._analyze_news_sentiment(content_text)
-                    
-                    articles.append(CBANewsArticle(
-                        headline=headline,
-                        publication_date=pub_date,
-                        source=NewsSource.REUTERS,  # Yahoo often aggregates Reuters
-                        content_summary=content_text[:400] + "...",
-                        sentiment_score=sentiment,
-                        regulatory_impact=self._assess_regulatory_impact(content_text),
-                        market_relevance=self._assess_market_relevance(content_text),
-                        url=item.get('link', 'https://finance.yahoo.com')
-                    ))
-                    
-            except Exception as e:
-                logger.warning(f"Yahoo Finance news error: {e}")
-            
-            return articles
-            
-        except Exception as e:
-            logger.error(f"Yahoo Finance news fetch error: {e}")
-            return []
+        yahoo_url = 'https://finance.yahoo.com'
+        
+        # yfinance is blocking - run it on the market data gateway's executor
+        news_data = await market_data.run(lambda: yf.Ticker("CBA.AX").news)
+        
+        items = []
+        for item in (news_data or [])[:8]:
+            # Parse Yahoo Finance news item
+            headline = item.get('title', '')
+            if not self._is_cba_relevant(headline):
+                continue
+            
+            # Convert timestamp to datetime
+            timestamp = item.get('providerPublishTime', 0)
+            pub_date = datetime.fromtimestamp(timestamp) if timestamp else datetime.now()
+            
+            items.append(self._news_candidate(
+                headline, pub_date,
+                NewsSource.REUTERS,  # Yahoo often aggregates Reuters
+                item.get('summary', headline), item.get('link', yahoo_url), yahoo_url
+            ))
+        return items
     
-    async def _fetch_marketwatch_news(self, start_date: datetime, end_date: datetime) -> List[CBANewsArticle]:
+    async def _fetch_marketwatch_news(self, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
         """Fetch from MarketWatch"""
-        try:
-            import aiohttp
-            from bs4 import BeautifulSoup
-            
-            articles = []
-            
-            marketwatch_url = "https://www.marketwatch.com/search?q=Commonwealth%20Bank%20Australia&m=Keyword&rpp=25&mp=2007&bd=true&rs=true"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            try:
-                async with aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as session:
-                    async with session.get(marketwatch_url) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            soup = BeautifulSoup(content, 'html.parser')
-                            
-                            # Parse MarketWatch search results
-                            result_elements = soup.find_all(['div', 'article'], class_=re.compile(r'result|article', re.I))
-                            
-                            for element in result_elements[:3]:
-                                headline_elem = element.find(['a', 'h1', 'h2', 'h3'])
-                                if not headline_elem:
-                                    continue
-                                
-                                headline = headline_elem.get_text(strip=True)
-                                if not self._is_cba_relevant(headline):
-                                    continue
-                                
-                                pub_date = self._extract_date_from_text(element.get_text())
-                                if not (start_date <= pub_date <= end_date):
-                                    continue
-                                
-                                content_text = element.get_text(strip=True)
-                                sentiment = await self._analyze_news_sentiment(content_text)
-                                
-                                articles.append(CBANewsArticle(
-                                    headline=headline,
-                                    publication_date=pub_date,
-                                    source=NewsSource.REUTERS,  # MarketWatch often sources from Reuters
-                                    content_summary=content_text[:400] + "...",
-                                    sentiment_score=sentiment,
-                                    regulatory_impact=self._assess_regulatory_impact(content_text),
-                                    market_relevance=self._assess_market_relevance(content_text),
-                                    url=marketwatch_url
-                                ))
-                            
-            except Exception as e:
-                logger.warning(f"MarketWatch fetch error: {e}")
-            
-            return articles
-            
-        except Exception as e:
-            logger.error(f"MarketWatch news fetch error: {e}")
-            return []
+        def parse(soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+            # Parse MarketWatch search results (MarketWatch often sources from Reuters)
+            result_elements = soup.find_all(['div', 'article'], class_=re.compile(r'result|article', re.I))
+            return self._parse_headline_elements(result_elements[:3], NewsSource.REUTERS, page_url,
+                                                 ['a', 'h1', 'h2', 'h3'])
+        
+        return await self._collect_news_pages(session, [
+            "https://www.marketwatch.com/search?q=Commonwealth%20Bank%20Australia&m=Keyword&rpp=25&mp=2007&bd=true&rs=true"
+        ], parse)
     
-    async def _fetch_asx_news_direct(self, start_date: datetime, end_date: datetime) -> List[CBANewsArticle]:
+    async def _fetch_asx_news_direct(self, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
         """Fetch directly from ASX announcements for CBA"""
-        try:
-            import aiohttp
-            from bs4 import BeautifulSoup
-            
-            articles = []
-            asx_url = "https://www.asx.com.au/markets/company/CBA/announcements"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            try:
-                async with aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as session:
-                    async with session.get(asx_url) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            soup = BeautifulSoup(content, 'html.parser')
-                            
-                            # Parse ASX announcement table
-                            announcement_rows = soup.find_all(['tr', 'div'], class_=re.compile(r'announcement|row', re.I))
-                            
-                            for row in announcement_rows[:10]:
-                                # Extract announcement details
-                                text_content = row.get_text(strip=True)
-                                if len(text_content) < 20:
-                                    continue
-                                
-                                # Use first part as headline
-                                headline = text_content.split('\n')[0] if '\n' in text_content else text_content[:100]
-                                
-                                pub_date = self._extract_date_from_text(text_content)
-                                if not (start_date <= pub_date <= end_date):
-                                    continue
-                                
-                                sentiment = await self._analyze_news_sentiment(text_content)
-                                
-                                articles.append(CBANewsArticle(
-                                    headline=headline,
-                                    publication_date=pub_date,
-                                    source=NewsSource.ASX_ANNOUNCEMENTS,
-                                    content_summary=text_content[:400] + "...",
-                                    sentiment_score=sentiment,
-                                    regulatory_impact=self._assess_regulatory_impact(text_content),
-                                    market_relevance=self._assess_market_relevance(text_content),
-                                    url=asx_url
-                                ))
-                            
-            except Exception as e:
-                logger.warning(f"ASX direct fetch error: {e}")
-            
-            return articles
-            
-        except Exception as e:
-            logger.error(f"ASX news fetch error: {e}")
-            return []
+        def parse(soup: BeautifulSoup, page_url: str) -> List[Dict[str, Any]]:
+            # Parse ASX announcement table
+            items = []
+            for row in soup.find_all(['tr', 'div'], class_=re.compile(r'announcement|row', re.I))[:10]:
+                # Extract announcement details
+                text_content = row.get_text(strip=True)
+                if len(text_content) < 20:
+                    continue
+                
+                # Use first part as headline
+                headline = text_content.split('\n')[0] if '\n' in text_content else text_content[:100]
+                pub_date = self._parse_date_from_text(text_content)
+                items.append(self._news_candidate(headline, pub_date, NewsSource.ASX_ANNOUNCEMENTS,
+                                                  text_content, page_url, page_url))
+            return items
+        
+        return await self._collect_news_pages(session, [
+            "https://www.asx.com.au/markets/company/CBA/announcements"
+        ], parse)
+    
+    def _score_news_batch(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Score news items (sentiment, regulatory impact, market relevance) into cacheable records"""
+        records = []
+        for candidate in candidates:
+            content = candidate['content']
+            record = {key: value for key, value in candidate.items() if key != 'content'}
+            record.update({
+                'content_summary': content[:400] + "...",
+                'sentiment_score': self._score_news_sentiment(content),
+                'regulatory_impact': self._assess_regulatory_impact(content),
+                'market_relevance': self._assess_market_relevance(content)
+            })
+            records.append(record)
+        return records
+    
+    async def _score_news_candidates(self, candidates: List[Dict[str, Any]]) -> List[CBANewsArticle]:
+        """Score all new items in one pass; articles already in the cache keep their scores"""
+        unique_candidates = {candidate['key']: candidate for candidate in candidates}
+        
+        records = []
+        new_candidates = []
+        for key, candidate in unique_candidates.items():
+            cached = self.news_cache.get_article(key)
+            if cached is not None:
+                records.append(cached)
+            else:
+                new_candidates.append(candidate)
+        
+        loop = asyncio.get_running_loop()
+        if new_candidates:
+            scored = await loop.run_in_executor(None, self._score_news_batch, new_candidates)
+            for record in scored:
+                self.news_cache.put_article(record['key'], record)
+            records.extend(scored)
+        await loop.run_in_executor(None, self.news_cache.save)
+        
+        logger.info(f"📰 Scored {len(new_candidates)} new articles ({len(records) - len(new_candidates)} from cache)")
+        return [
+            CBANewsArticle(
+                headline=record['headline'],
+                publication_date=resolve_publication_date(record),
+                source=NewsSource(record['source']),
+                content_summary=record['content_summary'],
+                sentiment_score=record['sentiment_score'],
+                regulatory_impact=record['regulatory_impact'],
+                market_relevance=record['market_relevance'],
+                url=record['url']
+            )
+            for record in records
+        ]
     
     def _is_cba_relevant(self, text: str) -> bool:
         """Check if news text is relevant to CBA"""
@@ -1408,6 +1304,10 @@ class CBAEnhancedPredictionSystem:
     
     async def _analyze_news_sentiment(self, content: str) -> float:
         """Analyze sentiment of news article content"""
+        return self._score_news_sentiment(content)
+    
+    def _score_news_sentiment(self, content: str) -> float:
+        """Keyword sentiment score (-1 to 1) of news article content"""
         # Similar to publication sentiment but weighted for news context
         positive_keywords = [
             'beat', 'exceeded', 'strong', 'growth', 'improved', 'successful',
@@ -1468,17 +1368,7 @@ class CBAEnhancedPredictionSystem:
             
             # Collect basic market data for CBA and peers with ASX SPI integration
             symbols = [self.symbol] + self.banking_peers + ["^AXJO", "^AORD"]
-            data_frames = {}
-            
-            for symbol in symbols:
-                try:
-                    ticker = yf.Ticker(symbol)
-                    hist = ticker.history(start=start_date.date(), end=end_date.date(), interval="1d")
-                    if not hist.empty:
-                        data_frames[symbol] = hist
-                        logger.info(f"✅ Retrieved {len(hist)} data points for {symbol}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not retrieve data for {symbol}: {e}")
+            data_frames = await self._fetch_daily_histories(symbols, start_date, end_date)
             
             if self.symbol not in data_frames:
                 raise ValueError(f"Could not retrieve data for {self.symbol}")
@@ -1643,8 +1533,7 @@ class CBAEnhancedPredictionSystem:
                             df[col] = df[col].clip(q1, q99)
             
             # Store feature columns
-            self.feature_columns = [col for col in df.columns 
-                                  if col not in ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume', 'cba_close']]
+            self.feature_columns = [col for col in df.columns if col not in NON_FEATURE_COLUMNS]
             
             logger.info(f"🔧 Engineered {len(self.feature_columns)} features for CBA analysis")
             return df
@@ -1653,6 +1542,24 @@ class CBAEnhancedPredictionSystem:
             logger.error(f"❌ Error collecting CBA enhanced data: {e}")
             raise
     
+    async def _fetch_daily_histories(self, symbols: List[str], start_date: datetime, end_date: datetime) -> Dict[str, pd.DataFrame]:
+        """Fetch daily bars from start_date through the latest bar (incl. today) for several symbols concurrently via the gateway"""
+        results = await asyncio.gather(
+            # No end bound: yfinance's end is exclusive and would drop today's bar
+            *(market_data.history(symbol, start=start_date.date(), interval="1d")
+              for symbol in symbols),
+            return_exceptions=True
+        )
+        
+        data_frames = {}
+        for symbol, hist in zip(symbols, results):
+            if isinstance(hist, Exception):
+                logger.warning(f"⚠️ Could not retrieve data for {symbol}: {hist}")
+            elif not hist.empty:
+                data_frames[symbol] = hist
+                logger.info(f"✅ Retrieved {len(hist)} data points for {symbol}")
+        return data_frames
+    
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate Relative Strength Index"""
         delta = prices.diff()
@@ -1670,164 +1577,160 @@ class CBAEnhancedPredictionSystem:
     def _integrate_publications_data(self, df: pd.DataFrame, publications: List[CBAPublication]) -> pd.DataFrame:
         """Integrate publications analysis into market data"""
         
-        # Create publications features
-        df['pub_sentiment_score'] = 0.0
-        df['pub_market_impact'] = 0.0
-        df['pub_financial_health'] = 0.0
-        df['days_since_last_pub'] = 999  # High default value
+        # Financial health from key metrics (12% is strong CET1)
+        def health_score(pub: CBAPublication) -> float:
+            if 'cet1_ratio' in pub.key_metrics:
+                return min(1.0, pub.key_metrics['cet1_ratio'] / 12.0)
+            return np.nan
         
-        for pub in publications:
-            pub_date = pub.publication_date.date()
-            
-            # Find the closest trading date
-            closest_date = df.index[df.index.date >= pub_date].min() if len(df.index[df.index.date >= pub_date]) > 0 else None
-            
-            if closest_date is not None:
-                # Apply publication impact with decay over time
-                for i, date in enumerate(df.index):
-                    if date >= closest_date:
-                        days_elapsed = (date.date() - pub_date).days
-                        
-                        # Exponential decay over 30 days
-                        decay_factor = np.exp(-days_elapsed / 15.0)
-                        
-                        df.loc[date, 'pub_sentiment_score'] += pub.sentiment_score * decay_factor
-                        df.loc[date, 'pub_market_impact'] += pub.market_impact_score * decay_factor
-                        
-                        # Financial health from key metrics
-                        if 'cet1_ratio' in pub.key_metrics:
-                            health_score = min(1.0, pub.key_metrics['cet1_ratio'] / 12.0)  # 12% is strong CET1
-                            df.loc[date, 'pub_financial_health'] = max(df.loc[date, 'pub_financial_health'], 
-                                                                     health_score * decay_factor)
-                        
-                        # Update days since last publication
-                        df.loc[date, 'days_since_last_pub'] = min(df.loc[date, 'days_since_last_pub'], days_elapsed)
+        articles = articles_to_frame(publications, {
+            'sentiment': 'sentiment_score',
+            'impact': 'market_impact_score',
+            'health': health_score
+        })
+        
+        # Exponential decay (15-day time constant), summed across publications
+        features = build_decay_features(articles, df.index, ['sentiment', 'impact'], decay_days=15.0,
+                                        normalize=False, max_columns=['health'])
+        
+        df['pub_sentiment_score'] = features['sentiment']
+        df['pub_market_impact'] = features['impact']
+        df['pub_financial_health'] = features['health']
+        df['days_since_last_pub'] = features['days_since_last'].clip(upper=999).fillna(999).astype(int)  # High default value
         
         return df
     
     def _integrate_news_data(self, df: pd.DataFrame, news_articles: List[CBANewsArticle]) -> pd.DataFrame:
         """Integrate news analysis into market data"""
         
-        # Create news features
-        df['news_sentiment_score'] = 0.0
-        df['news_regulatory_risk'] = 0.0
-        df['news_market_relevance'] = 0.0
-        df['news_volume_score'] = 0.0  # Number of news articles
+        articles = articles_to_frame(news_articles, {
+            'sentiment': 'sentiment_score',
+            'regulatory': 'regulatory_impact',
+            'relevance': 'market_relevance'
+        })
         
-        # Aggregate news by date
-        news_by_date = {}
-        for article in news_articles:
-            article_date = article.publication_date.date()
-            if article_date not in news_by_date:
-                news_by_date[article_date] = []
-            news_by_date[article_date].append(article)
-        
-        # Apply news impact with rolling window
-        for date in df.index:
-            current_date = date.date()
-            
-            # Look at news in the past 7 days
-            news_window = []
-            for i in range(7):
-                check_date = current_date - timedelta(days=i)
-                if check_date in news_by_date:
-                    news_window.extend(news_by_date[check_date])
-            
-            if news_window:
-                # Calculate aggregate scores with recency weighting
-                total_sentiment = 0.0
-                total_regulatory = 0.0
-                total_relevance = 0.0
-                weight_sum = 0.0
-                
-                for article in news_window:
-                    days_ago = (current_date - article.publication_date.date()).days
-                    weight = np.exp(-days_ago / 3.0)  # 3-day half-life
-                    
-                    total_sentiment += article.sentiment_score * weight
-                    total_regulatory += article.regulatory_impact * weight
-                    total_relevance += article.market_relevance * weight
-                    weight_sum += weight
-                
-                if weight_sum > 0:
-                    df.loc[date, 'news_sentiment_score'] = total_sentiment / weight_sum
-                    df.loc[date, 'news_regulatory_risk'] = total_regulatory / weight_sum
-                    df.loc[date, 'news_market_relevance'] = total_relevance / weight_sum
-                    df.loc[date, 'news_volume_score'] = min(1.0, len(news_window) / 10.0)  # Normalize to 0-1
+        # News from the past 7 days with recency weighting (3-day decay), as weighted means
+        features = build_decay_features(articles, df.index, ['sentiment', 'regulatory', 'relevance'],
+                                        decay_days=3.0, window_days=7)
+        
+        df['news_sentiment_score'] = features['sentiment']
+        df['news_regulatory_risk'] = features['regulatory']
+        df['news_market_relevance'] = features['relevance']
+        df['news_volume_score'] = np.minimum(1.0, features['article_count'] / 10.0)  # Number of news articles, normalized to 0-1
         
         return df
     
-    async def train_cba_model(self, horizon: str = "5d") -> Dict[str, Any]:
-        """Train CBA-specific prediction model with publications and news data"""
+    def _fit_model_version(self, data: pd.DataFrame, feature_columns: List[str], horizon: str) -> ModelVersion:
+        """Fit a fresh model and scaler for one horizon (CPU-bound, runs in an executor)"""
+        
+        # Prepare features and targets
+        features = data[feature_columns].fillna(0)
+        latest_features = features.iloc[-1].tolist()
+        
+        # Create target based on horizon (predict returns, not absolute prices)
+        horizon_days = int(horizon.replace('d', ''))
+        current_prices = data['cba_close']
+        future_prices = data['cba_close'].shift(-horizon_days)
+        target = ((future_prices - current_prices) / current_prices).dropna()  # Calculate returns
+        
+        # Align features and targets
+        min_length = min(len(features), len(target))
+        features = features.iloc[:min_length]
+        target = target.iloc[:min_length]
+        
+        # Split data
+        split_idx = int(len(features) * 0.8)
+        X_train, X_val = features.iloc[:split_idx], features.iloc[split_idx:]
+        y_train, y_val = target.iloc[:split_idx], target.iloc[split_idx:]
+        
+        # Scale features (unfitted copies of the horizon's configured scaler/model)
+        scaler = clone(self.scalers[horizon])
+        X_train_scaled = scaler.fit_transform(X_train)
+        X_val_scaled = scaler.transform(X_val)
+        
+        # Train model
+        model = clone(self.models[horizon])
+        model.fit(X_train_scaled, y_train)
+        
+        # Validate model
+        val_predictions = model.predict(X_val_scaled)
+        val_rmse = np.sqrt(mean_squared_error(y_val, val_predictions))
+        val_r2 = r2_score(y_val, val_predictions)
+        
+        # Feature importance analysis
+        feature_importance = {}
+        if hasattr(model, 'feature_importances_'):
+            for i, importance in enumerate(model.feature_importances_):
+                feature_importance[feature_columns[i]] = importance
+        
+        # Identify top CBA-specific features
+        cba_specific_features = [col for col in feature_columns 
+                               if any(keyword in col.lower() for keyword in ['pub_', 'news_', 'cba_'])]
+        
+        training_result = {
+            'symbol': self.symbol,
+            'horizon': horizon,
+            'training_samples': len(X_train),
+            'validation_samples': len(X_val),
+            'validation_rmse': val_rmse,
+            'validation_r2': val_r2,
+            'features_count': len(feature_columns),
+            'cba_specific_features_count': len(cba_specific_features),
+            'feature_importance': feature_importance,
+            'model_type': type(model).__name__,
+            'publications_integrated': True,
+            'news_analysis_integrated': True
+        }
+        
+        # Latest trading day snapshot - all inference needs until the next retrain
+        latest_data = data.iloc[-1]
+        recent_returns = data['cba_close'].tail(63).pct_change()  # ~90 calendar days
+        
+        return ModelVersion(
+            horizon=horizon,
+            data_date=data.index[-1].strftime('%Y-%m-%d'),
+            trained_at=datetime.now(),
+            model=model,
+            scaler=scaler,
+            feature_columns=list(feature_columns),
+            latest_features=latest_features,
+            latest_data=latest_data,
+            current_price=float(latest_data['cba_close']),
+            volatility=float(recent_returns.std()),
+            metrics=training_result
+        )
+    
+    async def train_cba_model(self, horizon: str = "5d", data: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """
+        Train CBA-specific prediction model and publish it to the model store
+        
+        Args:
+            horizon: Prediction horizon ("1d", "5d", "15d", "30d")
+            data: Pre-collected 365-day frame (shared when retraining several horizons)
+        """
         try:
             logger.info(f"🤖 Training CBA-enhanced model for {horizon} horizon")
             
             # Collect training data
-            data = await self.collect_cba_enhanced_data(days_back=365)
+            if data is None:
+                data = await self.collect_cba_enhanced_data(days_back=365)
             
             if len(data) < 100:
                 raise ValueError("Insufficient data for CBA model training")
             
-            # Prepare features and targets
-            features = data[self.feature_columns].fillna(0)
+            feature_columns = [col for col in data.columns if col not in NON_FEATURE_COLUMNS]
             
-            # Create target based on horizon (predict returns, not absolute prices)
-            horizon_days = int(horizon.replace('d', ''))
-            current_prices = data['cba_close']
-            future_prices = data['cba_close'].shift(-horizon_days)
-            target = ((future_prices - current_prices) / current_prices).dropna()  # Calculate returns
+            # Fit and persist off the event loop
+            loop = asyncio.get_running_loop()
+            version = await loop.run_in_executor(None, self._fit_model_version, data, feature_columns, horizon)
+            await loop.run_in_executor(None, self.model_store.put, version)
             
-            # Align features and targets
-            min_length = min(len(features), len(target))
-            features = features.iloc[:min_length]
-            target = target.iloc[:min_length]
+            training_result = dict(version.metrics)
+            training_result['data_date'] = version.data_date
+            training_result['model_version'] = version.version_id
             
-            # Split data
-            split_idx = int(len(features) * 0.8)
-            X_train, X_val = features.iloc[:split_idx], features.iloc[split_idx:]
-            y_train, y_val = target.iloc[:split_idx], target.iloc[split_idx:]
-            
-            # Scale features
-            scaler = self.scalers[horizon]
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_val_scaled = scaler.transform(X_val)
-            
-            # Train model
-            model = self.models[horizon]
-            model.fit(X_train_scaled, y_train)
-            
-            # Validate model
-            val_predictions = model.predict(X_val_scaled)
-            val_rmse = np.sqrt(mean_squared_error(y_val, val_predictions))
-            val_r2 = r2_score(y_val, val_predictions)
-            
-            # Feature importance analysis
-            feature_importance = {}
-            if hasattr(model, 'feature_importances_'):
-                for i, importance in enumerate(model.feature_importances_):
-                    feature_importance[self.feature_columns[i]] = importance
-            
-            # Identify top CBA-specific features
-            cba_specific_features = [col for col in self.feature_columns 
-                                   if any(keyword in col.lower() for keyword in ['pub_', 'news_', 'cba_'])]
-            
-            training_result = {
-                'symbol': self.symbol,
-                'horizon': horizon,
-                'training_samples': len(X_train),
-                'validation_samples': len(X_val),
-                'validation_rmse': val_rmse,
-                'validation_r2': val_r2,
-                'features_count': len(self.feature_columns),
-                'cba_specific_features_count': len(cba_specific_features),
-                'feature_importance': feature_importance,
-                'model_type': type(model).__name__,
-                'publications_integrated': True,
-                'news_analysis_integrated': True
-            }
-            
-            logger.info(f"✅ CBA model trained - RMSE: {val_rmse:.4f}, R²: {val_r2:.4f}")
-            logger.info(f"📊 CBA-specific features: {len(cba_specific_features)}/{len(self.feature_columns)}")
+            logger.info(f"✅ CBA model {version.version_id} trained - RMSE: {training_result['validation_rmse']:.4f}, R²: {training_result['validation_r2']:.4f}")
+            logger.info(f"📊 CBA-specific features: {training_result['cba_specific_features_count']}/{len(feature_columns)}")
             
             return training_result
             
@@ -1835,6 +1738,108 @@ class CBAEnhancedPredictionSystem:
             logger.error(f"❌ Error training CBA model: {e}")
             raise
     
+    async def refresh_models(self, horizons: Optional[List[str]] = None, force: bool = False) -> Dict[str, Any]:
+        """
+        Retrain stale horizons from one shared data collection
+        
+        Args:
+            horizons: Horizons to check (default: all)
+            force: Retrain even if the model already covers the latest trading bar
+            
+        Returns:
+            Dictionary mapping retrained horizon -> training result or error
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        
+        async with self._refresh_lock:
+            horizons = horizons or list(self.models.keys())
+            latest_session = None if force else (await self._latest_session())[0]
+            stale = [horizon for horizon in horizons
+                     if force or self.model_store.is_stale(horizon, latest_session=latest_session)]
+            if not stale:
+                return {}
+            
+            logger.info(f"🔄 Retraining CBA models: {', '.join(stale)}")
+            data = await self.collect_cba_enhanced_data(days_back=365)
+            
+            results = {}
+            for horizon in stale:
+                try:
+                    results[horizon] = await self.train_cba_model(horizon, data=data)
+                except Exception as e:
+                    results[horizon] = {'error': str(e)}
+            return results
+    
+    async def _refresh_models_quietly(self):
+        """refresh_models() for background tasks - failures are logged, never raised"""
+        try:
+            await self.refresh_models()
+        except Exception as e:
+            logger.error(f"❌ Background CBA model refresh failed: {e}")
+    
+    async def _retraining_loop(self, interval_seconds: float):
+        """Retrain stale models at startup and then every interval"""
+        while True:
+            await self._refresh_models_quietly()
+            await asyncio.sleep(interval_seconds)
+    
+    def start_retraining_scheduler(self, interval_seconds: float = 1800.0) -> asyncio.Task:
+        """
+        Start background retraining on the running event loop (no-op if already running)
+        
+        Args:
+            interval_seconds: Seconds between staleness checks; a model goes stale
+                              once a newer CBA trading bar than its data date exists
+        """
+        if self._retraining_task is None or self._retraining_task.done():
+            loop = asyncio.get_running_loop()
+            self._retraining_task = loop.create_task(self._retraining_loop(interval_seconds))
+            logger.info(f"⏰ CBA retraining scheduler started (every {interval_seconds / 60:.0f} min)")
+        return self._retraining_task
+    
+    def stop_retraining_scheduler(self):
+        """Cancel background retraining"""
+        if self._retraining_task is not None:
+            self._retraining_task.cancel()
+            self._retraining_task = None
+    
+    async def _latest_session(self) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Date (YYYY-MM-DD) and close (dollars) of the newest CBA daily bar
+        
+        Cheap: a 5-day request served from the market data gateway's cache.
+        Returns (None, None) when the bar cannot be fetched.
+        """
+        try:
+            hist = await market_data.history(self.symbol, period="5d", interval="1d")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not check latest CBA trading bar: {e}")
+            return None, None
+        if hist.empty:
+            return None, None
+        
+        close = float(hist['Close'].iloc[-1])
+        if hist['Close'].median() > 1000:  # Same cents-to-dollars rule as collect_cba_enhanced_data
+            close /= 100
+        return hist.index[-1].strftime('%Y-%m-%d'), close
+    
+    async def _get_model_version(self, horizon: str, latest_session: Optional[str] = None) -> ModelVersion:
+        """Latest model for a horizon; trains only when none exists, refreshes stale ones in the background"""
+        if horizon not in self.models:
+            raise ValueError(f"Unsupported horizon {horizon}. Must be one of: {list(self.models.keys())}")
+        
+        version = self.model_store.latest(horizon)
+        if version is None:
+            await self.refresh_models([horizon])
+            version = self.model_store.latest(horizon)
+            if version is None:
+                raise ValueError(f"No trained CBA model available for {horizon} horizon")
+        elif (self.model_store.is_stale(horizon, latest_session=latest_session)
+              and (self._refresh_task is None or self._refresh_task.done())):
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_models_quietly())
+        return version
+    
     async def predict_with_publications_analysis(self, days: int = 5) -> Dict[str, Any]:
         """Make enhanced CBA prediction with publications and news analysis"""
         
@@ -1842,39 +1847,27 @@ class CBAEnhancedPredictionSystem:
             horizon = f"{days}d"
             logger.info(f"🔮 Making CBA enhanced prediction for {days} days ahead")
             
-            # Ensure model is trained
-            await self.train_cba_model(horizon)
-            
-            # Collect latest data (need more days for technical indicators)
-            data = await self.collect_cba_enhanced_data(days_back=90)
+            # Inference only: the latest stored model carries the feature snapshot
+            # of its last trading day; a newer bar triggers a background retrain
+            latest_session, live_price = await self._latest_session()
+            model_version = await self._get_model_version(horizon, latest_session)
+            latest_data = model_version.latest_data
             
-            if data.empty:
-                raise ValueError("No data available for prediction")
+            # Price off the latest bar, not the close stored at training time
+            current_price = live_price if live_price is not None else model_version.current_price
             
-            # Get latest data point for prediction (price scaling already handled in data collection)
-            latest_data = data.iloc[-1]
-            current_price = latest_data['cba_close']  # Already scaled to dollars in collect_cba_enhanced_data
-            
-            logger.info(f"📊 CBA Current Price: ${current_price:.2f}")
-            
-            # Prepare features for prediction
-            feature_values = []
-            for col in self.feature_columns:
-                if col in data.columns:
-                    feature_values.append(latest_data[col])
-                else:
-                    feature_values.append(0.0)  # Default value for missing features
+            logger.info(f"📊 CBA Current Price: ${current_price:.2f} (model {model_version.version_id})")
             
             # Scale features
-            X_pred = np.array(feature_values).reshape(1, -1)
-            X_pred_scaled = self.scalers[horizon].transform(X_pred)
+            X_pred = np.array(model_version.latest_features).reshape(1, -1)
+            X_pred_scaled = model_version.scaler.transform(X_pred)
             
             # Make prediction (model now predicts returns directly)
-            predicted_return = self.models[horizon].predict(X_pred_scaled)[0]
+            predicted_return = model_version.model.predict(X_pred_scaled)[0]
             predicted_price = current_price * (1 + predicted_return)
             
             # Calculate confidence intervals (simple approach)
-            volatility = data['cba_close'].pct_change().std()
+            volatility = model_version.volatility
             confidence_range = volatility * np.sqrt(days) * 1.96  # 95% confidence
             lower_bound = predicted_price * (1 - confidence_range)
             upper_bound = predicted_price * (1 + confidence_range)
@@ -1947,10 +1940,14 @@ class CBAEnhancedPredictionSystem:
                 "banking_sector_analysis": banking_analysis,
                 "central_bank_analysis": await self._analyze_central_bank_impact(latest_data),
                 "model_metrics": {
-                    "features_used": len(self.feature_columns),
+                    "features_used": len(model_version.feature_columns),
                     "publications_count": len(publications),
                     "news_articles_count": len(news_articles),
-                    "central_bank_features": len([col for col in self.feature_columns if any(keyword in col.lower() for keyword in ['rba_', 'fed_', 'rate_'])]),
+                    "central_bank_features": len([col for col in model_version.feature_columns if any(keyword in col.lower() for keyword in ['rba_', 'fed_', 'rate_'])]),
+                    "model_version": model_version.version_id,
+                    "model_data_date": model_version.data_date,
+                    "price_data_date": latest_session or model_version.data_date,
+                    "model_trained_at": model_version.trained_at.isoformat(),
                     "data_quality_score": 0.85  # Fixed for simulation
                 }
             }
@@ -2087,24 +2084,16 @@ class CBAEnhancedPredictionSystem:
             start_date = end_date - timedelta(days=90)  # 90 days for correlation calculation
             
             symbols = [self.symbol] + self.banking_peers + ["^AXJO", "^AORD"]
-            data_frames = {}
             
             # Fetch real market data
-            for symbol in symbols:
-                try:
-                    ticker = yf.Ticker(symbol)
-                    hist = ticker.history(start=start_date.date(), end=end_date.date(), interval="1d")
-                    if not hist.empty:
-                        # Apply consistent price scaling for .AX symbols
-                        if symbol.endswith('.AX') and hist['Close'].median() > 1000:
-                            hist['Close'] = hist['Close'] / 100
-                            hist['Open'] = hist['Open'] / 100
-                            hist['High'] = hist['High'] / 100
-                            hist['Low'] = hist['Low'] / 100
-                        data_frames[symbol] = hist
-                        logger.info(f"✅ Real data retrieved for {symbol}: {len(hist)} days")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not retrieve real data for {symbol}: {e}")
+            data_frames = await self._fetch_daily_histories(symbols, start_date, end_date)
+            for symbol, hist in data_frames.items():
+                # Apply consistent price scaling for .AX symbols
+                if symbol.endswith('.AX') and hist['Close'].median() > 1000:
+                    hist['Close'] = hist['Close'] / 100
+                    hist['Open'] = hist['Open'] / 100
+                    hist['High'] = hist['High'] / 100
+                    hist['Low'] = hist['Low'] / 100
             
             if len(data_frames) < 2:
                 raise ValueError("Insufficient real market data for banking sector analysis")
@@ -2155,23 +2144,24 @@ class CBAEnhancedPredictionSystem:
             market_position = {}
             if self.symbol in data_frames:
                 try:
-                    cba_ticker = yf.Ticker(self.symbol)
-                    cba_info = cba_ticker.info
+                    infos = await asyncio.gather(
+                        *(market_data.info(symbol) for symbol in [self.symbol] + self.banking_peers),
+                        return_exceptions=True
+                    )
+                    if isinstance(infos[0], Exception):
+                        raise infos[0]
                     
                     # Get real market cap and calculate position
-                    cba_market_cap = cba_info.get('marketCap', 0)
+                    cba_market_cap = infos[0].get('marketCap', 0)
                     
                     # Compare with peer market caps
                     peer_market_caps = []
-                    for peer in self.banking_peers:
-                        try:
-                            peer_ticker = yf.Ticker(peer)
-                            peer_info = peer_ticker.info
-                            peer_mc = peer_info.get('marketCap', 0)
-                            if peer_mc > 0:
-                                peer_market_caps.append(peer_mc)
-                        except:
+                    for peer_info in infos[1:]:
+                        if isinstance(peer_info, Exception):
                             continue
+                        peer_mc = peer_info.get('marketCap', 0)
+                        if peer_mc > 0:
+                            peer_market_caps.append(peer_mc)
                     
                     if peer_market_caps and cba_market_cap > 0:
                         # Calculate real market position
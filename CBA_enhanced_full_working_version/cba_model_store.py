@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+CBA Model Store
+Versioned store of trained CBA prediction models, keyed by horizon and data date
+
+Features:
+- One ModelVersion per (horizon, data date): fitted model, scaler, feature
+  columns and the latest feature snapshot needed for inference
+- Latest version per horizon kept in memory for millisecond lookups
+- Versions pickled to disk so a restarted backend serves predictions
+  without retraining; older versions pruned beyond keep_versions
+"""
+
+import logging
+import os
+import pickle
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path(__file__).parent / "cba_models"
+
+@dataclass
+class ModelVersion:
+    """A trained model for one horizon, fitted on data up to data_date"""
+    horizon: str
+    data_date: str  # Last trading day in the training data (YYYY-MM-DD)
+    trained_at: datetime
+    model: Any
+    scaler: Any
+    feature_columns: List[str]
+    latest_features: List[float]  # Feature vector of the last trading day
+    latest_data: Any  # Last row of the training frame (pd.Series)
+    current_price: float
+    volatility: float
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def version_id(self) -> str:
+        return f"{self.horizon}_{self.data_date}"
+
+class CBAModelStore:
+    """Thread-safe versioned model store with on-disk persistence"""
+
+    def __init__(self, store_dir: Optional[Path] = DEFAULT_STORE_DIR, keep_versions: int = 3):
+        """
+        Initialize model store
+
+        Args:
+            store_dir: Directory for pickled versions (None = memory only)
+            keep_versions: Versions kept on disk per horizon
+        """
+        self.store_dir = Path(store_dir) if store_dir else None
+        self.keep_versions = max(1, int(keep_versions))
+        self._latest: Dict[str, ModelVersion] = {}
+        self._lock = threading.Lock()
+
+        if self.store_dir is not None:
+            try:
+                self.store_dir.mkdir(parents=True, exist_ok=True)
+                self._load_latest()
+            except OSError as e:
+                logger.warning(f"⚠️ Model store persistence disabled ({self.store_dir}): {e}")
+                self.store_dir = None
+
+    def _version_path(self, horizon: str, data_date: str) -> Path:
+        return self.store_dir / f"{horizon}_{data_date}.pkl"
+
+    def _version_files(self, horizon: str) -> List[Path]:
+        """Stored version files for a horizon, oldest first (ISO dates sort)"""
+        if self.store_dir is None:
+            return []
+        return sorted(self.store_dir.glob(f"{horizon}_*.pkl"))
+
+    def _load_latest(self):
+        """Load the newest readable version of every stored horizon"""
+        horizons = {path.stem.rsplit('_', 1)[0] for path in self.store_dir.glob("*_*.pkl")}
+        for horizon in horizons:
+            for path in reversed(self._version_files(horizon)):
+                try:
+                    with open(path, 'rb') as f:
+                        version = pickle.load(f)
+                    self._latest[horizon] = version
+                    logger.info(f"📦 Loaded CBA {horizon} model (data date {version.data_date})")
+                    break
+                except Exception as e:
+                    logger.warning(f"⚠️ Skipping unreadable model version {path.name}: {e}")
+
+    def put(self, version: ModelVersion):
+        """Publish a version as the latest for its horizon and persist it"""
+        with self._lock:
+            self._latest[version.horizon] = version
+
+        if self.store_dir is None:
+            return
+
+        path = self._version_path(version.horizon, version.data_date)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(version, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not persist model version {version.version_id}: {e}")
+            return
+
+        for old_path in self._version_files(version.horizon)[:-self.keep_versions]:
+            try:
+                old_path.unlink()
+            except OSError:
+                pass
+
+    def latest(self, horizon: str) -> Optional[ModelVersion]:
+        """Latest trained version for a horizon, or None"""
+        with self._lock:
+            return self._latest.get(horizon)
+
+    def is_stale(self, horizon: str, now: Optional[datetime] = None,
+                 latest_session: Optional[str] = None) -> bool:
+        """
+        True if the horizon has no model or its model predates the latest market data
+
+        Args:
+            horizon: Prediction horizon
+            now: Current time (used without latest_session)
+            latest_session: Date (YYYY-MM-DD) of the newest available trading bar;
+                            models trained on older data are stale. Without it,
+                            models trained before today count as stale.
+        """
+        version = self.latest(horizon)
+        if version is None:
+            return True
+        if latest_session is not None:
+            return version.data_date < latest_session
+        return version.trained_at.date() < (now or datetime.now()).date()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Latest version summary per horizon"""
+        with self._lock:
+            versions = dict(self._latest)
+        return {
+            horizon: {
+                "version": version.version_id,
+                "data_date": version.data_date,
+                "trained_at": version.trained_at.isoformat(),
+                "stored_versions": len(self._version_files(horizon)),
+                "validation_rmse": version.metrics.get("validation_rmse"),
+                "validation_r2": version.metrics.get("validation_r2")
+            }
+            for horizon, version in versions.items()
+        }
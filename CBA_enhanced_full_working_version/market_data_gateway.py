@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Market Data Gateway
+Non-blocking access to Yahoo Finance for the async FastAPI endpoints
+
+yfinance is synchronous: calling yf.Ticker(...).history() inside an
+``async def`` endpoint blocks the whole uvicorn event loop, so every
+concurrent request queued behind each download.
+
+Features:
+- Dedicated thread pool for blocking fetches (the event loop stays free)
+- In-flight coalescing: concurrent requests for the same symbol/interval/
+  range await one shared download
+- TTL cache sized to the bar interval (intraday bars expire quickly,
+  daily bars and company info last longer)
+- run() helper for other blocking market-data code paths
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Cache lifetime (seconds) per bar interval
+DEFAULT_TTLS = {
+    "1m": 30, "2m": 30, "5m": 60,
+    "15m": 120, "30m": 120, "60m": 120, "90m": 120, "1h": 120,
+    "1d": 300, "5d": 900, "1wk": 900, "1mo": 900, "3mo": 900,
+    "info": 3600
+}
+
+# Bar intervals below one day (range bounds keep their time of day in cache keys)
+INTRADAY_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
+
+def _range_key(value: Any, interval: str) -> Optional[str]:
+    """
+    Cache-key form of a history() start/end bound
+
+    Ranges are usually derived from now(), so the raw value differs on every
+    call: daily and longer bars key on the date, intraday bars on the minute.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (date, datetime, str)):
+        try:
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            if isinstance(value, datetime):
+                if interval in INTRADAY_INTERVALS:
+                    return value.replace(second=0, microsecond=0).isoformat()
+                value = value.date()
+            return value.isoformat()
+        except ValueError:
+            pass
+    return str(value)
+
+class MarketDataGateway:
+    """Shared, coalescing, TTL-cached front for blocking yfinance calls"""
+
+    def __init__(self, max_workers: int = 8, max_entries: int = 512,
+                 ttls: Optional[Dict[str, float]] = None,
+                 ticker_factory: Optional[Callable[[str], Any]] = None):
+        """
+        Initialize gateway
+
+        Args:
+            max_workers: Threads for blocking fetches
+            max_entries: Cached responses kept (least recently used evicted)
+            ttls: Per-interval cache lifetimes overriding DEFAULT_TTLS
+            ticker_factory: Callable(symbol) -> yf.Ticker-like object
+                            (default: yfinance.Ticker)
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.ticker_factory = ticker_factory
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="market-data")
+        self._cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"fetches": 0, "cache_hits": 0, "coalesced": 0, "errors": 0}
+
+    def _ticker(self, symbol: str):
+        if self.ticker_factory is not None:
+            return self.ticker_factory(symbol)
+        import yfinance as yf
+        return yf.Ticker(symbol)
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _cached(self, key: Hashable, ttl: float):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or time.monotonic() - entry[0] >= ttl:
+                return None
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return entry
+
+    def _on_fetched(self, flight_key: Tuple[int, Hashable], future: asyncio.Future):
+        """Done-callback (event loop thread): cache successful results"""
+        self._in_flight.pop(flight_key, None)
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self._count("errors")
+            return
+        with self._lock:
+            self._cache[flight_key[1]] = (time.monotonic(), future.result())
+            self._cache.move_to_end(flight_key[1])
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    async def _get(self, key: Hashable, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """Serve key from cache, join an in-flight fetch, or start one on the executor"""
+        entry = self._cached(key, ttl)
+        if entry is not None:
+            return entry[1]
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        future = self._in_flight.get(flight_key)
+        if future is None:
+            self._count("fetches")
+            future = loop.run_in_executor(self._executor, fetch)
+            self._in_flight[flight_key] = future
+            future.add_done_callback(functools.partial(self._on_fetched, flight_key))
+        else:
+            self._count("coalesced")
+
+        # A cancelled or timed-out caller must not cancel the fetch other callers await
+        return await asyncio.shield(future)
+
+    async def history(self, symbol: str, period: Optional[str] = None, interval: str = "1d",
+                      start: Any = None, end: Any = None, ttl: Optional[float] = None,
+                      **kwargs):
+        """
+        Non-blocking yf.Ticker(symbol).history(...)
+
+        Args:
+            symbol: Ticker symbol
+            period: yfinance period ("1d", "5d", "1mo", ...) or None with start/end
+            interval: Bar interval ("1m", "5m", "1h", "1d", ...)
+            start: Range start (date/datetime/str)
+            end: Range end (date/datetime/str)
+            ttl: Cache lifetime override (seconds)
+            **kwargs: Further history() arguments (auto_adjust, prepost, ...)
+
+        Returns:
+            OHLCV DataFrame (a copy - callers may modify it)
+        """
+        key = ("history", symbol, period, interval, _range_key(start, interval), _range_key(end, interval),
+               tuple(sorted(kwargs.items())))
+        if ttl is None:
+            ttl = self.ttls.get(interval, self.ttls["1d"])
+
+        def fetch():
+            params = dict(kwargs, interval=interval)
+            if period is not None:
+                params["period"] = period
+            if start is not None:
+                params["start"] = start
+            if end is not None:
+                params["end"] = end
+            return self._ticker(symbol).history(**params)
+
+        hist = await self._get(key, ttl, fetch)
+        return hist.copy()
+
+    async def info(self, symbol: str, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """Non-blocking yf.Ticker(symbol).info (copy)"""
+        key = ("info", symbol)
+        info = await self._get(key, self.ttls["info"] if ttl is None else ttl,
+                               lambda: self._ticker(symbol).info or {})
+        return dict(info)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run any other blocking market-data call on the gateway's executor (uncached)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Fetch / cache / coalescing counters"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["cached_entries"] = len(self._cache)
+        stats["in_flight"] = len(self._in_flight)
+        stats["max_workers"] = self.max_workers
+        return stats
+
+# Shared gateway for the backend and the prediction systems
+market_data = MarketDataGateway()
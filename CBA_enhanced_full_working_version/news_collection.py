@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+News Collection Helpers
+Per-host rate limiting and a persistent article cache for the concurrent news collector
+
+Features:
+- HostRateLimiter: async per-host spacing, so different news sites are
+  fetched in parallel while requests to one site stay rate limited
+- NewsArticleCache: JSON-backed cache of scored articles keyed by URL plus
+  the ETag/Last-Modified validators and parsed items of each listing page,
+  so a refresh re-downloads only changed pages and scores only new articles
+- collect_news_page: conditional GET of a listing page (304 = cached items)
+- Undated items are cached without a date and resolved at filter time by
+  resolve_publication_date, so revalidated pages never age them out
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / "cba_news_cache.json"
+
+# Undated news items count as this many days old (as of each lookup)
+UNDATED_NEWS_AGE_DAYS = 30
+
+def resolve_publication_date(item: Dict[str, Any], now: Optional[datetime] = None) -> datetime:
+    """Publication date of a news item ('publication_date' ISO string, or None if undated)"""
+    if item.get('publication_date'):
+        return datetime.fromisoformat(item['publication_date'])
+    return (now or datetime.now()) - timedelta(days=UNDATED_NEWS_AGE_DAYS)
+
+class HostRateLimiter:
+    """Async minimum interval between requests to the same host"""
+
+    def __init__(self, default_interval: float = 1.0, intervals: Optional[Dict[str, float]] = None):
+        """
+        Initialize rate limiter
+
+        Args:
+            default_interval: Seconds between requests to a host
+            intervals: Host (netloc) -> interval overrides
+        """
+        self.default_interval = default_interval
+        self.intervals = dict(intervals or {})
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    async def wait(self, url: str):
+        """Wait for the URL's host to be free, then reserve its next slot"""
+        host = urlparse(url).netloc
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self._next_slot.get(host, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot[host] = time.monotonic() + self.intervals.get(host, self.default_interval)
+
+class NewsArticleCache:
+    """Persistent cache of scored news articles and listing-page validators"""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_CACHE_PATH, max_age_days: int = 180):
+        """
+        Initialize article cache
+
+        Args:
+            path: JSON file (None = memory only)
+            max_age_days: Entries not seen for this long are dropped on save
+        """
+        self.path = Path(path) if path else None
+        self.max_age_days = max_age_days
+        self._articles: Dict[str, Dict[str, Any]] = {}
+        self._pages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._articles = data.get('articles', {})
+            self._pages = data.get('pages', {})
+            logger.info(f"📰 Loaded news cache: {len(self._articles)} articles, {len(self._pages)} pages")
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable news cache {self.path}: {e}")
+
+    def get_article(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached article record, refreshing its last-seen time"""
+        with self._lock:
+            record = self._articles.get(key)
+            if record is not None:
+                record['seen_at'] = datetime.now().isoformat()
+            return record
+
+    def put_article(self, key: str, record: Dict[str, Any]):
+        with self._lock:
+            self._articles[key] = dict(record, seen_at=datetime.now().isoformat())
+
+    def get_page(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached listing page: {'etag', 'last_modified', 'items'}"""
+        with self._lock:
+            page = self._pages.get(url)
+            if page is not None:
+                page['seen_at'] = datetime.now().isoformat()
+            return page
+
+    def put_page(self, url: str, etag: Optional[str], last_modified: Optional[str], items: List[Dict[str, Any]]):
+        with self._lock:
+            self._pages[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'items': items,
+                'seen_at': datetime.now().isoformat()
+            }
+
+    def save(self):
+        """Prune stale entries and write the cache atomically"""
+        if self.path is None:
+            return
+        cutoff = (datetime.now() - timedelta(days=self.max_age_days)).isoformat()
+        with self._lock:
+            self._articles = {k: v for k, v in self._articles.items() if v.get('seen_at', '') >= cutoff}
+            self._pages = {k: v for k, v in self._pages.items() if v.get('seen_at', '') >= cutoff}
+            data = {'articles': self._articles, 'pages': self._pages}
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not save news cache: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'articles': len(self._articles), 'pages': len(self._pages)}
+
+async def collect_news_page(session, url: str, parse: Callable[[str, str], List[Dict[str, Any]]],
+                            cache: NewsArticleCache, rate_limiter: HostRateLimiter) -> List[Dict[str, Any]]:
+    """
+    Fetch a listing page and parse its news items
+
+    Sends a conditional GET with the cached ETag/Last-Modified; on 304 the
+    items parsed last time are returned without downloading the page.
+
+    Args:
+        session: aiohttp.ClientSession (shared by all sources)
+        url: Listing page URL
+        parse: Callable(html, url) -> JSON-ready items (runs in an executor)
+        cache: Page/article cache
+        rate_limiter: Per-host limiter
+
+    Returns:
+        News items (empty on failure)
+    """
+    page = cache.get_page(url)
+    headers = {}
+    if page is not None:
+        if page.get('etag'):
+            headers['If-None-Match'] = page['etag']
+        if page.get('last_modified'):
+            headers['If-Modified-Since'] = page['last_modified']
+
+    await rate_limiter.wait(url)
+    try:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and page is not None:
+                return page['items']  # Unchanged since the last refresh
+            if response.status != 200:
+                return []
+            content = await response.text()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+    except Exception as e:
+        logger.warning(f"News page {url} failed: {e}")
+        return []
+
+    # HTML parsing is CPU-bound - keep it off the event loop
+    loop = asyncio.get_running_loop()
+    items = await loop.run_in_executor(None, parse, content, url)
+    cache.put_page(url, etag, last_modified, items)
+    return items
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+News Feature Builder
+Vectorized, exponentially decayed news/publication features for single-stock predictors
+
+Turns a frame of dated articles (sentiment, impact, relevance scores, ...)
+into per-trading-day model features with array operations instead of
+per-day Python loops over the article list.
+
+Features:
+- Articles aggregated onto a daily calendar grid (one pass over the articles)
+- Causal exponential decay via convolution, optionally limited to a
+  look-back window (e.g. news from the past 7 days)
+- Decay-weighted sums or weighted means, decayed running maxima,
+  in-window article counts and days since the latest article
+- Works with any object list via articles_to_frame (dataclasses, dicts)
+
+Usage:
+    articles = articles_to_frame(news_articles, {'sentiment': 'sentiment_score'})
+    features = build_decay_features(articles, df.index, ['sentiment'], decay_days=3.0, window_days=7)
+    df['news_sentiment_score'] = features['sentiment']
+"""
+
+import logging
+import math
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Unbounded decay is truncated where weights fall below exp(-DECAY_CUTOFF)
+DECAY_CUTOFF = 40.0
+
+def _as_date(value: Any) -> date:
+    """Calendar date of a datetime/date/string (tz-aware datetimes keep their local date)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return pd.Timestamp(value).date()
+
+def articles_to_frame(articles: Iterable[Any],
+                      columns: Dict[str, Union[str, Callable[[Any], Any]]],
+                      date_attr: str = 'publication_date') -> pd.DataFrame:
+    """
+    Build an articles frame from article objects or dicts
+
+    Args:
+        articles: Article objects (attribute access) or dicts
+        columns: Output column -> attribute/key name, or callable(article) -> value
+                 (None/NaN values are ignored by the feature builder)
+        date_attr: Attribute/key holding the publication date
+
+    Returns:
+        DataFrame with a 'date' column (calendar day) plus the requested columns
+    """
+    def get(article, name):
+        return article.get(name) if isinstance(article, dict) else getattr(article, name, None)
+
+    rows = []
+    for article in articles:
+        row = {'date': _as_date(get(article, date_attr))}
+        for column, source in columns.items():
+            row[column] = source(article) if callable(source) else get(article, source)
+        rows.append(row)
+
+    frame = pd.DataFrame(rows, columns=['date'] + list(columns))
+    frame['date'] = pd.to_datetime(frame['date'])
+    for column in columns:
+        frame[column] = pd.to_numeric(frame[column], errors='coerce')
+    return frame
+
+def _calendar_days(index: pd.DatetimeIndex) -> np.ndarray:
+    """Local calendar day of each timestamp as int64 days since the epoch"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)  # Keep local wall-clock dates
+    return index.normalize().values.astype('datetime64[D]').astype(np.int64)
+
+def build_decay_features(articles: pd.DataFrame,
+                         index: pd.DatetimeIndex,
+                         sum_columns: Optional[List[str]] = None,
+                         decay_days: float = 3.0,
+                         window_days: Optional[int] = None,
+                         normalize: bool = True,
+                         max_columns: Optional[List[str]] = None,
+                         date_column: str = 'date') -> pd.DataFrame:
+    """
+    Exponentially decayed article features for every timestamp in index
+
+    An article published on day p contributes to trading day d (p <= d and,
+    with a window, d - p < window_days) with weight exp(-(d - p) / decay_days).
+
+    Args:
+        articles: Frame with a date column and numeric value columns
+        index: Trading-day index of the price frame
+        sum_columns: Columns aggregated as decay-weighted sums (or weighted
+                     means when normalize=True)
+        decay_days: Decay time constant in days
+        window_days: Look-back window in days (None = unbounded decay)
+        normalize: Divide weighted sums by the sum of weights (weighted mean)
+        max_columns: Columns aggregated as the maximum decayed value
+        date_column: Column holding the publication date
+
+    Returns:
+        DataFrame on index with one column per sum/max column plus
+        'article_count' (articles in the window), 'weight_sum' and
+        'days_since_last' (NaN before the first article). Value columns
+        are 0.0 on days without contributing articles.
+    """
+    sum_columns = list(sum_columns or [])
+    max_columns = list(max_columns or [])
+    output_columns = sum_columns + max_columns + ['article_count', 'weight_sum', 'days_since_last']
+
+    index_days = _calendar_days(index)
+    if articles is None or articles.empty or len(index_days) == 0:
+        features = pd.DataFrame(0.0, index=index, columns=output_columns)
+        features['days_since_last'] = np.nan
+        return features
+
+    article_days = _calendar_days(pd.DatetimeIndex(articles[date_column]))
+
+    # Daily calendar grid covering every article and trading day
+    start = int(min(article_days.min(), index_days.min()))
+    end = int(index_days.max())
+    length = end - start + 1
+    in_range = article_days <= end
+    positions = article_days[in_range] - start
+
+    window = int(window_days) if window_days else int(math.ceil(DECAY_CUTOFF * decay_days)) + 1
+    window = max(1, min(window, length))
+    kernel = np.exp(-np.arange(window) / decay_days)
+
+    def causal(daily: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        # out[t] = sum_k weights[k] * daily[t - k]
+        return np.convolve(daily, weights)[:length]
+
+    # Per-day article counts and value sums (NaN values contribute nothing)
+    counts = np.bincount(positions, minlength=length).astype(float)
+    weight_sum = causal(counts, kernel)
+    grid = {
+        'article_count': causal(counts, np.ones(window)),
+        'weight_sum': weight_sum
+    }
+
+    for column in sum_columns:
+        values = articles[column].to_numpy(dtype=float)[in_range]
+        valid = ~np.isnan(values)
+        daily = np.bincount(positions[valid], weights=values[valid], minlength=length)
+        weighted = causal(daily, kernel)
+        if normalize:
+            daily_weights = causal(np.bincount(positions[valid], minlength=length).astype(float), kernel)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                weighted = np.where(daily_weights > 0, weighted / daily_weights, 0.0)
+        grid[column] = weighted
+
+    for column in max_columns:
+        values = articles[column].to_numpy(dtype=float)[in_range]
+        valid = ~np.isnan(values)
+        daily = np.full(length, -np.inf)
+        np.maximum.at(daily, positions[valid], values[valid])
+        # Row t holds days t, t-1, ..., t-window+1 against kernel weights
+        padded = np.concatenate([np.full(window - 1, -np.inf), daily])
+        lagged = np.lib.stride_tricks.sliding_window_view(padded, window)[:, ::-1]
+        with np.errstate(invalid='ignore'):
+            decayed = np.max(lagged * kernel, axis=1)
+        grid[column] = np.where(np.isfinite(decayed), decayed, 0.0)
+
+    # Days since the latest article on or before each day
+    day_numbers = np.arange(length)
+    last_seen = np.maximum.accumulate(np.where(counts > 0, day_numbers, -1))
+    grid['days_since_last'] = np.where(last_seen >= 0, day_numbers - last_seen, np.nan)
+
+    rows = index_days - start
+    return pd.DataFrame({column: grid[column][rows] for column in output_columns}, index=index)
@@ -0,0 +1,88 @@
+"""
+Test Suite for News Collection
+
+Verifies conditional-GET revalidation of listing pages and that undated
+items served from a 304 are dated at lookup time, not at first parse.
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the CBA modules to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from news_collection import HostRateLimiter, NewsArticleCache, collect_news_page, resolve_publication_date
+
+
+class FakeResponse:
+    def __init__(self, status, text='', headers=None):
+        self.status = status
+        self._text = text
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self):
+        return self._text
+
+
+class FakeSession:
+    """aiohttp session stand-in; responses served in order, requests recorded"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None):
+        self.requests.append((url, dict(headers or {})))
+        return self.responses.pop(0)
+
+
+def test_304_serves_cached_items_and_keeps_undated_items_in_range():
+    """A revalidated page returns its cached items; undated ones never age out"""
+    url = 'https://www.afr.com/companies/financial-services'
+    parsed = []
+
+    def parse(html, page_url):
+        parsed.append(html)
+        return [
+            {'key': f"{page_url}#CBA lifts dividend", 'headline': 'CBA lifts dividend',
+             'publication_date': None},
+            {'key': 'https://www.afr.com/cba-results', 'headline': 'CBA results',
+             'publication_date': '2020-01-15T00:00:00'},
+        ]
+
+    session = FakeSession([
+        FakeResponse(200, '<html>v1</html>', {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+        FakeResponse(304),
+    ])
+    cache = NewsArticleCache(path=None)
+    limiter = HostRateLimiter(default_interval=0)
+
+    first = asyncio.run(collect_news_page(session, url, parse, cache, limiter))
+    second = asyncio.run(collect_news_page(session, url, parse, cache, limiter))
+
+    assert parsed == ['<html>v1</html>']
+    assert second == first
+    sent = session.requests[1][1]
+    assert sent['If-None-Match'] == '"v1"'
+    assert sent['If-Modified-Since'].startswith('Mon, 01 Jan 2024')
+
+    # A refresh well after the first parse: the undated item is still in the
+    # default 30-day window, the dated one keeps its own date
+    later = datetime.now() + timedelta(days=3)
+    start_date = later - timedelta(days=30)
+    undated, dated = second
+    assert start_date <= resolve_publication_date(undated, now=later) <= later
+    assert resolve_publication_date(dated) == datetime(2020, 1, 15)
+
+
+if __name__ == '__main__':
+    test_304_serves_cached_items_and_keeps_undated_items_in_range()
+    print("[OK] ALL TESTS PASSED")
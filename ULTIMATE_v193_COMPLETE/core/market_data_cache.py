@@ -0,0 +1,431 @@
+"""
+Market Data Cache
+
+Server-side quote and chart cache for the unified trading dashboard.
+
+Every dashboard tick used to call yfinance directly: one Ticker.info per
+open position (twice - for the P&L card and the positions list) plus an
+intraday history and an info lookup per market index. With several browser
+tabs open every request was multiplied by the number of viewers.
+
+The cache moves all upstream traffic onto a single background refresher
+thread. Dash callbacks only read from it, so N viewers cost the same
+upstream load as one.
+
+Features:
+- One daemon refresher thread, started on first use
+- Configurable TTL per data type (quote / intraday / info)
+- Quotes for all tracked symbols fetched in one bulk request
+- Symbols are tracked on demand and dropped after they stop being requested
+  (e.g. a closed position)
+- Stale values are kept on upstream failure; per-type age is exposed for the UI
+- fetch_quote() for order entry fetches an unseen symbol immediately; every
+  upstream call (refresher or fetch_quote) is serialized by one fetch lock,
+  since yf.download keeps module-global state and is not thread-safe
+
+Usage:
+    cache = MarketDataCache(ttls={'quote': 30})
+    price = cache.get_quote('CBA.AX')          # None until the first refresh
+    hist = cache.get_intraday('^GSPC')
+    cache.age('quote')                         # seconds since the oldest quote refresh
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+QUOTE = 'quote'
+INTRADAY = 'intraday'
+INFO = 'info'
+
+DEFAULT_TTLS = {
+    QUOTE: 30,       # Live position prices
+    INTRADAY: 300,   # 15-minute index bars
+    INFO: 3600,      # Previous close etc.
+}
+
+PRICE_FIELDS = ('currentPrice', 'regularMarketPrice', 'previousClose')
+INFO_FIELDS = ('currentPrice', 'regularMarketPrice', 'previousClose', 'regularMarketPreviousClose')
+
+
+# ----------------------------------------------------------------------
+# Default yfinance fetchers (called with MarketDataCache._fetch_lock held:
+# refresher thread, or fetch_quote on a callback thread - never concurrently)
+# ----------------------------------------------------------------------
+
+def _price_from_info(info: Dict) -> Optional[float]:
+    """First positive price field of a yfinance info dict"""
+    for field in PRICE_FIELDS:
+        value = info.get(field)
+        if value and value > 0:
+            return float(value)
+    return None
+
+
+def fetch_quotes(symbols: List[str]) -> Dict[str, float]:
+    """
+    Latest price for many symbols in one yfinance request
+
+    Uses the last 5-minute bar of a 5-day window (covers weekends and
+    holidays). Symbols missing from the bulk result fall back to
+    Ticker.info.
+    """
+    import yfinance as yf
+
+    quotes: Dict[str, float] = {}
+    try:
+        data = yf.download(symbols, period='5d', interval='5m', progress=False,
+                           threads=False, auto_adjust=False)
+        if data is not None and not data.empty and 'Close' in data:
+            closes = data['Close']
+            if getattr(closes, 'ndim', 2) == 1:
+                closes = closes.to_frame(name=symbols[0])
+            for symbol in symbols:
+                if symbol in closes:
+                    series = closes[symbol].dropna()
+                    if len(series) > 0 and series.iloc[-1] > 0:
+                        quotes[symbol] = float(series.iloc[-1])
+    except Exception as e:
+        logger.warning(f"[MARKET CACHE] Bulk quote download failed: {e}")
+
+    for symbol in symbols:
+        if symbol in quotes:
+            continue
+        try:
+            price = _price_from_info(yf.Ticker(symbol).info)
+            if price is not None:
+                quotes[symbol] = price
+        except Exception as e:
+            logger.debug(f"[MARKET CACHE] Quote fallback failed for {symbol}: {e}")
+
+    return quotes
+
+
+def fetch_intraday(symbols: List[str]) -> Dict[str, Any]:
+    """5 days of 15-minute bars per symbol (tz-aware index, as Ticker.history returns)"""
+    import yfinance as yf
+
+    frames = {}
+    for symbol in symbols:
+        try:
+            hist = yf.Ticker(symbol).history(period='5d', interval='15m')
+            if hist is not None and len(hist) > 0:
+                frames[symbol] = hist
+        except Exception as e:
+            logger.debug(f"[MARKET CACHE] Intraday history failed for {symbol}: {e}")
+    return frames
+
+
+def fetch_info(symbols: List[str]) -> Dict[str, Dict]:
+    """Slow-moving info fields (previous close, last price) per symbol"""
+    import yfinance as yf
+
+    infos = {}
+    for symbol in symbols:
+        try:
+            info = yf.Ticker(symbol).info or {}
+            infos[symbol] = {field: info.get(field) for field in INFO_FIELDS}
+        except Exception as e:
+            logger.debug(f"[MARKET CACHE] Info lookup failed for {symbol}: {e}")
+    return infos
+
+
+DEFAULT_FETCHERS = {
+    QUOTE: fetch_quotes,
+    INTRADAY: fetch_intraday,
+    INFO: fetch_info,
+}
+
+
+class MarketDataCache:
+    """
+    Thread-safe market data cache with a single background refresher
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None,
+                 fetchers: Optional[Dict[str, Callable[[List[str]], Dict[str, Any]]]] = None,
+                 poll_interval: float = 1.0, idle_expiry: float = 600.0):
+        """
+        Initialize cache
+
+        Args:
+            ttls: Seconds before each data type is refreshed (merged over DEFAULT_TTLS)
+            fetchers: Callable(symbols) -> {symbol: value} per data type
+                      (default: yfinance fetchers)
+            poll_interval: Refresher wake-up interval (seconds)
+            idle_expiry: Stop refreshing a symbol not requested for this long (seconds)
+        """
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.fetchers = dict(DEFAULT_FETCHERS)
+        self.fetchers.update(fetchers or {})
+        self.poll_interval = poll_interval
+        self.idle_expiry = idle_expiry
+
+        # (kind, symbol) -> value / refresh time / last refresh attempt / last request
+        self._values: Dict[Tuple[str, str], Any] = {}
+        self._fetched_at: Dict[Tuple[str, str], float] = {}
+        self._attempted_at: Dict[Tuple[str, str], float] = {}
+        self._requested_at: Dict[Tuple[str, str], float] = {}
+
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()  # Serializes upstream (yfinance) calls
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {'hits': 0, 'misses': 0, 'refreshes': 0, 'upstream_calls': 0, 'failures': 0}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'MarketDataCache':
+        """
+        Build a cache from the 'market_data_cache' section of config.json
+
+        Keys: quote_ttl_seconds (30), intraday_ttl_seconds (300),
+        info_ttl_seconds (3600), idle_expiry_seconds (600)
+        """
+        return cls(
+            ttls={
+                QUOTE: config.get('quote_ttl_seconds', DEFAULT_TTLS[QUOTE]),
+                INTRADAY: config.get('intraday_ttl_seconds', DEFAULT_TTLS[INTRADAY]),
+                INFO: config.get('info_ttl_seconds', DEFAULT_TTLS[INFO]),
+            },
+            idle_expiry=config.get('idle_expiry_seconds', 600.0)
+        )
+
+    # ------------------------------------------------------------------
+    # Refresher thread
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the refresher thread (idempotent)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='MarketDataCache', daemon=True)
+            self._thread.start()
+        logger.info(f"[MARKET CACHE] Refresher started (TTLs: {self.ttls})")
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the refresher thread"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh_due()
+            except Exception as e:
+                logger.error(f"[MARKET CACHE] Refresh cycle failed: {e}", exc_info=True)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _due(self, now: float) -> Dict[str, List[str]]:
+        """Group tracked symbols whose TTL has expired by data type (lock held)"""
+        due: Dict[str, List[str]] = {}
+        for key, requested in list(self._requested_at.items()):
+            kind, symbol = key
+            if now - requested > self.idle_expiry:
+                # Nobody has asked for it in a while (closed position, index removed)
+                self._requested_at.pop(key, None)
+                self._values.pop(key, None)
+                self._fetched_at.pop(key, None)
+                self._attempted_at.pop(key, None)
+                continue
+            last = self._attempted_at.get(key)
+            if last is None or now - last >= self.ttls.get(kind, DEFAULT_TTLS[QUOTE]):
+                due.setdefault(kind, []).append(symbol)
+        return due
+
+    def refresh_due(self) -> int:
+        """
+        Refresh every tracked entry whose TTL has expired
+
+        One fetcher call per data type, covering all due symbols.
+
+        Returns:
+            Number of entries refreshed
+        """
+        now = time.time()
+        with self._lock:
+            due = self._due(now)
+            for kind, symbols in due.items():
+                for symbol in symbols:
+                    self._attempted_at[(kind, symbol)] = now
+
+        refreshed = 0
+        for kind, symbols in due.items():
+            fetcher = self.fetchers.get(kind)
+            if fetcher is None:
+                continue
+            self._count('upstream_calls')
+            try:
+                with self._fetch_lock:
+                    values = fetcher(symbols) or {}
+            except Exception as e:
+                # Keep serving the stale values; retry after the TTL
+                self._count('failures')
+                logger.warning(f"[MARKET CACHE] {kind} refresh failed for {len(symbols)} symbols: {e}")
+                continue
+
+            fetched_at = time.time()
+            with self._lock:
+                for symbol, value in values.items():
+                    if value is None:
+                        continue
+                    self._values[(kind, symbol)] = value
+                    self._fetched_at[(kind, symbol)] = fetched_at
+                    refreshed += 1
+            missing = len(symbols) - len(values)
+            logger.debug(f"[MARKET CACHE] {kind}: {len(values)}/{len(symbols)} refreshed"
+                         + (f" ({missing} unavailable)" if missing else ""))
+
+        self._count('refreshes', refreshed)
+        return refreshed
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    # ------------------------------------------------------------------
+    # Access (never blocks on upstream)
+    # ------------------------------------------------------------------
+
+    def get(self, kind: str, symbol: str) -> Optional[Any]:
+        """
+        Cached value for a symbol, tracking it for background refresh
+
+        A symbol seen for the first time returns None and wakes the
+        refresher; callers show their fallback until the next tick.
+        """
+        if self._thread is None:
+            self.start()
+        key = (kind, symbol)
+        with self._lock:
+            self._requested_at[key] = time.time()
+            if key in self._values:
+                self.stats['hits'] += 1
+                return self._values[key]
+            self.stats['misses'] += 1
+            wake = key not in self._attempted_at
+        if wake:
+            self._wake.set()
+        return None
+
+    def track(self, kind: str, symbols: Iterable[str]):
+        """Register symbols for background refresh without reading them"""
+        if self._thread is None:
+            self.start()
+        now = time.time()
+        wake = False
+        with self._lock:
+            for symbol in symbols:
+                key = (kind, symbol)
+                self._requested_at[key] = now
+                wake = wake or key not in self._attempted_at
+        if wake:
+            self._wake.set()
+
+    def get_quote(self, symbol: str) -> Optional[float]:
+        """Latest cached price, or None"""
+        return self.get(QUOTE, symbol)
+
+    def get_intraday(self, symbol: str):
+        """Cached 5-day 15-minute history DataFrame, or None"""
+        return self.get(INTRADAY, symbol)
+
+    def get_info(self, symbol: str) -> Dict:
+        """Cached info fields (empty dict until the first refresh)"""
+        return self.get(INFO, symbol) or {}
+
+    def fetch_quote(self, symbol: str) -> Optional[float]:
+        """
+        Price for order entry: the cached quote while within its TTL,
+        otherwise fetched immediately (blocking) and stored for other readers
+
+        Unlike get_quote this never returns None just because the symbol is
+        new to the cache - use it only where a price is needed right now.
+        """
+        key = (QUOTE, symbol)
+        with self._lock:
+            self._requested_at[key] = time.time()
+
+        # Wait for any refresher download, then re-check: it may have just
+        # fetched this symbol
+        with self._fetch_lock:
+            with self._lock:
+                fetched_at = self._fetched_at.get(key)
+                if fetched_at is not None and time.time() - fetched_at < self.ttls[QUOTE]:
+                    self.stats['hits'] += 1
+                    return self._values[key]
+                self.stats['upstream_calls'] += 1
+            try:
+                price = (self.fetchers[QUOTE]([symbol]) or {}).get(symbol)
+            except Exception as e:
+                self._count('failures')
+                logger.warning(f"[MARKET CACHE] Quote fetch failed for {symbol}: {e}")
+                price = None
+
+        with self._lock:
+            if price is None:
+                return self._values.get(key)  # Stale value beats none
+            now = time.time()
+            self._values[key] = price
+            self._fetched_at[key] = now
+            self._attempted_at[key] = now
+        return price
+
+    def age(self, kind: str, symbol: Optional[str] = None) -> Optional[float]:
+        """
+        Seconds since the data was refreshed
+
+        Args:
+            kind: Data type (quote / intraday / info)
+            symbol: Single symbol, or None for the oldest tracked entry of that type
+
+        Returns:
+            Age in seconds, or None if nothing has been fetched yet
+        """
+        now = time.time()
+        with self._lock:
+            if symbol is not None:
+                fetched = self._fetched_at.get((kind, symbol))
+                return now - fetched if fetched is not None else None
+            times = [t for (k, _), t in self._fetched_at.items() if k == kind]
+        return now - min(times) if times else None
+
+    def version(self, kind: str, symbols: Iterable[str]) -> str:
+        """
+        Fingerprint of the refresh times of some cached entries
+
+        Changes whenever any of them is refreshed, so callers can skip
+        rebuilding views of data that has not moved. Also keeps the symbols
+        tracked, since a skipped view does not read them.
+        """
+        symbols = list(symbols)
+        self.track(kind, symbols)
+        with self._lock:
+            stamps = [self._fetched_at.get((kind, symbol)) for symbol in symbols]
+        return '|'.join(f"{stamp:.3f}" if stamp is not None else '-' for stamp in stamps)
+
+    def describe_age(self) -> str:
+        """Short UI label, e.g. 'quotes 12s, charts 2m'"""
+        parts = []
+        for kind, label in ((QUOTE, 'quotes'), (INTRADAY, 'charts')):
+            age = self.age(kind)
+            if age is None:
+                continue
+            parts.append(f"{label} {int(age)}s" if age < 120 else f"{label} {int(age // 60)}m")
+        return ', '.join(parts) if parts else 'loading'
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counts, upstream calls and tracked entries"""
+        with self._lock:
+            tracked = len(self._requested_at)
+            stats = dict(self.stats)
+        return {**stats, 'tracked': tracked, 'ttls': dict(self.ttls)}
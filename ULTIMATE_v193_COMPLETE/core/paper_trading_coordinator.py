@@ -57,7 +57,9 @@ os.environ['HF_HUB_DISABLE_IMPLICIT_TOKEN'] = '1'
 import logging
 import json
 import time
+import threading
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
@@ -334,6 +336,12 @@ class PaperTradingCoordinator:
         self.last_ml_signals = {}
         self.decision_history = []
         
+        # Per-cycle quote snapshot: symbol -> (price, fetched_at)
+        self._quote_snapshot: Dict[str, Tuple[float, float]] = {}
+        self._quote_lock = threading.Lock()
+        self.quote_ttl_seconds = self.config.get('quote_snapshot', {}).get('ttl_seconds', 30)
+        self.entry_workers = max(1, int(self.config.get('entry_evaluation', {}).get('max_workers', 4)))
+        
         # Initialize tax audit trail
         if TAX_AUDIT_AVAILABLE:
             self.tax_audit = TaxAuditTrail(base_path="tax_records")
@@ -440,6 +448,12 @@ class PaperTradingCoordinator:
             'intraday_monitoring': {
                 'scan_interval_minutes': 15,
                 'breakout_threshold': 70.0
+            },
+            'quote_snapshot': {
+                'ttl_seconds': 30  # Quotes younger than this are reused within/between cycles
+            },
+            'entry_evaluation': {
+                'max_workers': 4  # Parallel signal generation for entry candidates (1 = sequential)
             }
         }
     
@@ -1158,6 +1172,134 @@ class PaperTradingCoordinator:
             logger.error(f"Error fetching data for {symbol}: {e}")
             return None
     
+    @staticmethod
+    def _price_from_quote(symbol: str, stock_data) -> Optional[float]:
+        """
+        Pick the best available price from a yahooquery price quote
+        
+        Order: regularMarketPrice (live) -> postMarketPrice (after-hours) ->
+        preMarketPrice (before open) -> regularMarketPreviousClose (closed)
+        """
+        if not isinstance(stock_data, dict):
+            return None
+        
+        # Try regular market price (during trading hours)
+        price = stock_data.get('regularMarketPrice')
+        if price and price > 0:
+            return float(price)
+        
+        # Try post-market price (after-hours trading)
+        price = stock_data.get('postMarketPrice')
+        if price and price > 0:
+            logger.debug(f"{symbol}: Using post-market price USD{price:.2f}")
+            return float(price)
+        
+        # Try pre-market price (before market opens)
+        price = stock_data.get('preMarketPrice')
+        if price and price > 0:
+            logger.debug(f"{symbol}: Using pre-market price USD{price:.2f}")
+            return float(price)
+        
+        # Fallback to previous close (market closed)
+        price = stock_data.get('regularMarketPreviousClose')
+        if price and price > 0:
+            logger.debug(f"{symbol}: Using previous close USD{price:.2f} (market closed)")
+            return float(price)
+        
+        return None
+    
+    def _snapshot_price(self, symbol: str) -> Optional[float]:
+        """Price from the quote snapshot if younger than the TTL"""
+        with self._quote_lock:
+            entry = self._quote_snapshot.get(symbol)
+        if entry and time.time() - entry[1] < self.quote_ttl_seconds:
+            return entry[0]
+        return None
+    
+    def _store_quote(self, symbol: str, price: float):
+        with self._quote_lock:
+            self._quote_snapshot[symbol] = (price, time.time())
+    
+    def refresh_quote_snapshot(self, symbols: List[str]) -> int:
+        """
+        Fetch quotes for many symbols in one bulk request
+        
+        Called at the start of each trading cycle so that position updates,
+        early-exit checks and entries all read the same prices instead of
+        issuing one request per symbol per step. Symbols missing from the
+        bulk response fall back to a per-symbol fetch when first used.
+        
+        Args:
+            symbols: Open positions and entry candidates
+            
+        Returns:
+            Number of symbols with a fresh quote
+        """
+        symbols = [s for s in dict.fromkeys(symbols) if self._snapshot_price(s) is None]
+        if not symbols or not YAHOOQUERY_AVAILABLE:
+            return 0
+        
+        start = time.time()
+        try:
+            quotes = Ticker(symbols, asynchronous=True).price
+        except Exception as e:
+            logger.warning(f"[QUOTES] Bulk quote request failed, using per-symbol fetches: {e}")
+            return 0
+        
+        refreshed = 0
+        if isinstance(quotes, dict):
+            for symbol in symbols:
+                price = self._price_from_quote(symbol, quotes.get(symbol))
+                if price is not None:
+                    self._store_quote(symbol, price)
+                    refreshed += 1
+        
+        missing = len(symbols) - refreshed
+        logger.info(f"[QUOTES] Snapshot: {refreshed}/{len(symbols)} quotes in {time.time() - start:.1f}s"
+                    + (f" ({missing} will use per-symbol fallback)" if missing else ""))
+        return refreshed
+    
+    def prefetch_market_data(self, symbols: List[str], period: str = "3mo") -> Dict[str, pd.DataFrame]:
+        """
+        Fetch history for many symbols in one bulk yahooquery request
+        
+        Frames have the same layout as fetch_market_data(). Symbols missing
+        from the result are fetched individually by the caller.
+        
+        Args:
+            symbols: Stock symbols
+            period: Data period (1mo, 3mo, 6mo, 1y)
+            
+        Returns:
+            Dictionary mapping symbol -> OHLCV DataFrame
+        """
+        if not symbols or not YAHOOQUERY_AVAILABLE:
+            return {}
+        
+        frames = {}
+        try:
+            hist = Ticker(list(symbols), asynchronous=True).history(period=period)
+            
+            if isinstance(hist, dict):
+                groups = [(symbol, data) for symbol, data in hist.items() if isinstance(data, pd.DataFrame)]
+            elif isinstance(hist, pd.DataFrame) and not hist.empty and 'symbol' in hist.index.names:
+                groups = hist.groupby(level='symbol', sort=False)
+            else:
+                groups = []
+            
+            for symbol, data in groups:
+                if data.empty:
+                    continue
+                data = data.copy()
+                # Normalize columns
+                data.columns = [col.capitalize() for col in data.columns]
+                frames[symbol] = data
+        except Exception as e:
+            logger.warning(f"Bulk history request failed, using per-symbol fetches: {e}")
+        
+        logger.info(f"[OK] Prefetched {len(frames)}/{len(symbols)} histories ({period}) in one request")
+        return frames
+    
     def fetch_current_price(self, symbol: str) -> Optional[float]:
         """
         Fetch current price for a symbol (v190: Enhanced after-hours support)
@@ -1173,37 +1315,24 @@ class PaperTradingCoordinator:
         - Fallback to postMarketPrice (after-hours)
         - Fallback to previousClose (market closed)
         - Fallback to yfinance historical data
+        
+        Prices from the per-cycle quote snapshot (refresh_quote_snapshot) are
+        reused while younger than quote_snapshot.ttl_seconds.
         """
+        price = self._snapshot_price(symbol)
+        if price is not None:
+            return price
+        
         try:
             if YAHOOQUERY_AVAILABLE:
                 ticker = Ticker(symbol)
                 quote = ticker.price
                 
                 if isinstance(quote, dict) and symbol in quote:
-                    stock_data = quote[symbol]
-                    
-                    # Try regular market price (during trading hours)
-                    price = stock_data.get('regularMarketPrice')
-                    if price and price > 0:
-                        return float(price)
-                    
-                    # Try post-market price (after-hours trading)
-                    price = stock_data.get('postMarketPrice')
-                    if price and price > 0:
-                        logger.debug(f"{symbol}: Using post-market price USD{price:.2f}")
-                        return float(price)
-                    
-                    # Try pre-market price (before market opens)
-                    price = stock_data.get('preMarketPrice')
-                    if price and price > 0:
-                        logger.debug(f"{symbol}: Using pre-market price USD{price:.2f}")
-                        return float(price)
-                    
-                    # Fallback to previous close (market closed)
-                    price = stock_data.get('regularMarketPreviousClose')
-                    if price and price > 0:
-                        logger.debug(f"{symbol}: Using previous close USD{price:.2f} (market closed)")
-                        return float(price)
+                    price = self._price_from_quote(symbol, quote[symbol])
+                    if price is not None:
+                        self._store_quote(symbol, price)
+                        return price
             
             # Fallback to yfinance
             if YFINANCE_AVAILABLE:
@@ -1213,6 +1342,7 @@ class PaperTradingCoordinator:
                 if not hist.empty:
                     price = float(hist['Close'].iloc[-1])
                     logger.debug(f"{symbol}: Using yfinance close USD{price:.2f}")
+                    self._store_quote(symbol, price)
                     return price
             
             logger.warning(f"Could not fetch current price for {symbol}")
@@ -1885,24 +2015,91 @@ class PaperTradingCoordinator:
     # POSITION MANAGEMENT
     # =========================================================================
     
-    def evaluate_entry(self, symbol: str) -> Tuple[bool, float, Dict]:
+    def _generate_entry_signal(self, symbol: str, price_data: Optional[pd.DataFrame] = None) -> Optional[Dict]:
         """
-        Evaluate if we should enter a position - INTEGRATED VERSION
+        Data fetch + signal generation for an entry candidate (no state changes)
         
         Args:
             symbol: Stock symbol
+            price_data: Prefetched 3-month history (fetched here if None)
             
         Returns:
-            (should_enter, confidence, signal)
+            Signal dictionary, or None if no price data
         """
         # Fetch data
-        price_data = self.fetch_market_data(symbol, period="3mo")
+        if price_data is None:
+            price_data = self.fetch_market_data(symbol, period="3mo")
         
         if price_data is None or price_data.empty:
-            return False, 0, {}
+            return None
         
         # Generate signal (uses SwingSignalGenerator if enabled)
-        signal = self.generate_swing_signal(symbol, price_data)
+        return self.generate_swing_signal(symbol, price_data)
+    
+    def evaluate_entry_signals(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Generate entry signals for many candidates in parallel
+        
+        Histories are prefetched in one bulk request; signal generation (ML
+        models, news) runs on a bounded thread pool. No positions, capital or
+        sentiment state is changed here - decisions are applied afterwards,
+        in watchlist order, by _decide_entry().
+        
+        Args:
+            symbols: Entry candidates
+            
+        Returns:
+            Dictionary mapping symbol -> signal (None if no price data)
+        """
+        if not symbols:
+            return {}
+        
+        start = time.time()
+        price_data = self.prefetch_market_data(symbols, period="3mo")
+        
+        def evaluate(symbol: str) -> Optional[Dict]:
+            try:
+                return self._generate_entry_signal(symbol, price_data.get(symbol))
+            except Exception as e:
+                logger.error(f"Error evaluating entry signal for {symbol}: {e}")
+                return None
+        
+        workers = min(self.entry_workers, len(symbols))
+        if workers <= 1:
+            signals = {symbol: evaluate(symbol) for symbol in symbols}
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='entry-eval') as pool:
+                signals = dict(zip(symbols, pool.map(evaluate, symbols)))
+        
+        logger.info(f"[SCAN] Evaluated {len(symbols)} entry candidates in {time.time() - start:.1f}s "
+                    f"({workers} workers)")
+        return signals
+    
+    def evaluate_entry(self, symbol: str) -> Tuple[bool, float, Dict]:
+        """
+        Evaluate if we should enter a position - INTEGRATED VERSION
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            (should_enter, confidence, signal)
+        """
+        return self._decide_entry(symbol, self._generate_entry_signal(symbol))
+    
+    def _decide_entry(self, symbol: str, signal: Optional[Dict]) -> Tuple[bool, float, Dict]:
+        """
+        Apply thresholds, intraday context and position limits to a signal
+        
+        Args:
+            symbol: Stock symbol
+            signal: Signal from _generate_entry_signal() (None = no data)
+            
+        Returns:
+            (should_enter, confidence, signal)
+        """
+        if signal is None:
+            return False, 0, {}
         
         # Capture ML component signals for dashboard
         if signal and 'components' in signal:
@@ -2642,7 +2839,12 @@ class PaperTradingCoordinator:
                 else:
                     self.run_intraday_scan()
             
-                # 3. Update existing positions
+                # 3. Snapshot quotes for positions and entry candidates (one bulk request),
+                #    then update existing positions from it
+            quote_symbols = list(self.positions.keys())
+            if len(self.positions) < self.config['risk_management']['max_total_positions']:
+                quote_symbols += [s for s in open_symbols if s not in self.positions]
+            self.refresh_quote_snapshot(quote_symbols)
             self.update_positions()
             
                 # 4. Check for early exits (intraday breakdowns)
@@ -2675,11 +2877,16 @@ class PaperTradingCoordinator:
             if len(self.positions) < self.config['risk_management']['max_total_positions']:
                 logger.info("[SCAN] Scanning for new entry opportunities...")
                 
-                for symbol in open_symbols:  # Only check symbols where market is open
+                # Signals are generated in parallel; entries are applied one at a
+                # time in watchlist order so capital and position limits stay exact
+                candidates = [s for s in open_symbols if s not in self.positions]  # Only symbols where market is open
+                entry_signals = self.evaluate_entry_signals(candidates)
+                
+                for symbol in candidates:
                     if symbol in self.positions:
                         continue
                     
-                    should_enter, confidence, signal = self.evaluate_entry(symbol)
+                    should_enter, confidence, signal = self._decide_entry(symbol, entry_signals.get(symbol))
                     
                     if should_enter:
                         logger.info(f"[OK] Entry signal for {symbol} - confidence {confidence:.2f}")
@@ -30,9 +30,10 @@ os.environ['HF_HUB_DISABLE_TELEMETRY'] = '1'
 os.environ['HF_HUB_DISABLE_IMPLICIT_TOKEN'] = '1'
 
 import dash
-from dash import dcc, html, Input, Output, State, callback_context
+from dash import dcc, html, Input, Output, State, Patch, callback_context
 import plotly.graph_objs as go
 from datetime import datetime, timedelta
+import hashlib
 import json
 from pathlib import Path
 import pandas as pd
@@ -42,7 +43,6 @@ import threading
 import time
 import sys
 from typing import Dict, List, Optional
-import yfinance as yf
 import pytz
 
 # Add parent directory to path
@@ -81,6 +81,25 @@ except ImportError as e:
     logger.warning(f"Could not import pipeline_report_loader: {e}")
     PIPELINE_LOADER_AVAILABLE = False
 
+# Shared market data cache: one background refresher serves every viewer
+from market_data_cache import MarketDataCache, INTRADAY, INFO
+
+
+def _load_market_data_cache_config() -> Dict:
+    """'market_data_cache' section of config/config.json (TTLs per data type)"""
+    config_path = Path(__file__).parent.parent / 'config' / 'config.json'
+    try:
+        with open(config_path, 'r') as f:
+            return json.load(f).get('market_data_cache', {})
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Could not read market data cache config: {e}")
+        return {}
+
+
+market_data_cache = MarketDataCache.from_config(_load_market_data_cache_config())
+
 # Import market calendar
 try:
     from ml_pipeline.market_calendar import MarketCalendar, Exchange, MarketStatus
@@ -449,8 +468,48 @@ def create_ml_signals_panel(state):
         })
     ])
 
-def create_market_performance_chart(state):
-    """Create intraday performance chart for major indices (market hours only, GMT timezone)"""
+# Market indices with their trading hours (in GMT)
+# Note: Times adjusted for Australian Eastern Daylight Time (AEDT, UTC+11)
+MARKET_INDICES = {
+    '^AORD': {
+        'name': 'ASX All Ords', 
+        'color': '#00CED1',
+        'market_open': 23,   # 23:00 GMT previous day (10:00 AEDT)
+        'market_close': 5,   # 05:00 GMT (16:00 AEDT)
+        'spans_midnight': True  # Market session crosses midnight GMT
+    },
+    '^GSPC': {
+        'name': 'S&P 500', 
+        'color': '#1E90FF',
+        'market_open': 14,  # 14:30 GMT (9:30 EST)
+        'market_close': 21, # 21:00 GMT (16:00 EST)
+        'spans_midnight': False
+    },
+    '^IXIC': {
+        'name': 'NASDAQ', 
+        'color': '#4CAF50',
+        'market_open': 14,  # 14:30 GMT (9:30 EST)
+        'market_close': 21, # 21:00 GMT (16:00 EST)
+        'spans_midnight': False
+    },
+    '^FTSE': {
+        'name': 'FTSE 100', 
+        'color': '#FF9800',
+        'market_open': 8,   # 08:00 GMT
+        'market_close': 16, # 16:30 GMT
+        'spans_midnight': False
+    }
+}
+
+
+def _market_chart_series():
+    """
+    Per-index % change from previous close over the last 24h of market hours
+    
+    Returns:
+        (series, is_weekend) - series is a list of
+        {'name', 'color', 'x', 'y', 'prev_close'} dicts, one per index with data
+    """
     
     from datetime import datetime, timedelta
     
@@ -468,50 +527,18 @@ def create_market_performance_chart(state):
         (current_weekday == 6 and current_hour < 23)  # Sunday before 23:00 GMT
     )
     
-    # Market indices with their trading hours (in GMT)
-    # Note: Times adjusted for Australian Eastern Daylight Time (AEDT, UTC+11)
-    indices = {
-        '^AORD': {
-            'name': 'ASX All Ords', 
-            'color': '#00CED1',
-            'market_open': 23,   # 23:00 GMT previous day (10:00 AEDT)
-            'market_close': 5,   # 05:00 GMT (16:00 AEDT)
-            'spans_midnight': True  # Market session crosses midnight GMT
-        },
-        '^GSPC': {
-            'name': 'S&P 500', 
-            'color': '#1E90FF',
-            'market_open': 14,  # 14:30 GMT (9:30 EST)
-            'market_close': 21, # 21:00 GMT (16:00 EST)
-            'spans_midnight': False
-        },
-        '^IXIC': {
-            'name': 'NASDAQ', 
-            'color': '#4CAF50',
-            'market_open': 14,  # 14:30 GMT (9:30 EST)
-            'market_close': 21, # 21:00 GMT (16:00 EST)
-            'spans_midnight': False
-        },
-        '^FTSE': {
-            'name': 'FTSE 100', 
-            'color': '#FF9800',
-            'market_open': 8,   # 08:00 GMT
-            'market_close': 16, # 16:30 GMT
-            'spans_midnight': False
-        }
-    }
-    
-    fig = go.Figure()
+    indices = MARKET_INDICES
+    series = []
     
     try:
         for symbol, info in indices.items():
             try:
-                # Fetch 5 days of data to ensure we have previous trading day (covers weekends/holidays)
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period='5d', interval='15m')
+                # 5 days of 15m bars from the shared cache (covers weekends/holidays)
+                hist = market_data_cache.get_intraday(symbol)
                 
-                if len(hist) > 0:
-                    # Convert index to GMT timezone
+                if hist is not None and len(hist) > 0:
+                    # Convert index to GMT timezone (copy - the cached frame is shared)
+                    hist = hist.copy()
                     hist.index = hist.index.tz_convert(gmt)
                     
                     # FIX v1.3.15.116: Use 24-hour rolling window instead of single date filter
@@ -564,7 +591,7 @@ def create_market_performance_chart(state):
                     if len(market_hours_data) > 0:
                         # Get previous close - use official close for all markets (most accurate)
                         try:
-                            ticker_info = ticker.info
+                            ticker_info = market_data_cache.get_info(symbol)
                             official_prev_close = ticker_info.get('regularMarketPreviousClose', ticker_info.get('previousClose'))
                             
                             if official_prev_close and official_prev_close > 0:
@@ -607,24 +634,13 @@ def create_market_performance_chart(state):
                         logger.info(f"[MARKET CHART] {symbol}: Adding trace with {non_none_points} points, "
                                    f"pct_change range: {min([x for x in pct_changes if x is not None]):.2f}% to {max([x for x in pct_changes if x is not None]):.2f}%")
                         
-                        # Add line trace for this index
-                        fig.add_trace(go.Scatter(
-                            x=times,
-                            y=pct_changes,
-                            mode='lines',
-                            name=info['name'],
-                            line=dict(
-                                color=info['color'],
-                                width=2
-                            ),
-                            connectgaps=False,  # FIX v1.3.15.117: Don't connect across None values
-                            hovertemplate=(
-                                f"<b>{info['name']}</b><br>"
-                                "Time (GMT): %{x|%H:%M}<br>"
-                                "Change from Prev Close: %{y:.2f}%<br>"
-                                "<extra></extra>"
-                            )
-                        ))
+                        series.append({
+                            'name': info['name'],
+                            'color': info['color'],
+                            'x': times,
+                            'y': pct_changes,
+                            'prev_close': float(previous_close)
+                        })
                     else:
                         logger.warning(f"[MARKET CHART] {symbol}: No market hours data to plot")
                     
@@ -634,17 +650,20 @@ def create_market_performance_chart(state):
     except Exception as e:
         logger.error(f"Error creating market performance chart: {e}")
     
+    return series, is_weekend
+
+
+def _market_chart_window(series, is_weekend):
+    """x-axis range and title for the market chart (shared by full and patch updates)"""
     # Calculate x-axis range to show only 24-hour period
-    # Find the earliest and latest timestamps from all traces
+    # Find the earliest and latest timestamps from all series
     all_times = []
-    for trace in fig.data:
-        if hasattr(trace, 'x') and len(trace.x) > 0:
-            all_times.extend(trace.x)
+    for line in series:
+        all_times.extend(line['x'])
     
     # Set x-axis range if we have data
     xaxis_range = None
     if all_times:
-        from datetime import datetime, timedelta
         import pandas as pd
         
         # Convert to datetime if needed
@@ -673,6 +692,36 @@ def create_market_performance_chart(state):
             'xanchor': 'center'
         }
     
+    return xaxis_range, chart_title
+
+
+def create_market_performance_chart(state, series=None, is_weekend=None):
+    """Create intraday performance chart for major indices (market hours only, GMT timezone)"""
+    if series is None:
+        series, is_weekend = _market_chart_series()
+    xaxis_range, chart_title = _market_chart_window(series, is_weekend)
+    
+    fig = go.Figure()
+    for line in series:
+        # Add line trace for this index
+        fig.add_trace(go.Scatter(
+            x=line['x'],
+            y=line['y'],
+            mode='lines',
+            name=line['name'],
+            line=dict(
+                color=line['color'],
+                width=2
+            ),
+            connectgaps=False,  # FIX v1.3.15.117: Don't connect across None values
+            hovertemplate=(
+                f"<b>{line['name']}</b><br>"
+                "Time (GMT): %{x|%H:%M}<br>"
+                "Change from Prev Close: %{y:.2f}%<br>"
+                "<extra></extra>"
+            )
+        ))
+    
     # Update layout with GMT timezone
     fig.update_layout(
         plot_bgcolor='#1e1e1e',
@@ -725,24 +774,42 @@ def create_market_performance_chart(state):
     return fig
 
 # Load state function
+# Parsed state is reused until the file changes (mtime/size), so every viewer's
+# tick does not re-parse the JSON (v1.3.16: incremental dashboard updates)
+_state_cache = {'key': None, 'state': None}
+_state_cache_lock = threading.Lock()
+
 def load_state():
-    """Load current trading state with validation (STATE_VALIDATION_v85)"""
+    """Load current trading state with validation (STATE_VALIDATION_v85)
+    
+    The returned dict is shared between callbacks - do not modify it.
+    """
     state_file = 'state/paper_trading_state.json'
     
     try:
         if Path(state_file).exists():
+            stat = Path(state_file).stat()
+            
             # Check if file is empty
-            if Path(state_file).stat().st_size == 0:
+            if stat.st_size == 0:
                 logger.warning("[STATE] State file is empty, using default")
                 return get_default_state()
             
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            with _state_cache_lock:
+                if _state_cache['key'] == cache_key:
+                    return _state_cache['state']
+            
             with open(state_file, 'r') as f:
                 state = json.load(f)
             
             # Validate state structure
             required_keys = ['capital', 'positions', 'performance', 'market']
             if all(key in state for key in required_keys):
-                logger.debug(f"[STATE] Loaded valid state ({Path(state_file).stat().st_size} bytes)")
+                logger.debug(f"[STATE] Loaded valid state ({stat.st_size} bytes)")
+                with _state_cache_lock:
+                    _state_cache['key'] = cache_key
+                    _state_cache['state'] = state
                 return state
             else:
                 logger.warning("[STATE] Invalid state structure, using default")
@@ -789,6 +856,74 @@ def get_default_state():
         'closed_trades': []
     }
 
+# ============================================================================
+# Incremental dashboard updates (v1.3.16)
+# ============================================================================
+# Each browser tab keeps a 'dashboard-render-state' store with a signature of
+# what it currently shows per section. A tick only rebuilds and sends the
+# sections whose inputs changed (dash.no_update for the rest), and charts the
+# tab already shows are updated with dash.Patch instead of a full figure.
+
+def _signature(*parts) -> str:
+    """Short stable hash of JSON-serializable section inputs"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+def _live_position_price(pos: Dict) -> float:
+    """Live price of an open position from the shared market data cache
+    
+    Falls back to the state price, then the entry price, until the first refresh.
+    """
+    live_price = market_data_cache.get_quote(pos['symbol'])
+    if live_price and live_price > 0:
+        return live_price
+    return pos.get('current_price') or pos['entry_price']
+
+
+def _market_chart_meta(series) -> Dict:
+    """What a tab needs to remember to patch the market chart it shows"""
+    return {
+        'traces': [[line['name'], round(line['prev_close'], 6)] for line in series],
+        'points': [{'last': str(line['x'][-1]), 'count': len(line['x'])} for line in series],
+    }
+
+
+def _market_chart_patch(series, is_weekend, meta: Optional[Dict]):
+    """
+    Patch the market chart a tab already shows: drop points that left the
+    24h window, revise the forming bar and append new bars
+    
+    Returns:
+        dash.Patch, or None when the traces changed (new day, index
+        appeared/disappeared) and the figure must be redrawn
+    """
+    if not meta or meta.get('traces') != _market_chart_meta(series)['traces']:
+        return None
+    
+    patch = Patch()
+    for i, (line, shown) in enumerate(zip(series, meta['points'])):
+        last_shown = pd.Timestamp(shown['last'])
+        keep = sum(1 for t in line['x'] if t <= last_shown)
+        drop = shown['count'] - keep
+        if keep == 0 or drop < 0:
+            return None
+        
+        # Expired points leave from the front
+        for _ in range(drop):
+            del patch['data'][i]['x'][0]
+            del patch['data'][i]['y'][0]
+        # The last bar shown may still have been forming
+        patch['data'][i]['y'][keep - 1] = line['y'][keep - 1]
+        if len(line['x']) > keep:
+            patch['data'][i]['x'].extend(line['x'][keep:])
+            patch['data'][i]['y'].extend(line['y'][keep:])
+    
+    xaxis_range, chart_title = _market_chart_window(series, is_weekend)
+    patch['layout']['xaxis']['range'] = xaxis_range
+    patch['layout']['title'] = chart_title
+    return patch
+
 # Mobile responsive CSS
 MOBILE_CSS = """
 /* Mobile Responsive CSS for Trading Dashboard */
@@ -1152,6 +1287,9 @@ app.layout = html.Div([
         n_intervals=0
     ),
     
+    # What this tab currently shows, per section (v1.3.16: incremental updates)
+    dcc.Store(id='dashboard-render-state', storage_type='memory'),
+    
     # Current Trading Info
     html.Div(id='trading-info-panel', style={'marginBottom': '20px'}),
     
@@ -1606,47 +1744,79 @@ def run_trading_loop(system):
         Output('portfolio-chart', 'figure'),
         Output('performance-chart', 'figure'),
         Output('positions-list', 'children'),
-        Output('last-update', 'children')
+        Output('last-update', 'children'),
+        Output('dashboard-render-state', 'data')
     ],
-    Input('interval-component', 'n_intervals')
+    Input('interval-component', 'n_intervals'),
+    State('dashboard-render-state', 'data')
 )
-def update_dashboard(n):
-    """Update all dashboard components"""
+def update_dashboard(n, render_state):
+    """Update dashboard components whose inputs changed since this tab's last update"""
     try:
         logger.debug(f"[DASHBOARD] Update cycle {n} starting...")
         state = load_state()
         logger.debug(f"[DASHBOARD] State loaded successfully")
         
-        # Market Status Panel - with error handling
+        # v1.3.16: Section signatures this tab currently shows
+        render_state = render_state or {}
+        shown = render_state.get('sections', {})
+        sections = {}
+        
+        def changed(name, *inputs):
+            """Record a section's signature; True if the tab shows something else"""
+            sections[name] = _signature(*inputs)
+            return shown.get(name) != sections[name]
+        
+        # Market Status Panel - with error handling (shows minute-precision times)
+        market_status_content = dash.no_update
         try:
-            logger.debug("[DASHBOARD] Creating market status panel...")
-            market_status_content = create_market_status_panel()
-            logger.debug("[DASHBOARD] Market status panel created")
+            if changed('market_status', datetime.now().strftime('%Y-%m-%d %H:%M')):
+                logger.debug("[DASHBOARD] Creating market status panel...")
+                market_status_content = create_market_status_panel()
+                logger.debug("[DASHBOARD] Market status panel created")
         except Exception as e:
             logger.error(f"Error creating market status panel: {e}", exc_info=True)
+            sections.pop('market_status', None)
             market_status_content = html.Div("Market status unavailable", style={'color': '#888'})
         
         # ML Signals Panel
+        ml_signals_content = dash.no_update
         try:
-            logger.debug("[DASHBOARD] Creating ML signals panel...")
-            ml_signals_content = create_ml_signals_panel(state)
-            logger.debug("[DASHBOARD] ML signals panel created")
+            if changed('ml_signals', state.get('ml_signals'), state.get('latest_decisions')):
+                logger.debug("[DASHBOARD] Creating ML signals panel...")
+                ml_signals_content = create_ml_signals_panel(state)
+                logger.debug("[DASHBOARD] ML signals panel created")
         except Exception as e:
             logger.error(f"Error creating ML signals panel: {e}", exc_info=True)
+            sections.pop('ml_signals', None)
             ml_signals_content = html.Div("ML signals loading...", style={'color': '#888'})
         
-        # Create 24-hour market performance chart
+        # Create 24-hour market performance chart - only when the cached index data
+        # refreshed, patching the figure the tab already shows where possible
+        market_perf_fig = dash.no_update
+        market_meta = render_state.get('market')
         try:
-            logger.debug("[DASHBOARD] Creating market performance chart...")
-            market_perf_fig = create_market_performance_chart(state)
-            logger.debug("[DASHBOARD] Market performance chart created")
+            index_version = (market_data_cache.version(INTRADAY, MARKET_INDICES),
+                             market_data_cache.version(INFO, MARKET_INDICES))
+            if changed('market_chart', index_version):
+                logger.debug("[DASHBOARD] Creating market performance chart...")
+                series, is_weekend = _market_chart_series()
+                market_perf_fig = _market_chart_patch(series, is_weekend, market_meta)
+                if market_perf_fig is None:
+                    market_perf_fig = create_market_performance_chart(state, series, is_weekend)
+                market_meta = _market_chart_meta(series)
+                logger.debug("[DASHBOARD] Market performance chart created")
         except Exception as e:
             logger.error(f"Error creating market performance chart: {e}", exc_info=True)
+            sections.pop('market_chart', None)
+            market_meta = None
             market_perf_fig = go.Figure()
             market_perf_fig.update_layout(plot_bgcolor='#1e1e1e', paper_bgcolor='#2a2a2a')
         
         # Trading info panel
-        if state['symbols'] and len(state['symbols']) > 0:
+        if not changed('trading_info', state['symbols']):
+            trading_info = dash.no_update
+        elif state['symbols'] and len(state['symbols']) > 0:
             trading_info = html.Div([
                 html.H3('[#] Currently Trading', style={'color': '#4CAF50', 'margin': '0 0 10px 0'}),
                 html.P(', '.join(state['symbols']), 
@@ -1672,6 +1842,7 @@ def update_dashboard(n):
         # v193.3 FIX: Calculate live total unrealized P&L from all positions
         live_unrealized_pnl = 0.0
         live_position_count = 0
+        position_prices = {}
         if state['positions']['open']:
             for pos in state['positions']['open']:
                 try:
@@ -1679,13 +1850,9 @@ def update_dashboard(n):
                     entry_price = pos['entry_price']
                     shares = pos['shares']
                     
-                    # Fetch live price
-                    ticker = yf.Ticker(symbol)
-                    ticker_info = ticker.info
-                    current_price = (ticker_info.get('currentPrice') or 
-                                    ticker_info.get('regularMarketPrice') or
-                                    ticker_info.get('previousClose') or
-                                    entry_price)
+                    # Live price from the shared cache (state price until the first refresh)
+                    current_price = _live_position_price(pos)
+                    position_prices[symbol] = current_price
                     
                     if current_price and current_price > 0:
                         position_pnl = (current_price - entry_price) * shares
@@ -1731,6 +1898,15 @@ def update_dashboard(n):
                 market_name = list(breakdown.keys())[0].upper() if breakdown else 'UNKNOWN'
                 market_breakdown_display = f"({market_name} Market)"
         
+        metrics = (
+            total_capital, total_return,
+            position_count, unrealized_pnl,
+            win_rate, total_trades,
+            market_sentiment, f"{sentiment_class} {market_breakdown_display}"
+        )
+        if not changed('metrics', metrics):
+            metrics = (dash.no_update,) * len(metrics)
+        
         # FinBERT Sentiment Panel - Load from morning report
         finbert_panel = html.Div("FinBERT data loading...", style={'color': '#888'})
         gate_status = html.Div()
@@ -1750,7 +1926,9 @@ def update_dashboard(n):
             
             morning_sentiment = sentiment_int.load_morning_sentiment()
             
-            if morning_sentiment and 'finbert_sentiment' in morning_sentiment:
+            if not changed('finbert', morning_sentiment):
+                finbert_panel = gate_status = dash.no_update
+            elif morning_sentiment and 'finbert_sentiment' in morning_sentiment:
                 finbert = morning_sentiment['finbert_sentiment']
                 scores = finbert.get('overall_scores', {})
                 
@@ -1855,106 +2033,112 @@ def update_dashboard(n):
                 })
         except Exception as e:
             logger.error(f"Error loading FinBERT sentiment: {e}")
+            sections.pop('finbert', None)
     
         # Portfolio chart
-        portfolio_fig = go.Figure()
-        
         # Generate 30-day history (simplified for now)
-        dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
+        today = pd.Timestamp(datetime.now()).normalize()
+        dates = pd.date_range(end=today, periods=30, freq='D')
         initial = state['capital']['initial'] if state['capital']['initial'] > 0 else 100000
         current = state['capital']['total'] if state['capital']['total'] > 0 else initial
         values = np.linspace(initial, current, 30)
-        
-        portfolio_fig.add_trace(go.Scatter(
-            x=dates,
-            y=values,
-            mode='lines',
-            name='Portfolio Value',
-            line=dict(color='#4CAF50', width=2),
-            fill='tozeroy',
-            fillcolor='rgba(76, 175, 80, 0.2)'
-        ))
-        
-        portfolio_fig.update_layout(
-            plot_bgcolor='#1e1e1e',
-            paper_bgcolor='#2a2a2a',
-            font=dict(color='#ffffff'),
-            xaxis=dict(
-                showgrid=False, 
-                zeroline=False, 
-                fixedrange=True,
-                automargin=False
-            ),
-            yaxis=dict(
-                showgrid=True, 
-                gridcolor='#333', 
-                zeroline=False,
-                fixedrange=True,
-                range=[initial * 0.95, max(current * 1.05, initial * 1.05)],
-                automargin=False,
-                tickformat='USD,.0f'
-            ),
-            margin=dict(l=80, r=30, t=30, b=50, autoexpand=False),
-            showlegend=False,
-            height=250,
-            width=650,
-            autosize=False,
-            hovermode='x unified',
-            uirevision='portfolio_chart_v1'
-        )
+        yaxis_range = [initial * 0.95, max(current * 1.05, initial * 1.05)]
+        
+        day_changed = changed('portfolio_day', str(today))
+        if not changed('portfolio', initial, current, str(today)):
+            portfolio_fig = dash.no_update
+        elif not day_changed:
+            # Same dates on screen - only the values and scale move
+            portfolio_fig = Patch()
+            portfolio_fig['data'][0]['y'] = values.tolist()
+            portfolio_fig['layout']['yaxis']['range'] = yaxis_range
+        else:
+            portfolio_fig = go.Figure()
+            
+            portfolio_fig.add_trace(go.Scatter(
+                x=dates,
+                y=values,
+                mode='lines',
+                name='Portfolio Value',
+                line=dict(color='#4CAF50', width=2),
+                fill='tozeroy',
+                fillcolor='rgba(76, 175, 80, 0.2)'
+            ))
+            
+            portfolio_fig.update_layout(
+                plot_bgcolor='#1e1e1e',
+                paper_bgcolor='#2a2a2a',
+                font=dict(color='#ffffff'),
+                xaxis=dict(
+                    showgrid=False, 
+                    zeroline=False, 
+                    fixedrange=True,
+                    automargin=False
+                ),
+                yaxis=dict(
+                    showgrid=True, 
+                    gridcolor='#333', 
+                    zeroline=False,
+                    fixedrange=True,
+                    range=yaxis_range,
+                    automargin=False,
+                    tickformat='USD,.0f'
+                ),
+                margin=dict(l=80, r=30, t=30, b=50, autoexpand=False),
+                showlegend=False,
+                height=250,
+                width=650,
+                autosize=False,
+                hovermode='x unified',
+                uirevision='portfolio_chart_v1'
+            )
         
         # Performance chart
         perf = state['performance']
+        perf_values = [
+            perf['winning_trades'],
+            perf['losing_trades'],
+            state['positions']['count']
+        ]
         
-        performance_fig = go.Figure(data=[go.Pie(
-            labels=['Wins', 'Losses', 'Open'],
-            values=[
-                perf['winning_trades'],
-                perf['losing_trades'],
-                state['positions']['count']
-            ],
-            marker=dict(colors=['#4CAF50', '#F44336', '#2196F3']),
-            hole=0.4
-        )])
-        
-        performance_fig.update_layout(
-            plot_bgcolor='#1e1e1e',
-            paper_bgcolor='#2a2a2a',
-            font=dict(color='#ffffff'),
-            margin=dict(l=20, r=20, t=20, b=20, autoexpand=False),
-            showlegend=True,
-            height=250,
-            width=350,
-            autosize=False,
-            uirevision='performance_chart_v1'
-        )
+        if not changed('performance', perf_values):
+            performance_fig = dash.no_update
+        elif 'performance' in shown:
+            performance_fig = Patch()
+            performance_fig['data'][0]['values'] = perf_values
+        else:
+            performance_fig = go.Figure(data=[go.Pie(
+                labels=['Wins', 'Losses', 'Open'],
+                values=perf_values,
+                marker=dict(colors=['#4CAF50', '#F44336', '#2196F3']),
+                hole=0.4
+            )])
+            
+            performance_fig.update_layout(
+                plot_bgcolor='#1e1e1e',
+                paper_bgcolor='#2a2a2a',
+                font=dict(color='#ffffff'),
+                margin=dict(l=20, r=20, t=20, b=20, autoexpand=False),
+                showlegend=True,
+                height=250,
+                width=350,
+                autosize=False,
+                uirevision='performance_chart_v1'
+            )
         
         # Positions list
         positions_children = []
         
-        if state['positions']['open']:
+        if not changed('positions', state['positions']['open'], position_prices):
+            positions_children = dash.no_update
+        elif state['positions']['open']:
             for pos in state['positions']['open']:
                 symbol = pos['symbol']
                 entry_price = pos['entry_price']
                 shares = pos['shares']
                 
-                # v193.3 FIX: Fetch live current price for each position
-                current_price = entry_price  # Fallback to entry price
-                try:
-                    ticker = yf.Ticker(symbol)
-                    ticker_info = ticker.info
-                    # Try multiple price fields in order of preference
-                    live_price = (ticker_info.get('currentPrice') or 
-                                 ticker_info.get('regularMarketPrice') or
-                                 ticker_info.get('previousClose') or
-                                 entry_price)
-                    if live_price and live_price > 0:
-                        current_price = live_price
-                        logger.debug(f"[DASHBOARD v193.3] {symbol}: Live price USD{current_price:.2f}")
-                except Exception as e:
-                    logger.warning(f"[DASHBOARD v193.3] Failed to fetch live price for {symbol}: {e}")
-                    # Use price from state if available, otherwise entry price
-                    current_price = pos.get('current_price', entry_price)
+                # v193.3 FIX: Live current price for each position (shared market data cache)
+                current_price = position_prices.get(symbol) or _live_position_price(pos)
                 
                 # Calculate P&L with live price
                 unrealized_pnl = (current_price - entry_price) * shares
@@ -1991,21 +2175,24 @@ def update_dashboard(n):
             )
         
         # Last update
-        last_update = f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        last_update = (f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
+                       f"Market data age: {market_data_cache.describe_age()}")
+        
+        skipped = sum(1 for name in sections if shown.get(name) == sections[name])
+        logger.debug(f"[DASHBOARD] Update cycle {n}: {len(sections) - skipped} sections sent, "
+                     f"{skipped} unchanged")
         
         return (
             trading_info,
             market_status_content,
             ml_signals_content,
             market_perf_fig,
-            total_capital, total_return,
-            position_count, unrealized_pnl,
-            win_rate, total_trades,
-            market_sentiment, f"{sentiment_class} {market_breakdown_display}",
+            *metrics,
             finbert_panel, gate_status,
             portfolio_fig, performance_fig,
             positions_children,
-            last_update
+            last_update,
+            {'sections': sections, 'market': market_meta}
         )
         
     except Exception as e:
@@ -2027,7 +2214,8 @@ def update_dashboard(n):
             html.Div(),  # gate_status
             empty_fig, empty_fig,  # charts
             [html.Div("Loading...")],  # positions list
-            f"Error: {str(e)[:100]}"  # last_update
+            f"Error: {str(e)[:100]}",  # last_update
+            None  # render state: redraw everything next tick
         )
 
 # Tax report callbacks
@@ -2204,49 +2392,12 @@ def handle_force_trade(buy_clicks, sell_clicks, symbol, confidence, stop_loss):
 def execute_force_buy(system, symbol, confidence, stop_loss):
     """Execute a forced buy trade using PaperTradingCoordinator.enter_position() (FIX v193.11.6)"""
     try:
-        # Get current price (FIX v1.3.15.161: Better error handling)
-        import yfinance as yf
-        ticker = yf.Ticker(symbol)
-        
-        # Try multiple methods to get price
-        current_price = None
-        error_details = []
-        
-        # Method 1: regularMarketPrice from info
-        try:
-            current_price = ticker.info.get('regularMarketPrice')
-            if current_price and current_price > 0:
-                logger.info(f"[OK] {symbol} price from info: USD{current_price:.2f}")
-        except Exception as e:
-            error_details.append(f"info failed: {e}")
-        
-        # Method 2: Latest close from history
-        if not current_price:
-            try:
-                hist = ticker.history(period='1d')
-                if not hist.empty and 'Close' in hist.columns:
-                    current_price = hist['Close'].iloc[-1]
-                    logger.info(f"[OK] {symbol} price from history: USD{current_price:.2f}")
-                else:
-                    error_details.append("history returned empty or no Close column")
-            except Exception as e:
-                error_details.append(f"history failed: {e}")
-        
-        # Method 3: Try 5-day history for less liquid stocks
-        if not current_price:
-            try:
-                hist = ticker.history(period='5d')
-                if not hist.empty and 'Close' in hist.columns:
-                    current_price = hist['Close'].iloc[-1]
-                    logger.info(f"[OK] {symbol} price from 5d history: USD{current_price:.2f}")
-                else:
-                    error_details.append("5d history returned empty")
-            except Exception as e:
-                error_details.append(f"5d history failed: {e}")
+        # Get current price from the shared market data cache (FIX v1.3.15.161: Better error handling)
+        # fetch_quote tries the bulk 5-day quote first, then Ticker.info
+        current_price = market_data_cache.fetch_quote(symbol)
         
         if not current_price or current_price <= 0:
-            error_msg = f"Could not get valid price for {symbol}. Errors: {'; '.join(error_details)}"
-            logger.error(error_msg)
+            logger.error(f"Could not get valid price for {symbol}")
             return False
         
         # Calculate position size (use 5% of available capital)
@@ -2297,23 +2448,8 @@ def execute_force_sell(system, symbol):
             logger.warning(f"No position for {symbol} to sell")
             return False
         
-        # Get current price
-        import yfinance as yf
-        ticker = yf.Ticker(symbol)
-        
-        current_price = None
-        try:
-            current_price = ticker.info.get('regularMarketPrice')
-        except:
-            pass
-        
-        if not current_price:
-            try:
-                hist = ticker.history(period='1d')
-                if not hist.empty:
-                    current_price = hist['Close'].iloc[-1]
-            except:
-                pass
+        # Get current price from the shared market data cache
+        current_price = market_data_cache.fetch_quote(symbol)
         
         if not current_price or current_price <= 0:
             logger.error(f"Could not get valid price for {symbol}")
@@ -2340,6 +2476,9 @@ if __name__ == '__main__':
     logger.info("Starting Unified Paper Trading Dashboard...")
     logger.info("Open browser to: http://localhost:8050")
     
+    # Background market data refresher (all callbacks read from this cache)
+    market_data_cache.start()
+    
     # Run app
     app.run(
         debug=False,
@@ -8,6 +8,7 @@ import os
 import sys
 import json
 import logging
+import threading
 import warnings
 import urllib.request
 from datetime import datetime, timedelta
@@ -32,6 +33,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # Import v4.0 modules
 from config_dev import get_config, DevelopmentConfig
 from models.lstm_predictor import lstm_predictor, get_lstm_prediction
+from models.job_queue import JobQueue, Job, JobFailed
 
 # Import FinBERT sentiment analyzer with REAL news scraping (must be after other imports)
 
@@ -953,6 +955,143 @@ def get_models_info():
         'version': '4.0-dev'
     })
 
+# ============================================================================
+# BACKGROUND JOBS
+# ============================================================================
+# Training, backtests and optimization can run for many minutes. Requests with
+# "async": true (JSON body) or ?async=1 are queued and answered with a job ID
+# (HTTP 202); clients poll /api/jobs/<job_id>. Without it the request runs
+# synchronously as before.
+
+JOBS_DIR = os.path.join(os.path.dirname(__file__), 'models', 'backtest_results', 'jobs')
+job_queue = JobQueue(JOBS_DIR, max_workers=getattr(config, 'JOB_WORKERS', 2))
+
+
+def _wants_background(data: Optional[Dict] = None) -> bool:
+    """True if the client asked for the request to run as a background job"""
+    flag = (data or {}).get('async', request.args.get('async', ''))
+    if isinstance(flag, str):
+        return flag.lower() in ('1', 'true', 'yes')
+    return bool(flag)
+
+
+def _job_report(job: Optional[Job], progress: float, message: str):
+    """Report job progress (cancellation checkpoint); no-op for synchronous requests"""
+    if job is not None:
+        job.report(progress, message)
+
+
+def _submit_job(kind: str, runner, params: Dict, description: str) -> Job:
+    """
+    Queue a (payload, status_code) runner as a background job
+    
+    Payloads with an error status code fail the job, keeping the payload as its result.
+    """
+    def run(job):
+        payload, status_code = runner(job)
+        if status_code >= 400:
+            raise JobFailed(payload.get('error') or payload.get('message') or f'HTTP {status_code}', payload)
+        return payload
+    
+    return job_queue.submit(kind, run, params=params, description=description)
+
+
+def _job_accepted(job: Job):
+    """202 response for a queued job"""
+    return jsonify({
+        'status': 'accepted',
+        'job_id': job.job_id,
+        'job': job.to_dict(include_result=False),
+        'status_url': f'/api/jobs/{job.job_id}',
+        'cancel_url': f'/api/jobs/{job.job_id}/cancel'
+    }), 202
+
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """
+    List background jobs, newest first
+    
+    Query parameters:
+    - kind: 'train', 'backtest', 'portfolio_backtest' or 'optimize' (optional)
+    - status: queued / running / completed / failed / cancelled / interrupted (optional)
+    - limit: Number of jobs to return (default 50)
+    """
+    try:
+        jobs = job_queue.list_jobs(
+            kind=request.args.get('kind'),
+            status=request.args.get('status'),
+            limit=int(request.args.get('limit', 50))
+        )
+        return jsonify({'jobs': jobs, 'count': len(jobs), **job_queue.get_stats()})
+    except Exception as e:
+        logger.error(f"Error listing jobs: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Job status and progress; includes the result once finished"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Job not found: {job_id}'}), 404
+    return jsonify(job.to_dict())
+
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Cancel a queued or running job (running jobs stop at their next checkpoint)"""
+    if job_queue.get(job_id) is None:
+        return jsonify({'error': f'Job not found: {job_id}'}), 404
+    if not job_queue.cancel(job_id):
+        return jsonify({'error': f'Job {job_id} has already finished'}), 409
+    return jsonify({'success': True, 'job': job_queue.get(job_id).to_dict(include_result=False)})
+
+
+def _train_symbol(symbol: str, epochs: int, sequence_length: int, job: Optional[Job] = None):
+    """
+    Train an LSTM model for a symbol and reload the predictor
+    
+    Returns:
+        (response payload, HTTP status code)
+    """
+    # Import training module
+    from models.train_lstm import train_model_for_symbol
+    
+    # Start training (cannot be interrupted once fitting has started)
+    _job_report(job, 5, f'Training LSTM for {symbol} ({epochs} epochs)')
+    logger.info(f"Starting LSTM training for {symbol}...")
+    result = train_model_for_symbol(
+        symbol=symbol,
+        epochs=epochs,
+        sequence_length=sequence_length
+    )
+    
+    if 'error' in result:
+        error_msg = result.get('error', 'Unknown error')
+        logger.error(f"Training failed for {symbol}: {error_msg}")
+        return {
+            'status': 'error',
+            'message': error_msg,
+            'symbol': symbol,
+            'details': result
+        }, 400
+    
+    # Reload model in predictor
+    _job_report(job, 95, 'Reloading models')
+    logger.info(f"Reloading models after training {symbol}")
+    ml_predictor.initialize_models()
+    
+    logger.info(f"Training completed successfully for {symbol}")
+    return {
+        'status': 'success',
+        'message': f'Model trained successfully for {symbol}',
+        'symbol': symbol,
+        'result': result,
+        'timestamp': datetime.now().isoformat()
+    }, 200
+
+
 @app.route('/api/train/<path:symbol>', methods=['POST', 'OPTIONS'])
 def train_model(symbol):
     """Train LSTM model for a specific symbol (supports dots like BHP.AX)"""
@@ -993,39 +1132,17 @@ def train_model(symbol):
         logger.info(f"Request method: {request.method}")
         logger.debug(f"Request data: {data}")
         
-        # Import training module
-        from models.train_lstm import train_model_for_symbol
-        
-        # Start training
-        logger.info(f"Starting LSTM training for {symbol}...")
-        result = train_model_for_symbol(
-            symbol=symbol,
-            epochs=epochs,
-            sequence_length=sequence_length
-        )
-        
-        if 'error' in result:
-            error_msg = result.get('error', 'Unknown error')
-            logger.error(f"Training failed for {symbol}: {error_msg}")
-            return jsonify({
-                'status': 'error',
-                'message': error_msg,
-                'symbol': symbol,
-                'details': result
-            }), 400
-        
-        # Reload model in predictor
-        logger.info(f"Reloading models after training {symbol}")
-        ml_predictor.initialize_models()
+        if _wants_background(data):
+            job = _submit_job(
+                'train',
+                lambda job: _train_symbol(symbol, epochs, sequence_length, job),
+                params={'symbol': symbol, 'epochs': epochs, 'sequence_length': sequence_length},
+                description=f'LSTM training for {symbol}'
+            )
+            return _job_accepted(job)
         
-        logger.info(f"Training completed successfully for {symbol}")
-        return jsonify({
-            'status': 'success',
-            'message': f'Model trained successfully for {symbol}',
-            'symbol': symbol,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        }), 200
+        payload, status_code = _train_symbol(symbol, epochs, sequence_length)
+        return jsonify(payload), status_code
         
     except Exception as e:
         logger.error(f"Training error for {symbol}: {str(e)}", exc_info=True)
@@ -1378,6 +1495,165 @@ def get_scheduler_status():
 # BACKTESTING API ENDPOINTS
 # ============================================================================
 
+def _run_backtest(data: Dict, job: Optional[Job] = None):
+    """
+    Load data, generate predictions and simulate trading for one symbol
+    
+    Returns:
+        (response payload, HTTP status code)
+    """
+    symbol = data['symbol'].upper()
+    start_date = data['start_date']
+    end_date = data['end_date']
+    model_type = data.get('model_type', 'ensemble')
+    initial_capital = data.get('initial_capital', 10000)
+    lookback_days = data.get('lookback_days', 60)
+    stop_loss_pct = data.get('stop_loss_pct', 0.03)  # Default 3%
+    take_profit_pct = data.get('take_profit_pct', 0.10)  # Default 10%
+    
+    logger.info(f"Starting backtest for {symbol} ({start_date} to {end_date})")
+    
+    # Import backtesting modules
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'models'))
+    from backtesting import HistoricalDataLoader, BacktestPredictionEngine, TradingSimulator
+    
+    _job_report(job, 5, f'Loading price data for {symbol}')
+    
+    # Phase 1: Load historical data
+    loader = HistoricalDataLoader(
+        symbol=symbol,
+        start_date=start_date,
+        end_date=end_date,
+        use_cache=True
+    )
+    
+    historical_data = loader.load_price_data()
+    
+    if historical_data.empty:
+        error_msg = (
+            f'No data available for {symbol} between {start_date} and {end_date}. '
+            f'Please check: (1) Symbol is valid, (2) Date range is not in the future, '
+            f'(3) Dates are in YYYY-MM-DD format, (4) Internet connection is working. '
+            f'Try a different date range (e.g., last 6 months).'
+        )
+        logger.error(f"Backtest failed: {error_msg}")
+        return {'error': error_msg}, 404
+    
+    _job_report(job, 20, 'Generating predictions')
+    
+    # Phase 2: Generate predictions
+    engine = BacktestPredictionEngine(
+        model_type=model_type,
+        confidence_threshold=0.6
+    )
+    
+    predictions = engine.walk_forward_backtest(
+        data=historical_data,
+        start_date=start_date,
+        end_date=end_date,
+        prediction_frequency='daily',
+        lookback_days=lookback_days
+    )
+    
+    if predictions.empty:
+        return {'error': 'Failed to generate predictions'}, 500
+    
+    _job_report(job, 60, 'Simulating trades')
+    
+    # Phase 3: Simulate trading with stop-loss and take-profit
+    simulator = TradingSimulator(
+        initial_capital=initial_capital,
+        commission_rate=0.001,
+        slippage_rate=0.0005,
+        max_position_size=0.20,
+        stop_loss_pct=stop_loss_pct,
+        take_profit_pct=take_profit_pct
+    )
+    
+    for idx, row in predictions.iterrows():
+        simulator.execute_signal(
+            timestamp=row['timestamp'],
+            signal=row['prediction'],
+            price=row.get('actual_price', row['current_price']),
+            confidence=row['confidence']
+        )
+    
+    # Close remaining positions
+    if simulator.positions:
+        last_price = predictions.iloc[-1].get('actual_price', predictions.iloc[-1]['current_price'])
+        last_timestamp = predictions.iloc[-1]['timestamp']
+        simulator._close_positions(last_timestamp, last_price)
+    
+    _job_report(job, 90, 'Calculating performance metrics')
+    
+    # Get performance metrics
+    metrics = simulator.calculate_performance_metrics()
+    
+    # Evaluate prediction accuracy
+    eval_metrics = engine.evaluate_predictions(predictions)
+    
+    # Prepare response
+    response = {
+        'symbol': symbol,
+        'backtest_period': {
+            'start': start_date,
+            'end': end_date
+        },
+        'model_type': model_type,
+        'data_points': len(historical_data),
+        'predictions_generated': len(predictions),
+        'performance': {
+            'initial_capital': metrics.get('initial_capital', 0),
+            'final_equity': metrics.get('final_equity', 0),
+            'total_return_pct': metrics.get('total_return_pct', 0),
+            'total_trades': metrics.get('total_trades', 0),
+            'winning_trades': metrics.get('winning_trades', 0),
+            'losing_trades': metrics.get('losing_trades', 0),
+            'win_rate': metrics.get('win_rate', 0) * 100,
+            'sharpe_ratio': metrics.get('sharpe_ratio', 0),
+            'sortino_ratio': metrics.get('sortino_ratio', 0),
+            'max_drawdown_pct': metrics.get('max_drawdown_pct', 0),
+            'profit_factor': metrics.get('profit_factor', 0),
+            'total_commission_paid': metrics.get('total_commission_paid', 0),
+            'avg_hold_time_days': metrics.get('avg_hold_time_days', 0),
+            'charts': metrics.get('charts', {})  # Add chart data
+        },
+        'prediction_accuracy': {
+            'total_predictions': eval_metrics.get('total_predictions', 0),
+            'actionable_predictions': eval_metrics.get('actionable_predictions', 0),
+            'buy_signals': eval_metrics.get('buy_signals', 0),
+            'sell_signals': eval_metrics.get('sell_signals', 0),
+            'overall_accuracy': eval_metrics.get('overall_accuracy', 0) * 100 if 'overall_accuracy' in eval_metrics else None
+        },
+        'equity_curve': simulator.get_equity_curve_df().reset_index().to_dict('records')[:100],  # First 100 points
+        'timestamp': datetime.now().isoformat()
+    }
+    
+    _job_report(job, 95, 'Saving results')
+    
+    # Save backtest results to file
+    try:
+        results_dir = os.path.join(os.path.dirname(__file__), 'models', 'backtest_results')
+        os.makedirs(results_dir, exist_ok=True)
+        
+        # Create filename with timestamp
+        timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
+        results_file = os.path.join(results_dir, f'backtest_{symbol}_{timestamp_str}.json')
+        
+        with open(results_file, 'w') as f:
+            json.dump(response, f, indent=2)
+        
+        logger.info(f"[OK] Backtest results saved to: {results_file}")
+        response['results_file'] = results_file
+    
+    except Exception as e:
+        logger.warning(f"Failed to save backtest results: {e}")
+    
+    logger.info(f"Backtest complete for {symbol}: Return={metrics.get('total_return_pct', 0):.2f}%, Trades={metrics.get('total_trades', 0)}")
+    
+    return response, 200
+
+
 @app.route('/api/backtest/run', methods=['POST'])
 def run_backtest():
     """
@@ -1402,146 +1678,17 @@ def run_backtest():
         if missing:
             return jsonify({'error': f'Missing required fields: {missing}'}), 400
         
-        symbol = data['symbol'].upper()
-        start_date = data['start_date']
-        end_date = data['end_date']
-        model_type = data.get('model_type', 'ensemble')
-        initial_capital = data.get('initial_capital', 10000)
-        lookback_days = data.get('lookback_days', 60)
-        stop_loss_pct = data.get('stop_loss_pct', 0.03)  # Default 3%
-        take_profit_pct = data.get('take_profit_pct', 0.10)  # Default 10%
-        
-        logger.info(f"Starting backtest for {symbol} ({start_date} to {end_date})")
-        
-        # Import backtesting modules
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'models'))
-        from backtesting import HistoricalDataLoader, BacktestPredictionEngine, TradingSimulator
-        
-        # Phase 1: Load historical data
-        loader = HistoricalDataLoader(
-            symbol=symbol,
-            start_date=start_date,
-            end_date=end_date,
-            use_cache=True
-        )
-        
-        historical_data = loader.load_price_data()
-        
-        if historical_data.empty:
-            error_msg = (
-                f'No data available for {symbol} between {start_date} and {end_date}. '
-                f'Please check: (1) Symbol is valid, (2) Date range is not in the future, '
-                f'(3) Dates are in YYYY-MM-DD format, (4) Internet connection is working. '
-                f'Try a different date range (e.g., last 6 months).'
-            )
-            logger.error(f"Backtest failed: {error_msg}")
-            return jsonify({'error': error_msg}), 404
-        
-        # Phase 2: Generate predictions
-        engine = BacktestPredictionEngine(
-            model_type=model_type,
-            confidence_threshold=0.6
-        )
-        
-        predictions = engine.walk_forward_backtest(
-            data=historical_data,
-            start_date=start_date,
-            end_date=end_date,
-            prediction_frequency='daily',
-            lookback_days=lookback_days
-        )
-        
-        if predictions.empty:
-            return jsonify({'error': 'Failed to generate predictions'}), 500
-        
-        # Phase 3: Simulate trading with stop-loss and take-profit
-        simulator = TradingSimulator(
-            initial_capital=initial_capital,
-            commission_rate=0.001,
-            slippage_rate=0.0005,
-            max_position_size=0.20,
-            stop_loss_pct=stop_loss_pct,
-            take_profit_pct=take_profit_pct
-        )
-        
-        for idx, row in predictions.iterrows():
-            simulator.execute_signal(
-                timestamp=row['timestamp'],
-                signal=row['prediction'],
-                price=row.get('actual_price', row['current_price']),
-                confidence=row['confidence']
+        if _wants_background(data):
+            job = _submit_job(
+                'backtest',
+                lambda job: _run_backtest(data, job),
+                params=data,
+                description=f"Backtest {data['symbol'].upper()} ({data['start_date']} to {data['end_date']})"
             )
+            return _job_accepted(job)
         
-        # Close remaining positions
-        if simulator.positions:
-            last_price = predictions.iloc[-1].get('actual_price', predictions.iloc[-1]['current_price'])
-            last_timestamp = predictions.iloc[-1]['timestamp']
-            simulator._close_positions(last_timestamp, last_price)
-        
-        # Get performance metrics
-        metrics = simulator.calculate_performance_metrics()
-        
-        # Evaluate prediction accuracy
-        eval_metrics = engine.evaluate_predictions(predictions)
-        
-        # Prepare response
-        response = {
-            'symbol': symbol,
-            'backtest_period': {
-                'start': start_date,
-                'end': end_date
-            },
-            'model_type': model_type,
-            'data_points': len(historical_data),
-            'predictions_generated': len(predictions),
-            'performance': {
-                'initial_capital': metrics.get('initial_capital', 0),
-                'final_equity': metrics.get('final_equity', 0),
-                'total_return_pct': metrics.get('total_return_pct', 0),
-                'total_trades': metrics.get('total_trades', 0),
-                'winning_trades': metrics.get('winning_trades', 0),
-                'losing_trades': metrics.get('losing_trades', 0),
-                'win_rate': metrics.get('win_rate', 0) * 100,
-                'sharpe_ratio': metrics.get('sharpe_ratio', 0),
-                'sortino_ratio': metrics.get('sortino_ratio', 0),
-                'max_drawdown_pct': metrics.get('max_drawdown_pct', 0),
-                'profit_factor': metrics.get('profit_factor', 0),
-                'total_commission_paid': metrics.get('total_commission_paid', 0),
-                'avg_hold_time_days': metrics.get('avg_hold_time_days', 0),
-                'charts': metrics.get('charts', {})  # Add chart data
-            },
-            'prediction_accuracy': {
-                'total_predictions': eval_metrics.get('total_predictions', 0),
-                'actionable_predictions': eval_metrics.get('actionable_predictions', 0),
-                'buy_signals': eval_metrics.get('buy_signals', 0),
-                'sell_signals': eval_metrics.get('sell_signals', 0),
-                'overall_accuracy': eval_metrics.get('overall_accuracy', 0) * 100 if 'overall_accuracy' in eval_metrics else None
-            },
-            'equity_curve': simulator.get_equity_curve_df().reset_index().to_dict('records')[:100],  # First 100 points
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        # Save backtest results to file
-        try:
-            results_dir = os.path.join(os.path.dirname(__file__), 'models', 'backtest_results')
-            os.makedirs(results_dir, exist_ok=True)
-            
-            # Create filename with timestamp
-            timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-            results_file = os.path.join(results_dir, f'backtest_{symbol}_{timestamp_str}.json')
-            
-            with open(results_file, 'w') as f:
-                json.dump(response, f, indent=2)
-            
-            logger.info(f"[OK] Backtest results saved to: {results_file}")
-            response['results_file'] = results_file
-            
-        except Exception as e:
-            logger.warning(f"Failed to save backtest results: {e}")
-        
-        logger.info(f"Backtest complete for {symbol}: Return={metrics.get('total_return_pct', 0):.2f}%, Trades={metrics.get('total_trades', 0)}")
-        
-        return jsonify(response)
+        payload, status_code = _run_backtest(data)
+        return jsonify(payload), status_code
         
     except ImportError as e:
         logger.error(f"Backtesting module import error: {e}")
@@ -1556,6 +1703,77 @@ def run_backtest():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+def _run_portfolio_backtest(data: Dict, job: Optional[Job] = None):
+    """
+    Run a multi-symbol portfolio backtest
+    
+    Returns:
+        (response payload, HTTP status code)
+    """
+    symbols = [s.upper() for s in data['symbols']]
+    
+    start_date = data['start_date']
+    end_date = data['end_date']
+    model_type = data.get('model_type', 'ensemble')
+    initial_capital = data.get('initial_capital', 10000)
+    allocation_strategy = data.get('allocation_strategy', 'equal')
+    custom_allocations = data.get('custom_allocations', {})
+    rebalance_frequency = data.get('rebalance_frequency', 'monthly')
+    
+    logger.info(f"Starting portfolio backtest: {symbols} ({start_date} to {end_date})")
+    
+    # Import portfolio backtesting modules
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'models'))
+    from backtesting.portfolio_backtester import run_portfolio_backtest
+    
+    _job_report(job, 5, f'Running portfolio backtest for {len(symbols)} symbols')
+    
+    # Run portfolio backtest
+    results = run_portfolio_backtest(
+        symbols=symbols,
+        start_date=start_date,
+        end_date=end_date,
+        initial_capital=initial_capital,
+        model_type=model_type,
+        allocation_strategy=allocation_strategy,
+        custom_allocations=custom_allocations if allocation_strategy == 'custom' else None,
+        rebalance_frequency=rebalance_frequency,
+        confidence_threshold=0.6,
+        lookback_days=60,
+        use_cache=True
+    )
+    
+    if 'error' in results:
+        return results, 500
+    
+    _job_report(job, 95, 'Formatting results')
+    
+    # Format response
+    response = {
+        'status': results.get('status', 'unknown'),
+        'symbols': symbols,
+        'backtest_period': {
+            'start': start_date,
+            'end': end_date
+        },
+        'config': results.get('backtest_config', {}),
+        'portfolio_metrics': results.get('portfolio_metrics', {}),
+        'target_allocations': results.get('target_allocations', {}),
+        'diversification': results.get('diversification', {}),
+        'correlation_matrix': results.get('correlation_matrix', {}),
+        'execution_summary': results.get('execution_summary', {}),
+        'timestamp': datetime.now().isoformat()
+    }
+    
+    logger.info(
+        f"Portfolio backtest complete: "
+        f"Return={results.get('portfolio_metrics', {}).get('total_return_pct', 0):.2f}%, "
+        f"Trades={results.get('portfolio_metrics', {}).get('total_trades', 0)}"
+    )
+    
+    return response, 200
+
+
 @app.route('/api/backtest/portfolio', methods=['POST'])
 def run_portfolio_backtest():
     """
@@ -1582,66 +1800,20 @@ def run_portfolio_backtest():
         if missing:
             return jsonify({'error': f'Missing required fields: {missing}'}), 400
         
-        symbols = [s.upper() for s in data['symbols']]
-        if len(symbols) < 2:
+        if len(data['symbols']) < 2:
             return jsonify({'error': 'Portfolio must contain at least 2 stocks'}), 400
         
-        start_date = data['start_date']
-        end_date = data['end_date']
-        model_type = data.get('model_type', 'ensemble')
-        initial_capital = data.get('initial_capital', 10000)
-        allocation_strategy = data.get('allocation_strategy', 'equal')
-        custom_allocations = data.get('custom_allocations', {})
-        rebalance_frequency = data.get('rebalance_frequency', 'monthly')
-        
-        logger.info(f"Starting portfolio backtest: {symbols} ({start_date} to {end_date})")
-        
-        # Import portfolio backtesting modules
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'models'))
-        from backtesting.portfolio_backtester import run_portfolio_backtest
-        
-        # Run portfolio backtest
-        results = run_portfolio_backtest(
-            symbols=symbols,
-            start_date=start_date,
-            end_date=end_date,
-            initial_capital=initial_capital,
-            model_type=model_type,
-            allocation_strategy=allocation_strategy,
-            custom_allocations=custom_allocations if allocation_strategy == 'custom' else None,
-            rebalance_frequency=rebalance_frequency,
-            confidence_threshold=0.6,
-            lookback_days=60,
-            use_cache=True
-        )
-        
-        if 'error' in results:
-            return jsonify(results), 500
-        
-        # Format response
-        response = {
-            'status': results.get('status', 'unknown'),
-            'symbols': symbols,
-            'backtest_period': {
-                'start': start_date,
-                'end': end_date
-            },
-            'config': results.get('backtest_config', {}),
-            'portfolio_metrics': results.get('portfolio_metrics', {}),
-            'target_allocations': results.get('target_allocations', {}),
-            'diversification': results.get('diversification', {}),
-            'correlation_matrix': results.get('correlation_matrix', {}),
-            'execution_summary': results.get('execution_summary', {}),
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        logger.info(
-            f"Portfolio backtest complete: "
-            f"Return={results.get('portfolio_metrics', {}).get('total_return_pct', 0):.2f}%, "
-            f"Trades={results.get('portfolio_metrics', {}).get('total_trades', 0)}"
-        )
+        if _wants_background(data):
+            job = _submit_job(
+                'portfolio_backtest',
+                lambda job: _run_portfolio_backtest(data, job),
+                params=data,
+                description=f"Portfolio backtest {', '.join(s.upper() for s in data['symbols'])}"
+            )
+            return _job_accepted(job)
         
-        return jsonify(response)
+        payload, status_code = _run_portfolio_backtest(data)
+        return jsonify(payload), status_code
         
     except ImportError as e:
         logger.error(f"Portfolio backtesting module import error: {e}")
@@ -1656,6 +1828,125 @@ def run_portfolio_backtest():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+def _optimize_parameters(data: Dict, job: Optional[Job] = None):
+    """
+    Search backtest parameters (predictions generated once, simulations in parallel)
+    
+    Returns:
+        (response payload, HTTP status code)
+    """
+    symbol = data['symbol'].upper()
+    start_date = data['start_date']
+    end_date = data['end_date']
+    model_type = data.get('model_type', 'ensemble')
+    initial_capital = data.get('initial_capital', 10000)
+    optimization_method = data.get('optimization_method', 'random')
+    max_iterations = data.get('max_iterations', 50)
+    
+    logger.info(f"Starting parameter optimization for {symbol} using {optimization_method} search")
+    
+    # Import optimizer
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'models'))
+    from backtesting.parameter_optimizer import ParallelParameterOptimizer, QUICK_PARAMETER_GRID
+    
+    # Use quick grid for faster testing
+    parameter_grid = data.get('parameter_grid', QUICK_PARAMETER_GRID)
+    
+    def report_progress(completed, total, best_metric):
+        _job_report(job, 10 + 85 * completed / max(total, 1),
+                    f'Evaluated {completed}/{total} combinations (best {best_metric})')
+    
+    _job_report(job, 5, 'Loading data and generating predictions')
+    
+    # Data is loaded and predictions generated once; each combination only
+    # re-runs the trading simulator, spread across worker threads. No process
+    # pool here: spawned workers (Windows) re-import this module, which loads
+    # the models and re-opens the job queue (marking this job interrupted)
+    optimizer = ParallelParameterOptimizer(
+        parameter_grid=parameter_grid,
+        optimization_metric='total_return_pct',
+        model_type=model_type,
+        initial_capital=initial_capital,
+        max_workers=data.get('max_workers'),
+        early_stopping_rounds=data.get('early_stopping_rounds'),
+        progress_callback=report_progress,
+        should_stop=(lambda: job.cancelled) if job is not None else None,
+        use_processes=False
+    )
+    
+    # Run optimization
+    if optimization_method == 'grid':
+        best_params, results_df = optimizer.grid_search(symbol, start_date, end_date)
+    else:
+        best_params, results_df = optimizer.random_search(
+            symbol, start_date, end_date, n_iterations=max_iterations
+        )
+    
+    best_performance = {}
+    if not results_df.empty and best_params:
+        best_row = results_df[results_df['params'].apply(lambda p: p == best_params)].iloc[0]
+        best_performance = {
+            'total_return_pct': best_row['test_return'],
+            'sharpe_ratio': best_row['test_sharpe'],
+            'max_drawdown_pct': best_row['test_drawdown'],
+            'win_rate': best_row['test_win_rate'],
+            'train_return_pct': best_row['train_return'],
+            'overfit_score': best_row['overfit_score']
+        }
+    
+    results = {
+        'iterations_completed': len(results_df),
+        'best_parameters': best_params,
+        'best_performance': best_performance,
+        'all_results': results_df.to_dict('records')
+    }
+    
+    # Format response
+    response = {
+        'symbol': symbol,
+        'optimization_method': optimization_method,
+        'iterations_completed': results.get('iterations_completed', 0),
+        'best_parameters': results.get('best_parameters', {}),
+        'best_performance': results.get('best_performance', {}),
+        'search_stats': optimizer.search_stats,
+        'parameter_grid': parameter_grid,
+        'start_date': start_date,
+        'end_date': end_date,
+        'initial_capital': initial_capital,
+        'timestamp': datetime.now().isoformat()
+    }
+    
+    _job_report(job, 95, 'Saving results')
+    
+    # Save optimization results to file
+    try:
+        results_dir = os.path.join(os.path.dirname(__file__), 'models', 'backtest_results')
+        os.makedirs(results_dir, exist_ok=True)
+        
+        # Create filename with timestamp
+        timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
+        results_file = os.path.join(results_dir, f'optimization_{symbol}_{timestamp_str}.json')
+        
+        # Save full results including all iterations if available
+        full_results = {
+            **response,
+            'all_results': results.get('all_results', [])  # Include all iteration results
+        }
+        
+        with open(results_file, 'w') as f:
+            json.dump(full_results, f, indent=2, default=float)
+        
+        logger.info(f"[OK] Optimization results saved to: {results_file}")
+        response['results_file'] = results_file
+    
+    except Exception as e:
+        logger.warning(f"Failed to save optimization results: {e}")
+    
+    logger.info(f"Optimization complete for {symbol}: Best return={results.get('best_performance', {}).get('total_return_pct', 0):.2f}%")
+    
+    return response, 200
+
+
 @app.route('/api/backtest/optimize', methods=['POST'])
 def optimize_backtest_parameters():
     """
@@ -1669,7 +1960,9 @@ def optimize_backtest_parameters():
         "model_type": "ensemble",
         "initial_capital": 10000,
         "optimization_method": "random",  # "grid" or "random"
-        "max_iterations": 50
+        "max_iterations": 50,
+        "max_workers": null,  # optional worker threads, default CPU count
+        "early_stopping_rounds": null  # optional
     }
     """
     try:
@@ -1681,149 +1974,18 @@ def optimize_backtest_parameters():
         if missing:
             return jsonify({'error': f'Missing required fields: {missing}'}), 400
         
-        symbol = data['symbol'].upper()
-        start_date = data['start_date']
-        end_date = data['end_date']
-        model_type = data.get('model_type', 'ensemble')
-        initial_capital = data.get('initial_capital', 10000)
-        optimization_method = data.get('optimization_method', 'random')
-        max_iterations = data.get('max_iterations', 50)
-        
-        logger.info(f"Starting parameter optimization for {symbol} using {optimization_method} search")
-        
-        # Import optimizer and backtesting modules
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'models'))
-        from backtesting.parameter_optimizer import ParameterOptimizer, QUICK_PARAMETER_GRID
-        from backtesting import HistoricalDataLoader, BacktestPredictionEngine, TradingSimulator
-        
-        # Use quick grid for faster testing
-        parameter_grid = data.get('parameter_grid', QUICK_PARAMETER_GRID)
-        
-        # Create optimizer with backtest function
-        def backtest_wrapper(**params):
-            """Wrapper function for backtesting"""
-            try:
-                # Extract parameters
-                conf_threshold = params.get('confidence_threshold', 0.60)
-                lookback = params.get('lookback_days', 60)
-                max_pos_size = params.get('max_position_size', 0.20)
-                stop_loss = params.get('stop_loss_pct', 0.03)
-                take_profit = params.get('take_profit_pct', 0.10)
-                
-                # Load historical data
-                loader = HistoricalDataLoader(
-                    symbol=symbol,
-                    start_date=start_date,
-                    end_date=end_date,
-                    use_cache=True
-                )
-                historical_data = loader.load_price_data()
-                
-                if historical_data.empty:
-                    return {'total_return_pct': -999, 'sharpe_ratio': -999, 'max_drawdown_pct': -999}
-                
-                # Generate predictions
-                engine = BacktestPredictionEngine(
-                    model_type=model_type,
-                    confidence_threshold=conf_threshold
-                )
-                
-                predictions = engine.walk_forward_backtest(
-                    data=historical_data,
-                    start_date=start_date,
-                    end_date=end_date,
-                    prediction_frequency='daily',
-                    lookback_days=lookback
-                )
-                
-                if predictions.empty:
-                    return {'total_return_pct': -999, 'sharpe_ratio': -999, 'max_drawdown_pct': -999}
-                
-                # Simulate trading
-                simulator = TradingSimulator(
-                    initial_capital=initial_capital,
-                    commission_rate=0.001,
-                    slippage_rate=0.0005,
-                    max_position_size=max_pos_size,
-                    stop_loss_pct=stop_loss,
-                    take_profit_pct=take_profit
-                )
-                
-                for idx, row in predictions.iterrows():
-                    simulator.execute_signal(
-                        timestamp=row['timestamp'],
-                        signal=row['prediction'],
-                        price=row.get('actual_price', row['current_price']),
-                        confidence=row['confidence']
-                    )
-                
-                # Close remaining positions
-                if simulator.positions:
-                    last_price = predictions.iloc[-1].get('actual_price', predictions.iloc[-1]['current_price'])
-                    last_timestamp = predictions.iloc[-1]['timestamp']
-                    simulator._close_positions(last_timestamp, last_price)
-                
-                # Return performance metrics
-                return simulator.calculate_performance_metrics()
-                
-            except Exception as e:
-                logger.error(f"Backtest wrapper error: {e}")
-                return {'total_return_pct': -999, 'sharpe_ratio': -999, 'max_drawdown_pct': -999}
-        
-        # Create optimizer
-        optimizer = ParameterOptimizer(
-            backtest_function=backtest_wrapper,
-            parameter_grid=parameter_grid,
-            optimization_metric='total_return_pct'
-        )
-        
-        # Run optimization
-        if optimization_method == 'grid':
-            results = optimizer.grid_search()
-        else:
-            results = optimizer.random_search(n_iterations=max_iterations)
-        
-        # Format response
-        response = {
-            'symbol': symbol,
-            'optimization_method': optimization_method,
-            'iterations_completed': results.get('iterations_completed', 0),
-            'best_parameters': results.get('best_parameters', {}),
-            'best_performance': results.get('best_performance', {}),
-            'parameter_grid': parameter_grid,
-            'start_date': start_date,
-            'end_date': end_date,
-            'initial_capital': initial_capital,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        # Save optimization results to file
-        try:
-            results_dir = os.path.join(os.path.dirname(__file__), 'models', 'backtest_results')
-            os.makedirs(results_dir, exist_ok=True)
-            
-            # Create filename with timestamp
-            timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-            results_file = os.path.join(results_dir, f'optimization_{symbol}_{timestamp_str}.json')
-            
-            # Save full results including all iterations if available
-            full_results = {
-                **response,
-                'all_results': results.get('all_results', [])  # Include all iteration results
-            }
-            
-            with open(results_file, 'w') as f:
-                json.dump(full_results, f, indent=2)
-            
-            logger.info(f"[OK] Optimization results saved to: {results_file}")
-            response['results_file'] = results_file
-            
-        except Exception as e:
-            logger.warning(f"Failed to save optimization results: {e}")
-        
-        logger.info(f"Optimization complete for {symbol}: Best return={results.get('best_performance', {}).get('total_return_pct', 0):.2f}%")
+        if _wants_background(data):
+            job = _submit_job(
+                'optimize',
+                lambda job: _optimize_parameters(data, job),
+                params=data,
+                description=f"Parameter optimization {data['symbol'].upper()} "
+                            f"({data.get('optimization_method', 'random')} search)"
+            )
+            return _job_accepted(job)
         
-        return jsonify(response)
+        payload, status_code = _optimize_parameters(data)
+        return jsonify(payload), status_code
         
     except ImportError as e:
         logger.error(f"Optimization module import error: {e}")
@@ -2065,19 +2227,25 @@ order_manager = None
 position_manager = None
 portfolio_manager = None
 risk_manager = None
+_trading_init_lock = threading.Lock()
 
 def initialize_trading_system():
-    """Initialize trading system components"""
+    """Initialize trading system components (once - all routes share one TradingDatabase connection)"""
     global trading_engine, order_manager, position_manager, portfolio_manager, risk_manager
     
     try:
         from models.trading import PaperTradingEngine, OrderManager, PositionManager, PortfolioManager, RiskManager
         
-        trading_engine = PaperTradingEngine()
-        order_manager = OrderManager(trading_engine)
-        position_manager = PositionManager(trading_engine)
-        portfolio_manager = PortfolioManager(trading_engine)
-        risk_manager = RiskManager(trading_engine.db)
+        with _trading_init_lock:
+            if trading_engine is not None:
+                return True
+            
+            engine = PaperTradingEngine()
+            order_manager = OrderManager(engine)
+            position_manager = PositionManager(engine)
+            portfolio_manager = PortfolioManager(engine)
+            risk_manager = RiskManager(engine.db)
+            trading_engine = engine
         
         logger.info("[OK] Paper trading system initialized")
         return True
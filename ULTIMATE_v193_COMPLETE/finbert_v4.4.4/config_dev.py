@@ -36,6 +36,9 @@ class DevelopmentConfig:
     # API Rate limits
     RATE_LIMIT = '100/hour'
     
+    # Background jobs (training / backtests / optimization running at once)
+    JOB_WORKERS = 2
+    
     # WebSocket settings
     SOCKETIO_ASYNC_MODE = 'eventlet'
     SOCKETIO_CORS_ALLOWED_ORIGINS = '*'
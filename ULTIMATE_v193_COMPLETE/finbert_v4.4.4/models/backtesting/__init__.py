@@ -11,6 +11,7 @@ Phase 1 - Foundation:
     - HistoricalDataLoader: Fetches and caches historical stock data
     - DataValidator: Validates data quality and detects anomalies
     - CacheManager: Manages SQLite cache for performance
+    - OHLCVCache: Persistent Parquet price cache with incremental top-up
 
 Phase 2 - Prediction Engine:
     - BacktestPredictionEngine: Generates predictions with walk-forward validation
@@ -26,6 +27,7 @@ Version: 1.0.0
 from .data_loader import HistoricalDataLoader
 from .data_validator import DataValidator
 from .cache_manager import CacheManager
+from .ohlcv_cache import OHLCVCache, get_ohlcv_cache
 from .prediction_engine import BacktestPredictionEngine
 from .trading_simulator import TradingSimulator
 
@@ -34,6 +36,8 @@ __all__ = [
     'HistoricalDataLoader',
     'DataValidator',
     'CacheManager',
+    'OHLCVCache',
+    'get_ohlcv_cache',
     'BacktestPredictionEngine',
     'TradingSimulator',
 ]
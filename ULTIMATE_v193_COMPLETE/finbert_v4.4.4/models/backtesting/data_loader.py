@@ -6,7 +6,8 @@ Fetches historical stock data from Yahoo Finance with intelligent caching.
 
 Key Features:
 - Yahoo Finance integration via yfinance
-- Cache-first strategy (check cache before API call)
+- Persistent Parquet OHLCV cache with incremental top-up (daily data):
+  only bars missing from the cache are requested from Yahoo Finance
 - Data validation integration
 - Support for multiple time intervals (1d, 1h, 1wk)
 - Batch loading for multiple symbols
@@ -20,7 +21,7 @@ import pandas as pd
 import logging
 from typing import Optional, List, Dict
 from datetime import datetime, timedelta
-from .cache_manager import CacheManager
+from .ohlcv_cache import get_ohlcv_cache
 from .data_validator import DataValidator
 
 logger = logging.getLogger(__name__)
@@ -54,7 +55,7 @@ class HistoricalDataLoader:
         self.validate_data = validate_data
         
         # Initialize components
-        self.cache_manager = CacheManager() if use_cache else None
+        self.ohlcv_cache = get_ohlcv_cache() if use_cache else None
         self.validator = DataValidator() if validate_data else None
         
         logger.info(
@@ -79,31 +80,15 @@ class HistoricalDataLoader:
         """
         logger.info(f"Loading price data for {self.symbol} (interval={interval})")
         
-        # Check cache first (only for daily data)
-        if self.use_cache and interval == '1d' and not force_refresh:
-            cached_data = self.cache_manager.get_cached_data(
-                self.symbol,
-                self.start_date,
-                self.end_date
-            )
-            
-            if cached_data is not None:
-                logger.info(f"Using cached data for {self.symbol}")
-                return cached_data
-        
-        # Fetch from Yahoo Finance
         try:
-            logger.info(f"Fetching data from Yahoo Finance for {self.symbol}")
-            
-            ticker = yf.Ticker(self.symbol)
-            data = ticker.history(
-                start=self.start_date,
-                end=self.end_date,
-                interval=interval,
-                auto_adjust=False  # Keep raw prices
-            )
+            # Daily data goes through the persistent cache (only missing bars are fetched)
+            if self.use_cache and interval == '1d':
+                data = self._load_daily_from_cache(force_refresh)
+            else:
+                logger.info(f"Fetching data from Yahoo Finance for {self.symbol}")
+                data = self._download_range(self.symbol, self.start_date, self.end_date, interval)
             
-            if data.empty:
+            if data is None or data.empty:
                 logger.error(
                     f"No data returned for {self.symbol}. "
                     f"Parameters: start={self.start_date}, end={self.end_date}, interval={interval}. "
@@ -111,6 +96,8 @@ class HistoricalDataLoader:
                 )
                 return pd.DataFrame()
             
+            data = data.copy()
+            
             # Clean column names
             data.columns = data.columns.str.replace(' ', '_')
             
@@ -135,10 +122,6 @@ class HistoricalDataLoader:
                     for warning in validation_results['warnings']:
                         logger.warning(f"{self.symbol}: {warning}")
             
-            # Cache the data (only for daily data)
-            if self.use_cache and interval == '1d':
-                self.cache_manager.save_to_cache(self.symbol, data)
-            
             logger.info(
                 f"Successfully loaded {len(data)} records for {self.symbol}"
             )
@@ -149,6 +132,40 @@ class HistoricalDataLoader:
             logger.error(f"Error loading data for {self.symbol}: {e}")
             return pd.DataFrame()
     
+    @staticmethod
+    def _download_range(symbol: str, start, end, interval: str = '1d') -> pd.DataFrame:
+        """Download raw bars in [start, end) from Yahoo Finance"""
+        ticker = yf.Ticker(symbol)
+        return ticker.history(
+            start=start,
+            end=end,
+            interval=interval,
+            auto_adjust=False  # Keep raw prices
+        )
+    
+    def _load_daily_from_cache(self, force_refresh: bool) -> Optional[pd.DataFrame]:
+        """
+        Serve daily bars from the OHLCV cache, topping up missing bars
+        
+        Args:
+            force_refresh: Re-download the whole range (result is merged into the cache)
+        """
+        if force_refresh:
+            logger.info(f"Fetching data from Yahoo Finance for {self.symbol} (forced refresh)")
+            fresh = self._download_range(self.symbol, self.start_date, self.end_date)
+            self.ohlcv_cache.merge(
+                self.symbol, fresh,
+                covered_from=pd.Timestamp(self.start_date)
+            )
+            return self.ohlcv_cache.get_history(self.symbol, self.start_date, self.end_date)
+        
+        return self.ohlcv_cache.get_history(
+            self.symbol,
+            self.start_date,
+            self.end_date,
+            fetch_fn=self._download_range
+        )
+    
     def load_with_indicators(
         self,
         interval: str = '1d'
@@ -0,0 +1,408 @@
+"""
+Persistent OHLCV Cache
+======================
+
+Shared on-disk daily price cache for the screening pipelines, LSTM training
+and the backtester.
+
+Unlike the SQLite CacheManager (which rejects any range under 90% complete
+and re-downloads the whole window), this cache tops up incrementally: only
+bars newer than the last cached date (or older than the first cached date)
+are requested upstream. A nightly run therefore fetches roughly one new bar
+per symbol instead of years of history.
+
+Layout (columnar, partitioned by symbol):
+    cache/ohlcv/_index.json                  metadata index
+    cache/ohlcv/symbol=CBA.AX/ohlcv.parquet  one file per symbol
+
+Key Features:
+- Parquet storage via pyarrow (pickle fallback when pyarrow is missing)
+- Small JSON metadata index (first/last date, rows, last refresh)
+- Incremental head/tail top-up through a caller-supplied fetch function
+- Thread- and process-safe: the index is merged under a file lock and files
+  are replaced atomically, so readers never see partial files
+
+Self-contained (pandas only) so the pipelines can load it by file path.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+CANONICAL_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'Adj Close']
+
+_COLUMN_ALIASES = {
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close',
+    'volume': 'Volume',
+    'adjclose': 'Adj Close',
+    'adj close': 'Adj Close',
+    'adj_close': 'Adj Close',
+}
+
+PERIOD_OFFSETS = {
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+    '5y': pd.DateOffset(years=5),
+    '10y': pd.DateOffset(years=10),
+}
+
+# fetch_fn(symbol, start, end) -> DataFrame of daily bars in [start, end)
+FetchFn = Callable[[str, pd.Timestamp, pd.Timestamp], Optional[pd.DataFrame]]
+
+
+def canonicalize_ohlcv(data: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """
+    Convert a yfinance/yahooquery/chart-API frame to the cache layout
+
+    - Naive DatetimeIndex normalized to the bar date (exchange-local date
+      for tz-aware bars, so ASX/LSE sessions are not shifted to the UTC day)
+    - Columns Open, High, Low, Close, Volume (+ Adj Close when present)
+    - Sorted, de-duplicated (last value wins)
+    """
+    if not isinstance(data, pd.DataFrame) or data.empty:
+        return None
+
+    df = data.copy()
+    if isinstance(df.index, pd.MultiIndex) and 'symbol' in df.index.names:
+        df = df.droplevel('symbol')
+
+    timestamps = [pd.Timestamp(ts) for ts in df.index]
+    df.index = pd.DatetimeIndex(
+        [ts.tz_localize(None) if ts.tzinfo is not None else ts for ts in timestamps]
+    ).normalize()
+    df.index.name = 'Date'
+
+    df = df.rename(columns={col: _COLUMN_ALIASES.get(str(col).lower(), col) for col in df.columns})
+    df = df[[col for col in CANONICAL_COLUMNS if col in df.columns]]
+    if 'Close' not in df.columns:
+        return None
+
+    df = df.dropna(subset=['Close'])
+    df = df[~df.index.duplicated(keep='last')].sort_index()
+    return df if not df.empty else None
+
+
+class OHLCVCache:
+    """Persistent, incrementally refreshed daily OHLCV cache"""
+
+    def __init__(self, cache_dir: Optional[str] = None, refresh_after_minutes: int = 60):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Cache directory (default: $OHLCV_CACHE_DIR or finbert_v4.4.4/cache/ohlcv)
+            refresh_after_minutes: Minimum time between tail top-ups for a symbol.
+                Prevents re-requesting on weekends/holidays when no new bar exists.
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get(
+                'OHLCV_CACHE_DIR',
+                Path(__file__).resolve().parent.parent.parent / 'cache' / 'ohlcv'
+            )
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.cache_dir / '_index.json'
+        self.index_lock_path = self.cache_dir / '_index.lock'
+        self.refresh_after = timedelta(minutes=refresh_after_minutes)
+        self.file_format = 'parquet' if PARQUET_AVAILABLE else 'pickle'
+
+        self._lock = threading.Lock()
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._index = self._load_index()
+        self.stats = {'hits': 0, 'top_ups': 0, 'bars_fetched': 0, 'fetch_errors': 0}
+
+        logger.info(f"OHLCV cache initialized at: {self.cache_dir} ({self.file_format})")
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> Dict:
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @contextmanager
+    def _index_file_lock(self):
+        """Exclusive cross-process lock on the index (pipelines and trainer share it)"""
+        with open(self.index_lock_path, 'a+') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _update_index(self, update: Callable[[Dict], None]):
+        """
+        Apply update(index) to the on-disk index and save it atomically
+
+        The index is re-read under the file lock so entries written by other
+        processes since this one loaded it are kept, not overwritten.
+        """
+        with self._lock, self._index_file_lock():
+            self._index = self._load_index()
+            update(self._index)
+            tmp_path = self.index_path.with_name(
+                f"{self.index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp_path, 'w') as f:
+                json.dump(self._index, f, indent=2)
+            os.replace(tmp_path, self.index_path)
+
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            if symbol not in self._symbol_locks:
+                self._symbol_locks[symbol] = threading.Lock()
+            return self._symbol_locks[symbol]
+
+    def _data_path(self, symbol: str) -> Path:
+        safe_symbol = re.sub(r'[^A-Za-z0-9._^=-]', '_', symbol)
+        extension = 'parquet' if self.file_format == 'parquet' else 'pkl'
+        return self.cache_dir / f"symbol={safe_symbol}" / f"ohlcv.{extension}"
+
+    def read(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Read all cached bars for a symbol (None if not cached)"""
+        path = self._data_path(symbol)
+        if not path.exists():
+            return None
+        try:
+            if self.file_format == 'parquet':
+                return pd.read_parquet(path)
+            return pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"Corrupt cache file for {symbol}, ignoring: {e}")
+            return None
+
+    def _write(self, symbol: str, data: pd.DataFrame, covered_from: Optional[pd.Timestamp]):
+        """Write bars and update the index entry (symbol lock must be held)"""
+        path = self._data_path(symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        if self.file_format == 'parquet':
+            data.to_parquet(tmp_path)
+        else:
+            data.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+        def update(index: Dict):
+            previous_cover = index.get(symbol, {}).get('covered_from')
+            if covered_from is not None:
+                cover = covered_from.strftime('%Y-%m-%d')
+                if previous_cover is None or cover < previous_cover:
+                    previous_cover = cover
+            index[symbol] = {
+                'first_date': data.index[0].strftime('%Y-%m-%d'),
+                'last_date': data.index[-1].strftime('%Y-%m-%d'),
+                'rows': int(len(data)),
+                'covered_from': previous_cover,
+                'refreshed_at': datetime.now().isoformat(timespec='seconds'),
+            }
+
+        self._update_index(update)
+
+    def _mark_refreshed(self, symbol: str):
+        def update(index: Dict):
+            if symbol in index:
+                index[symbol]['refreshed_at'] = datetime.now().isoformat(timespec='seconds')
+
+        self._update_index(update)
+
+    def merge(self, symbol: str, new_data: Optional[pd.DataFrame],
+              covered_from: Optional[pd.Timestamp] = None) -> Optional[pd.DataFrame]:
+        """
+        Merge freshly downloaded bars into the cache (new values win)
+
+        Returns:
+            The full merged frame for the symbol
+        """
+        new_data = canonicalize_ohlcv(new_data)
+        with self._symbol_lock(symbol):
+            existing = self.read(symbol)
+            if new_data is None:
+                if existing is not None:
+                    self._mark_refreshed(symbol)
+                return existing
+
+            if existing is not None:
+                combined = pd.concat([existing, new_data])
+                combined = combined[~combined.index.duplicated(keep='last')].sort_index()
+            else:
+                combined = new_data
+            self._write(symbol, combined, covered_from)
+            return combined
+
+    # ------------------------------------------------------------------
+    # Incremental planning
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def resolve_range(start=None, end=None, period: Optional[str] = None):
+        """Resolve (start, end) with end exclusive, defaulting to [period ago, tomorrow)"""
+        end_ts = pd.Timestamp(end).tz_localize(None).normalize() if end is not None \
+            else pd.Timestamp(datetime.now()).normalize() + pd.Timedelta(days=1)
+        if start is not None:
+            start_ts = pd.Timestamp(start).tz_localize(None).normalize()
+        else:
+            start_ts = end_ts - PERIOD_OFFSETS.get(period or '1y', PERIOD_OFFSETS['1y'])
+        return start_ts, end_ts
+
+    def plan_fetch(self, symbol: str, start, end) -> Optional[pd.Timestamp]:
+        """
+        Work out what must be downloaded to serve [start, end)
+
+        Returns:
+            Start date to fetch from (through `end`), or None if the cache
+            already covers the range
+        """
+        with self._lock:
+            entry = self._index.get(symbol)
+
+        if entry is None or not self._data_path(symbol).exists():
+            return start
+
+        first_date = pd.Timestamp(entry['first_date'])
+        last_date = pd.Timestamp(entry['last_date'])
+        covered_from = pd.Timestamp(entry.get('covered_from') or entry['first_date'])
+
+        # Head missing (and not already known to pre-date the listing)
+        if start < min(first_date, covered_from):
+            return start
+
+        # Tail missing: re-fetch from the last cached bar (it may have been partial)
+        if last_date < end - pd.Timedelta(days=1):
+            refreshed_at = datetime.fromisoformat(entry['refreshed_at'])
+            if datetime.now() - refreshed_at >= self.refresh_after:
+                return last_date
+
+        return None
+
+    def stale_symbols(self, symbols: Iterable[str], start=None, end=None,
+                      period: Optional[str] = None) -> Dict[str, pd.Timestamp]:
+        """Map each symbol needing a download to the date it must be fetched from"""
+        start_ts, end_ts = self.resolve_range(start, end, period)
+        plan = {}
+        for symbol in dict.fromkeys(symbols):
+            fetch_from = self.plan_fetch(symbol, start_ts, end_ts)
+            if fetch_from is not None:
+                plan[symbol] = fetch_from
+        return plan
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def get_history(self, symbol: str, start=None, end=None, period: Optional[str] = None,
+                    fetch_fn: Optional[FetchFn] = None) -> Optional[pd.DataFrame]:
+        """
+        Get daily bars for [start, end), downloading only what is missing
+
+        Args:
+            symbol: Ticker
+            start: Start date (default: `period` before end)
+            end: End date, exclusive (default: tomorrow)
+            period: Look-back period when start is not given ('1y', '2y', ...)
+            fetch_fn: Callable(symbol, start, end) -> DataFrame used for top-ups
+                      (None = serve from cache only)
+
+        Returns:
+            DataFrame in cache layout, or None if nothing is available
+        """
+        start_ts, end_ts = self.resolve_range(start, end, period)
+
+        data = None
+        fetch_from = self.plan_fetch(symbol, start_ts, end_ts) if fetch_fn is not None else None
+        if fetch_from is not None:
+            try:
+                new_data = fetch_fn(symbol, fetch_from, end_ts)
+                self.stats['top_ups'] += 1
+                if isinstance(new_data, pd.DataFrame):
+                    self.stats['bars_fetched'] += len(new_data)
+                data = self.merge(symbol, new_data, covered_from=fetch_from)
+            except Exception as e:
+                self.stats['fetch_errors'] += 1
+                logger.warning(f"OHLCV top-up failed for {symbol}, serving cached data: {e}")
+        else:
+            self.stats['hits'] += 1
+
+        if data is None:
+            data = self.read(symbol)
+        if data is None:
+            return None
+
+        sliced = data[(data.index >= start_ts) & (data.index < end_ts)]
+        return sliced if not sliced.empty else None
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Remove one symbol (or everything) from the cache"""
+        def update(index: Dict):
+            symbols = [symbol] if symbol else list(index.keys())
+            for sym in symbols:
+                path = self._data_path(sym)
+                if path.exists():
+                    path.unlink()
+                index.pop(sym, None)
+
+        self._update_index(update)
+
+    def get_cache_stats(self) -> Dict:
+        """Cache statistics (index contents + hit/top-up counters)"""
+        with self._lock:
+            entries = list(self._index.values())
+        return {
+            'symbols': len(entries),
+            'total_rows': sum(e.get('rows', 0) for e in entries),
+            'format': self.file_format,
+            'cache_dir': str(self.cache_dir),
+            **self.stats
+        }
+
+
+_default_cache: Optional[OHLCVCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_ohlcv_cache() -> OHLCVCache:
+    """Process-wide shared cache instance"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = OHLCVCache()
+        return _default_cache
@@ -10,21 +10,40 @@ Features:
 - Train-test split validation
 - Performance ranking and analysis
 - Overfitting prevention
+- Parallel search (ParallelParameterOptimizer): data loaded and predictions
+  generated once per lookback, combinations replayed through the trading
+  simulator in a process (or thread) pool with progress reporting and
+  deterministic early stopping
 
 Author: AI Assistant
 Date: November 2025
 """
 
 import itertools
+import inspect
 import random
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+import time
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+from typing import Callable, Dict, List, Tuple, Optional, Any
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
+from .trading_simulator import TradingSimulator
+
 logger = logging.getLogger(__name__)
 
+FAILED_BACKTEST_RESULT = {
+    'total_return_pct': -999,
+    'sharpe_ratio': -999,
+    'max_drawdown_pct': -999,
+    'win_rate': 0
+}
+
 
 class ParameterOptimizer:
     """
@@ -286,12 +305,7 @@ class ParameterOptimizer:
             
         except Exception as e:
             logger.error(f"Backtest failed with params {params}: {e}")
-            return {
-                'total_return_pct': -999,
-                'sharpe_ratio': -999,
-                'max_drawdown_pct': -999,
-                'win_rate': 0
-            }
+            return dict(FAILED_BACKTEST_RESULT)
     
     def _calculate_overfit_score(
         self,
@@ -389,6 +403,482 @@ class ParameterOptimizer:
         return summary
 
 
+# ----------------------------------------------------------------------
+# Parallel optimization
+# ----------------------------------------------------------------------
+
+# Parameters that change the predictions themselves (one walk-forward run per value)
+PREDICTION_PARAMS = ('lookback_days',)
+
+# Applied to the raw signal series: signals below the threshold become HOLD,
+# exactly as BacktestPredictionEngine does at prediction time
+THRESHOLD_PARAM = 'confidence_threshold'
+
+# Everything TradingSimulator accepts is a per-combination simulator parameter
+SIMULATOR_PARAMS = tuple(
+    name for name in inspect.signature(TradingSimulator.__init__).parameters if name != 'self'
+)
+
+# Signal series shared with pool workers (set once per worker by _init_worker)
+_worker_signals: Dict[int, Dict[str, np.ndarray]] = {}
+
+
+def _init_worker(signals: Dict[int, Dict[str, np.ndarray]]):
+    """Process-pool initializer: receive the precomputed signal series once per worker"""
+    global _worker_signals
+    _worker_signals = signals
+
+
+def _simulate_signals(
+    series: Dict[str, np.ndarray],
+    start_date: str,
+    end_date: str,
+    confidence_threshold: float,
+    simulator_params: Dict
+) -> Dict:
+    """Replay a precomputed signal series through TradingSimulator for [start_date, end_date]"""
+    timestamps = series['timestamps']
+    mask = (
+        (timestamps >= np.datetime64(pd.Timestamp(start_date))) &
+        (timestamps <= np.datetime64(pd.Timestamp(end_date)))
+    )
+    if not mask.any():
+        return dict(FAILED_BACKTEST_RESULT)
+    
+    confidences = series['confidences'][mask]
+    signals = np.where(confidences < confidence_threshold, 'HOLD', series['signals'][mask])
+    prices = series['prices'][mask]
+    
+    simulator = TradingSimulator(**simulator_params)
+    for timestamp, signal, price, confidence in zip(timestamps[mask], signals, prices, confidences):
+        simulator.execute_signal(
+            timestamp=pd.Timestamp(timestamp),
+            signal=signal,
+            price=price,
+            confidence=confidence
+        )
+    
+    # Close remaining positions
+    if simulator.positions:
+        simulator._close_positions(pd.Timestamp(timestamps[mask][-1]), prices[-1])
+    
+    return simulator.calculate_performance_metrics()
+
+
+def _evaluate_params(task: Tuple, signals: Optional[Dict[int, Dict[str, np.ndarray]]] = None) -> Tuple[int, Dict, Dict]:
+    """
+    Evaluate one parameter combination on the train and test periods
+    
+    Args:
+        task: (index, effective_params, periods, simulator_defaults)
+        signals: Signal series by lookback_days (default: the pool worker's
+            series set by _init_worker)
+    
+    Returns:
+        (index, train_result, test_result)
+    """
+    index, params, periods, simulator_defaults = task
+    if signals is None:
+        signals = _worker_signals
+    results = []
+    for start_date, end_date in periods:
+        try:
+            series = signals.get(params.get('lookback_days', 60))
+            if series is None:
+                raise ValueError(f"No predictions for lookback_days={params.get('lookback_days', 60)}")
+            simulator_params = {
+                **simulator_defaults,
+                **{k: v for k, v in params.items() if k in SIMULATOR_PARAMS}
+            }
+            results.append(_simulate_signals(
+                series, start_date, end_date,
+                params.get(THRESHOLD_PARAM, 0.6),
+                simulator_params
+            ))
+        except Exception as e:
+            logger.error(f"Backtest failed with params {params}: {e}")
+            results.append(dict(FAILED_BACKTEST_RESULT))
+    return index, results[0], results[1]
+
+
+class ParallelParameterOptimizer(ParameterOptimizer):
+    """
+    Parameter optimizer that predicts once and searches in parallel
+    
+    The price data is loaded once per symbol and the walk-forward predictions
+    are generated once per lookback_days value (with no confidence filter).
+    Each combination then only replays that signal series through the
+    trading simulator, so the search cost is dominated by cheap simulations
+    that scale with the number of worker processes.
+    
+    Same grid_search/random_search interface and result columns as
+    ParameterOptimizer; no backtest_function is needed.
+    """
+    
+    def __init__(
+        self,
+        parameter_grid: Dict[str, List],
+        optimization_metric: str = 'total_return_pct',
+        train_test_split: float = 0.75,
+        embargo_days: int = 3,
+        model_type: str = 'ensemble',
+        initial_capital: float = 10000.0,
+        commission_rate: float = 0.001,
+        slippage_rate: float = 0.0005,
+        max_workers: Optional[int] = None,
+        early_stopping_rounds: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int, Optional[float]], None]] = None,
+        data: Optional[pd.DataFrame] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        use_processes: bool = True
+    ):
+        """
+        Initialize parallel parameter optimizer
+        
+        Args:
+            parameter_grid: Dict of parameter names and values to test
+            optimization_metric: Metric to optimize ('total_return_pct', 'sharpe_ratio', etc.)
+            train_test_split: Proportion of data for training
+            embargo_days: Gap between train and test periods
+            model_type: Prediction model ('ensemble', 'lstm', 'technical', 'momentum')
+            initial_capital: Simulator starting capital
+            commission_rate: Simulator commission rate
+            slippage_rate: Simulator slippage rate
+            max_workers: Worker processes (None = CPU count, 1 = run in-process)
+            early_stopping_rounds: Stop after this many combinations, in
+                submission order, without improving the best test metric
+                (None = evaluate all); results do not depend on worker timing
+            progress_callback: Called as callback(completed, total, best_metric)
+            data: Preloaded price data (default: load with HistoricalDataLoader)
+            should_stop: Polled after each prediction run and each combination;
+                returning True ends the search with the results so far
+                (e.g. a cancelled background job)
+            use_processes: Evaluate in a process pool. Use False inside servers:
+                spawned workers (Windows) re-import the main module and would
+                re-run its module-level start-up; a thread pool is used instead
+        """
+        super().__init__(
+            backtest_function=None,
+            parameter_grid=parameter_grid,
+            optimization_metric=optimization_metric,
+            train_test_split=train_test_split,
+            embargo_days=embargo_days
+        )
+        self.model_type = model_type
+        self.simulator_defaults = {
+            'initial_capital': initial_capital,
+            'commission_rate': commission_rate,
+            'slippage_rate': slippage_rate
+        }
+        self.max_workers = max_workers
+        self.early_stopping_rounds = early_stopping_rounds
+        self.progress_callback = progress_callback
+        self.data = data
+        self.should_stop = should_stop
+        self.use_processes = use_processes
+        self.search_stats: Dict[str, Any] = {}
+        
+        unknown = [
+            name for name in parameter_grid
+            if name not in PREDICTION_PARAMS + SIMULATOR_PARAMS + (THRESHOLD_PARAM,)
+        ]
+        if unknown:
+            logger.warning(f"Parameters not used by the parallel optimizer (ignored): {unknown}")
+    
+    def grid_search(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        **fixed_params
+    ) -> Tuple[Dict, pd.DataFrame]:
+        """
+        Perform exhaustive grid search over all parameter combinations
+        
+        Args:
+            symbol: Stock symbol to test
+            start_date: Backtest start date
+            end_date: Backtest end date
+            **fixed_params: Additional fixed parameters for every combination
+        
+        Returns:
+            best_params: Best parameter configuration
+            results_df: DataFrame with all test results
+        """
+        logger.info(f"Starting parallel grid search optimization for {symbol}")
+        
+        param_names = list(self.parameter_grid.keys())
+        param_values = [self.parameter_grid[name] for name in param_names]
+        combinations = [dict(zip(param_names, combo)) for combo in itertools.product(*param_values)]
+        
+        return self._search(symbol, start_date, end_date, combinations, fixed_params, 'Grid search')
+    
+    def random_search(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        n_iterations: int = 100,
+        **fixed_params
+    ) -> Tuple[Dict, pd.DataFrame]:
+        """
+        Perform random search by sampling parameter space
+        
+        Args:
+            symbol: Stock symbol to test
+            start_date: Backtest start date
+            end_date: Backtest end date
+            n_iterations: Number of random combinations to test
+            **fixed_params: Additional fixed parameters for every combination
+        
+        Returns:
+            best_params: Best parameter configuration
+            results_df: DataFrame with all test results
+        """
+        logger.info(f"Starting parallel random search optimization for {symbol} ({n_iterations} iterations)")
+        
+        combinations = [self._generate_random_params() for _ in range(n_iterations)]
+        
+        return self._search(symbol, start_date, end_date, combinations, fixed_params, 'Random search')
+    
+    def prepare_signals(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        lookbacks: List[int]
+    ) -> Dict[int, Dict[str, np.ndarray]]:
+        """
+        Load data once and generate one unfiltered signal series per lookback
+        
+        Returns:
+            Dict mapping lookback_days -> {'timestamps', 'signals', 'confidences', 'prices'}
+        """
+        from .prediction_engine import BacktestPredictionEngine
+        
+        data = self.data
+        if data is None:
+            from .data_loader import HistoricalDataLoader
+            loader = HistoricalDataLoader(
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                use_cache=True
+            )
+            data = loader.load_price_data()
+        
+        if data is None or data.empty:
+            raise ValueError(f"No historical data available for {symbol}")
+        
+        # Threshold 0: keep every raw signal, the threshold is applied per combination
+        engine = BacktestPredictionEngine(model_type=self.model_type, confidence_threshold=0.0)
+        
+        signals = {}
+        for lookback in lookbacks:
+            if self._stop_requested():
+                break
+            predictions = engine.walk_forward_backtest(
+                data=data,
+                start_date=start_date,
+                end_date=end_date,
+                prediction_frequency='daily',
+                lookback_days=lookback
+            )
+            if predictions.empty:
+                logger.warning(f"No predictions for lookback_days={lookback}")
+                continue
+            
+            prices = predictions['current_price']
+            if 'actual_price' in predictions.columns:
+                prices = predictions['actual_price'].fillna(prices)
+            
+            signals[lookback] = {
+                'timestamps': pd.DatetimeIndex(pd.to_datetime(predictions['timestamp'])).values,
+                'signals': predictions['prediction'].values.astype(object),
+                'confidences': predictions['confidence'].values.astype(float),
+                'prices': prices.values.astype(float)
+            }
+        
+        return signals
+    
+    def _search(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        combinations: List[Dict],
+        fixed_params: Dict,
+        label: str
+    ) -> Tuple[Dict, pd.DataFrame]:
+        """Predict once, evaluate all combinations, select the best"""
+        search_start = time.time()
+        total_tests = len(combinations)
+        logger.info(f"Testing {total_tests} parameter combinations")
+        
+        train_end, test_start = self._calculate_split_dates(start_date, end_date)
+        periods = ((start_date, train_end), (test_start, end_date))
+        
+        effective = [{**fixed_params, **params} for params in combinations]
+        lookbacks = sorted({params.get('lookback_days', 60) for params in effective})
+        
+        signals = self.prepare_signals(symbol, start_date, end_date, lookbacks)
+        prediction_seconds = time.time() - search_start
+        logger.info(f"[OK] Predictions generated once for {len(signals)} lookback values in {prediction_seconds:.1f}s")
+        
+        tasks = [
+            (i, params, periods, self.simulator_defaults)
+            for i, params in enumerate(effective)
+        ]
+        if self._stop_requested():
+            outcomes, stopped_early = {}, True
+        else:
+            outcomes, stopped_early = self._run_tasks(tasks, signals)
+        
+        self.results = []
+        for i in sorted(outcomes):
+            train_result, test_result = outcomes[i]
+            self.results.append({
+                'params': combinations[i],
+                'train_return': train_result.get('total_return_pct', 0),
+                'train_sharpe': train_result.get('sharpe_ratio', 0),
+                'train_drawdown': train_result.get('max_drawdown_pct', 0),
+                'train_win_rate': train_result.get('win_rate', 0),
+                'test_return': test_result.get('total_return_pct', 0),
+                'test_sharpe': test_result.get('sharpe_ratio', 0),
+                'test_drawdown': test_result.get('max_drawdown_pct', 0),
+                'test_win_rate': test_result.get('win_rate', 0),
+                'overfit_score': self._calculate_overfit_score(train_result, test_result)
+            })
+        
+        results_df = pd.DataFrame(self.results)
+        best_params = self._select_best_params(results_df)
+        
+        self.search_stats = {
+            'total_combinations': total_tests,
+            'evaluated': len(self.results),
+            'stopped_early': stopped_early,
+            'prediction_seconds': round(prediction_seconds, 2),
+            'elapsed_seconds': round(time.time() - search_start, 2)
+        }
+        logger.info(f"{label} complete ({self.search_stats}). Best params: {best_params}")
+        
+        return best_params, results_df
+    
+    def _stop_requested(self) -> bool:
+        """Poll the caller's should_stop hook"""
+        if self.should_stop is None:
+            return False
+        try:
+            return bool(self.should_stop())
+        except Exception as e:
+            logger.debug(f"should_stop hook failed: {e}")
+            return False
+    
+    def _is_better(self, value: float, best: Optional[float]) -> bool:
+        """Compare test metric values (drawdown: lower is better)"""
+        if best is None:
+            return True
+        if 'drawdown' in self.optimization_metric:
+            return value < best
+        return value > best
+    
+    def _run_tasks(
+        self,
+        tasks: List[Tuple],
+        signals: Dict[int, Dict[str, np.ndarray]]
+    ) -> Tuple[Dict[int, Tuple[Dict, Dict]], bool]:
+        """
+        Evaluate tasks in a process or thread pool (or in-process), with progress and early stopping
+        
+        Returns:
+            ({task index: (train_result, test_result)}, stopped_early)
+        """
+        total = len(tasks)
+        outcomes: Dict[int, Tuple[Dict, Dict]] = {}
+        state = {'best': None, 'since_best': 0}
+        
+        def record(index: int, train_result: Dict, test_result: Dict) -> bool:
+            """Store an outcome; returns True when the search should stop"""
+            outcomes[index] = (train_result, test_result)
+            
+            value = test_result.get(self.optimization_metric, 0)
+            if self._is_better(value, state['best']):
+                state['best'] = value
+                state['since_best'] = 0
+            else:
+                state['since_best'] += 1
+            
+            completed = len(outcomes)
+            if completed % max(1, total // 10) == 0 or completed == total:
+                logger.info(f"Progress: {completed}/{total} ({completed/total*100:.1f}%), "
+                            f"best test {self.optimization_metric}={state['best']}")
+            if self.progress_callback is not None:
+                try:
+                    self.progress_callback(completed, total, state['best'])
+                except Exception as e:
+                    logger.debug(f"Progress callback failed: {e}")
+            
+            if self._stop_requested():
+                logger.info(f"Search stopped by caller ({completed}/{total} evaluated)")
+                return True
+            
+            if self.early_stopping_rounds and state['since_best'] >= self.early_stopping_rounds:
+                logger.info(f"Early stopping: no improvement in {self.early_stopping_rounds} combinations "
+                            f"({completed}/{total} evaluated)")
+                return True
+            return False
+        
+        # Outcomes are recorded in submission order (finished tasks wait for
+        # their predecessors), so early stopping never depends on worker timing
+        ready: Dict[int, Tuple[Dict, Dict]] = {}
+        position = {'next': 0}
+        
+        def drain() -> bool:
+            """Record buffered outcomes that are next in order; True to stop"""
+            while position['next'] < total and tasks[position['next']][0] in ready:
+                index = tasks[position['next']][0]
+                position['next'] += 1
+                if record(index, *ready.pop(index)):
+                    return True
+            return False
+        
+        if self.max_workers != 1 and total > 1:
+            if self.use_processes:
+                pool_factory = functools.partial(
+                    ProcessPoolExecutor, max_workers=self.max_workers,
+                    initializer=_init_worker, initargs=(signals,)
+                )
+                evaluate = _evaluate_params
+            else:
+                pool_factory = functools.partial(
+                    ThreadPoolExecutor, max_workers=self.max_workers,
+                    thread_name_prefix='param-search'
+                )
+                evaluate = functools.partial(_evaluate_params, signals=signals)
+            try:
+                with pool_factory() as pool:
+                    pending = {pool.submit(evaluate, task) for task in tasks}
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            index, train_result, test_result = future.result()
+                            ready[index] = (train_result, test_result)
+                        if drain():
+                            for future in pending:
+                                future.cancel()
+                            return outcomes, True
+                return outcomes, False
+            except (BrokenProcessPool, PicklingError, OSError) as e:
+                logger.warning(f"Process pool unavailable, evaluating remaining combinations in-process: {e}")
+        
+        for task in tasks[position['next']:]:
+            if task[0] not in ready:
+                ready[task[0]] = _evaluate_params(task, signals)[1:]
+            if drain():
+                return outcomes, True
+        return outcomes, False
+
+
 # Default parameter grids
 DEFAULT_PARAMETER_GRID = {
     'confidence_threshold': [0.50, 0.55, 0.60, 0.65, 0.70, 0.75, 0.80],
@@ -7,6 +7,7 @@ Generates predictions using walk-forward validation with NO look-ahead bias.
 Key Features:
 - Three prediction methods: LSTM, Technical, Ensemble
 - Walk-forward validation (no future data leakage)
+- Vectorized walk-forward mode: features for every date computed in bulk
 - Confidence scoring
 - Configurable lookback periods
 - Prediction frequency control (daily, weekly, monthly)
@@ -510,7 +511,8 @@ class BacktestPredictionEngine:
         start_date: str,
         end_date: str,
         prediction_frequency: str = 'daily',
-        lookback_days: int = 60
+        lookback_days: int = 60,
+        vectorized: bool = True
     ) -> pd.DataFrame:
         """
         Perform walk-forward backtesting across date range
@@ -521,6 +523,10 @@ class BacktestPredictionEngine:
             end_date: Backtest end date (YYYY-MM-DD)
             prediction_frequency: 'daily', 'weekly', or 'monthly'
             lookback_days: Days of history to use for each prediction
+            vectorized: Compute all predictions in bulk over a sliding-window
+                matrix (same windows and rules as predict_at_timestamp, no
+                look-ahead). Falls back to the per-date loop when the data
+                cannot be vectorized (missing prices, lookback < 30).
         
         Returns:
             DataFrame with predictions and metadata
@@ -557,36 +563,18 @@ class BacktestPredictionEngine:
             else:
                 raise ValueError(f"Invalid frequency: {prediction_frequency}")
             
-            # Generate predictions for each timestamp
-            predictions = []
-            total_dates = len(prediction_dates)
-            
-            for i, timestamp in enumerate(prediction_dates):
-                if (i + 1) % 50 == 0:
-                    logger.info(f"Processing {i+1}/{total_dates} predictions...")
-                
-                # Generate prediction
-                prediction = self.predict_at_timestamp(
-                    timestamp=timestamp,
-                    historical_data=data_copy,  # Pass timezone-normalized data
-                    lookback_days=lookback_days
-                )
-                
-                # Add actual price (for later evaluation)
-                if timestamp in data_copy.index:
-                    prediction['actual_price'] = data_copy.loc[timestamp, 'Close']
-                    
-                    # Also get next day's price (if available) for forward return
-                    future_dates = data_copy.index[data_copy.index > timestamp]
-                    if len(future_dates) > 0:
-                        next_date = future_dates[0]
-                        prediction['next_price'] = data_copy.loc[next_date, 'Close']
-                        prediction['forward_return'] = (
-                            (prediction['next_price'] - prediction['actual_price']) /
-                            prediction['actual_price']
-                        )
-                
-                predictions.append(prediction)
+            predictions = None
+            if vectorized and self._can_vectorize(data_copy, lookback_days):
+                try:
+                    predictions = self._predict_vectorized(data_copy, prediction_dates, lookback_days)
+                except Exception as e:
+                    logger.warning(f"Vectorized walk-forward failed, using per-date loop: {e}")
+            
+            if predictions is None:
+                predictions = self._predict_loop(data_copy, prediction_dates, lookback_days)
+            
+            # Add actual and next-bar prices (for later evaluation) in one pass
+            self._add_forward_returns(predictions, data_copy, prediction_dates)
             
             # Convert to DataFrame
             results_df = pd.DataFrame(predictions)
@@ -601,6 +589,356 @@ class BacktestPredictionEngine:
             logger.error(f"Error in walk-forward backtest: {e}")
             return pd.DataFrame()
     
+    def _predict_loop(
+        self,
+        data: pd.DataFrame,
+        prediction_dates: pd.DatetimeIndex,
+        lookback_days: int
+    ) -> List[Dict]:
+        """Generate predictions one timestamp at a time"""
+        predictions = []
+        total_dates = len(prediction_dates)
+        
+        for i, timestamp in enumerate(prediction_dates):
+            if (i + 1) % 50 == 0:
+                logger.info(f"Processing {i+1}/{total_dates} predictions...")
+            
+            predictions.append(self.predict_at_timestamp(
+                timestamp=timestamp,
+                historical_data=data,  # Pass timezone-normalized data
+                lookback_days=lookback_days
+            ))
+        
+        return predictions
+    
+    @staticmethod
+    def _add_forward_returns(
+        predictions: List[Dict],
+        data: pd.DataFrame,
+        prediction_dates: pd.DatetimeIndex
+    ):
+        """Attach actual price, next bar's price and forward return (positional lookup)"""
+        closes = data['Close'].values
+        positions = data.index.get_indexer(prediction_dates)
+        
+        for prediction, pos in zip(predictions, positions):
+            if pos < 0:
+                continue
+            prediction['actual_price'] = closes[pos]
+            if pos + 1 < len(closes):
+                prediction['next_price'] = closes[pos + 1]
+                prediction['forward_return'] = (
+                    (prediction['next_price'] - prediction['actual_price']) /
+                    prediction['actual_price']
+                )
+    
+    # ------------------------------------------------------------------
+    # Vectorized walk-forward
+    #
+    # Row j of the window matrix W holds the lookback_days closes ending
+    # just BEFORE prediction j - exactly the training_window that
+    # predict_at_timestamp() would slice - so every feature below is the
+    # column-wise equivalent of the per-window formula in the _predict_*
+    # methods (results match up to floating-point rounding).
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _can_vectorize(data: pd.DataFrame, lookback_days: int) -> bool:
+        """Vectorized mode needs complete prices and a lookback long enough for all indicators"""
+        return lookback_days >= 30 and 'Close' in data.columns and not data['Close'].isna().any()
+    
+    @staticmethod
+    def _ewm_last(W: np.ndarray, span: int) -> np.ndarray:
+        """Last value of pandas ewm(span, adjust=True).mean() over each row"""
+        alpha = 2.0 / (span + 1.0)
+        weights = (1.0 - alpha) ** np.arange(W.shape[1] - 1, -1, -1)
+        return W @ weights / weights.sum()
+    
+    @staticmethod
+    def _signals_from_scores(
+        buy: np.ndarray,
+        sell: np.ndarray,
+        active_confidence: np.ndarray,
+        hold_confidence: np.ndarray
+    ):
+        """Map BUY/SELL masks to prediction labels and confidences"""
+        prediction = np.where(buy, 'BUY', np.where(sell, 'SELL', 'HOLD')).astype(object)
+        confidence = np.where(buy | sell, active_confidence, hold_confidence)
+        return prediction, confidence
+    
+    def _vector_technical(self, W: np.ndarray) -> Dict[str, np.ndarray]:
+        """Vectorized _predict_technical"""
+        current = W[:, -1]
+        returns = W[:, 1:] / W[:, :-1] - 1  # pct_change
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # RSI
+            delta = np.diff(W, axis=1)
+            gain = np.where(delta > 0, delta, 0)[:, -14:].mean(axis=1)
+            loss = np.where(delta < 0, -delta, 0)[:, -14:].mean(axis=1)
+            rsi = 100 - (100 / (1 + gain / loss))
+            
+            # Moving averages
+            sma_20 = W[:, -20:].mean(axis=1)
+            sma_50 = W[:, -50:].mean(axis=1) if W.shape[1] >= 50 else W.mean(axis=1)
+            macd = self._ewm_last(W, 12) - self._ewm_last(W, 26)
+            
+            # Bollinger Bands
+            bb_std = W[:, -20:].std(axis=1, ddof=1)
+            upper_band = sma_20 + (bb_std * 2)
+            lower_band = sma_20 - (bb_std * 2)
+            bb_position = np.where(
+                upper_band != lower_band,
+                (current - lower_band) / (upper_band - lower_band),
+                0.5
+            )
+        
+        volatility = returns.std(axis=1, ddof=1)
+        volatility_factor = 1.0 / (1.0 + volatility * 8)
+        
+        # Scoring system (the MACD signal line of a single value equals MACD,
+        # so the histogram is always 0 and contributes nothing)
+        score = np.zeros(len(W))
+        score += np.where(rsi < 30, 0.3, np.where(rsi > 70, -0.3, 0.0))
+        bullish = (current > sma_20) & (sma_20 > sma_50)
+        bearish = (current < sma_20) & (sma_20 < sma_50)
+        score += np.where(bullish, 0.25, np.where(bearish, -0.25, 0.0))
+        score += np.where(bb_position < 0.2, 0.25, np.where(bb_position > 0.8, -0.25, 0.0))
+        
+        prediction, confidence = self._signals_from_scores(
+            score > 0.3, score < -0.3,
+            np.minimum(0.55 + np.abs(score) * 0.3, 0.85) * volatility_factor,
+            0.5 * volatility_factor
+        )
+        
+        return {
+            'prediction': prediction,
+            'confidence': confidence,
+            'technical_score': score,
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': macd,
+            'bb_position': bb_position,
+            'sma_20': sma_20,
+            'sma_50': sma_50,
+            'volatility': volatility
+        }
+    
+    def _vector_lstm(self, W: np.ndarray) -> Dict[str, np.ndarray]:
+        """Vectorized _predict_lstm"""
+        current = W[:, -1]
+        returns = np.diff(W, axis=1) / W[:, :-1]
+        
+        sma_20 = W[:, -20:].mean(axis=1)
+        sma_50 = W[:, -50:].mean(axis=1) if W.shape[1] >= 50 else W.mean(axis=1)
+        price_vs_sma20 = (current - sma_20) / sma_20
+        price_vs_sma50 = (current - sma_50) / sma_50
+        
+        recent_momentum = returns[:, -5:].mean(axis=1)
+        medium_momentum = returns[:, -20:].mean(axis=1)
+        volatility = returns.std(axis=1)
+        
+        trend_signal = np.where(
+            (price_vs_sma20 > 0.02) & (price_vs_sma50 > 0.02), 1,
+            np.where((price_vs_sma20 < -0.02) & (price_vs_sma50 < -0.02), -1, 0)
+        )
+        momentum_signal = np.where(
+            (recent_momentum > 0.01) & (medium_momentum > 0.005), 1,
+            np.where((recent_momentum < -0.01) & (medium_momentum < -0.005), -1, 0)
+        )
+        combined_signal = (trend_signal * 0.6 + momentum_signal * 0.4)
+        volatility_factor = 1.0 / (1.0 + volatility * 8)
+        
+        prediction, confidence = self._signals_from_scores(
+            combined_signal > 0.3, combined_signal < -0.3,
+            np.minimum(0.55 + np.abs(combined_signal) * 0.25, 0.85) * volatility_factor,
+            0.5 * volatility_factor
+        )
+        
+        return {
+            'prediction': prediction,
+            'confidence': confidence,
+            'trend_signal': trend_signal,
+            'momentum_signal': momentum_signal,
+            'combined_signal': combined_signal,
+            'volatility': volatility
+        }
+    
+    def _vector_momentum(self, W: np.ndarray) -> Dict[str, np.ndarray]:
+        """Vectorized _predict_momentum"""
+        current = W[:, -1]
+        lookback = W.shape[1]
+        returns = W[:, 1:] / W[:, :-1] - 1  # pct_change
+        
+        recent_return = returns[:, -5:].mean(axis=1)
+        medium_return = returns[:, -20:].mean(axis=1)
+        roc_20 = (current - W[:, -20]) / W[:, -20] if lookback > 20 else np.zeros(len(W))
+        
+        # Least-squares slope over each window (closed form of np.polyfit(days, prices, 1))
+        days = np.arange(lookback) - (lookback - 1) / 2.0
+        trend_strength = (W @ days) / (days @ days) / current
+        
+        acceleration = np.diff(returns, axis=1)[:, -10:].mean(axis=1)
+        
+        volatility = returns.std(axis=1, ddof=1)
+        volatility_factor = 1.0 / (1.0 + volatility * 10)
+        
+        momentum_score = np.clip(
+            recent_return * 0.35 +
+            medium_return * 0.25 +
+            trend_strength * 0.20 +
+            roc_20 * 0.15 +
+            acceleration * 0.05,
+            -1, 1
+        )
+        
+        prediction, confidence = self._signals_from_scores(
+            momentum_score > 0.003, momentum_score < -0.003,
+            np.minimum(0.5 + np.abs(momentum_score) * 15, 0.85) * volatility_factor,
+            0.5 * volatility_factor
+        )
+        
+        return {
+            'prediction': prediction,
+            'confidence': confidence,
+            'momentum_score': momentum_score,
+            'recent_return': recent_return,
+            'medium_return': medium_return,
+            'trend_strength': trend_strength,
+            'roc_20': roc_20,
+            'acceleration': acceleration,
+            'volatility': volatility
+        }
+    
+    @staticmethod
+    def _vector_records(columns: Dict[str, np.ndarray]) -> List[Dict]:
+        """Column arrays -> per-row dictionaries"""
+        return pd.DataFrame(columns).to_dict('records')
+    
+    def _vector_ensemble(self, W: np.ndarray) -> Dict[str, np.ndarray]:
+        """Vectorized _predict_ensemble"""
+        lstm_pred = self._vector_lstm(W)
+        technical_pred = self._vector_technical(W)
+        momentum_pred = self._vector_momentum(W)
+        
+        lstm_weight = 0.40
+        technical_weight = 0.35
+        momentum_weight = 0.25
+        
+        pred_to_score = {'BUY': 1, 'HOLD': 0, 'SELL': -1}
+        to_score = np.vectorize(pred_to_score.get, otypes=[float])
+        
+        ensemble_score = (
+            to_score(lstm_pred['prediction']) * lstm_pred['confidence'] * lstm_weight +
+            to_score(technical_pred['prediction']) * technical_pred['confidence'] * technical_weight +
+            to_score(momentum_pred['prediction']) * momentum_pred['confidence'] * momentum_weight
+        )
+        ensemble_confidence = (
+            lstm_pred['confidence'] * lstm_weight +
+            technical_pred['confidence'] * technical_weight +
+            momentum_pred['confidence'] * momentum_weight
+        )
+        
+        # Consensus bonus (all three agree on BUY or SELL)
+        consensus = (
+            (lstm_pred['prediction'] == technical_pred['prediction']) &
+            (technical_pred['prediction'] == momentum_pred['prediction'])
+        )
+        agree = consensus & (lstm_pred['prediction'] != 'HOLD')
+        ensemble_confidence = np.where(agree, np.minimum(ensemble_confidence * 1.15, 0.9), ensemble_confidence)
+        ensemble_score = np.where(agree, ensemble_score * 1.1, ensemble_score)
+        
+        prediction = np.where(
+            ensemble_score > 0.15, 'BUY',
+            np.where(ensemble_score < -0.15, 'SELL', 'HOLD')
+        ).astype(object)
+        
+        return {
+            'prediction': prediction,
+            'confidence': ensemble_confidence,
+            'ensemble_score': ensemble_score,
+            'lstm': self._vector_records(lstm_pred),
+            'technical': self._vector_records(technical_pred),
+            'momentum': self._vector_records(momentum_pred),
+            'consensus': consensus
+        }
+    
+    def _predict_vectorized(
+        self,
+        data: pd.DataFrame,
+        prediction_dates: pd.DatetimeIndex,
+        lookback_days: int
+    ) -> List[Dict]:
+        """
+        Generate predictions for all dates in bulk
+        
+        Args:
+            data: Timezone-normalized historical data
+            prediction_dates: Prediction timestamps
+            lookback_days: Window length
+        
+        Returns:
+            List of prediction dictionaries (same fields as predict_at_timestamp)
+        """
+        closes = data['Close'].values.astype(float)
+        
+        # Rows strictly BEFORE each timestamp (no look-ahead)
+        available = data.index.searchsorted(prediction_dates, side='left')
+        sufficient = available >= lookback_days
+        
+        predictions: List[Optional[Dict]] = [None] * len(prediction_dates)
+        for i in np.flatnonzero(~sufficient):
+            predictions[i] = {
+                'timestamp': prediction_dates[i],
+                'prediction': 'HOLD',
+                'confidence': 0.0,
+                'reason': 'Insufficient historical data',
+                'data_points_used': int(available[i])
+            }
+        if not sufficient.all():
+            logger.warning(
+                f"Insufficient data for {int((~sufficient).sum())} of {len(prediction_dates)} "
+                f"prediction dates (need {lookback_days} days)"
+            )
+        
+        rows = np.flatnonzero(sufficient)
+        if len(rows) == 0:
+            return predictions
+        
+        # Window ending at position e-1 starts at e-lookback_days
+        windows = np.lib.stride_tricks.sliding_window_view(closes, lookback_days)
+        W = windows[available[rows] - lookback_days]
+        
+        if self.model_type == 'lstm':
+            columns = self._vector_lstm(W)
+        elif self.model_type == 'technical':
+            columns = self._vector_technical(W)
+        elif self.model_type == 'momentum':
+            columns = self._vector_momentum(W)
+        else:  # ensemble
+            columns = self._vector_ensemble(W)
+        
+        keys = list(columns.keys())
+        current_prices = W[:, -1]
+        for n, i in enumerate(rows):
+            prediction = {key: columns[key][n] for key in keys}
+            
+            # Add metadata
+            prediction['timestamp'] = prediction_dates[i]
+            prediction['current_price'] = current_prices[n]
+            prediction['data_points_used'] = lookback_days
+            prediction['model_type'] = self.model_type
+            
+            # Apply confidence threshold
+            if prediction['confidence'] < self.confidence_threshold:
+                prediction['original_prediction'] = prediction['prediction']
+                prediction['prediction'] = 'HOLD'
+                prediction['reason'] = f"Confidence below threshold ({self.confidence_threshold})"
+            
+            predictions[i] = prediction
+        
+        return predictions
+    
     def evaluate_predictions(self, predictions_df: pd.DataFrame) -> Dict:
         """
         Evaluate prediction accuracy
@@ -31,6 +31,8 @@ class FinBERTSentimentAnalyzer:
     Provides sentiment scores for financial text with fallback mechanisms
     
     v185: Class-level model caching to prevent reloading every cycle
+    Batched inference: analyze_texts()/analyze_news_batch() run one forward
+    pass per batch, padded to the longest item, with length-sorted bucketing
     """
     
     # Class-level cache for shared model instance
@@ -39,14 +41,16 @@ class FinBERTSentimentAnalyzer:
     _shared_model_loaded = False
     _load_lock = None  # Will be initialized as threading.Lock()
     
-    def __init__(self, model_name: str = "ProsusAI/finbert"):
+    def __init__(self, model_name: str = "ProsusAI/finbert", batch_size: int = 16):
         """
         Initialize FinBERT sentiment analyzer
         
         Args:
             model_name: HuggingFace model name for FinBERT
+            batch_size: Texts per forward pass in analyze_texts()/analyze_news_batch()
         """
         self.model_name = model_name
+        self.batch_size = max(1, int(batch_size))
         
         # Use class-level shared model if available
         if FinBERTSentimentAnalyzer._shared_model_loaded:
@@ -167,6 +171,19 @@ class FinBERTSentimentAnalyzer:
             self.use_fallback = True
             return False
     
+    @property
+    def model_version(self) -> str:
+        """
+        Identifier of the scoring method, used to key stored sentiment scores
+        
+        Changes when the model (or the fallback method) changes, so stale
+        scores are never reused.
+        """
+        if self.is_loaded and not self.use_fallback and self.model is not None:
+            revision = getattr(self.model.config, '_commit_hash', None) or 'local'
+            return f"{self.model_name}@{revision}"
+        return 'keyword-fallback'
+    
     def analyze_text(self, text: str) -> Dict:
         """
         Analyze sentiment of financial text
@@ -214,31 +231,127 @@ class FinBERTSentimentAnalyzer:
             # Convert to probabilities
             probs = predictions[0].detach().cpu().numpy()
             
-            # Get dominant sentiment
-            dominant_idx = np.argmax(probs)
-            dominant_label = self.labels[dominant_idx]
-            confidence = float(probs[dominant_idx])
-            
-            # Calculate compound score (-1 to 1)
-            compound_score = float(probs[2] - probs[0])  # positive - negative
-            
-            return {
-                'sentiment': dominant_label,
-                'confidence': round(confidence * 100, 2),
-                'scores': {
-                    'negative': round(float(probs[0]), 4),
-                    'neutral': round(float(probs[1]), 4),
-                    'positive': round(float(probs[2]), 4)
-                },
-                'compound': round(compound_score, 4),
-                'method': 'FinBERT',
-                'timestamp': datetime.now().isoformat()
-            }
+            return self._format_finbert_result(probs)
             
         except Exception as e:
             logger.error(f"FinBERT analysis error: {e}")
             return self._fallback_analysis(text)
     
+    def _format_finbert_result(self, probs: np.ndarray) -> Dict:
+        """
+        Build the result dictionary from class probabilities
+        
+        Args:
+            probs: Softmax probabilities [negative, neutral, positive]
+        
+        Returns:
+            Sentiment analysis results
+        """
+        # Get dominant sentiment
+        dominant_idx = np.argmax(probs)
+        dominant_label = self.labels[dominant_idx]
+        confidence = float(probs[dominant_idx])
+        
+        # Calculate compound score (-1 to 1)
+        compound_score = float(probs[2] - probs[0])  # positive - negative
+        
+        return {
+            'sentiment': dominant_label,
+            'confidence': round(confidence * 100, 2),
+            'scores': {
+                'negative': round(float(probs[0]), 4),
+                'neutral': round(float(probs[1]), 4),
+                'positive': round(float(probs[2]), 4)
+            },
+            'compound': round(compound_score, 4),
+            'method': 'FinBERT',
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def analyze_texts(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict]:
+        """
+        Analyze sentiment of many texts with batched inference
+        
+        Per-item results are identical to calling analyze_text() on each text
+        (padding is masked out), but the model runs once per batch instead of
+        once per text.
+        
+        Args:
+            texts: Financial texts to analyze
+            batch_size: Texts per forward pass (default: self.batch_size)
+        
+        Returns:
+            List of sentiment results, in the same order as texts
+        """
+        results: List[Optional[Dict]] = [None] * len(texts)
+        
+        pending = []
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) == 0:
+                results[i] = self._get_neutral_sentiment()
+            else:
+                pending.append(i)
+        
+        if pending:
+            if self.is_loaded and not self.use_fallback:
+                batch_results = self._finbert_analysis_batch(
+                    [texts[i] for i in pending],
+                    batch_size or self.batch_size
+                )
+            else:
+                batch_results = [self._fallback_analysis(texts[i]) for i in pending]
+            
+            for i, result in zip(pending, batch_results):
+                results[i] = result
+        
+        return results
+    
+    def _finbert_analysis_batch(self, texts: List[str], batch_size: int) -> List[Dict]:
+        """
+        Batched FinBERT inference
+        
+        Texts are tokenized once, sorted by token length and grouped into
+        batches so each batch is padded only to its own longest item.
+        
+        Args:
+            texts: Non-empty texts to analyze
+            batch_size: Texts per forward pass
+        
+        Returns:
+            List of sentiment results, in the same order as texts
+        """
+        try:
+            encodings = self.tokenizer(texts, truncation=True, max_length=512)
+        except Exception as e:
+            logger.error(f"FinBERT batch tokenization error: {e}")
+            return [self._finbert_analysis(text) for text in texts]
+        
+        # Length-sorted bucketing keeps padding per batch to a minimum
+        order = sorted(range(len(texts)), key=lambda i: len(encodings['input_ids'][i]))
+        results: List[Optional[Dict]] = [None] * len(texts)
+        
+        for start in range(0, len(order), max(1, batch_size)):
+            batch_idx = order[start:start + batch_size]
+            try:
+                features = [{key: encodings[key][i] for key in encodings.keys()} for i in batch_idx]
+                inputs = self.tokenizer.pad(features, padding='longest', return_tensors="pt")
+                
+                with torch.no_grad():
+                    outputs = self.model(**inputs)
+                    predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+                
+                probs = predictions.detach().cpu().numpy()
+                for row, i in enumerate(batch_idx):
+                    results[i] = self._format_finbert_result(probs[row])
+                    
+            except Exception as e:
+                # Isolate the failure: score this batch item by item
+                logger.error(f"FinBERT batch analysis error ({len(batch_idx)} texts): {e}")
+                for i in batch_idx:
+                    results[i] = self._finbert_analysis(texts[i])
+        
+        return results
+    
     def _fallback_analysis(self, text: str) -> Dict:
         """
         Fallback sentiment analysis using keyword matching
@@ -326,12 +439,13 @@ class FinBERTSentimentAnalyzer:
             'timestamp': datetime.now().isoformat()
         }
     
-    def analyze_news_batch(self, news_items: List[str]) -> Dict:
+    def analyze_news_batch(self, news_items: List[str], batch_size: Optional[int] = None) -> Dict:
         """
         Analyze sentiment for multiple news items
         
         Args:
             news_items: List of news headlines/texts
+            batch_size: Texts per forward pass (default: self.batch_size)
         
         Returns:
             Aggregated sentiment analysis
@@ -339,13 +453,26 @@ class FinBERTSentimentAnalyzer:
         if not news_items or len(news_items) == 0:
             return self._get_neutral_sentiment()
         
-        # Analyze each item
-        sentiments = []
-        for item in news_items:
-            if item and len(item.strip()) > 0:
-                sentiment = self.analyze_text(item)
-                sentiments.append(sentiment)
+        # Analyze all items in batched forward passes
+        valid_items = [item for item in news_items if item and len(item.strip()) > 0]
+        sentiments = self.analyze_texts(valid_items, batch_size=batch_size)
+        
+        return self.aggregate_results(sentiments)
+    
+    def aggregate_results(self, sentiments: List[Dict]) -> Dict:
+        """
+        Aggregate per-item sentiment results (mean of class scores)
+        
+        Lets callers that already hold per-item scores (e.g. from a shared
+        scoring queue) build the analyze_news_batch() output without
+        re-running the model.
+        
+        Args:
+            sentiments: Per-item results from analyze_text()/analyze_texts()
         
+        Returns:
+            Aggregated sentiment analysis
+        """
         if len(sentiments) == 0:
             return self._get_neutral_sentiment()
         
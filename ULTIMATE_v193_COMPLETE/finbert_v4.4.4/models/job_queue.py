@@ -0,0 +1,339 @@
+"""
+Background Job Queue
+In-process job subsystem for long-running API work (LSTM training, backtests,
+portfolio backtests, parameter optimization)
+
+Long jobs used to run inside the Flask request, tying up a worker for many
+minutes and timing out the browser. Routes now submit a job and return its
+ID immediately; clients poll /api/jobs/<job_id> for status and progress.
+
+Features:
+- Bounded worker pool; further jobs wait in FIFO order
+- Job IDs with status: queued / running / completed / failed / cancelled / interrupted
+- Progress (0-100%) with a stage message
+- Cancellation: queued jobs never start, running jobs stop at their next
+  progress checkpoint
+- Job records (including results) persisted as JSON, so status survives a
+  restart; jobs cut off by a restart are marked interrupted
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+INTERRUPTED = 'interrupted'
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED, INTERRUPTED)
+
+
+class JobCancelled(Exception):
+    """Raised at a progress checkpoint once a job has been cancelled"""
+
+
+class JobFailed(Exception):
+    """Raised by a job function to fail with a structured result payload"""
+
+    def __init__(self, message: str, result: Optional[Dict] = None):
+        super().__init__(message)
+        self.result = result
+
+
+class Job:
+    """A unit of background work and its observable state"""
+
+    def __init__(self, job_id: str, kind: str, params: Optional[Dict] = None, description: str = ''):
+        self.job_id = job_id
+        self.kind = kind
+        self.params = params or {}
+        self.description = description
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = 'Waiting for a free worker'
+        self.result: Optional[Any] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self._cancel_event = threading.Event()
+        self._on_update: Optional[Callable[['Job', bool], None]] = None
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancellation has been requested"""
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """Raise JobCancelled if cancellation has been requested"""
+        if self.cancelled:
+            raise JobCancelled(f"Job {self.job_id} cancelled")
+
+    def report(self, progress: Optional[float] = None, message: Optional[str] = None):
+        """
+        Record progress - also a cancellation checkpoint
+
+        Args:
+            progress: Percent complete (0-100), None to keep the current value
+            message: Current stage description
+        """
+        self.check_cancelled()
+        if progress is not None:
+            self.progress = round(max(0.0, min(100.0, float(progress))), 1)
+        if message is not None:
+            self.message = message
+        if self._on_update is not None:
+            self._on_update(self, False)
+
+    def to_dict(self, include_result: bool = True) -> Dict:
+        """JSON-serializable job record"""
+        record = {
+            'job_id': self.job_id,
+            'kind': self.kind,
+            'description': self.description,
+            'status': self.status,
+            'progress': self.progress,
+            'message': self.message,
+            'error': self.error,
+            'params': self.params,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+        if include_result:
+            record['result'] = self.result
+        return record
+
+    @classmethod
+    def from_dict(cls, record: Dict) -> 'Job':
+        """Rebuild a job from its persisted record"""
+        job = cls(record['job_id'], record.get('kind', 'unknown'),
+                  record.get('params'), record.get('description', ''))
+        for field in ('status', 'progress', 'message', 'result', 'error',
+                      'created_at', 'started_at', 'finished_at'):
+            if field in record:
+                setattr(job, field, record[field])
+        return job
+
+
+class JobQueue:
+    """Bounded in-process job queue with persisted job records"""
+
+    def __init__(self, jobs_dir: str, max_workers: int = 2, max_history: int = 200,
+                 save_interval: float = 1.0):
+        """
+        Initialize job queue
+
+        Args:
+            jobs_dir: Directory for <job_id>.json records
+            max_workers: Jobs run concurrently; the rest wait in the queue
+            max_history: Finished jobs kept (in memory and on disk)
+            save_interval: Minimum seconds between progress writes per job
+        """
+        self.jobs_dir = jobs_dir
+        self.max_workers = max(1, int(max_workers))
+        self.max_history = max_history
+        self.save_interval = save_interval
+
+        self._jobs: Dict[str, Job] = {}
+        self._futures: Dict[str, Any] = {}
+        self._last_saved: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='api-job')
+
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self._load_history()
+        logger.info(f"[OK] Job queue ready ({self.max_workers} workers, {len(self._jobs)} jobs on record)")
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _job_path(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, f'{job_id}.json')
+
+    def _save(self, job: Job, force: bool = True):
+        """Write a job record atomically (progress writes are throttled)"""
+        now = time.time()
+        with self._lock:
+            if not force and now - self._last_saved.get(job.job_id, 0) < self.save_interval:
+                return
+            self._last_saved[job.job_id] = now
+            record = job.to_dict()
+
+        path = self._job_path(job.job_id)
+        tmp_path = f'{path}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(record, f, indent=2, default=str)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not persist job {job.job_id}: {e}")
+
+    def _load_history(self):
+        """Load persisted jobs; anything left queued/running was cut off by a restart"""
+        records = []
+        for filename in os.listdir(self.jobs_dir):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.jobs_dir, filename), 'r') as f:
+                    records.append(json.load(f))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable job record {filename}: {e}")
+
+        for record in sorted(records, key=lambda r: r.get('created_at', '')):
+            job = Job.from_dict(record)
+            if job.status not in FINISHED_STATES:
+                job.status = INTERRUPTED
+                job.message = 'Server restarted before the job finished'
+                job.finished_at = datetime.now().isoformat()
+                self._save(job)
+            self._jobs[job.job_id] = job
+        self._prune()
+
+    def _prune(self):
+        """Drop the oldest finished jobs beyond max_history"""
+        with self._lock:
+            finished = [job for job in self._jobs.values() if job.status in FINISHED_STATES]
+            excess = len(finished) - self.max_history
+            for job in sorted(finished, key=lambda j: j.created_at)[:max(0, excess)]:
+                self._jobs.pop(job.job_id, None)
+                self._last_saved.pop(job.job_id, None)
+                try:
+                    os.remove(self._job_path(job.job_id))
+                except OSError:
+                    pass
+
+    # ------------------------------------------------------------------
+    # Submission / execution
+    # ------------------------------------------------------------------
+
+    def submit(self, kind: str, fn: Callable[[Job], Any], params: Optional[Dict] = None,
+               description: str = '') -> Job:
+        """
+        Queue a job
+
+        Args:
+            kind: Job type ('train', 'backtest', 'portfolio_backtest', 'optimize', ...)
+            fn: Callable(job) -> JSON-serializable result. Should call
+                job.report() at checkpoints; raise JobFailed to fail with a payload
+            params: Request parameters (stored with the job record)
+            description: Human-readable summary
+
+        Returns:
+            The queued Job
+        """
+        job = Job(uuid.uuid4().hex[:12], kind, params, description)
+        job._on_update = self._save
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._save(job)
+            self._futures[job.job_id] = self._executor.submit(self._run, job, fn)
+        logger.info(f"Job {job.job_id} queued: {kind} {description}")
+        return job
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]):
+        if job.cancelled:
+            return
+
+        job.status = RUNNING
+        job.started_at = datetime.now().isoformat()
+        job.message = 'Started'
+        self._save(job)
+        logger.info(f"Job {job.job_id} started: {job.kind} {job.description}")
+
+        try:
+            job.result = fn(job)
+            job.check_cancelled()
+            job.status = COMPLETED
+            job.progress = 100.0
+            job.message = 'Completed'
+        except JobCancelled:
+            job.status = CANCELLED
+            job.message = 'Cancelled'
+        except JobFailed as e:
+            job.status = FAILED
+            job.error = str(e)
+            job.result = e.result
+            job.message = 'Failed'
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {e}", exc_info=True)
+            job.status = FAILED
+            job.error = f"{type(e).__name__}: {e}"
+            job.message = 'Failed'
+
+        job.finished_at = datetime.now().isoformat()
+        self._save(job)
+        with self._lock:
+            self._futures.pop(job.job_id, None)
+        self._prune()
+        logger.info(f"Job {job.job_id} {job.status}: {job.kind} {job.description}")
+
+    # ------------------------------------------------------------------
+    # Queries / control
+    # ------------------------------------------------------------------
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, kind: Optional[str] = None, status: Optional[str] = None,
+                  limit: int = 50) -> List[Dict]:
+        """Job records (without results), newest first"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if kind:
+            jobs = [job for job in jobs if job.kind == kind]
+        if status:
+            jobs = [job for job in jobs if job.status == status]
+        jobs.sort(key=lambda j: j.created_at, reverse=True)
+        return [job.to_dict(include_result=False) for job in jobs[:limit]]
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Request cancellation
+
+        Returns:
+            True if the job was queued or running, False if unknown or finished
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED_STATES:
+                return False
+            job._cancel_event.set()
+            future = self._futures.get(job_id)
+            if job.status == QUEUED and future is not None and future.cancel():
+                # Never started: finish it here
+                self._futures.pop(job_id, None)
+                job.status = CANCELLED
+                job.message = 'Cancelled before start'
+                job.finished_at = datetime.now().isoformat()
+                self._save(job)
+            else:
+                job.message = 'Cancelling at next checkpoint'
+        logger.info(f"Job {job_id} cancellation requested")
+        return True
+
+    def get_stats(self) -> Dict:
+        """Job counts by status"""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return {'max_workers': self.max_workers, 'jobs': counts}
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting jobs; running jobs finish unless the process exits"""
+        self._executor.shutdown(wait=wait)
@@ -348,102 +348,15 @@ class StockLSTMPredictor:
             return None  # Return None instead of fallback
         
         try:
-            # AUTO-CALCULATE technical indicators if missing (RESTORED FIX)
-            data = self.calculate_technical_indicators(data)
-            
-            # Prepare data with feature mismatch handling
-            feature_data = data[self.features].values
-            
-            # Check for feature mismatch between current data and trained scaler
-            if hasattr(self.scaler, 'n_features_in_') and feature_data.shape[1] != self.scaler.n_features_in_:
-                logger.error(f"[ERROR] CRITICAL: Feature mismatch for {symbol if symbol else 'symbol'}")
-                logger.error(f"[ERROR] Data has {feature_data.shape[1]} features, scaler expects {self.scaler.n_features_in_}")
-                logger.error(f"[ERROR] This should NOT happen after v1.3.15.123 8-feature restoration")
-                logger.error(f"[ERROR] Prediction FAILED - System integrity compromised")
-                return None  # FAIL LOUD - no fallback
-            
-            scaled_data = self.scaler.transform(feature_data)
-            
-            # Need at least sequence_length data points
-            if len(scaled_data) < self.sequence_length:
-                logger.error(f"[ERROR] INSUFFICIENT DATA for LSTM: {symbol if symbol else 'symbol'}")
-                logger.error(f"[ERROR] Need {self.sequence_length} days, have {len(scaled_data)} days")
-                logger.error(f"[ERROR] Prediction SKIPPED - Cannot meet 75-85% accuracy target")
-                return None  # FAIL LOUD - no fallback
-            
-            # Prepare input sequence
-            X = scaled_data[-self.sequence_length:].reshape(1, self.sequence_length, len(self.features))
+            prepared = self.prepare_sequence(data, symbol)
+            if prepared is None:
+                return None  # FAIL LOUD - reasons logged by prepare_sequence
+            X, data = prepared
             
             # Make prediction
-            prediction = self.model.predict(X, verbose=0)[0]
-            
-            # Extract predictions
-            price_change_scaled = prediction[0]
-            confidence_raw = prediction[1]
-            direction = prediction[2]
-            
-            # Inverse transform price prediction
-            last_price = data['close'].iloc[-1] if 'close' in data.columns else data['Close'].iloc[-1]
-            
-            # Calculate predicted price
-            price_change_percent = price_change_scaled * 10  # Scale to percentage
-            predicted_price = last_price * (1 + price_change_percent / 100)
-            
-            # Get or generate sentiment data
-            if sentiment_data is None and symbol:
-                sentiment_data = self._get_sentiment(symbol)
-            
-            # Integrate sentiment into prediction
-            if sentiment_data:
-                direction, confidence, predicted_price, price_change_percent = self._integrate_sentiment(
-                    direction, confidence_raw, predicted_price, last_price, sentiment_data
-                )
-            else:
-                # Original logic without sentiment
-                if direction > 0.3:
-                    signal = "BUY"
-                    confidence = min(50 + abs(direction) * 30 + confidence_raw * 20, 85)
-                elif direction < -0.3:
-                    signal = "SELL"
-                    confidence = min(50 + abs(direction) * 30 + confidence_raw * 20, 85)
-                else:
-                    signal = "HOLD"
-                    confidence = 50 + confidence_raw * 10
-            
-            # Determine final signal
-            if direction > 0.3:
-                signal = "BUY"
-            elif direction < -0.3:
-                signal = "SELL"
-            else:
-                signal = "HOLD"
+            prediction = self.run_model(self.model, X[np.newaxis])[0]
             
-            # Calculate technical indicators for context
-            sma_20 = data['close'].tail(20).mean() if len(data) >= 20 else last_price
-            rsi = self._calculate_rsi(data['close'].tail(14)) if len(data) >= 14 else 50
-            
-            result = {
-                'prediction': signal,
-                'predicted_price': float(round(predicted_price, 2)),
-                'current_price': float(round(last_price, 2)),
-                'predicted_change': float(round(predicted_price - last_price, 2)),
-                'predicted_change_percent': float(round(price_change_percent, 2)),
-                'confidence': float(round(confidence, 1)),
-                'model_type': 'LSTM + Sentiment' if sentiment_data else 'LSTM',
-                'model_accuracy': 78.5,  # Target: 75-85% win rate (LSTM component of two-stage system)
-                'technical_indicators': {
-                    'sma_20': float(round(sma_20, 2)),
-                    'rsi': float(round(rsi, 2)),
-                    'trend': 'bullish' if direction > 0 else 'bearish' if direction < 0 else 'neutral'
-                },
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # Add sentiment data if available
-            if sentiment_data:
-                result['sentiment'] = sentiment_data
-            
-            return result
+            return self.build_prediction(prediction, data, sentiment_data, symbol)
             
         except Exception as e:
             logger.error(f"[ERROR] CRITICAL: LSTM prediction exception for {symbol if symbol else 'symbol'}")
@@ -453,6 +366,149 @@ class StockLSTMPredictor:
             traceback.print_exc()
             return None  # FAIL LOUD - no fallback to low-accuracy prediction
     
+    def prepare_sequence(self, data: pd.DataFrame, symbol: str = None) -> Optional[Tuple[np.ndarray, pd.DataFrame]]:
+        """
+        Build the scaled model input for the most recent window
+        
+        Args:
+            data: Recent stock data (OHLCV, indicators are added if missing)
+            symbol: Stock symbol (for logging)
+        
+        Returns:
+            Tuple of (sequence of shape (sequence_length, n_features),
+            data with indicators), or None if the data cannot be used
+        """
+        # AUTO-CALCULATE technical indicators if missing (RESTORED FIX)
+        data = self.calculate_technical_indicators(data)
+        
+        # Prepare data with feature mismatch handling
+        feature_data = data[self.features].values
+        
+        # Check for feature mismatch between current data and trained scaler
+        if hasattr(self.scaler, 'n_features_in_') and feature_data.shape[1] != self.scaler.n_features_in_:
+            logger.error(f"[ERROR] CRITICAL: Feature mismatch for {symbol if symbol else 'symbol'}")
+            logger.error(f"[ERROR] Data has {feature_data.shape[1]} features, scaler expects {self.scaler.n_features_in_}")
+            logger.error(f"[ERROR] This should NOT happen after v1.3.15.123 8-feature restoration")
+            logger.error(f"[ERROR] Prediction FAILED - System integrity compromised")
+            return None  # FAIL LOUD - no fallback
+        
+        scaled_data = self.scaler.transform(feature_data)
+        
+        # Need at least sequence_length data points
+        if len(scaled_data) < self.sequence_length:
+            logger.error(f"[ERROR] INSUFFICIENT DATA for LSTM: {symbol if symbol else 'symbol'}")
+            logger.error(f"[ERROR] Need {self.sequence_length} days, have {len(scaled_data)} days")
+            logger.error(f"[ERROR] Prediction SKIPPED - Cannot meet 75-85% accuracy target")
+            return None  # FAIL LOUD - no fallback
+        
+        # Prepare input sequence
+        X = scaled_data[-self.sequence_length:].reshape(self.sequence_length, len(self.features))
+        return X.astype(np.float32), data
+    
+    @staticmethod
+    def run_model(model, X: np.ndarray) -> np.ndarray:
+        """
+        Run the network on a batch of sequences
+        
+        Calls the model directly rather than model.predict(): predict() builds
+        a full data pipeline and callback loop on every call, which dominates
+        the cost when scoring a handful of sequences.
+        
+        Args:
+            model: Keras model
+            X: Input batch of shape (batch, sequence_length, n_features)
+        
+        Returns:
+            Model outputs of shape (batch, 3)
+        """
+        try:
+            return np.asarray(model(X, training=False))
+        except Exception as e:
+            logger.debug(f"Direct model call failed, using model.predict: {e}")
+            return model.predict(X, verbose=0)
+    
+    def build_prediction(self, prediction: np.ndarray, data: pd.DataFrame,
+                         sentiment_data: Optional[Dict] = None, symbol: str = None) -> Dict:
+        """
+        Turn one row of model output into the prediction dictionary
+        
+        Args:
+            prediction: Model output row [price_change, confidence, direction]
+            data: Stock data with indicators (from prepare_sequence)
+            sentiment_data: Optional sentiment analysis data
+            symbol: Stock symbol
+        
+        Returns:
+            Prediction dictionary with sentiment integration
+        """
+        # Extract predictions
+        price_change_scaled = prediction[0]
+        confidence_raw = prediction[1]
+        direction = prediction[2]
+        
+        # Inverse transform price prediction
+        last_price = data['close'].iloc[-1] if 'close' in data.columns else data['Close'].iloc[-1]
+        
+        # Calculate predicted price
+        price_change_percent = price_change_scaled * 10  # Scale to percentage
+        predicted_price = last_price * (1 + price_change_percent / 100)
+        
+        # Get or generate sentiment data
+        if sentiment_data is None and symbol:
+            sentiment_data = self._get_sentiment(symbol)
+        
+        # Integrate sentiment into prediction
+        if sentiment_data:
+            direction, confidence, predicted_price, price_change_percent = self._integrate_sentiment(
+                direction, confidence_raw, predicted_price, last_price, sentiment_data
+            )
+        else:
+            # Original logic without sentiment
+            if direction > 0.3:
+                signal = "BUY"
+                confidence = min(50 + abs(direction) * 30 + confidence_raw * 20, 85)
+            elif direction < -0.3:
+                signal = "SELL"
+                confidence = min(50 + abs(direction) * 30 + confidence_raw * 20, 85)
+            else:
+                signal = "HOLD"
+                confidence = 50 + confidence_raw * 10
+        
+        # Determine final signal
+        if direction > 0.3:
+            signal = "BUY"
+        elif direction < -0.3:
+            signal = "SELL"
+        else:
+            signal = "HOLD"
+        
+        # Calculate technical indicators for context
+        sma_20 = data['close'].tail(20).mean() if len(data) >= 20 else last_price
+        rsi = self._calculate_rsi(data['close'].tail(14)) if len(data) >= 14 else 50
+        
+        result = {
+            'prediction': signal,
+            'predicted_price': float(round(predicted_price, 2)),
+            'current_price': float(round(last_price, 2)),
+            'predicted_change': float(round(predicted_price - last_price, 2)),
+            'predicted_change_percent': float(round(price_change_percent, 2)),
+            'confidence': float(round(confidence, 1)),
+            'model_type': 'LSTM + Sentiment' if sentiment_data else 'LSTM',
+            'model_accuracy': 78.5,  # Target: 75-85% win rate (LSTM component of two-stage system)
+            'technical_indicators': {
+                'sma_20': float(round(sma_20, 2)),
+                'rsi': float(round(rsi, 2)),
+                'trend': 'bullish' if direction > 0 else 'bearish' if direction < 0 else 'neutral'
+            },
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        # Add sentiment data if available
+        if sentiment_data:
+            result['sentiment'] = sentiment_data
+        
+        return result
+    
     def _get_sentiment(self, symbol: str) -> Optional[Dict]:
         """Get sentiment data for a symbol"""
         # Sentiment is handled externally by finbert_bridge.py
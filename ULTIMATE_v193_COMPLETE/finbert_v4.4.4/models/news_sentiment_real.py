@@ -3,6 +3,11 @@ Real News-based Sentiment Analysis - NO MOCK DATA
 Uses yfinance API for reliable news fetching (NO WEB SCRAPING)
 Enhanced with Australian market-specific sources (RBA, ABS, Treasury, ASIC, ASX)
 Integrates with FinBERT analysis
+
+Headline scores are kept in a content-hashed store (normalized text + model
+version), and get_real_sentiment_for_symbols() scores a whole universe
+through one de-duplicated, batched FinBERT queue: macro and sector headlines
+shared by many symbols are scored once.
 """
 
 import logging
@@ -11,7 +16,10 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import sqlite3
 import hashlib
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import feedparser
 import requests
 from bs4 import BeautifulSoup
@@ -54,6 +62,9 @@ except (ImportError, ValueError) as e:
 # SQLite cache database
 CACHE_DB = "news_sentiment_cache.db"
 CACHE_MINUTES = 15  # Cache validity period
+SENTIMENT_STORE_DAYS = 7  # Per-headline score retention
+SCORING_BATCH_SIZE = 64  # Texts per FinBERT forward pass in the scoring queue
+MAX_ARTICLES_PER_SYMBOL = 25
 
 # Australian market-specific direct scraping URLs (RBA official pages)
 AUSTRALIAN_SCRAPING_SOURCES = {
@@ -95,6 +106,16 @@ def init_cache_db():
             )
         ''')
         
+        # Per-headline scores keyed by hash(model version + normalized text)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS text_sentiment (
+                text_hash TEXT PRIMARY KEY,
+                model_version TEXT,
+                sentiment_data TEXT,
+                timestamp INTEGER
+            )
+        ''')
+        
         conn.commit()
         conn.close()
         logger.info("[OK] News sentiment cache database initialized")
@@ -525,7 +546,6 @@ def get_cached_sentiment(symbol: str) -> Optional[Dict]:
             
             if age_minutes < CACHE_MINUTES:
                 logger.info(f"Cache hit for {symbol} (age: {age_minutes:.1f} min, {article_count} articles)")
-                import json
                 sentiment_data = json.loads(sentiment_json)
                 sentiment_data['cached'] = True
                 sentiment_data['cache_age_minutes'] = round(age_minutes, 1)
@@ -548,7 +568,6 @@ def save_to_cache(symbol: str, sentiment_data: Dict, article_count: int):
         article_count: Number of articles analyzed
     """
     try:
-        import json
         conn = sqlite3.connect(CACHE_DB)
         cursor = conn.cursor()
         
@@ -571,6 +590,240 @@ def save_to_cache(symbol: str, sentiment_data: Dict, article_count: int):
     except Exception as e:
         logger.error(f"Cache save error: {e}")
 
+def normalize_text(text: str) -> str:
+    """Normalize text for de-duplication (FinBERT is uncased, so case is irrelevant)"""
+    return re.sub(r'\s+', ' ', text or '').strip().lower()
+
+def get_text_hash(text: str, model_version: str) -> str:
+    """Content hash of a text for a given scoring model"""
+    return hashlib.sha1(f"{model_version}\n{normalize_text(text)}".encode('utf-8')).hexdigest()
+
+class SentimentStore:
+    """
+    Content-hashed per-text sentiment store
+    
+    In-memory for the current process, backed by the text_sentiment table
+    so scores survive across runs. Keys include the model version, so
+    switching models (or falling back to keywords) never reuses scores.
+    """
+    
+    def __init__(self, db_path: str = CACHE_DB, retention_days: int = SENTIMENT_STORE_DAYS):
+        self.db_path = db_path
+        self.retention_seconds = retention_days * 86400
+        self._memory: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+    
+    def get_many(self, text_hashes: List[str]) -> Dict[str, Dict]:
+        """Look up stored results for many text hashes"""
+        found = {}
+        with self._lock:
+            for text_hash in text_hashes:
+                if text_hash in self._memory:
+                    found[text_hash] = self._memory[text_hash]
+        
+        missing = [h for h in text_hashes if h not in found]
+        if not missing:
+            return found
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            min_timestamp = int(time.time()) - self.retention_seconds
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(missing), 500):
+                chunk = missing[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'''
+                    SELECT text_hash, sentiment_data FROM text_sentiment
+                    WHERE text_hash IN ({placeholders}) AND timestamp >= ?
+                ''', (*chunk, min_timestamp))
+                for text_hash, sentiment_json in cursor.fetchall():
+                    found[text_hash] = json.loads(sentiment_json)
+            conn.close()
+        except Exception as e:
+            logger.error(f"Sentiment store lookup error: {e}")
+        
+        with self._lock:
+            self._memory.update({h: found[h] for h in missing if h in found})
+        return found
+    
+    def put_many(self, results: Dict[str, Dict], model_version: str):
+        """Store results for many text hashes"""
+        if not results:
+            return
+        
+        with self._lock:
+            self._memory.update(results)
+        
+        try:
+            now = int(time.time())
+            conn = sqlite3.connect(self.db_path)
+            conn.executemany('''
+                INSERT OR REPLACE INTO text_sentiment
+                (text_hash, model_version, sentiment_data, timestamp)
+                VALUES (?, ?, ?, ?)
+            ''', [(h, model_version, json.dumps(r), now) for h, r in results.items()])
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Sentiment store save error: {e}")
+
+sentiment_store = SentimentStore()
+
+def score_texts(texts: List[str]) -> List[Dict]:
+    """
+    Score texts with FinBERT through the de-duplicating scoring queue
+    
+    Identical texts (after normalization) are scored once; texts already in
+    the sentiment store are not scored at all. Remaining unique texts run
+    through FinBERT in large batches.
+    
+    Args:
+        texts: Texts to score (may contain duplicates)
+    
+    Returns:
+        Per-text sentiment results, in the same order as texts
+    """
+    if not texts:
+        return []
+    
+    model_version = finbert_analyzer.model_version
+    keys = [get_text_hash(text, model_version) for text in texts]
+    
+    unique: Dict[str, str] = {}
+    for key, text in zip(keys, texts):
+        unique.setdefault(key, text)
+    
+    stored = sentiment_store.get_many(list(unique))
+    missing = [key for key in unique if key not in stored]
+    
+    if missing:
+        scored = finbert_analyzer.analyze_texts(
+            [unique[key] for key in missing],
+            batch_size=SCORING_BATCH_SIZE
+        )
+        new_results = dict(zip(missing, scored))
+        sentiment_store.put_many(new_results, model_version)
+        stored.update(new_results)
+    
+    logger.info(
+        f"Scoring queue: {len(texts)} texts, {len(unique)} unique, "
+        f"{len(unique) - len(missing)} from store, {len(missing)} scored with {model_version}"
+    )
+    return [dict(stored[key]) for key in keys]
+
+def collect_articles_for_symbol(symbol: str) -> List[Dict]:
+    """
+    Fetch news articles for a symbol from all market-specific sources
+    
+    Args:
+        symbol: Stock ticker symbol (upper case)
+    
+    Returns:
+        List of article dictionaries
+    """
+    # Determine market-specific sources
+    if symbol.endswith('.AX'):
+        sources_desc = "yfinance API + Australian RBA sources"
+    elif symbol.endswith('.L'):
+        sources_desc = "yfinance API + UK financial news sources"
+    else:
+        sources_desc = "yfinance API + US financial news sources"
+    
+    logger.info(f"Fetching REAL news for {symbol} using {sources_desc}...")
+    
+    # Fetch from yfinance (works for US, AU, UK, and other markets)
+    all_articles = fetch_yfinance_news(symbol)
+    logger.info(f"  yfinance: {len(all_articles)} articles")
+    
+    # For Australian stocks, add RBA official sources and enrich context
+    if symbol.endswith('.AX'):
+        # Scrape RBA official pages for monetary policy, speeches, statistics
+        rba_articles = scrape_rba_pages(symbol)
+        logger.info(f"  RBA Official Sources: {len(rba_articles)} articles")
+        
+        # Combine yfinance and RBA articles
+        all_articles.extend(rba_articles)
+        
+        # Enrich all articles with Australian market context detection
+        # This identifies RBA news, government announcements, economic indicators, etc.
+        all_articles = enrich_australian_news_context(all_articles, symbol)
+        logger.info(f"  Total with Australian context: {len(all_articles)} articles")
+    
+    return all_articles
+
+def _neutral_result(symbol: str, method: str, error: str) -> Dict:
+    """Neutral sentiment result for symbols without usable news"""
+    return {
+        'symbol': symbol,
+        'sentiment': 'neutral',
+        'confidence': 0.0,
+        'scores': {'negative': 0.33, 'neutral': 0.34, 'positive': 0.33},
+        'compound': 0.0,
+        'method': method,
+        'article_count': 0,
+        'articles': [],
+        'timestamp': datetime.now().isoformat(),
+        'error': error,
+        'cached': False
+    }
+
+def _article_text(article: Dict) -> str:
+    """Text scored for an article (title + summary)"""
+    return f"{article['title']}. {article['summary']}"
+
+def _build_symbol_sentiment(symbol: str, articles: List[Dict], scored: List[Dict]) -> Dict:
+    """
+    Attach per-article scores and aggregate them into the symbol result
+    
+    Args:
+        symbol: Stock ticker symbol
+        articles: Articles analyzed (already limited to MAX_ARTICLES_PER_SYMBOL)
+        scored: Per-article sentiment results, aligned with articles
+    
+    Returns:
+        Aggregated sentiment result (also saved to the per-symbol cache)
+    """
+    analyzed_articles = []
+    for article, sentiment_result in zip(articles, scored):
+        article['sentiment'] = sentiment_result['sentiment']
+        article['sentiment_score'] = sentiment_result['compound']
+        article['confidence'] = sentiment_result['confidence']
+        analyzed_articles.append(article)
+    
+    if len(analyzed_articles) == 0:
+        return _neutral_result(symbol, 'No Valid Articles', 'Could not analyze any articles')
+    
+    # Aggregate sentiment from all articles (same as analyze_news_batch, without re-scoring)
+    aggregate_sentiment = finbert_analyzer.aggregate_results(scored)
+    
+    # Add metadata
+    aggregate_sentiment['symbol'] = symbol
+    aggregate_sentiment['article_count'] = len(analyzed_articles)
+    aggregate_sentiment['articles'] = analyzed_articles[:10]  # Return top 10 articles
+    aggregate_sentiment['sources'] = list(set(a['source'] for a in analyzed_articles))
+    aggregate_sentiment['cached'] = False
+    
+    # Calculate distribution
+    positive_count = sum(1 for a in analyzed_articles if a['sentiment'] == 'positive')
+    negative_count = sum(1 for a in analyzed_articles if a['sentiment'] == 'negative')
+    neutral_count = sum(1 for a in analyzed_articles if a['sentiment'] == 'neutral')
+    
+    aggregate_sentiment['distribution'] = {
+        'positive': positive_count,
+        'negative': negative_count,
+        'neutral': neutral_count,
+        'positive_pct': round((positive_count / len(analyzed_articles)) * 100, 1),
+        'negative_pct': round((negative_count / len(analyzed_articles)) * 100, 1),
+        'neutral_pct': round((neutral_count / len(analyzed_articles)) * 100, 1)
+    }
+    
+    # Save to cache
+    save_to_cache(symbol, aggregate_sentiment, len(analyzed_articles))
+    
+    logger.info(f"[OK] REAL sentiment analysis complete for {symbol}: {aggregate_sentiment['sentiment'].upper()} ({aggregate_sentiment['confidence']:.1f}%)")
+    return aggregate_sentiment
+
 def get_real_sentiment_for_symbol(symbol: str, use_cache: bool = True) -> Dict:
     """
     Get REAL sentiment analysis for a stock symbol using yfinance API and FinBERT
@@ -591,134 +844,109 @@ def get_real_sentiment_for_symbol(symbol: str, use_cache: bool = True) -> Dict:
         if cached:
             return cached
     
-    # Determine market-specific sources
-    if symbol.endswith('.AX'):
-        sources_desc = "yfinance API + Australian RBA sources"
-    elif symbol.endswith('.L'):
-        sources_desc = "yfinance API + UK financial news sources"
-    else:
-        sources_desc = "yfinance API + US financial news sources"
-    
-    logger.info(f"Fetching REAL news for {symbol} using {sources_desc}...")
-    
-    # Fetch news using yfinance API (simple and reliable)
     try:
-        # Fetch from yfinance (works for US, AU, UK, and other markets)
-        all_articles = fetch_yfinance_news(symbol)
-        logger.info(f"  yfinance: {len(all_articles)} articles")
-        
-        # For Australian stocks, add RBA official sources and enrich context
-        if symbol.endswith('.AX'):
-            # Scrape RBA official pages for monetary policy, speeches, statistics
-            rba_articles = scrape_rba_pages(symbol)
-            logger.info(f"  RBA Official Sources: {len(rba_articles)} articles")
-            
-            # Combine yfinance and RBA articles
-            all_articles.extend(rba_articles)
-            
-            # Enrich all articles with Australian market context detection
-            # This identifies RBA news, government announcements, economic indicators, etc.
-            all_articles = enrich_australian_news_context(all_articles, symbol)
-            logger.info(f"  Total with Australian context: {len(all_articles)} articles")
+        all_articles = collect_articles_for_symbol(symbol)
         
         if len(all_articles) == 0:
             logger.warning(f"NO REAL NEWS FOUND for {symbol} - Cannot provide sentiment")
-            return {
-                'symbol': symbol,
-                'sentiment': 'neutral',
-                'confidence': 0.0,
-                'scores': {
-                    'negative': 0.33,
-                    'neutral': 0.34,
-                    'positive': 0.33
-                },
-                'compound': 0.0,
-                'method': 'No News Available',
-                'article_count': 0,
-                'articles': [],
-                'timestamp': datetime.now().isoformat(),
-                'error': 'No news articles found for this symbol',
-                'cached': False
-            }
+            return _neutral_result(symbol, 'No News Available', 'No news articles found for this symbol')
+        
+        if not finbert_analyzer:
+            logger.error("FinBERT analyzer not available")
+            return {"error": "FinBERT not available"}
         
         # Analyze sentiment of each article using FinBERT
-        logger.info(f"Analyzing {len(all_articles)} articles with FinBERT for {symbol}")
-        
-        analyzed_articles = []
-        for article in all_articles[:25]:  # Limit to 25 most recent
-            # Combine title and summary for analysis
-            text = f"{article['title']}. {article['summary']}"
-            if not finbert_analyzer:
-                logger.error("FinBERT analyzer not available")
-                return {"error": "FinBERT not available"}
-            sentiment_result = finbert_analyzer.analyze_text(text)
-            
-            article['sentiment'] = sentiment_result['sentiment']
-            article['sentiment_score'] = sentiment_result['compound']
-            article['confidence'] = sentiment_result['confidence']
-            analyzed_articles.append(article)
-        
-        # Aggregate sentiment from all articles
-        if len(analyzed_articles) > 0:
-            news_texts = [f"{a['title']}. {a['summary']}" for a in analyzed_articles]
-            aggregate_sentiment = finbert_analyzer.analyze_news_batch(news_texts)
-            
-            # Add metadata
-            aggregate_sentiment['symbol'] = symbol
-            aggregate_sentiment['article_count'] = len(analyzed_articles)
-            aggregate_sentiment['articles'] = analyzed_articles[:10]  # Return top 10 articles
-            aggregate_sentiment['sources'] = list(set(a['source'] for a in analyzed_articles))
-            aggregate_sentiment['cached'] = False
-            
-            # Calculate distribution
-            positive_count = sum(1 for a in analyzed_articles if a['sentiment'] == 'positive')
-            negative_count = sum(1 for a in analyzed_articles if a['sentiment'] == 'negative')
-            neutral_count = sum(1 for a in analyzed_articles if a['sentiment'] == 'neutral')
-            
-            aggregate_sentiment['distribution'] = {
-                'positive': positive_count,
-                'negative': negative_count,
-                'neutral': neutral_count,
-                'positive_pct': round((positive_count / len(analyzed_articles)) * 100, 1),
-                'negative_pct': round((negative_count / len(analyzed_articles)) * 100, 1),
-                'neutral_pct': round((neutral_count / len(analyzed_articles)) * 100, 1)
-            }
-            
-            # Save to cache
-            save_to_cache(symbol, aggregate_sentiment, len(analyzed_articles))
-            
-            logger.info(f"[OK] REAL sentiment analysis complete for {symbol}: {aggregate_sentiment['sentiment'].upper()} ({aggregate_sentiment['confidence']:.1f}%)")
-            return aggregate_sentiment
-        else:
-            return {
-                'symbol': symbol,
-                'sentiment': 'neutral',
-                'confidence': 0.0,
-                'scores': {'negative': 0.33, 'neutral': 0.34, 'positive': 0.33},
-                'compound': 0.0,
-                'method': 'No Valid Articles',
-                'article_count': 0,
-                'articles': [],
-                'timestamp': datetime.now().isoformat(),
-                'error': 'Could not analyze any articles',
-                'cached': False
-            }
+        articles = all_articles[:MAX_ARTICLES_PER_SYMBOL]  # Limit to 25 most recent
+        logger.info(f"Analyzing {len(articles)} articles with FinBERT for {symbol}")
+        scored = score_texts([_article_text(a) for a in articles])
+        
+        return _build_symbol_sentiment(symbol, articles, scored)
             
     except Exception as e:
         logger.error(f"Error in real sentiment analysis for {symbol}: {e}")
-        return {
-            'symbol': symbol,
-            'sentiment': 'neutral',
-            'confidence': 0.0,
-            'scores': {'negative': 0.33, 'neutral': 0.34, 'positive': 0.33},
-            'compound': 0.0,
-            'method': 'Error',
-            'article_count': 0,
-            'articles': [],
-            'timestamp': datetime.now().isoformat(),
-            'error': str(e),
-            'cached': False
-        }
+        return _neutral_result(symbol, 'Error', str(e))
+
+def get_real_sentiment_for_symbols(symbols: List[str], use_cache: bool = True,
+                                   max_workers: int = 4) -> Dict[str, Dict]:
+    """
+    Get REAL sentiment for many symbols through one shared scoring queue
+    
+    News for every uncached symbol is collected first (concurrently), all
+    article texts are de-duplicated across symbols and scored once in large
+    FinBERT batches, and the scores are fanned back out per symbol.
+    
+    Args:
+        symbols: Stock ticker symbols
+        use_cache: Whether to use cached per-symbol results
+        max_workers: Concurrent news fetches
+    
+    Returns:
+        Dictionary mapping symbol (upper case) -> sentiment result, in the
+        same format as get_real_sentiment_for_symbol()
+    """
+    results: Dict[str, Dict] = {}
+    pending = []
+    for symbol in dict.fromkeys(s.upper() for s in symbols):
+        cached = get_cached_sentiment(symbol) if use_cache else None
+        if cached:
+            results[symbol] = cached
+        else:
+            pending.append(symbol)
+    
+    if not pending:
+        return results
+    
+    if not finbert_analyzer:
+        logger.error("FinBERT analyzer not available")
+        for symbol in pending:
+            results[symbol] = {"error": "FinBERT not available"}
+        return results
+    
+    # 1. Collect articles for every symbol (network bound)
+    def _collect(symbol: str):
+        try:
+            return collect_articles_for_symbol(symbol), None
+        except Exception as e:
+            return [], e
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        collected = dict(zip(pending, executor.map(_collect, pending)))
+    
+    # 2. Queue all article texts
+    queue: List[str] = []
+    spans: Dict[str, tuple] = {}
+    for symbol in pending:
+        all_articles, error = collected[symbol]
+        if error is not None:
+            logger.error(f"Error in real sentiment analysis for {symbol}: {error}")
+            results[symbol] = _neutral_result(symbol, 'Error', str(error))
+        elif len(all_articles) == 0:
+            logger.warning(f"NO REAL NEWS FOUND for {symbol} - Cannot provide sentiment")
+            results[symbol] = _neutral_result(symbol, 'No News Available', 'No news articles found for this symbol')
+        else:
+            articles = all_articles[:MAX_ARTICLES_PER_SYMBOL]
+            spans[symbol] = (articles, len(queue))
+            queue.extend(_article_text(a) for a in articles)
+    
+    # 3. Score the de-duplicated queue once, then fan results back out
+    try:
+        scored = score_texts(queue)
+    except Exception as e:
+        logger.error(f"FinBERT scoring queue failed: {e}")
+        for symbol in spans:
+            results[symbol] = _neutral_result(symbol, 'Error', str(e))
+        return results
+    
+    for symbol, (articles, offset) in spans.items():
+        try:
+            results[symbol] = _build_symbol_sentiment(
+                symbol, articles, scored[offset:offset + len(articles)]
+            )
+        except Exception as e:
+            logger.error(f"Error in real sentiment analysis for {symbol}: {e}")
+            results[symbol] = _neutral_result(symbol, 'Error', str(e))
+    
+    return results
 
 def get_sentiment_sync(symbol: str, use_cache: bool = True) -> Dict:
     """
@@ -750,3 +978,20 @@ def get_sentiment_sync(symbol: str, use_cache: bool = True) -> Dict:
             'error': str(e),
             'cached': False
         }
+
+def get_sentiment_batch_sync(symbols: List[str], use_cache: bool = True) -> Dict[str, Dict]:
+    """
+    Get real sentiment analysis for many symbols (shared, de-duplicated scoring)
+    
+    Args:
+        symbols: Stock ticker symbols
+        use_cache: Whether to use cached results
+    
+    Returns:
+        Dictionary mapping symbol (upper case) -> sentiment results
+    """
+    try:
+        return get_real_sentiment_for_symbols(symbols, use_cache)
+    except Exception as e:
+        logger.error(f"Batch sentiment error: {e}")
+        return {symbol.upper(): _neutral_result(symbol.upper(), 'Error', str(e)) for symbol in symbols}
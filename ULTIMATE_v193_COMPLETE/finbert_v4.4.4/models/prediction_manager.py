@@ -315,6 +315,11 @@ class PredictionManager:
         Validate all active predictions that have passed their target date
         Called at end of trading day or manually
         
+        Each symbol's close is fetched once per target date; all due
+        predictions for that date are then resolved against the price
+        snapshot in one database pass, and accuracy statistics are
+        recomputed in one aggregation.
+        
         Returns:
             Dictionary with validation results
         """
@@ -327,6 +332,8 @@ class PredictionManager:
         
         logger.info(f"[*] Validating {len(active_predictions)} active predictions...")
         
+        # Group due predictions by target date -> symbols
+        due: Dict[str, Dict[str, datetime]] = {}
         for pred in active_predictions:
             try:
                 target_date = datetime.fromisoformat(pred['target_date'])
@@ -337,49 +344,40 @@ class PredictionManager:
                 
                 # Check if target date has passed
                 if now >= target_date:
-                    symbol = pred['symbol']
-                    
-                    # Fetch actual closing price
-                    actual_price = self.get_closing_price(symbol, target_date)
-                    
-                    if actual_price:
-                        # Calculate accuracy
-                        predicted_price = pred['predicted_price']
-                        error_percent = abs((actual_price - predicted_price) / predicted_price * 100)
-                        
-                        # Within 2% is considered correct
-                        is_correct = error_percent <= 2.0
-                        
-                        # Update prediction record
-                        success = self.prediction_db.update_prediction_outcome(
-                            pred['prediction_id'],
-                            actual_price,
-                            is_correct
-                        )
-                        
-                        if success:
-                            validated_count += 1
-                            symbols_updated.add(symbol)
-                            logger.info(f"[OK] Validated {symbol}: Predicted=USD{predicted_price:.2f}, "
-                                       f"Actual=USD{actual_price:.2f}, Error={error_percent:.2f}%, "
-                                       f"Correct={is_correct}")
-                        else:
-                            errors.append(f"Failed to update prediction {pred['prediction_id']}")
-                    else:
-                        errors.append(f"Could not get closing price for {symbol} on {target_date.date()}")
-                        logger.warning(f"[!] Could not validate {symbol}: No closing price data")
-                        
+                    day = pred['target_date'][:10]
+                    due.setdefault(day, {})[pred['symbol']] = target_date
+            
             except Exception as e:
                 errors.append(f"Error validating prediction {pred.get('prediction_id', 'unknown')}: {str(e)}")
                 logger.error(f"[X] Error validating prediction: {e}")
         
-        # Update accuracy statistics for updated symbols
-        for symbol in symbols_updated:
+        for day, symbols in sorted(due.items()):
+            # Price snapshot for this target date
+            prices = {}
+            for symbol, target_date in symbols.items():
+                actual_price = self.get_closing_price(symbol, target_date)
+                if actual_price:
+                    prices[symbol] = float(actual_price)
+                else:
+                    errors.append(f"Could not get closing price for {symbol} on {day}")
+                    logger.warning(f"[!] Could not validate {symbol}: No closing price data")
+            
+            try:
+                count = self.prediction_db.resolve_pending_predictions(prices, target_date=day)
+                validated_count += count
+                symbols_updated.update(prices)
+                logger.info(f"[OK] Validated {count} predictions due {day} ({len(prices)} symbols)")
+            except Exception as e:
+                errors.append(f"Failed to update predictions due {day}: {str(e)}")
+                logger.error(f"[X] Error resolving predictions due {day}: {e}")
+        
+        # Update accuracy statistics for updated symbols in one pass
+        if symbols_updated:
             try:
-                self.prediction_db.update_accuracy_stats(symbol)
-                logger.info(f"[OK] Updated accuracy stats for {symbol}")
+                self.prediction_db.refresh_accuracy_stats(symbols=sorted(symbols_updated))
+                logger.info(f"[OK] Updated accuracy stats for {len(symbols_updated)} symbols")
             except Exception as e:
-                logger.error(f"[X] Error updating stats for {symbol}: {e}")
+                logger.error(f"[X] Error updating accuracy stats: {e}")
         
         result = {
             'success': True,
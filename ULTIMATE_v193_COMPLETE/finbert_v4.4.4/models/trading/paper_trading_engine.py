@@ -116,49 +116,78 @@ class PaperTradingEngine:
             # Calculate costs
             total_cost, commission, slippage = self.calculate_costs(current_price, quantity, side)
             
-            # Get account info
-            account = self.db.get_account()
-            
-            # Check sufficient funds for BUY
-            if side == 'BUY':
-                if total_cost > account['cash_balance']:
-                    return {
-                        'success': False,
-                        'error': f'Insufficient funds. Need USD{total_cost:.2f}, have USD{account["cash_balance"]:.2f}'
-                    }
-            
-            # Check if position exists for SELL
-            if side == 'SELL':
-                position = self.db.get_position(symbol)
-                if position is None:
-                    return {'success': False, 'error': f'No position in {symbol} to sell'}
-                if position['quantity'] < quantity:
-                    return {
-                        'success': False,
-                        'error': f'Insufficient shares. Have {position["quantity"]}, trying to sell {quantity}'
-                    }
-            
-            # Execute trade
-            if side == 'BUY':
-                # Create trade record
-                trade_id = self.db.create_trade(
-                    symbol=symbol,
-                    side='BUY',
-                    quantity=quantity,
-                    entry_price=current_price,
-                    commission=commission,
-                    slippage=slippage,
-                    strategy=strategy,
-                    notes=notes
-                )
+            # Checks and fill run in one transaction: it holds the shared
+            # connection's lock, so concurrent orders (Flask threads, order
+            # monitor) cannot fill against a stale cash balance or position
+            with self.db.transaction():
+                # Get account info
+                account = self.db.get_account()
                 
-                # Update position
-                self.db.upsert_position(symbol, quantity, current_price)
+                # Check sufficient funds for BUY
+                if side == 'BUY':
+                    if total_cost > account['cash_balance']:
+                        return {
+                            'success': False,
+                            'error': f'Insufficient funds. Need USD{total_cost:.2f}, have USD{account["cash_balance"]:.2f}'
+                        }
                 
-                # Update account cash
-                new_cash = account['cash_balance'] - total_cost
-                self.db.update_account(cash_balance=new_cash)
+                # Check if position exists for SELL
+                if side == 'SELL':
+                    position = self.db.get_position(symbol)
+                    if position is None:
+                        return {'success': False, 'error': f'No position in {symbol} to sell'}
+                    if position['quantity'] < quantity:
+                        return {
+                            'success': False,
+                            'error': f'Insufficient shares. Have {position["quantity"]}, trying to sell {quantity}'
+                        }
                 
+                # Execute trade (trade record, position and cash move together)
+                if side == 'BUY':
+                    trade_id = self.db.create_trade(
+                        symbol=symbol,
+                        side='BUY',
+                        quantity=quantity,
+                        entry_price=current_price,
+                        commission=commission,
+                        slippage=slippage,
+                        strategy=strategy,
+                        notes=notes
+                    )
+                    
+                    # Update position
+                    self.db.upsert_position(symbol, quantity, current_price)
+                    
+                    # Update account cash
+                    new_cash = account['cash_balance'] - total_cost
+                    self.db.update_account(cash_balance=new_cash)
+                
+                else:  # SELL
+                    # Find matching open trade(s) to close
+                    open_trades = self.db.get_trades(status='OPEN', symbol=symbol)
+                    
+                    # Close trade (simplified: close oldest first)
+                    if open_trades:
+                        trade = open_trades[-1]  # Get oldest
+                        pnl, pnl_percent = self.db.close_trade(
+                            trade['trade_id'],
+                            current_price,
+                            commission,
+                            slippage
+                        )
+                    
+                    # Update position
+                    new_quantity = position['quantity'] - quantity
+                    if new_quantity == 0:
+                        self.db.remove_position(symbol)
+                    else:
+                        self.db.upsert_position(symbol, -quantity, position['avg_cost'])
+                    
+                    # Update account cash
+                    new_cash = account['cash_balance'] + total_cost
+                    self.db.update_account(cash_balance=new_cash)
+            
+            if side == 'BUY':
                 logger.info(f"[OK] BUY ORDER FILLED: {quantity} {symbol} @ USD{current_price:.2f}")
                 
                 return {
@@ -175,33 +204,6 @@ class PaperTradingEngine:
                 }
             
             else:  # SELL
-                # Get existing position
-                position = self.db.get_position(symbol)
-                
-                # Find matching open trade(s) to close
-                open_trades = self.db.get_trades(status='OPEN', symbol=symbol)
-                
-                # Close trade (simplified: close oldest first)
-                if open_trades:
-                    trade = open_trades[-1]  # Get oldest
-                    pnl, pnl_percent = self.db.close_trade(
-                        trade['trade_id'],
-                        current_price,
-                        commission,
-                        slippage
-                    )
-                
-                # Update position
-                new_quantity = position['quantity'] - quantity
-                if new_quantity == 0:
-                    self.db.remove_position(symbol)
-                else:
-                    self.db.upsert_position(symbol, -quantity, position['avg_cost'])
-                
-                # Update account cash
-                new_cash = account['cash_balance'] + total_cost
-                self.db.update_account(cash_balance=new_cash)
-                
                 logger.info(f"[OK] SELL ORDER FILLED: {quantity} {symbol} @ USD{current_price:.2f}")
                 
                 return {
@@ -251,34 +253,37 @@ class PaperTradingEngine:
             Summary of updates
         """
         positions = self.db.get_positions()
-        updated = 0
+        prices = {}
         failed = []
         
         total_portfolio_value = 0
         
+        # Fetch prices first - no database lock is held during network calls
         for position in positions:
             symbol = position['symbol']
             current_price = self.get_current_price(symbol)
             
             if current_price:
-                self.db.update_position_prices(symbol, current_price)
+                prices[symbol] = current_price
                 total_portfolio_value += current_price * position['quantity']
-                updated += 1
             else:
                 failed.append(symbol)
         
-        # Update account portfolio value
-        account = self.db.get_account()
-        total_value = account['cash_balance'] + total_portfolio_value
-        total_pnl = total_value - account['initial_capital']
-        total_pnl_percent = (total_pnl / account['initial_capital']) * 100 if account['initial_capital'] > 0 else 0
-        
-        self.db.update_account(
-            portfolio_value=total_portfolio_value,
-            total_value=total_value,
-            total_pnl=total_pnl,
-            total_pnl_percent=total_pnl_percent
-        )
+        # Write all positions and the account in a single transaction
+        with self.db.transaction():
+            updated = self.db.update_position_prices_many(prices)
+            
+            account = self.db.get_account()
+            total_value = account['cash_balance'] + total_portfolio_value
+            total_pnl = total_value - account['initial_capital']
+            total_pnl_percent = (total_pnl / account['initial_capital']) * 100 if account['initial_capital'] > 0 else 0
+            
+            self.db.update_account(
+                portfolio_value=total_portfolio_value,
+                total_value=total_value,
+                total_pnl=total_pnl,
+                total_pnl_percent=total_pnl_percent
+            )
         
         logger.info(f"Updated {updated} positions (Portfolio value: USD{total_portfolio_value:.2f})")
         
@@ -159,14 +159,7 @@ class PositionManager:
             }
         
         # Update position with stop-loss
-        conn = self.db.db.connect(self.db.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE portfolio SET stop_loss_price = ?, updated_at = ?
-            WHERE symbol = ?
-        ''', (final_stop_price, datetime.now().isoformat(), symbol))
-        conn.commit()
-        conn.close()
+        self.db.set_position_levels(symbol, stop_loss=final_stop_price)
         
         logger.info(f"Stop-loss set for {symbol}: USD{final_stop_price:.2f} ({((current_price - final_stop_price)/current_price)*100:.1f}% below current)")
         
@@ -216,14 +209,7 @@ class PositionManager:
             }
         
         # Update position with take-profit
-        conn = self.db.db.connect(self.db.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE portfolio SET take_profit_price = ?, updated_at = ?
-            WHERE symbol = ?
-        ''', (final_tp_price, datetime.now().isoformat(), symbol))
-        conn.commit()
-        conn.close()
+        self.db.set_position_levels(symbol, take_profit=final_tp_price)
         
         logger.info(f"Take-profit set for {symbol}: USD{final_tp_price:.2f} ({((final_tp_price - current_price)/current_price)*100:.1f}% above current)")
         
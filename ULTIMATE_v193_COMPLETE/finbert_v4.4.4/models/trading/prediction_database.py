@@ -12,6 +12,34 @@ import os
 
 logger = logging.getLogger(__name__)
 
+INSERT_PREDICTION_SQL = '''
+    {verb} INTO predictions (
+        symbol, prediction_date, target_date, timeframe,
+        current_price, predicted_price, predicted_change_percent,
+        prediction, confidence,
+        lstm_prediction, lstm_weight,
+        trend_prediction, trend_weight,
+        technical_prediction, technical_weight,
+        sentiment_label, sentiment_score, sentiment_confidence, article_count,
+        chart_interval, chart_period, data_points_count
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Accuracy aggregates over completed predictions (one row per GROUP BY group)
+ACCURACY_AGGREGATES_SQL = '''
+    COUNT(*),
+    COALESCE(SUM(prediction_correct = 1), 0),
+    COALESCE(SUM(prediction = 'BUY'), 0),
+    COALESCE(SUM(prediction = 'BUY' AND prediction_correct = 1), 0),
+    COALESCE(SUM(prediction = 'SELL'), 0),
+    COALESCE(SUM(prediction = 'SELL' AND prediction_correct = 1), 0),
+    COALESCE(SUM(prediction = 'HOLD'), 0),
+    COALESCE(SUM(prediction = 'HOLD' AND prediction_correct = 1), 0),
+    COALESCE(AVG(prediction_error_percent), 0),
+    COALESCE(AVG(ABS(prediction_error_percent)), 0),
+    COALESCE(AVG(confidence), 0)
+'''
+
 
 class PredictionDatabase:
     """Manages prediction storage and accuracy tracking"""
@@ -192,41 +220,8 @@ class PredictionDatabase:
         cursor = conn.cursor()
         
         try:
-            cursor.execute('''
-                INSERT INTO predictions (
-                    symbol, prediction_date, target_date, timeframe,
-                    current_price, predicted_price, predicted_change_percent,
-                    prediction, confidence,
-                    lstm_prediction, lstm_weight,
-                    trend_prediction, trend_weight,
-                    technical_prediction, technical_weight,
-                    sentiment_label, sentiment_score, sentiment_confidence, article_count,
-                    chart_interval, chart_period, data_points_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                prediction_data['symbol'].upper(),
-                prediction_data['prediction_date'],
-                prediction_data['target_date'],
-                prediction_data['timeframe'],
-                prediction_data['current_price'],
-                prediction_data['predicted_price'],
-                prediction_data['predicted_change_percent'],
-                prediction_data['prediction'],
-                prediction_data['confidence'],
-                prediction_data.get('lstm_prediction'),
-                prediction_data.get('lstm_weight'),
-                prediction_data.get('trend_prediction'),
-                prediction_data.get('trend_weight'),
-                prediction_data.get('technical_prediction'),
-                prediction_data.get('technical_weight'),
-                prediction_data.get('sentiment_label'),
-                prediction_data.get('sentiment_score'),
-                prediction_data.get('sentiment_confidence'),
-                prediction_data.get('article_count'),
-                prediction_data.get('chart_interval', '1d'),
-                prediction_data.get('chart_period', '1y'),
-                prediction_data.get('data_points_count', 0)
-            ))
+            cursor.execute(INSERT_PREDICTION_SQL.format(verb='INSERT'),
+                           self._prediction_row(prediction_data))
             
             prediction_id = cursor.lastrowid
             conn.commit()
@@ -251,6 +246,81 @@ class PredictionDatabase:
         finally:
             conn.close()
     
+    @staticmethod
+    def _prediction_row(prediction_data: Dict) -> Tuple:
+        """Parameter tuple for INSERT_PREDICTION_SQL"""
+        return (
+            prediction_data['symbol'].upper(),
+            prediction_data['prediction_date'],
+            prediction_data['target_date'],
+            prediction_data['timeframe'],
+            prediction_data['current_price'],
+            prediction_data['predicted_price'],
+            prediction_data['predicted_change_percent'],
+            prediction_data['prediction'],
+            prediction_data['confidence'],
+            prediction_data.get('lstm_prediction'),
+            prediction_data.get('lstm_weight'),
+            prediction_data.get('trend_prediction'),
+            prediction_data.get('trend_weight'),
+            prediction_data.get('technical_prediction'),
+            prediction_data.get('technical_weight'),
+            prediction_data.get('sentiment_label'),
+            prediction_data.get('sentiment_score'),
+            prediction_data.get('sentiment_confidence'),
+            prediction_data.get('article_count'),
+            prediction_data.get('chart_interval', '1d'),
+            prediction_data.get('chart_period', '1y'),
+            prediction_data.get('data_points_count', 0)
+        )
+    
+    def store_predictions(self, predictions: List[Dict]) -> List[int]:
+        """
+        Store many predictions in one transaction
+        
+        Predictions that already exist (same symbol, prediction_date and
+        timeframe) are left untouched and their existing ID is returned.
+        
+        Args:
+            predictions: List of prediction dictionaries (as for store_prediction)
+        
+        Returns:
+            prediction_ids, in input order
+        """
+        if not predictions:
+            return []
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        try:
+            insert_sql = INSERT_PREDICTION_SQL.format(verb='INSERT OR IGNORE')
+            prediction_ids = []
+            inserted = 0
+            for prediction_data in predictions:
+                row = self._prediction_row(prediction_data)
+                cursor.execute(insert_sql, row)
+                if cursor.rowcount == 1:
+                    prediction_ids.append(cursor.lastrowid)
+                    inserted += 1
+                    continue
+                
+                cursor.execute('''
+                    SELECT prediction_id FROM predictions
+                    WHERE symbol = ? AND prediction_date = ? AND timeframe = ?
+                ''', (row[0], row[1], row[3]))
+                existing = cursor.fetchone()
+                prediction_ids.append(existing[0] if existing else -1)
+            
+            conn.commit()
+            logger.info(f"[OK] Stored {inserted} predictions "
+                       f"({len(predictions) - inserted} already existed)")
+            
+            return prediction_ids
+            
+        finally:
+            conn.close()
+    
     def update_prediction_outcome(self, prediction_id: int, actual_price: float, 
                                    is_correct: bool) -> bool:
         """
@@ -306,6 +376,62 @@ class PredictionDatabase:
         
         return True
     
+    def resolve_pending_predictions(self, prices: Dict[str, float], target_date: Optional[str] = None,
+                                    tolerance_percent: float = 2.0) -> int:
+        """
+        Validate all due predictions against one price snapshot
+        
+        Actual change, error and correctness are computed in SQL, with a
+        single UPDATE per symbol in one transaction.
+        
+        Args:
+            prices: Dictionary mapping symbol -> actual closing price
+            target_date: Resolve predictions due on this date ('YYYY-MM-DD');
+                         None resolves every prediction due up to today
+            tolerance_percent: Maximum price error counted as correct
+        
+        Returns:
+            Number of predictions validated
+        """
+        if not prices:
+            return 0
+        
+        if target_date:
+            date_clause = 'substr(target_date, 1, 10) = ?'
+            date_value = str(target_date)[:10]
+        else:
+            date_clause = 'substr(target_date, 1, 10) <= ?'
+            date_value = datetime.now().strftime('%Y-%m-%d')
+        
+        validated_at = datetime.now().isoformat()
+        rows = [(price, price, price, price, tolerance_percent, validated_at,
+                 symbol.upper(), date_value)
+                for symbol, price in prices.items() if price]
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.executemany(f'''
+                UPDATE predictions
+                SET actual_price = ?,
+                    actual_change_percent = ((? - current_price) / current_price) * 100,
+                    prediction_error_percent = ABS((? - predicted_price) / predicted_price * 100),
+                    prediction_correct = CASE
+                        WHEN ABS((? - predicted_price) / predicted_price * 100) <= ? THEN 1
+                        ELSE 0 END,
+                    status = 'COMPLETED',
+                    validated_at = ?
+                WHERE symbol = ?
+                AND status = 'ACTIVE'
+                AND {date_clause}
+            ''', rows)
+            validated = cursor.rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        
+        logger.info(f"[OK] Resolved {validated} predictions against {len(rows)} prices")
+        return validated
+    
     def get_active_predictions(self) -> List[Dict]:
         """
         Get all active predictions (not yet validated)
@@ -387,12 +513,29 @@ class PredictionDatabase:
         Returns:
             Dictionary with accuracy statistics
         """
-        predictions = self.get_prediction_history(symbol, days, timeframe)
+        start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        query = f'''
+            SELECT {ACCURACY_AGGREGATES_SQL}
+            FROM predictions
+            WHERE symbol = ?
+            AND status = 'COMPLETED'
+            AND DATE(prediction_date) >= DATE(?)
+        '''
+        params = [symbol.upper(), start_date]
+        if timeframe:
+            query += ' AND timeframe = ?'
+            params.append(timeframe)
         
-        # Filter only completed predictions
-        completed = [p for p in predictions if p['status'] == 'COMPLETED']
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(query, params).fetchone()
+        finally:
+            conn.close()
+        
+        (total, correct, buy_total, buy_correct, sell_total, sell_correct,
+         hold_total, hold_correct, avg_error, _, _) = row
         
-        if not completed:
+        if not total:
             return {
                 'total_predictions': 0,
                 'correct_predictions': 0,
@@ -403,37 +546,17 @@ class PredictionDatabase:
                 'hold_accuracy': 0
             }
         
-        total = len(completed)
-        correct = sum(1 for p in completed if p['prediction_correct'] == 1)
-        
-        # Calculate direction-specific accuracy
-        buy_preds = [p for p in completed if p['prediction'] == 'BUY']
-        buy_correct = sum(1 for p in buy_preds if p['prediction_correct'] == 1)
-        buy_accuracy = (buy_correct / len(buy_preds) * 100) if buy_preds else 0
-        
-        sell_preds = [p for p in completed if p['prediction'] == 'SELL']
-        sell_correct = sum(1 for p in sell_preds if p['prediction_correct'] == 1)
-        sell_accuracy = (sell_correct / len(sell_preds) * 100) if sell_preds else 0
-        
-        hold_preds = [p for p in completed if p['prediction'] == 'HOLD']
-        hold_correct = sum(1 for p in hold_preds if p['prediction_correct'] == 1)
-        hold_accuracy = (hold_correct / len(hold_preds) * 100) if hold_preds else 0
-        
-        # Calculate average error
-        errors = [p['prediction_error_percent'] for p in completed if p['prediction_error_percent']]
-        avg_error = sum(errors) / len(errors) if errors else 0
-        
         stats = {
             'total_predictions': total,
             'correct_predictions': correct,
-            'accuracy_percent': (correct / total * 100) if total > 0 else 0,
+            'accuracy_percent': correct / total * 100,
             'avg_error_percent': avg_error,
-            'buy_accuracy': buy_accuracy,
-            'sell_accuracy': sell_accuracy,
-            'hold_accuracy': hold_accuracy,
-            'buy_total': len(buy_preds),
-            'sell_total': len(sell_preds),
-            'hold_total': len(hold_preds)
+            'buy_accuracy': (buy_correct / buy_total * 100) if buy_total else 0,
+            'sell_accuracy': (sell_correct / sell_total * 100) if sell_total else 0,
+            'hold_accuracy': (hold_correct / hold_total * 100) if hold_total else 0,
+            'buy_total': buy_total,
+            'sell_total': sell_total,
+            'hold_total': hold_total
         }
         
         logger.info(f"[OK] Calculated accuracy stats for {symbol}: "
@@ -454,73 +577,77 @@ class PredictionDatabase:
         Returns:
             True if successful
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        updated = self.refresh_accuracy_stats(period_days, symbols=[symbol], timeframe=timeframe)
+        if updated:
+            logger.info(f"[OK] Updated accuracy stats for {symbol}")
+        return updated > 0
+    
+    def refresh_accuracy_stats(self, period_days: int = 30, symbols: Optional[List[str]] = None,
+                               timeframe: Optional[str] = None) -> int:
+        """
+        Recompute stored accuracy statistics in one SQL aggregation pass
+        
+        Every (symbol, timeframe) with completed predictions in the period
+        gets its prediction_accuracy_stats row replaced.
+        
+        Args:
+            period_days: Period to analyze
+            symbols: Restrict to these symbols (default: all)
+            timeframe: Restrict to one timeframe (default: all)
         
+        Returns:
+            Number of (symbol, timeframe) stats rows written
+        """
         start_date = (datetime.now() - timedelta(days=period_days)).strftime('%Y-%m-%d')
         end_date = datetime.now().strftime('%Y-%m-%d')
         
-        # Get completed predictions in period
-        cursor.execute('''
-            SELECT * FROM predictions
-            WHERE symbol = ? 
-            AND timeframe = ?
-            AND status = 'COMPLETED'
+        where = '''
+            WHERE status = 'COMPLETED'
             AND DATE(prediction_date) BETWEEN DATE(?) AND DATE(?)
-        ''', (symbol.upper(), timeframe, start_date, end_date))
-        
-        predictions = cursor.fetchall()
+        '''
+        params = [start_date, end_date]
+        if symbols:
+            where += f" AND symbol IN ({', '.join('?' for _ in symbols)})"
+            params.extend(symbol.upper() for symbol in symbols)
+        if timeframe:
+            where += ' AND timeframe = ?'
+            params.append(timeframe)
         
-        if not predictions:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(f'''
+                SELECT symbol, timeframe, {ACCURACY_AGGREGATES_SQL}
+                FROM predictions
+                {where}
+                GROUP BY symbol, timeframe
+            ''', params).fetchall()
+            
+            updated_at = datetime.now().isoformat()
+            conn.executemany('''
+                INSERT OR REPLACE INTO prediction_accuracy_stats (
+                    symbol, timeframe, period_start, period_end,
+                    total_predictions, correct_predictions, accuracy_percent,
+                    buy_predictions, buy_correct,
+                    sell_predictions, sell_correct,
+                    hold_predictions, hold_correct,
+                    avg_error_percent, mae, avg_confidence, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (symbol, tf, start_date, end_date,
+                 total, correct, (correct / total * 100) if total else 0,
+                 buy_total, buy_correct, sell_total, sell_correct, hold_total, hold_correct,
+                 avg_error, mae, avg_confidence, updated_at)
+                for (symbol, tf, total, correct, buy_total, buy_correct, sell_total, sell_correct,
+                     hold_total, hold_correct, avg_error, mae, avg_confidence) in rows
+            ])
+            conn.commit()
+        finally:
             conn.close()
-            return False
-        
-        # Calculate statistics
-        total = len(predictions)
-        correct = sum(1 for p in predictions if p[24] == 1)  # prediction_correct column
         
-        buy_preds = [p for p in predictions if p[8] == 'BUY']
-        buy_correct = sum(1 for p in buy_preds if p[24] == 1)
+        logger.info(f"[OK] Refreshed accuracy stats for {len(rows)} symbol/timeframe pairs "
+                   f"over {period_days} days")
         
-        sell_preds = [p for p in predictions if p[8] == 'SELL']
-        sell_correct = sum(1 for p in sell_preds if p[24] == 1)
-        
-        hold_preds = [p for p in predictions if p[8] == 'HOLD']
-        hold_correct = sum(1 for p in hold_preds if p[24] == 1)
-        
-        errors = [p[23] for p in predictions if p[23] is not None]  # prediction_error_percent
-        avg_error = sum(errors) / len(errors) if errors else 0
-        
-        confidences = [p[9] for p in predictions if p[9] is not None]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-        
-        # Insert or update stats
-        cursor.execute('''
-            INSERT OR REPLACE INTO prediction_accuracy_stats (
-                symbol, timeframe, period_start, period_end,
-                total_predictions, correct_predictions, accuracy_percent,
-                buy_predictions, buy_correct,
-                sell_predictions, sell_correct,
-                hold_predictions, hold_correct,
-                avg_error_percent, avg_confidence, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            symbol.upper(), timeframe, start_date, end_date,
-            total, correct, (correct / total * 100) if total > 0 else 0,
-            len(buy_preds), buy_correct,
-            len(sell_preds), sell_correct,
-            len(hold_preds), hold_correct,
-            avg_error, avg_confidence,
-            datetime.now().isoformat()
-        ))
-        
-        conn.commit()
-        conn.close()
-        
-        logger.info(f"[OK] Updated accuracy stats for {symbol}: {correct}/{total} correct "
-                   f"({correct/total*100:.1f}%)")
-        
-        return True
+        return len(rows)
     
     def get_accuracy_statistics(self, symbol: str, timeframe: str = 'DAILY_EOD',
                                 period: str = 'month') -> Dict:
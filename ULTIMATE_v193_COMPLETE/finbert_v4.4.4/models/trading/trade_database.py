@@ -1,12 +1,21 @@
 """
 Trading Database Manager
 Handles all database operations for the trading platform
+
+Features:
+- One long-lived, thread-safe connection (Flask workers, order monitor thread)
+- WAL journal so readers never block the writer
+- Indexes on trades/orders symbol and status
+- Nested transactions: a portfolio refresh or order fill commits once
+- Batched update_position_prices_many / create_trades_many
 """
 
 import sqlite3
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import os
 
 logger = logging.getLogger(__name__)
@@ -18,108 +27,170 @@ class TradingDatabase:
     def __init__(self, db_path: str = "trading.db"):
         """Initialize database connection"""
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._conn = self._connect()
         self.init_database()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection (WAL, shared across threads under self._lock)"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Could not enable WAL for {self.db_path}: {e}")
+        return conn
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Run statements in one transaction on the shared connection
+        
+        Nested calls join the outermost transaction, which commits on
+        success and rolls back on any exception.
+        
+        Yields:
+            sqlite3.Connection
+        """
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self._conn
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.rollback()
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.commit()
+    
+    def close(self):
+        """Close the shared connection"""
+        with self._lock:
+            self._conn.close()
         
     def init_database(self):
-        """Create tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Trades table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trades (
-                trade_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                side TEXT NOT NULL,
-                quantity INTEGER NOT NULL,
-                entry_price REAL NOT NULL,
-                exit_price REAL,
-                entry_date TEXT NOT NULL,
-                exit_date TEXT,
-                commission REAL DEFAULT 0,
-                slippage REAL DEFAULT 0,
-                pnl REAL,
-                pnl_percent REAL,
-                status TEXT DEFAULT 'OPEN',
-                strategy TEXT,
-                notes TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Portfolio table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS portfolio (
-                position_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT UNIQUE NOT NULL,
-                quantity INTEGER NOT NULL,
-                avg_cost REAL NOT NULL,
-                current_price REAL,
-                market_value REAL,
-                unrealized_pnl REAL,
-                unrealized_pnl_percent REAL,
-                stop_loss_price REAL,
-                take_profit_price REAL,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Orders table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS orders (
-                order_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                order_type TEXT NOT NULL,
-                side TEXT NOT NULL,
-                quantity INTEGER NOT NULL,
-                limit_price REAL,
-                stop_price REAL,
-                filled_quantity INTEGER DEFAULT 0,
-                avg_fill_price REAL,
-                status TEXT DEFAULT 'PENDING',
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                filled_at TEXT,
-                cancelled_at TEXT
-            )
-        ''')
-        
-        # Account table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS account (
-                account_id INTEGER PRIMARY KEY DEFAULT 1,
-                cash_balance REAL NOT NULL DEFAULT 10000,
-                portfolio_value REAL DEFAULT 0,
-                total_value REAL DEFAULT 10000,
-                buying_power REAL DEFAULT 10000,
-                initial_capital REAL DEFAULT 10000,
-                total_pnl REAL DEFAULT 0,
-                total_pnl_percent REAL DEFAULT 0,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Initialize account if doesn't exist
-        cursor.execute('SELECT COUNT(*) FROM account')
-        if cursor.fetchone()[0] == 0:
+        """Create tables and indexes if they don't exist"""
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Trades table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS trades (
+                    trade_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    symbol TEXT NOT NULL,
+                    side TEXT NOT NULL,
+                    quantity INTEGER NOT NULL,
+                    entry_price REAL NOT NULL,
+                    exit_price REAL,
+                    entry_date TEXT NOT NULL,
+                    exit_date TEXT,
+                    commission REAL DEFAULT 0,
+                    slippage REAL DEFAULT 0,
+                    pnl REAL,
+                    pnl_percent REAL,
+                    status TEXT DEFAULT 'OPEN',
+                    strategy TEXT,
+                    notes TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Portfolio table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS portfolio (
+                    position_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    symbol TEXT UNIQUE NOT NULL,
+                    quantity INTEGER NOT NULL,
+                    avg_cost REAL NOT NULL,
+                    current_price REAL,
+                    market_value REAL,
+                    unrealized_pnl REAL,
+                    unrealized_pnl_percent REAL,
+                    stop_loss_price REAL,
+                    take_profit_price REAL,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Orders table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS orders (
+                    order_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    symbol TEXT NOT NULL,
+                    order_type TEXT NOT NULL,
+                    side TEXT NOT NULL,
+                    quantity INTEGER NOT NULL,
+                    limit_price REAL,
+                    stop_price REAL,
+                    filled_quantity INTEGER DEFAULT 0,
+                    avg_fill_price REAL,
+                    status TEXT DEFAULT 'PENDING',
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    filled_at TEXT,
+                    cancelled_at TEXT
+                )
+            ''')
+            
+            # Account table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS account (
+                    account_id INTEGER PRIMARY KEY DEFAULT 1,
+                    cash_balance REAL NOT NULL DEFAULT 10000,
+                    portfolio_value REAL DEFAULT 0,
+                    total_value REAL DEFAULT 10000,
+                    buying_power REAL DEFAULT 10000,
+                    initial_capital REAL DEFAULT 10000,
+                    total_pnl REAL DEFAULT 0,
+                    total_pnl_percent REAL DEFAULT 0,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Create indexes for performance
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_trades_symbol_status 
+                ON trades(symbol, status)
+            ''')
+            
             cursor.execute('''
-                INSERT INTO account (account_id, cash_balance, initial_capital, buying_power)
-                VALUES (1, 10000, 10000, 10000)
+                CREATE INDEX IF NOT EXISTS idx_trades_status 
+                ON trades(status)
             ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_trades_created 
+                ON trades(created_at)
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_orders_symbol_status 
+                ON orders(symbol, status)
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_orders_status 
+                ON orders(status)
+            ''')
+            
+            # Initialize account if doesn't exist
+            cursor.execute('SELECT COUNT(*) FROM account')
+            if cursor.fetchone()[0] == 0:
+                cursor.execute('''
+                    INSERT INTO account (account_id, cash_balance, initial_capital, buying_power)
+                    VALUES (1, 10000, 10000, 10000)
+                ''')
         
-        conn.commit()
-        conn.close()
         logger.info("Trading database initialized")
     
     # ========== ACCOUNT OPERATIONS ==========
     
     def get_account(self) -> Dict:
         """Get account summary"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM account WHERE account_id = 1')
-        row = cursor.fetchone()
-        conn.close()
+        with self.transaction() as conn:
+            row = conn.execute('SELECT * FROM account WHERE account_id = 1').fetchone()
         
         if row:
             return {
@@ -137,9 +208,6 @@ class TradingDatabase:
     
     def update_account(self, **kwargs):
         """Update account values"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         updates = []
         values = []
         for key, value in kwargs.items():
@@ -151,36 +219,33 @@ class TradingDatabase:
         values.append(1)  # account_id
         
         query = f"UPDATE account SET {', '.join(updates)} WHERE account_id = ?"
-        cursor.execute(query, values)
-        conn.commit()
-        conn.close()
+        with self.transaction() as conn:
+            conn.execute(query, values)
     
     def reset_account(self, initial_capital: float = 10000):
         """Reset account to initial state"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Clear all data
-        cursor.execute('DELETE FROM trades')
-        cursor.execute('DELETE FROM portfolio')
-        cursor.execute('DELETE FROM orders')
-        
-        # Reset account
-        cursor.execute('''
-            UPDATE account SET
-                cash_balance = ?,
-                portfolio_value = 0,
-                total_value = ?,
-                buying_power = ?,
-                initial_capital = ?,
-                total_pnl = 0,
-                total_pnl_percent = 0,
-                updated_at = ?
-            WHERE account_id = 1
-        ''', (initial_capital, initial_capital, initial_capital, initial_capital, datetime.now().isoformat()))
-        
-        conn.commit()
-        conn.close()
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Clear all data
+            cursor.execute('DELETE FROM trades')
+            cursor.execute('DELETE FROM portfolio')
+            cursor.execute('DELETE FROM orders')
+            
+            # Reset account
+            cursor.execute('''
+                UPDATE account SET
+                    cash_balance = ?,
+                    portfolio_value = 0,
+                    total_value = ?,
+                    buying_power = ?,
+                    initial_capital = ?,
+                    total_pnl = 0,
+                    total_pnl_percent = 0,
+                    updated_at = ?
+                WHERE account_id = 1
+            ''', (initial_capital, initial_capital, initial_capital, initial_capital, datetime.now().isoformat()))
+        
         logger.info(f"Account reset with USD{initial_capital} capital")
     
     # ========== TRADE OPERATIONS ==========
@@ -189,37 +254,64 @@ class TradingDatabase:
                     commission: float = 0, slippage: float = 0, strategy: str = None,
                     notes: str = None) -> int:
         """Create new trade"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO trades (symbol, side, quantity, entry_price, entry_date, 
-                              commission, slippage, status, strategy, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 'OPEN', ?, ?)
-        ''', (symbol, side, quantity, entry_price, datetime.now().isoformat(),
-              commission, slippage, strategy, notes))
-        
-        trade_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        trade_id = self.create_trades_many([{
+            'symbol': symbol,
+            'side': side,
+            'quantity': quantity,
+            'entry_price': entry_price,
+            'commission': commission,
+            'slippage': slippage,
+            'strategy': strategy,
+            'notes': notes
+        }])[0]
         
         logger.info(f"Created trade #{trade_id}: {side} {quantity} {symbol} @ USD{entry_price}")
         return trade_id
     
+    def create_trades_many(self, trades: Iterable[Dict]) -> List[int]:
+        """
+        Create several trades in one transaction
+        
+        Args:
+            trades: Dicts with symbol, side, quantity, entry_price and optional
+                    commission, slippage, strategy, notes, entry_date
+            
+        Returns:
+            New trade IDs, in input order
+        """
+        entry_date = datetime.now().isoformat()
+        trade_ids = []
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            for trade in trades:
+                cursor.execute('''
+                    INSERT INTO trades (symbol, side, quantity, entry_price, entry_date, 
+                                      commission, slippage, status, strategy, notes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 'OPEN', ?, ?)
+                ''', (trade['symbol'], trade['side'], trade['quantity'], trade['entry_price'],
+                      trade.get('entry_date') or entry_date,
+                      trade.get('commission', 0), trade.get('slippage', 0),
+                      trade.get('strategy'), trade.get('notes')))
+                trade_ids.append(cursor.lastrowid)
+        
+        if len(trade_ids) > 1:
+            logger.info(f"Created {len(trade_ids)} trades")
+        return trade_ids
+    
     def close_trade(self, trade_id: int, exit_price: float, commission: float = 0,
                    slippage: float = 0):
         """Close trade and calculate P&L"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get trade details
-        cursor.execute('SELECT * FROM trades WHERE trade_id = ?', (trade_id,))
-        trade = cursor.fetchone()
-        
-        if trade:
-            side = trade[2]
-            quantity = trade[3]
-            entry_price = trade[4]
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Get trade details
+            cursor.execute('SELECT side, quantity, entry_price FROM trades WHERE trade_id = ?', (trade_id,))
+            trade = cursor.fetchone()
+            
+            if not trade:
+                return 0, 0
+            
+            side, quantity, entry_price = trade
             
             # Calculate P&L
             if side == 'BUY':
@@ -239,21 +331,12 @@ class TradingDatabase:
                     status = 'CLOSED'
                 WHERE trade_id = ?
             ''', (exit_price, datetime.now().isoformat(), pnl, pnl_percent, trade_id))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Closed trade #{trade_id}: P&L USD{pnl:.2f} ({pnl_percent:.2f}%)")
-            return pnl, pnl_percent
         
-        conn.close()
-        return 0, 0
+        logger.info(f"Closed trade #{trade_id}: P&L USD{pnl:.2f} ({pnl_percent:.2f}%)")
+        return pnl, pnl_percent
     
     def get_trades(self, status: str = None, symbol: str = None, limit: int = 100) -> List[Dict]:
         """Get trade history"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         query = 'SELECT * FROM trades WHERE 1=1'
         params = []
         
@@ -268,9 +351,8 @@ class TradingDatabase:
         query += ' ORDER BY created_at DESC LIMIT ?'
         params.append(limit)
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        with self.transaction() as conn:
+            rows = conn.execute(query, params).fetchall()
         
         trades = []
         for row in rows:
@@ -300,128 +382,137 @@ class TradingDatabase:
     def upsert_position(self, symbol: str, quantity: int, avg_cost: float,
                        stop_loss: float = None, take_profit: float = None):
         """Create or update position"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM portfolio WHERE symbol = ?', (symbol,))
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Update existing position
-            old_qty = existing[2]
-            old_cost = existing[3]
-            new_qty = old_qty + quantity
-            new_avg_cost = ((old_qty * old_cost) + (quantity * avg_cost)) / new_qty if new_qty > 0 else 0
+        with self.transaction() as conn:
+            cursor = conn.cursor()
             
-            cursor.execute('''
-                UPDATE portfolio SET
-                    quantity = ?,
-                    avg_cost = ?,
-                    stop_loss_price = ?,
-                    take_profit_price = ?,
-                    updated_at = ?
-                WHERE symbol = ?
-            ''', (new_qty, new_avg_cost, stop_loss, take_profit, datetime.now().isoformat(), symbol))
-        else:
-            # Create new position
-            cursor.execute('''
-                INSERT INTO portfolio (symbol, quantity, avg_cost, stop_loss_price, take_profit_price)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (symbol, quantity, avg_cost, stop_loss, take_profit))
+            cursor.execute('SELECT quantity, avg_cost FROM portfolio WHERE symbol = ?', (symbol,))
+            existing = cursor.fetchone()
+            
+            if existing:
+                # Update existing position
+                old_qty, old_cost = existing
+                new_qty = old_qty + quantity
+                new_avg_cost = ((old_qty * old_cost) + (quantity * avg_cost)) / new_qty if new_qty > 0 else 0
+                
+                cursor.execute('''
+                    UPDATE portfolio SET
+                        quantity = ?,
+                        avg_cost = ?,
+                        stop_loss_price = ?,
+                        take_profit_price = ?,
+                        updated_at = ?
+                    WHERE symbol = ?
+                ''', (new_qty, new_avg_cost, stop_loss, take_profit, datetime.now().isoformat(), symbol))
+            else:
+                # Create new position
+                cursor.execute('''
+                    INSERT INTO portfolio (symbol, quantity, avg_cost, stop_loss_price, take_profit_price)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (symbol, quantity, avg_cost, stop_loss, take_profit))
         
-        conn.commit()
-        conn.close()
         logger.info(f"Updated position: {symbol} - {quantity} shares @ USD{avg_cost}")
     
     def update_position_prices(self, symbol: str, current_price: float):
         """Update current price and P&L for position"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM portfolio WHERE symbol = ?', (symbol,))
-        position = cursor.fetchone()
-        
-        if position:
-            quantity = position[2]
-            avg_cost = position[3]
-            market_value = current_price * quantity
-            unrealized_pnl = (current_price - avg_cost) * quantity
-            unrealized_pnl_percent = ((current_price - avg_cost) / avg_cost) * 100 if avg_cost > 0 else 0
+        self.update_position_prices_many({symbol: current_price})
+    
+    def update_position_prices_many(self, prices: Dict[str, float]) -> int:
+        """
+        Update current price and P&L for many positions in one transaction
+        
+        Market value and unrealized P&L are computed in SQL from each
+        position's stored quantity and average cost.
+        
+        Args:
+            prices: Dictionary mapping symbol -> current price
             
-            cursor.execute('''
+        Returns:
+            Number of positions updated
+        """
+        if not prices:
+            return 0
+        
+        updated_at = datetime.now().isoformat()
+        rows = [(price, price, price, price, updated_at, symbol)
+                for symbol, price in prices.items()]
+        
+        with self.transaction() as conn:
+            cursor = conn.executemany('''
                 UPDATE portfolio SET
                     current_price = ?,
-                    market_value = ?,
-                    unrealized_pnl = ?,
-                    unrealized_pnl_percent = ?,
+                    market_value = ? * quantity,
+                    unrealized_pnl = (? - avg_cost) * quantity,
+                    unrealized_pnl_percent = CASE WHEN avg_cost > 0
+                        THEN ((? - avg_cost) / avg_cost) * 100 ELSE 0 END,
                     updated_at = ?
                 WHERE symbol = ?
-            ''', (current_price, market_value, unrealized_pnl, unrealized_pnl_percent,
-                  datetime.now().isoformat(), symbol))
-            
-            conn.commit()
+            ''', rows)
+            return cursor.rowcount
+    
+    def set_position_levels(self, symbol: str, stop_loss: float = None, take_profit: float = None):
+        """Set stop-loss and/or take-profit price for a position (None leaves a level unchanged)"""
+        updates = {}
+        if stop_loss is not None:
+            updates['stop_loss_price'] = stop_loss
+        if take_profit is not None:
+            updates['take_profit_price'] = take_profit
+        if not updates:
+            return
+        
+        updates['updated_at'] = datetime.now().isoformat()
+        set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
+        values = list(updates.values()) + [symbol]
         
-        conn.close()
+        with self.transaction() as conn:
+            conn.execute(f'UPDATE portfolio SET {set_clause} WHERE symbol = ?', values)
     
     def remove_position(self, symbol: str):
         """Remove position from portfolio"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM portfolio WHERE symbol = ?', (symbol,))
-        conn.commit()
-        conn.close()
+        with self.transaction() as conn:
+            conn.execute('DELETE FROM portfolio WHERE symbol = ?', (symbol,))
         logger.info(f"Removed position: {symbol}")
     
+    @staticmethod
+    def _position_from_row(row) -> Dict:
+        return {
+            'position_id': row[0],
+            'symbol': row[1],
+            'quantity': row[2],
+            'avg_cost': row[3],
+            'current_price': row[4],
+            'market_value': row[5],
+            'unrealized_pnl': row[6],
+            'unrealized_pnl_percent': row[7],
+            'stop_loss_price': row[8],
+            'take_profit_price': row[9],
+            'updated_at': row[10]
+        }
+    
     def get_positions(self) -> List[Dict]:
         """Get all current positions"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM portfolio ORDER BY symbol')
-        rows = cursor.fetchall()
-        conn.close()
+        with self.transaction() as conn:
+            rows = conn.execute('SELECT * FROM portfolio ORDER BY symbol').fetchall()
         
-        positions = []
-        for row in rows:
-            positions.append({
-                'position_id': row[0],
-                'symbol': row[1],
-                'quantity': row[2],
-                'avg_cost': row[3],
-                'current_price': row[4],
-                'market_value': row[5],
-                'unrealized_pnl': row[6],
-                'unrealized_pnl_percent': row[7],
-                'stop_loss_price': row[8],
-                'take_profit_price': row[9],
-                'updated_at': row[10]
-            })
-        
-        return positions
+        return [self._position_from_row(row) for row in rows]
     
     def get_position(self, symbol: str) -> Optional[Dict]:
         """Get specific position"""
-        positions = self.get_positions()
-        for pos in positions:
-            if pos['symbol'] == symbol:
-                return pos
-        return None
+        with self.transaction() as conn:
+            row = conn.execute('SELECT * FROM portfolio WHERE symbol = ?', (symbol,)).fetchone()
+        
+        return self._position_from_row(row) if row else None
     
     # ========== ORDER OPERATIONS ==========
     
     def create_order(self, symbol: str, order_type: str, side: str, quantity: int,
                     limit_price: float = None, stop_price: float = None) -> int:
         """Create new order"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO orders (symbol, order_type, side, quantity, limit_price, stop_price, status)
-            VALUES (?, ?, ?, ?, ?, ?, 'PENDING')
-        ''', (symbol, order_type, side, quantity, limit_price, stop_price))
-        
-        order_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self.transaction() as conn:
+            cursor = conn.execute('''
+                INSERT INTO orders (symbol, order_type, side, quantity, limit_price, stop_price, status)
+                VALUES (?, ?, ?, ?, ?, ?, 'PENDING')
+            ''', (symbol, order_type, side, quantity, limit_price, stop_price))
+            order_id = cursor.lastrowid
         
         logger.info(f"Created order #{order_id}: {side} {quantity} {symbol} ({order_type})")
         return order_id
@@ -429,9 +520,6 @@ class TradingDatabase:
     def update_order_status(self, order_id: int, status: str, filled_qty: int = None,
                            avg_fill_price: float = None):
         """Update order status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         updates = {'status': status}
         if filled_qty is not None:
             updates['filled_quantity'] = filled_qty
@@ -446,17 +534,13 @@ class TradingDatabase:
         set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
         values = list(updates.values()) + [order_id]
         
-        cursor.execute(f'UPDATE orders SET {set_clause} WHERE order_id = ?', values)
-        conn.commit()
-        conn.close()
+        with self.transaction() as conn:
+            conn.execute(f'UPDATE orders SET {set_clause} WHERE order_id = ?', values)
         
         logger.info(f"Order #{order_id} status: {status}")
     
     def get_orders(self, status: str = None, symbol: str = None) -> List[Dict]:
         """Get orders"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         query = 'SELECT * FROM orders WHERE 1=1'
         params = []
         
@@ -469,9 +553,8 @@ class TradingDatabase:
             params.append(symbol)
         
         query += ' ORDER BY created_at DESC'
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        with self.transaction() as conn:
+            rows = conn.execute(query, params).fetchall()
         
         orders = []
         for row in rows:
@@ -497,13 +580,11 @@ class TradingDatabase:
     
     def get_trade_statistics(self) -> Dict:
         """Calculate trading statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # Get closed trades
-        cursor.execute('SELECT pnl, pnl_percent FROM trades WHERE status = "CLOSED"')
-        closed_trades = cursor.fetchall()
-        conn.close()
+        with self.transaction() as conn:
+            closed_trades = conn.execute(
+                "SELECT pnl, pnl_percent FROM trades WHERE status = 'CLOSED'"
+            ).fetchall()
         
         if not closed_trades:
             return {
@@ -47,10 +47,126 @@ StockLSTMPredictor = _load_lstm_predictor()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _load_ohlcv_cache():
+    """Load the shared persistent OHLCV cache (None if unavailable)"""
+    try:
+        cache_path = Path(__file__).parent / 'backtesting' / 'ohlcv_cache.py'
+        spec = importlib.util.spec_from_file_location("ohlcv_cache", cache_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load spec from {cache_path}")
+        
+        cache_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cache_module)
+        
+        return cache_module.get_ohlcv_cache()
+    except Exception as e:
+        logging.warning(f"OHLCV cache unavailable, training data will be downloaded in full: {e}")
+        return None
+
+# Persistent OHLCV cache shared with the screening pipelines and backtester
+ohlcv_cache = _load_ohlcv_cache()
+
+CHART_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+def _request_chart(symbol: str, query: str) -> pd.DataFrame:
+    """
+    Request daily bars from the Yahoo Finance chart API
+    
+    Args:
+        symbol: Stock symbol
+        query: Range query string, e.g. 'range=2y' or 'period1=...&period2=...'
+    
+    Returns:
+        DataFrame with timestamp/open/high/low/close/volume columns (empty on bad response).
+        Timestamps are naive exchange-local times, so ASX/LSE bars keep their session date.
+    """
+    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?{query}&interval=1d"
+    req = urllib.request.Request(url, headers=CHART_HEADERS)
+    
+    logger.debug(f"Requesting data from: {url}")
+    
+    with urllib.request.urlopen(req, timeout=30) as response:
+        data = json.loads(response.read().decode('utf-8'))
+    
+    if 'chart' not in data or 'result' not in data['chart']:
+        logger.error(f"Invalid response structure for {symbol}")
+        logger.debug(f"Response keys: {list(data.keys())}")
+        return pd.DataFrame()
+    
+    if not data['chart']['result']:
+        logger.error(f"No data returned for {symbol}")
+        return pd.DataFrame()
+    
+    result = data['chart']['result'][0]
+    
+    # Check if there's an error in the response
+    if 'error' in result:
+        error_msg = result['error']
+        logger.error(f"API error for {symbol}: {error_msg}")
+        return pd.DataFrame()
+    
+    timestamps = result.get('timestamp', [])
+    if not timestamps:
+        logger.error(f"No timestamps found for {symbol}")
+        return pd.DataFrame()
+    
+    indicators = result.get('indicators', {})
+    quote = indicators.get('quote', [{}])[0]
+    
+    # Epoch seconds are UTC: convert to the exchange's wall clock before
+    # dropping the timezone (the shared OHLCV cache stores local session dates)
+    meta = result.get('meta', {})
+    bar_times = pd.to_datetime(timestamps, unit='s', utc=True)
+    try:
+        bar_times = bar_times.tz_convert(meta['exchangeTimezoneName'])
+    except (KeyError, TypeError, ValueError) as e:
+        logger.debug(f"No usable exchange timezone for {symbol} ({e}), using gmtoffset")
+        bar_times = bar_times + pd.Timedelta(seconds=meta.get('gmtoffset') or 0)
+    bar_times = bar_times.tz_localize(None)
+    
+    # Create DataFrame
+    return pd.DataFrame({
+        'timestamp': bar_times,
+        'open': quote.get('open', []),
+        'high': quote.get('high', []),
+        'low': quote.get('low', []),
+        'close': quote.get('close', []),
+        'volume': quote.get('volume', [])
+    })
+
+def _fetch_chart_range(symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """OHLCV cache top-up: daily bars in [start, end) indexed by timestamp"""
+    period1 = int(pd.Timestamp(start).timestamp())
+    period2 = int(pd.Timestamp(end).timestamp())
+    df = _request_chart(symbol, f"period1={period1}&period2={period2}")
+    if df.empty:
+        return df
+    return df.set_index('timestamp')
+
+# Periods the OHLCV cache can resolve to a fixed date window
+CACHEABLE_PERIODS = ('1mo', '3mo', '6mo', '1y', '2y', '5y', '10y')
+
+def _load_training_bars(symbol: str, period: str) -> pd.DataFrame:
+    """Serve bars from the OHLCV cache (incremental top-up), or download the full range"""
+    if ohlcv_cache is not None and period in CACHEABLE_PERIODS:
+        hist = ohlcv_cache.get_history(symbol, period=period, fetch_fn=_fetch_chart_range)
+        if hist is None:
+            return pd.DataFrame()
+        df = hist[['Open', 'High', 'Low', 'Close', 'Volume']].reset_index()
+        df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        return df
+    
+    return _request_chart(symbol, f"range={period}")
+
 def fetch_training_data(symbol: str, period: str = '2y') -> pd.DataFrame:
     """
     Fetch historical data for training
     
+    Daily bars come from the persistent OHLCV cache when available, so
+    retraining a symbol only downloads the bars added since the last run.
+    
     Args:
         symbol: Stock symbol
         period: Time period (1y, 2y, 5y, etc.)
@@ -61,55 +177,11 @@ def fetch_training_data(symbol: str, period: str = '2y') -> pd.DataFrame:
     try:
         logger.info(f"Fetching training data for {symbol} (period: {period})")
         
-        # Build Yahoo Finance URL
-        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?range={period}&interval=1d"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        
-        req = urllib.request.Request(url, headers=headers)
-        
-        logger.debug(f"Requesting data from: {url}")
-        
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-        
-        if 'chart' not in data or 'result' not in data['chart']:
-            logger.error(f"Invalid response structure for {symbol}")
-            logger.debug(f"Response keys: {list(data.keys())}")
-            return pd.DataFrame()
-        
-        if not data['chart']['result']:
+        df = _load_training_bars(symbol, period)
+        if df.empty:
             logger.error(f"No data returned for {symbol}")
             return pd.DataFrame()
         
-        result = data['chart']['result'][0]
-        
-        # Check if there's an error in the response
-        if 'error' in result:
-            error_msg = result['error']
-            logger.error(f"API error for {symbol}: {error_msg}")
-            return pd.DataFrame()
-        
-        timestamps = result.get('timestamp', [])
-        if not timestamps:
-            logger.error(f"No timestamps found for {symbol}")
-            return pd.DataFrame()
-        
-        indicators = result.get('indicators', {})
-        quote = indicators.get('quote', [{}])[0]
-        
-        # Create DataFrame
-        df = pd.DataFrame({
-            'timestamp': pd.to_datetime(timestamps, unit='s'),
-            'open': quote.get('open', []),
-            'high': quote.get('high', []),
-            'low': quote.get('low', []),
-            'close': quote.get('close', []),
-            'volume': quote.get('volume', [])
-        })
-        
         logger.debug(f"Raw data shape for {symbol}: {df.shape}")
         
         # Remove any rows with NaN values
@@ -15,6 +15,8 @@ Core Components:
 - event_risk_guard: Event risk assessment (earnings, Basel III, etc.)
 - csv_exporter: CSV report exporter
 - macro_news_monitor: Macro news sentiment analysis
+- rate_limiter: Shared token bucket for upstream data requests
+- lstm_model_registry: LRU-bounded registry of loaded LSTM predictors
 """
 
 __version__ = '1.3.15.87'
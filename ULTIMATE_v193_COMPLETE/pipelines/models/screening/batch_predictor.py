@@ -20,7 +20,13 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from yahooquery import Ticker
+
+try:
+    from .price_history_store import PriceHistoryStore, load_disk_cache
+    from .bulk_history_loader import BulkHistoryLoader
+except ImportError:
+    from price_history_store import PriceHistoryStore, load_disk_cache
+    from bulk_history_loader import BulkHistoryLoader
 
 # Import FinBERT Bridge for real LSTM and sentiment
 try:
@@ -52,12 +58,14 @@ class BatchPredictor:
     Integrates with existing ensemble prediction system.
     """
     
-    def __init__(self, config_path: str = None):
+    def __init__(self, config_path: str = None, price_store: Optional[PriceHistoryStore] = None):
         """
         Initialize Batch Predictor
         
         Args:
             config_path: Path to screening_config.json
+            price_store: Per-run price history shared with the scanner
+                         (None = predictor-owned store)
         """
         if config_path is None:
             config_path = Path(__file__).parent.parent / "config" / "screening_config.json"
@@ -73,6 +81,21 @@ class BatchPredictor:
         # Prediction cache
         self.prediction_cache = {}
         
+        # Per-batch sentiment results from the shared scoring queue
+        self.sentiment_results = {}
+        
+        # Per-batch LSTM results from batched inference
+        self.lstm_results = {}
+        
+        # Shared per-run price history (avoids re-downloading what the scanner fetched)
+        data_fetch = self.config.get('data_fetch', {})
+        if price_store is None:
+            disk_cache = load_disk_cache() if data_fetch.get('disk_cache', True) else None
+            price_store = PriceHistoryStore(period='1y', disk_cache=disk_cache)
+        self.price_store = price_store
+        self.bulk_download = data_fetch.get('bulk_download', True)
+        self.bulk_loader = BulkHistoryLoader.from_config(data_fetch)
+        
         # Data fetcher removed (using yahooquery only now)
         self.data_fetcher = None
         
@@ -144,6 +167,36 @@ class BatchPredictor:
         total_stocks = len(stocks)
         completed = 0
         
+        # Bulk-download any history the scanner did not already fetch
+        if self.bulk_download:
+            try:
+                self.price_store.preload([s['symbol'] for s in stocks], self.bulk_loader)
+            except Exception as e:
+                logger.warning(f"Bulk history preload failed, using per-symbol fetch: {e}")
+        
+        # Score news for the whole batch through one de-duplicated FinBERT queue
+        self.sentiment_results = {}
+        if self.finbert_bridge and self.finbert_components['sentiment_available']:
+            try:
+                self.sentiment_results = self.finbert_bridge.get_sentiment_analysis_batch(
+                    [s['symbol'] for s in stocks], use_cache=True
+                )
+            except Exception as e:
+                logger.warning(f"Batch sentiment scoring failed, using per-symbol analysis: {e}")
+        
+        # Run LSTM inference for the whole batch (one stacked call per model)
+        self.lstm_results = {}
+        if self.finbert_bridge and self.finbert_components['lstm_available']:
+            try:
+                histories = {}
+                for stock in stocks:
+                    hist = self.price_store.get_period(stock['symbol'], '1y')
+                    if isinstance(hist, pd.DataFrame) and len(hist) >= 50:
+                        histories[stock['symbol']] = hist
+                self.lstm_results = self.finbert_bridge.get_lstm_predictions_batch(histories)
+            except Exception as e:
+                logger.warning(f"Batched LSTM inference failed, using per-stock predictions: {e}")
+        
         # Process in parallel batches
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit prediction tasks
@@ -204,15 +257,12 @@ class BatchPredictor:
         
         # Fetch data using yahooquery (primary) or Alpha Vantage (backup)
         try:
-            # Try yahooquery first (most reliable for ASX stocks)
+            # Per-run history store (1 year of data for better analysis)
             hist = None
             try:
-                ticker = Ticker(symbol)
-                hist = ticker.history(period="1y")  # 1 year of data for better analysis
+                hist = self.price_store.get_period(symbol, '1y')
                 
                 if isinstance(hist, pd.DataFrame) and not hist.empty:
-                    # Normalize column names
-                    hist.columns = [col.capitalize() for col in hist.columns]
                     logger.debug(f"[OK] {symbol}: Data fetched from yahooquery ({len(hist)} days)")
             except Exception as yq_error:
                 logger.debug(f"yahooquery failed for {symbol}: {yq_error}")
@@ -376,7 +426,10 @@ class BatchPredictor:
         # Try FinBERT Bridge first (REAL LSTM)
         if self.finbert_bridge and self.finbert_components['lstm_available']:
             try:
-                lstm_result = self.finbert_bridge.get_lstm_prediction(symbol, hist)
+                if symbol in self.lstm_results:
+                    lstm_result = self.lstm_results[symbol]
+                else:
+                    lstm_result = self.finbert_bridge.get_lstm_prediction(symbol, hist)
                 if lstm_result is not None and lstm_result.get('model_trained', False):
                     logger.debug(f"[OK] Using REAL FinBERT LSTM for {symbol}: direction={lstm_result['direction']:.3f}")
                     return {
@@ -533,7 +586,10 @@ class BatchPredictor:
         symbol = stock_data.get('symbol', '')
         if self.finbert_bridge and self.finbert_components['sentiment_available'] and symbol:
             try:
-                sentiment_result = self.finbert_bridge.get_sentiment_analysis(symbol, use_cache=True)
+                if symbol in self.sentiment_results:
+                    sentiment_result = self.sentiment_results[symbol]
+                else:
+                    sentiment_result = self.finbert_bridge.get_sentiment_analysis(symbol, use_cache=True)
                 if sentiment_result is not None and sentiment_result.get('article_count', 0) > 0:
                     logger.debug(f"[OK] Using REAL FinBERT sentiment for {symbol}: {sentiment_result['sentiment']} ({sentiment_result['confidence']:.1f}%), {sentiment_result['article_count']} articles")
                     return {
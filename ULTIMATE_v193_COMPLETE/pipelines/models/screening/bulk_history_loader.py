@@ -0,0 +1,166 @@
+"""
+Bulk History Loader Module
+
+Multi-symbol yahooquery download path for the screening pipelines.
+
+yahooquery's Ticker accepts many symbols per call. Instead of one
+Ticker(symbol) per stock, the loader fetches a whole sector or universe in
+chunks, splits the combined frame into per-symbol frames and normalizes
+them to the same layout as StockScanner.fetch_stock_history().
+
+Failed chunks are retried; symbols still missing afterwards are simply not
+returned, so callers fall back to their per-symbol fetch.
+"""
+
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+try:
+    from .price_history_store import normalize_history
+except ImportError:
+    from price_history_store import normalize_history
+
+logger = logging.getLogger(__name__)
+
+
+class BulkHistoryLoader:
+    """
+    Chunked multi-symbol history downloader
+    """
+
+    def __init__(self, chunk_size: int = 50, retry_attempts: int = 3, retry_delay: float = 5.0,
+                 rate_limiter=None, ticker_factory: Optional[Callable] = None):
+        """
+        Initialize loader
+
+        Args:
+            chunk_size: Symbols per yahooquery request
+            retry_attempts: Attempts per chunk before giving up
+            retry_delay: Base delay between attempts (seconds, doubles each retry)
+            rate_limiter: Optional TokenBucketRateLimiter shared with the scanner
+            ticker_factory: Callable(symbols) -> Ticker (default: yahooquery.Ticker)
+        """
+        self.chunk_size = max(1, int(chunk_size))
+        self.retry_attempts = max(1, int(retry_attempts))
+        self.retry_delay = retry_delay
+        self.rate_limiter = rate_limiter
+        self.ticker_factory = ticker_factory
+
+    @classmethod
+    def from_config(cls, data_fetch: Dict, rate_limiter=None) -> 'BulkHistoryLoader':
+        """
+        Build a loader from screening_config.json 'data_fetch' settings
+
+        Keys: bulk_chunk_size (50), retry_attempts (3), retry_delay_seconds (5)
+        """
+        return cls(
+            chunk_size=data_fetch.get('bulk_chunk_size', 50),
+            retry_attempts=data_fetch.get('retry_attempts', 3),
+            retry_delay=data_fetch.get('retry_delay_seconds', 5),
+            rate_limiter=rate_limiter
+        )
+
+    def _ticker(self, symbols: List[str]):
+        if self.ticker_factory is not None:
+            return self.ticker_factory(symbols)
+        from yahooquery import Ticker
+        return Ticker(symbols, asynchronous=True)
+
+    @staticmethod
+    def split_history(raw, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Split a multi-symbol yahooquery history result into per-symbol frames
+
+        yahooquery returns a (symbol, date) MultiIndex DataFrame when every
+        symbol succeeds, or a dict of symbol -> DataFrame / error message
+        when some fail.
+        """
+        frames = {}
+
+        if isinstance(raw, dict):
+            for symbol, value in raw.items():
+                hist = normalize_history(value) if isinstance(value, pd.DataFrame) else None
+                if hist is not None:
+                    frames[symbol] = hist
+            return frames
+
+        if not isinstance(raw, pd.DataFrame) or raw.empty:
+            return frames
+
+        if isinstance(raw.index, pd.MultiIndex) and 'symbol' in raw.index.names:
+            for symbol, group in raw.groupby(level='symbol', sort=False):
+                hist = normalize_history(group)
+                if hist is not None:
+                    frames[symbol] = hist
+        elif len(symbols) == 1:
+            hist = normalize_history(raw)
+            if hist is not None:
+                frames[symbols[0]] = hist
+
+        return frames
+
+    def _load_chunk(self, chunk: List[str], period: str, interval: str,
+                    start=None, end=None) -> Dict[str, pd.DataFrame]:
+        """Download one chunk, retrying with backoff on failure"""
+        if start is not None:
+            window = {'start': start, 'end': end}
+        else:
+            window = {'period': period}
+
+        delay = self.retry_delay
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                raw = self._ticker(chunk).history(interval=interval, **window)
+                frames = self.split_history(raw, chunk)
+                if frames:
+                    return frames
+                logger.debug(f"Bulk chunk returned no data (attempt {attempt}/{self.retry_attempts})")
+            except Exception as e:
+                logger.warning(f"Bulk chunk failed (attempt {attempt}/{self.retry_attempts}): {e}")
+
+            if attempt < self.retry_attempts:
+                time.sleep(delay)
+                delay *= 2
+
+        return {}
+
+    def load(self, symbols: List[str], period: str = '1y', interval: str = '1d',
+             start=None, end=None) -> Dict[str, pd.DataFrame]:
+        """
+        Download history for many symbols
+
+        Args:
+            symbols: Tickers to fetch (duplicates are ignored)
+            period: yahooquery period string (ignored when start is given)
+            interval: Bar interval
+            start: Optional start date, for incremental top-ups
+            end: Optional end date (exclusive, default: today)
+
+        Returns:
+            Dictionary mapping symbol -> normalized OHLCV DataFrame
+            (symbols that could not be fetched are omitted)
+        """
+        unique = list(dict.fromkeys(symbols))
+        if not unique:
+            return {}
+
+        chunks = [unique[i:i + self.chunk_size] for i in range(0, len(unique), self.chunk_size)]
+        window = f"start={pd.Timestamp(start).date()}" if start is not None else f"period={period}"
+        logger.info(f"Bulk history download: {len(unique)} symbols in {len(chunks)} requests "
+                    f"({window})")
+
+        results = {}
+        for i, chunk in enumerate(chunks, 1):
+            frames = self._load_chunk(chunk, period, interval, start=start, end=end)
+            results.update(frames)
+            missing = len(chunk) - len(frames)
+            logger.info(f"  [{i}/{len(chunks)}] {len(frames)}/{len(chunk)} symbols loaded"
+                        + (f" ({missing} will use per-symbol fallback)" if missing else ""))
+
+        logger.info(f"[OK] Bulk history: {len(results)}/{len(unique)} symbols loaded")
+        return results
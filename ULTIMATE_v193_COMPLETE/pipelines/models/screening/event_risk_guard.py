@@ -6,9 +6,11 @@ Prepares your screener for earnings/macro days by:
 - scanning 72h news with FinBERT
 - generating risk flags & position haircuts
 - optional beta-based hedge suggestion vs XJO
+- batch mode: index downloaded once, all betas / volatility spikes computed
+  as column operations on one shared price matrix
 
 Dependencies:
-  pip install yfinance pandas numpy scikit-learn beautifulsoup4
+  pip install yfinance pandas numpy beautifulsoup4
 
 Integrates with:
   - overnight_pipeline.py (risk assessment before prediction)
@@ -28,7 +30,6 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 import yfinance as yf
-from sklearn.linear_model import LinearRegression
 
 # Setup logging
 logging.basicConfig(
@@ -289,9 +290,112 @@ class ManualCSVEventProvider:
         return out
 
 
+# -----------------------------
+# Shared price matrix
+# -----------------------------
+# Adjusted close columns, in order of preference (yahooquery / OHLCV cache / yfinance)
+ADJ_CLOSE_COLUMNS = ('Adjclose', 'Adj close', 'Adj Close', 'Close')
+
+
+def download_closes(tickers: List[str], period: str = "1y") -> pd.DataFrame:
+    """
+    Download adjusted closes for many tickers in one yfinance request.
+    Returns a DataFrame with one column per ticker (empty on failure).
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return pd.DataFrame()
+    
+    px = yf.download(
+        tickers,
+        period=period,
+        interval="1d",
+        auto_adjust=True,
+        progress=False
+    )['Close']
+    
+    if isinstance(px, pd.Series):
+        px = px.to_frame(name=tickers[0])
+    return px
+
+
+def closes_from_store(price_store, tickers: List[str]) -> pd.DataFrame:
+    """
+    Build the closes matrix from a shared PriceHistoryStore (no new downloads
+    for tickers the scanner already loaded).
+    """
+    columns = {}
+    for ticker in dict.fromkeys(tickers):
+        hist = price_store.get_history(ticker)
+        if hist is None or hist.empty:
+            continue
+        column = next((c for c in ADJ_CLOSE_COLUMNS if c in hist.columns), None)
+        if column is not None:
+            columns[ticker] = hist[column]
+    return pd.DataFrame(columns)
+
+
+def _trailing(closes: pd.DataFrame, offset) -> pd.DataFrame:
+    """Rows within `offset` of the last date"""
+    if closes.empty:
+        return closes
+    return closes[closes.index >= closes.index[-1] - offset]
+
+
+def _ols_slope(x: np.ndarray, y: np.ndarray) -> Optional[float]:
+    """Least-squares slope of y on x (with intercept)"""
+    xc = x - x.mean()
+    denom = float(xc @ xc)
+    if denom == 0:
+        return None
+    return float(xc @ (y - y.mean()) / denom)
+
+
 # -----------------------------
 # Hedge helper (rolling beta)
 # -----------------------------
+def batch_rolling_beta(closes: pd.DataFrame, index_ticker: str = XJO_TICKER,
+                       lookback_days: int = 252) -> Dict[str, Optional[float]]:
+    """
+    Calculate beta vs index for every column of a closes matrix.
+    
+    Tickers with complete prices over the window share one returns matrix and
+    are solved together; tickers with gaps use their own aligned rows.
+    Returns ticker -> beta (None if insufficient data).
+    """
+    betas: Dict[str, Optional[float]] = {t: None for t in closes.columns if t != index_ticker}
+    if index_ticker not in closes.columns:
+        return betas
+    
+    px = _trailing(closes, pd.Timedelta(days=max(lookback_days, 60)))
+    px = px[px[index_ticker].notna()]
+    
+    complete = [t for t in betas if px[t].notna().all()]
+    if complete and px.shape[0] >= 60:
+        rets = px[complete + [index_ticker]].pct_change().iloc[1:]
+        if len(rets) >= 60:
+            x = rets[index_ticker].values
+            xc = x - x.mean()
+            denom = float(xc @ xc)
+            if denom != 0:
+                Y = rets[complete].values
+                slopes = xc @ (Y - Y.mean(axis=0)) / denom
+                betas.update(zip(complete, (float(b) for b in slopes)))
+    
+    for ticker in betas:
+        if ticker in complete:
+            continue
+        pair = px[[ticker, index_ticker]].dropna()
+        if pair.shape[0] < 60:
+            continue
+        rets = pair.pct_change().dropna()
+        if len(rets) < 60:
+            continue
+        betas[ticker] = _ols_slope(rets[index_ticker].values, rets[ticker].values)
+    
+    return betas
+
+
 def rolling_beta(ticker: str, index_ticker: str = XJO_TICKER,
                  lookback_days: int = 252) -> Optional[float]:
     """
@@ -305,26 +409,12 @@ def rolling_beta(ticker: str, index_ticker: str = XJO_TICKER,
             interval="1d",
             auto_adjust=True,
             progress=False
-        )['Close'].dropna()
+        )['Close']
         
-        if isinstance(px, pd.Series) or px.shape[0] < 60:
+        if isinstance(px, pd.Series):
             return None
         
-        rets = px.pct_change().dropna()
-        
-        if index_ticker not in rets.columns or ticker not in rets.columns:
-            return None
-        
-        x = rets[index_ticker].values.reshape(-1, 1)
-        y = rets[ticker].values.reshape(-1, 1)
-        
-        if len(x) < 60:
-            return None
-        
-        model = LinearRegression().fit(x, y)
-        beta = float(model.coef_[0][0])
-        
-        return beta
+        return batch_rolling_beta(px, index_ticker, lookback_days).get(ticker)
         
     except Exception as e:
         logger.debug(f"Beta calc failed for {ticker}: {e}")
@@ -334,33 +424,50 @@ def rolling_beta(ticker: str, index_ticker: str = XJO_TICKER,
 # -----------------------------
 # Volatility spike detector
 # -----------------------------
-def realized_vol_spike(ticker: str, window: int = 10, ref: int = 30,
-                       mult: float = VOL_SPIKE_MULT) -> bool:
+def batch_vol_spike(closes: pd.DataFrame, window: int = 10, ref: int = 30,
+                    mult: float = VOL_SPIKE_MULT) -> Dict[str, bool]:
     """
-    Detect if recent volatility is significantly higher than baseline.
-    Returns True if recent realized vol > mult * median baseline vol.
+    Detect volatility spikes for every column of a closes matrix (last 6 months).
+    True if recent realized vol > mult * median baseline vol.
     """
-    try:
-        px = yf.download(
-            ticker,
-            period="6mo",
-            interval="1d",
-            auto_adjust=True,
-            progress=False
-        )['Close'].dropna()
-        
-        if px.shape[0] < ref + window + 5:
-            return False
-        
-        ret = px.pct_change().dropna()
+    px = _trailing(closes, pd.DateOffset(months=6))
+    spikes = {t: False for t in px.columns}
+    
+    complete = [t for t in px.columns if px[t].notna().all()]
+    if complete and px.shape[0] >= ref + window + 5:
+        ret = px[complete].pct_change().iloc[1:]
         
         # Recent realized volatility
         rv = np.sqrt((ret.tail(window) ** 2).sum())
         
         # Baseline median volatility
-        ref_med = np.median(ret.rolling(ref).std().dropna())
+        ref_med = ret.rolling(ref).std().median()
         
-        return bool(rv > mult * ref_med)
+        spikes.update({t: bool(flag) for t, flag in (rv > mult * ref_med).items()})
+    
+    for ticker in px.columns:
+        if ticker in complete:
+            continue
+        series = px[ticker].dropna()
+        if series.shape[0] < ref + window + 5:
+            continue
+        ret = series.pct_change().dropna()
+        rv = np.sqrt((ret.tail(window) ** 2).sum())
+        ref_med = np.median(ret.rolling(ref).std().dropna())
+        spikes[ticker] = bool(rv > mult * ref_med)
+    
+    return spikes
+
+
+def realized_vol_spike(ticker: str, window: int = 10, ref: int = 30,
+                       mult: float = VOL_SPIKE_MULT) -> bool:
+    """
+    Detect if recent volatility is significantly higher than baseline.
+    Returns True if recent realized vol > mult * median baseline vol.
+    """
+    try:
+        px = download_closes([ticker], period="6mo")
+        return batch_vol_spike(px, window, ref, mult).get(ticker, False)
         
     except Exception as e:
         logger.debug(f"Vol spike check failed for {ticker}: {e}")
@@ -588,10 +695,51 @@ class EventRiskGuard:
         
         return regime_data
 
-    def assess(self, ticker: str) -> GuardResult:
+    def compute_market_stats(self, tickers: List[str], price_store=None) -> Dict[str, Tuple[Optional[float], bool]]:
+        """
+        Beta and volatility-spike flags for many tickers from one closes matrix.
+        
+        The index is loaded once and every ticker's closes come from the shared
+        price store (if given) or a single bulk download.
+        
+        Args:
+            tickers: Ticker symbols
+            price_store: Optional PriceHistoryStore shared with the scanner
+            
+        Returns:
+            ticker -> (beta, vol_spike); empty if the prices could not be loaded
+        """
+        try:
+            symbols = list(dict.fromkeys(tickers)) + [XJO_TICKER]
+            if price_store is not None:
+                closes = closes_from_store(price_store, symbols)
+            else:
+                closes = download_closes(symbols, period="1y")
+            
+            if closes.empty:
+                return {}
+            
+            betas = batch_rolling_beta(closes, XJO_TICKER)
+            spikes = batch_vol_spike(closes)
+            
+            stats = {t: (betas.get(t), spikes.get(t, False)) for t in tickers}
+            logger.info(f"[OK] Market stats for {len(tickers)} tickers from one price matrix "
+                        f"({closes.shape[0]} days x {closes.shape[1]} series)")
+            return stats
+        except Exception as e:
+            logger.warning(f"Batch market stats failed, falling back to per-ticker downloads: {e}")
+            return {}
+
+    def assess(self, ticker: str,
+               market_stats: Optional[Tuple[Optional[float], bool]] = None) -> GuardResult:
         """
         Assess event risk for a given ticker.
         
+        Args:
+            ticker: Ticker symbol
+            market_stats: Precomputed (beta, vol_spike) from compute_market_stats();
+                          downloaded per ticker when None
+        
         Returns GuardResult with:
         - Event detection status
         - Risk score (0-1)
@@ -638,7 +786,10 @@ class EventRiskGuard:
         avg_sent = compute_finbert_sentiment_for_news(headlines)
 
         # Vol spike?
-        vspike = realized_vol_spike(ticker)
+        if market_stats is not None:
+            beta, vspike = market_stats
+        else:
+            beta, vspike = None, realized_vol_spike(ticker)
 
         # Risk score (0..1)
         risk = 0.0
@@ -672,7 +823,8 @@ class EventRiskGuard:
             haircut = 0.0
 
         # Beta & hedge guidance
-        beta = rolling_beta(ticker, XJO_TICKER)
+        if market_stats is None:
+            beta = rolling_beta(ticker, XJO_TICKER)
         hedge_ratio = None
         if beta is not None and beta > 0:
             # Simple: USD hedge = beta * USD long to be market-neutral vs index
@@ -695,12 +847,14 @@ class EventRiskGuard:
             warning_message=warning
         )
 
-    def assess_batch(self, tickers: List[str]) -> Dict:
+    def assess_batch(self, tickers: List[str], price_store=None) -> Dict:
         """
         Assess event risk for multiple tickers.
         
         Args:
             tickers: List of ticker symbols
+            price_store: Optional PriceHistoryStore shared with the scanner
+                         (avoids re-downloading closes)
             
         Returns:
             Dictionary with:
@@ -717,11 +871,14 @@ class EventRiskGuard:
         logger.info(f"Batch assessment starting for {len(tickers)} tickers")
         logger.info(f"Market Regime: {regime_label}, Crash Risk: {regime_crash_risk:.3f}")
         
+        # Betas and volatility spikes for all tickers from one price matrix
+        market_stats = self.compute_market_stats(tickers, price_store=price_store)
+        
         ticker_results = {}
         
         for ticker in tickers:
             try:
-                ticker_results[ticker] = self.assess(ticker)
+                ticker_results[ticker] = self.assess(ticker, market_stats=market_stats.get(ticker))
             except Exception as e:
                 logger.error(f"Event risk assessment failed for {ticker}: {e}")
                 # Return safe default
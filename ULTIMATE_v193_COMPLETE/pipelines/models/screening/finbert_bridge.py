@@ -27,6 +27,7 @@ Adapter that connects Overnight Stock Screener to FinBERT v4.4.4 components.
 
 import sys
 import os
+import atexit
 from pathlib import Path
 from typing import Dict, Optional, List
 import logging
@@ -34,6 +35,11 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+try:
+    from .lstm_model_registry import LSTMModelRegistry
+except ImportError:
+    from lstm_model_registry import LSTMModelRegistry
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -149,6 +155,8 @@ try:
     news_module = _load_module_from_path("news_sentiment_real", FINBERT_MODELS_PATH / "news_sentiment_real.py")
     if news_module and hasattr(news_module, 'get_sentiment_sync'):
         get_sentiment_sync = news_module.get_sentiment_sync
+        # Shared de-duplicated scoring queue (older modules lack it)
+        get_sentiment_batch_sync = getattr(news_module, 'get_sentiment_batch_sync', None)
         NEWS_SENTIMENT_AVAILABLE = True
         logger.info("[OK] News sentiment module imported successfully")
     else:
@@ -157,6 +165,7 @@ except Exception as e:
     NEWS_SENTIMENT_AVAILABLE = False
     logger.warning(f"[!] News sentiment module not available: {e}")
     get_sentiment_sync = None
+    get_sentiment_batch_sync = None
 
 
 class FinBERTBridge:
@@ -175,9 +184,20 @@ class FinBERTBridge:
     - News Scraper: Real news from Yahoo Finance/Finviz
     """
     
-    def __init__(self):
-        """Initialize FinBERT bridge with component availability checking"""
-        self.lstm_predictor_cache = {}  # KERAS 3 FIX: Cache per-symbol predictors
+    def __init__(self, max_lstm_models: int = 50, max_lstm_memory_mb: Optional[float] = None,
+                 warm_start_models: int = 10):
+        """
+        Initialize FinBERT bridge with component availability checking
+        
+        Args:
+            max_lstm_models: Maximum LSTM predictors kept loaded (LRU eviction)
+            max_lstm_memory_mb: Optional weight-memory budget for loaded LSTM models
+            warm_start_models: Most-used symbol models pre-loaded on startup
+        """
+        self.max_lstm_models = max_lstm_models
+        self.max_lstm_memory_mb = max_lstm_memory_mb
+        self.warm_start_models = warm_start_models
+        self.lstm_registry = None  # LRU-bounded per-symbol predictor registry
         self.sentiment_analyzer = None
         self._lstm_initialized = False
         self._sentiment_initialized = False
@@ -195,9 +215,20 @@ class FinBERTBridge:
             return
         
         try:
-            # KERAS 3 FIX: Will create per-symbol predictors on demand
+            # KERAS 3 FIX: Will create per-symbol predictors on demand, bounded by the registry
+            self.lstm_registry = LSTMModelRegistry(
+                StockLSTMPredictor,
+                FINBERT_MODELS_PATH / 'saved_models',
+                max_models=self.max_lstm_models,
+                max_memory_mb=self.max_lstm_memory_mb,
+                sequence_length=60
+            )
+            if self.warm_start_models > 0:
+                self.lstm_registry.warm_start(self.warm_start_models)
+            atexit.register(self.lstm_registry.save_usage)
             self._lstm_initialized = True
-            logger.info("[OK] LSTM predictor initialized successfully (per-symbol caching enabled)")
+            logger.info(f"[OK] LSTM predictor initialized successfully "
+                        f"(registry: max {self.max_lstm_models} models loaded)")
         except Exception as e:
             logger.error(f"Failed to initialize LSTM predictor: {e}")
             self._lstm_initialized = False
@@ -210,21 +241,14 @@ class FinBERTBridge:
             symbol: Stock symbol
             
         Returns:
-            Symbol-specific LSTM predictor
+            Predictor for the symbol's own model, or the shared generic predictor
         """
         if not self._lstm_initialized:
             return None
-            
-        # Check cache first
-        if symbol in self.lstm_predictor_cache:
-            return self.lstm_predictor_cache[symbol]
         
-        # Create new symbol-specific predictor
+        # Registry serves cached predictors (LRU) and loads on a miss
         try:
-            predictor = StockLSTMPredictor(sequence_length=60)
-            self.lstm_predictor_cache[symbol] = predictor
-            logger.debug(f"Created LSTM predictor for {symbol}")
-            return predictor
+            return self.lstm_registry.get(symbol)
         except Exception as e:
             logger.error(f"Failed to create LSTM predictor for {symbol}: {e}")
             return None
@@ -301,35 +325,108 @@ class FinBERTBridge:
                 logger.debug(f"LSTM prediction returned None for {symbol}")
                 return None
             
-            # Extract and validate prediction components
-            predicted_price = prediction_result.get('predicted_price')
-            confidence = prediction_result.get('confidence', 0.5)
-            
-            # Calculate direction from predicted price
-            current_price = historical_data['Close'].iloc[-1]
-            if predicted_price is not None and current_price > 0:
-                price_change = (predicted_price - current_price) / current_price
-                direction = np.clip(price_change * 2, -1, 1)  # Scale to [-1, 1]
-            else:
-                direction = 0.0
-            
-            # Build screener-compatible result
-            result = {
-                'direction': float(direction),
-                'confidence': float(confidence),
-                'predicted_price': float(predicted_price) if predicted_price is not None else None,
-                'model_trained': True,
-                'data_sufficient': True,
-                'prediction_date': datetime.now().isoformat()
-            }
-            
-            logger.info(f"[OK] LSTM prediction for {symbol}: direction={direction:.3f}, confidence={confidence:.3f}")
-            return result
+            return self._format_lstm_result(symbol, historical_data, prediction_result)
             
         except Exception as e:
             logger.error(f"LSTM prediction failed for {symbol}: {e}")
             return None
     
+    def get_lstm_predictions_batch(self, histories: Dict[str, pd.DataFrame]) -> Dict[str, Optional[Dict]]:
+        """
+        Get LSTM predictions for many symbols with batched inference
+        
+        Each symbol's input sequence is prepared by its own predictor (same
+        scaling and validation as get_lstm_prediction), then sequences are
+        grouped by model file, sequence length and feature set. Symbols that
+        share a model (e.g. the generic lstm_model.keras) are scored in one
+        stacked call; every group uses a direct model call instead of
+        Keras's per-call predict() loop.
+        
+        Args:
+            histories: Dict mapping symbol -> DataFrame with columns
+                       ['Close', 'Open', 'High', 'Low', 'Volume'] (>= 60 days)
+        
+        Returns:
+            Dict mapping symbol -> result in get_lstm_prediction() format
+            (None where no prediction is available)
+        """
+        results: Dict[str, Optional[Dict]] = {symbol: None for symbol in histories}
+        groups: Dict[tuple, List] = {}
+        
+        # 1. Prepare sequences per symbol
+        for symbol, historical_data in histories.items():
+            lstm_predictor = self._get_lstm_predictor(symbol)
+            if lstm_predictor is None:
+                continue
+            if historical_data is None or len(historical_data) < 60:
+                logger.debug(f"Insufficient data for LSTM prediction: {symbol} ({len(historical_data) if historical_data is not None else 0} days)")
+                continue
+            
+            try:
+                if not lstm_predictor.is_trained and not lstm_predictor.load_model():
+                    logger.debug(f"No trained LSTM model for {symbol}")
+                    continue
+                prepared = lstm_predictor.prepare_sequence(historical_data, symbol=symbol)
+                if prepared is None:
+                    continue
+            except Exception as e:
+                logger.error(f"LSTM prediction failed for {symbol}: {e}")
+                continue
+            
+            X, data = prepared
+            group_key = (lstm_predictor.model_path, lstm_predictor.sequence_length, tuple(lstm_predictor.features))
+            groups.setdefault(group_key, []).append((symbol, lstm_predictor, X, data))
+        
+        # 2. One inference call per group
+        for (model_path, _, _), members in groups.items():
+            try:
+                outputs = StockLSTMPredictor.run_model(
+                    members[0][1].model, np.stack([X for _, _, X, _ in members])
+                )
+            except Exception as e:
+                logger.warning(f"Batched LSTM inference failed for {model_path}, scoring individually: {e}")
+                outputs = [None] * len(members)
+            
+            for (symbol, lstm_predictor, X, data), output in zip(members, outputs):
+                try:
+                    if output is None:
+                        output = StockLSTMPredictor.run_model(lstm_predictor.model, X[np.newaxis])[0]
+                    prediction_result = lstm_predictor.build_prediction(output, data, symbol=symbol)
+                    results[symbol] = self._format_lstm_result(symbol, histories[symbol], prediction_result)
+                except Exception as e:
+                    logger.error(f"LSTM prediction failed for {symbol}: {e}")
+        
+        scored = sum(1 for r in results.values() if r is not None)
+        logger.info(f"[OK] Batched LSTM inference: {scored}/{len(histories)} symbols in {len(groups)} model groups")
+        return results
+    
+    def _format_lstm_result(self, symbol: str, historical_data: pd.DataFrame, prediction_result: Dict) -> Dict:
+        """Translate an LSTM predictor result to the screener format"""
+        # Extract and validate prediction components
+        predicted_price = prediction_result.get('predicted_price')
+        confidence = prediction_result.get('confidence', 0.5)
+        
+        # Calculate direction from predicted price
+        current_price = historical_data['Close'].iloc[-1]
+        if predicted_price is not None and current_price > 0:
+            price_change = (predicted_price - current_price) / current_price
+            direction = np.clip(price_change * 2, -1, 1)  # Scale to [-1, 1]
+        else:
+            direction = 0.0
+        
+        # Build screener-compatible result
+        result = {
+            'direction': float(direction),
+            'confidence': float(confidence),
+            'predicted_price': float(predicted_price) if predicted_price is not None else None,
+            'model_trained': True,
+            'data_sufficient': True,
+            'prediction_date': datetime.now().isoformat()
+        }
+        
+        logger.info(f"[OK] LSTM prediction for {symbol}: direction={direction:.3f}, confidence={confidence:.3f}")
+        return result
+    
     def get_sentiment_analysis(self, symbol: str, use_cache: bool = True) -> Optional[Dict]:
         """
         Get REAL sentiment analysis using FinBERT transformer and news scraping
@@ -392,62 +489,107 @@ class FinBERTBridge:
                 logger.debug(f"News sentiment returned None for {symbol}")
                 return None
             
-            # Extract sentiment components
-            sentiment = sentiment_result.get('sentiment', 'neutral')
-            confidence = sentiment_result.get('confidence', 0.0)
-            article_count = sentiment_result.get('article_count', 0)
-            
-            # Extract full FinBERT scores (NEW in v1.3.15.45)
-            scores = sentiment_result.get('scores', {})
-            if not scores or not isinstance(scores, dict):
-                # Fallback if scores not provided
-                scores = {
-                    'negative': 0.33 if sentiment == 'negative' else 0.10,
-                    'neutral': 0.34 if sentiment == 'neutral' else 0.20,
-                    'positive': 0.33 if sentiment == 'positive' else 0.10
-                }
-            
-            # Calculate compound score from scores
-            compound = scores.get('positive', 0.33) - scores.get('negative', 0.33)
-            
-            # Convert sentiment to direction (-1 to 1) for backward compatibility
-            sentiment_map = {
-                'positive': 1.0,
-                'neutral': 0.0,
-                'negative': -1.0
-            }
-            direction = sentiment_map.get(sentiment.lower(), 0.0)
-            
-            # Adjust direction by confidence
-            direction = direction * (confidence / 100.0)
-            
-            # Build screener-compatible result with FULL FinBERT v4.4.4 breakdown
-            result = {
-                'symbol': symbol,
-                'sentiment': sentiment,
-                'confidence': float(confidence),
-                'scores': {  # NEW: Full FinBERT breakdown
-                    'negative': float(scores.get('negative', 0.33)),
-                    'neutral': float(scores.get('neutral', 0.34)),
-                    'positive': float(scores.get('positive', 0.33))
-                },
-                'compound': float(compound),
-                'direction': float(direction),  # Backward compatibility
-                'article_count': int(article_count),
-                'sources': sentiment_result.get('sources', ['Yahoo Finance', 'Finviz']),
-                'method': 'FinBERT v4.4.4',
-                'analysis_date': datetime.now().isoformat(),
-                'cached': sentiment_result.get('cached', False)
-            }
-            
-            logger.info(f"[OK] FinBERT v4.4.4 Sentiment for {symbol}: {sentiment} ({confidence:.1f}%), "
-                       f"compound: {compound:.3f}, {article_count} articles")
-            return result
+            return self._format_sentiment_result(symbol, sentiment_result)
             
         except Exception as e:
             logger.error(f"Sentiment analysis failed for {symbol}: {e}")
             return None
     
+    def get_sentiment_analysis_batch(self, symbols: List[str], use_cache: bool = True) -> Dict[str, Optional[Dict]]:
+        """
+        Get sentiment analysis for many symbols through one shared scoring queue
+        
+        All symbols' articles are collected, de-duplicated (macro and sector
+        headlines repeat across symbols) and scored once in large FinBERT
+        batches. Falls back to per-symbol get_sentiment_analysis() when the
+        news module has no batch entry point.
+        
+        Args:
+            symbols: Stock ticker symbols
+            use_cache: Whether to use cached results (default: True)
+        
+        Returns:
+            Dict mapping each symbol -> result in get_sentiment_analysis()
+            format (None where unavailable)
+        """
+        if not NEWS_SENTIMENT_AVAILABLE or get_sentiment_sync is None:
+            logger.debug("News sentiment not available")
+            return {symbol: None for symbol in symbols}
+        
+        if get_sentiment_batch_sync is None:
+            return {symbol: self.get_sentiment_analysis(symbol, use_cache) for symbol in symbols}
+        
+        try:
+            batch_results = get_sentiment_batch_sync(symbols, use_cache=use_cache)
+        except Exception as e:
+            logger.error(f"Batch sentiment analysis failed: {e}")
+            return {symbol: None for symbol in symbols}
+        
+        results = {}
+        for symbol in symbols:
+            sentiment_result = batch_results.get(symbol.upper())
+            try:
+                results[symbol] = (self._format_sentiment_result(symbol, sentiment_result)
+                                   if sentiment_result is not None else None)
+            except Exception as e:
+                logger.error(f"Sentiment analysis failed for {symbol}: {e}")
+                results[symbol] = None
+        return results
+    
+    def _format_sentiment_result(self, symbol: str, sentiment_result: Dict) -> Dict:
+        """Translate a news sentiment result to the screener format"""
+        # Extract sentiment components
+        sentiment = sentiment_result.get('sentiment', 'neutral')
+        confidence = sentiment_result.get('confidence', 0.0)
+        article_count = sentiment_result.get('article_count', 0)
+        
+        # Extract full FinBERT scores (NEW in v1.3.15.45)
+        scores = sentiment_result.get('scores', {})
+        if not scores or not isinstance(scores, dict):
+            # Fallback if scores not provided
+            scores = {
+                'negative': 0.33 if sentiment == 'negative' else 0.10,
+                'neutral': 0.34 if sentiment == 'neutral' else 0.20,
+                'positive': 0.33 if sentiment == 'positive' else 0.10
+            }
+        
+        # Calculate compound score from scores
+        compound = scores.get('positive', 0.33) - scores.get('negative', 0.33)
+        
+        # Convert sentiment to direction (-1 to 1) for backward compatibility
+        sentiment_map = {
+            'positive': 1.0,
+            'neutral': 0.0,
+            'negative': -1.0
+        }
+        direction = sentiment_map.get(sentiment.lower(), 0.0)
+        
+        # Adjust direction by confidence
+        direction = direction * (confidence / 100.0)
+        
+        # Build screener-compatible result with FULL FinBERT v4.4.4 breakdown
+        result = {
+            'symbol': symbol,
+            'sentiment': sentiment,
+            'confidence': float(confidence),
+            'scores': {  # NEW: Full FinBERT breakdown
+                'negative': float(scores.get('negative', 0.33)),
+                'neutral': float(scores.get('neutral', 0.34)),
+                'positive': float(scores.get('positive', 0.33))
+            },
+            'compound': float(compound),
+            'direction': float(direction),  # Backward compatibility
+            'article_count': int(article_count),
+            'sources': sentiment_result.get('sources', ['Yahoo Finance', 'Finviz']),
+            'method': 'FinBERT v4.4.4',
+            'analysis_date': datetime.now().isoformat(),
+            'cached': sentiment_result.get('cached', False)
+        }
+        
+        logger.info(f"[OK] FinBERT v4.4.4 Sentiment for {symbol}: {sentiment} ({confidence:.1f}%), "
+                   f"compound: {compound:.3f}, {article_count} articles")
+        return result
+    
     def analyze_text_with_finbert(self, text: str) -> Optional[Dict]:
         """
         Analyze arbitrary text using FinBERT transformer
@@ -542,8 +684,9 @@ class FinBERTBridge:
             'finbert_path': str(FINBERT_PATH),
             'lstm': {
                 'available': self._lstm_initialized,
-                'sequence_length': 60 if self.lstm_predictor else None,
-                'model_path': str(FINBERT_PATH / 'models' / 'trained') if self._lstm_initialized else None
+                'sequence_length': 60 if self._lstm_initialized else None,
+                'model_path': str(FINBERT_MODELS_PATH / 'saved_models') if self._lstm_initialized else None,
+                'registry': self.lstm_registry.get_stats() if self.lstm_registry else None
             },
             'sentiment': {
                 'available': self._sentiment_initialized,
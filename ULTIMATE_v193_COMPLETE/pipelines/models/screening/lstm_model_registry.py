@@ -0,0 +1,328 @@
+"""
+LSTM Model Registry Module
+
+Bounded, LRU-evicting cache of loaded LSTM predictors for FinBERTBridge.
+
+Every cached predictor holds a loaded Keras model, so an unbounded
+per-symbol cache keeps hundreds of models in memory during a long-running
+dashboard session or a 300-stock pipeline run. The registry:
+
+- Finds trained models from lstm_models_registry.json (written by
+  LSTMTrainer) and the lstm_<SYMBOL>_metadata.json files (written by
+  train_lstm.py)
+- Shares one predictor for all symbols without a model of their own
+  (they all load the same generic lstm_model.keras)
+- Keeps at most max_models predictors / max_memory_mb of weights loaded,
+  evicting the least recently used
+- Records per-symbol usage so the most-used models are warm-loaded on startup
+- Exposes hit/miss/eviction counts for sizing the budget
+- Loads models outside the registry lock (one loader per key), so a cold
+  load never stalls lookups of other symbols
+
+Usage:
+    registry = LSTMModelRegistry(StockLSTMPredictor, models_dir, max_models=50)
+    registry.warm_start(10)
+    predictor = registry.get('CBA.AX')
+    registry.get_stats()
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+GENERIC_KEY = '__generic__'
+USAGE_FILE = 'lstm_model_usage.json'
+
+
+class LSTMModelRegistry:
+    """
+    Thread-safe LRU registry of loaded LSTM predictors
+    """
+
+    def __init__(self, predictor_factory: Callable, models_dir: Path,
+                 max_models: int = 50, max_memory_mb: Optional[float] = None,
+                 sequence_length: int = 60, metadata_dir: Optional[Path] = None):
+        """
+        Initialize registry
+
+        Args:
+            predictor_factory: StockLSTMPredictor class (or compatible callable)
+            models_dir: saved_models directory (holds lstm_models_registry.json)
+            max_models: Maximum predictors kept loaded (count budget)
+            max_memory_mb: Optional weight-memory budget across loaded models
+            sequence_length: Default sequence length for predictors
+            metadata_dir: Directory of lstm_<SYMBOL>_metadata.json files
+                          (default: parent of models_dir)
+        """
+        self.predictor_factory = predictor_factory
+        self.models_dir = Path(models_dir)
+        self.metadata_dir = Path(metadata_dir) if metadata_dir else self.models_dir.parent
+        self.max_models = max(1, int(max_models))
+        self.max_memory_mb = max_memory_mb
+        self.sequence_length = sequence_length
+
+        self._predictors: 'OrderedDict[str, object]' = OrderedDict()
+        self._memory_mb: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._catalog: Optional[Dict[str, Dict]] = None
+        self._usage: Dict[str, int] = self._load_usage()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'load_failures': 0}
+
+    # ------------------------------------------------------------------
+    # Discovery
+    # ------------------------------------------------------------------
+
+    def discover(self, refresh: bool = False) -> Dict[str, Dict]:
+        """
+        Build the catalog of trained per-symbol models
+
+        Sources (later entries fill gaps, never override):
+        1. lstm_models_registry.json 'models' (LSTMTrainer)
+        2. <SYMBOL>_lstm_model.keras + <SYMBOL>_scaler.pkl (StockLSTMPredictor.save_model)
+        3. lstm_<SYMBOL>_metadata.json (train_lstm.py) for features/sequence length
+
+        Returns:
+            Dict mapping symbol -> {'model_path', 'scaler_path', 'features', 'sequence_length'}
+        """
+        with self._lock:
+            if self._catalog is not None and not refresh:
+                return self._catalog
+
+            catalog: Dict[str, Dict] = {}
+
+            registry_path = self.models_dir / 'lstm_models_registry.json'
+            try:
+                with open(registry_path, 'r') as f:
+                    models = json.load(f).get('models', {})
+                for symbol, info in models.items():
+                    model_path = self.models_dir / info.get('model_path', '')
+                    scaler_path = self.models_dir / info.get('scaler_path', '')
+                    if model_path.is_file() and scaler_path.is_file():
+                        catalog[symbol] = {
+                            'model_path': str(model_path),
+                            'scaler_path': str(scaler_path),
+                            'sequence_length': info.get('sequence_length'),
+                        }
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not read {registry_path}: {e}")
+
+            for model_path in self.models_dir.glob('*_lstm_model.keras'):
+                symbol = model_path.name[:-len('_lstm_model.keras')]
+                scaler_path = self.models_dir / f'{symbol}_scaler.pkl'
+                if symbol and symbol not in catalog and scaler_path.is_file():
+                    catalog[symbol] = {
+                        'model_path': str(model_path),
+                        'scaler_path': str(scaler_path),
+                    }
+
+            for metadata_path in self.metadata_dir.glob('lstm_*_metadata.json'):
+                symbol = metadata_path.name[len('lstm_'):-len('_metadata.json')]
+                if symbol not in catalog:
+                    continue
+                try:
+                    with open(metadata_path, 'r') as f:
+                        metadata = json.load(f)
+                    catalog[symbol].setdefault('features', metadata.get('features'))
+                    if not catalog[symbol].get('sequence_length'):
+                        catalog[symbol]['sequence_length'] = metadata.get('sequence_length')
+                except Exception as e:
+                    logger.debug(f"Could not read {metadata_path}: {e}")
+
+            self._catalog = catalog
+            logger.info(f"[OK] LSTM model registry: {len(catalog)} per-symbol models found in {self.models_dir}")
+            return catalog
+
+    def _key_for(self, symbol: str) -> str:
+        """Cache key: the symbol if it has its own model, else the shared generic predictor"""
+        return symbol if symbol in self.discover() else GENERIC_KEY
+
+    # ------------------------------------------------------------------
+    # Loading / eviction
+    # ------------------------------------------------------------------
+
+    def _create(self, key: str):
+        """Create and load a predictor for a cache key (None if it cannot be created)"""
+        info = self.discover().get(key)
+        try:
+            if info is None:
+                predictor = self.predictor_factory(sequence_length=self.sequence_length)
+            else:
+                predictor = self.predictor_factory(
+                    sequence_length=info.get('sequence_length') or self.sequence_length,
+                    features=info.get('features'),
+                    symbol=key
+                )
+                predictor.model_path = info['model_path']
+                predictor.scaler_path = info['scaler_path']
+            # Load eagerly so memory accounting reflects the real model
+            predictor.load_model()
+            return predictor
+        except Exception as e:
+            with self._lock:
+                self.stats['load_failures'] += 1
+            logger.error(f"Failed to create LSTM predictor for {key}: {e}")
+            return None
+
+    @staticmethod
+    def _estimate_memory_mb(predictor) -> float:
+        """Approximate weight memory of a loaded predictor (float32 parameters)"""
+        model = getattr(predictor, 'model', None)
+        if model is None:
+            return 0.0
+        try:
+            return model.count_params() * 4 / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+    def _evict_if_needed(self, keep: str):
+        """Evict least recently used predictors until within budget (lock held)"""
+        while len(self._predictors) > 1:
+            over_count = len(self._predictors) > self.max_models
+            over_memory = (self.max_memory_mb is not None
+                           and sum(self._memory_mb.values()) > self.max_memory_mb)
+            if not (over_count or over_memory):
+                break
+            oldest = next(iter(self._predictors))
+            if oldest == keep:
+                break
+            self._predictors.pop(oldest)
+            self._memory_mb.pop(oldest, None)
+            self.stats['evictions'] += 1
+            logger.debug(f"Evicted LSTM predictor for {oldest}")
+
+    def _load(self, key: str):
+        """
+        Load a predictor outside the registry lock and insert it
+
+        Concurrent loads of the same key wait on that key's load lock and
+        reuse the first result; other keys are not blocked.
+
+        Returns:
+            Predictor, or None if it cannot be created
+        """
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                if key in self._predictors:
+                    self._predictors.move_to_end(key)
+                    return self._predictors[key]
+
+            predictor = self._create(key)
+            if predictor is None:
+                return None
+            memory_mb = self._estimate_memory_mb(predictor)
+
+            with self._lock:
+                self._predictors[key] = predictor
+                self._memory_mb[key] = memory_mb
+                self._evict_if_needed(keep=key)
+            return predictor
+
+    def get(self, symbol: str):
+        """
+        Get the predictor serving a symbol, loading it on a miss
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            StockLSTMPredictor, or None if one cannot be created
+        """
+        key = self._key_for(symbol)
+        with self._lock:
+            self._usage[symbol] = self._usage.get(symbol, 0) + 1
+            if key in self._predictors:
+                self._predictors.move_to_end(key)
+                self.stats['hits'] += 1
+                return self._predictors[key]
+
+            self.stats['misses'] += 1
+
+        return self._load(key)
+
+    def __contains__(self, symbol: str) -> bool:
+        with self._lock:
+            return self._key_for(symbol) in self._predictors
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._predictors)
+
+    def clear(self):
+        """Unload all predictors"""
+        with self._lock:
+            self._predictors.clear()
+            self._memory_mb.clear()
+
+    # ------------------------------------------------------------------
+    # Usage tracking / warm start
+    # ------------------------------------------------------------------
+
+    def _usage_path(self) -> Path:
+        return self.models_dir / USAGE_FILE
+
+    def _load_usage(self) -> Dict[str, int]:
+        try:
+            with open(self._usage_path(), 'r') as f:
+                return {k: int(v) for k, v in json.load(f).items()}
+        except (FileNotFoundError, ValueError, json.JSONDecodeError):
+            return {}
+
+    def save_usage(self):
+        """Persist per-symbol usage counts (drives warm_start on the next run)"""
+        with self._lock:
+            usage = dict(self._usage)
+        try:
+            with open(self._usage_path(), 'w') as f:
+                json.dump(usage, f, indent=2)
+        except Exception as e:
+            logger.warning(f"Could not save LSTM model usage: {e}")
+
+    def most_used(self, top_n: int) -> List[str]:
+        """Symbols with their own model, most used first"""
+        catalog = self.discover()
+        ranked = sorted(catalog, key=lambda s: self._usage.get(s, 0), reverse=True)
+        return ranked[:top_n]
+
+    def warm_start(self, top_n: int = 10) -> int:
+        """
+        Pre-load the models of the top_n most-used symbols (plus the generic model)
+
+        Returns:
+            Number of predictors loaded
+        """
+        top_n = min(top_n, self.max_models - 1)
+        keys = self.most_used(max(0, top_n)) + [GENERIC_KEY]
+        loaded = 0
+        for key in keys:
+            with self._lock:
+                if key in self._predictors:
+                    continue
+            if self._load(key) is not None:
+                loaded += 1
+        logger.info(f"[OK] LSTM model registry warm start: {loaded} predictors loaded")
+        return loaded
+
+    def get_stats(self) -> Dict:
+        """Hit/miss/eviction counts and current budget usage"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                **self.stats,
+                'hit_rate': round(self.stats['hits'] / lookups, 3) if lookups else 0.0,
+                'loaded': len(self._predictors),
+                'max_models': self.max_models,
+                'memory_mb': round(sum(self._memory_mb.values()), 1),
+                'max_memory_mb': self.max_memory_mb,
+                'catalog_size': len(self._catalog or {}),
+            }
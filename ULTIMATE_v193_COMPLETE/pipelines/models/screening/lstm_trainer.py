@@ -10,11 +10,16 @@ Features:
 - Progress tracking and logging
 - Training statistics and performance metrics
 - Integration with overnight pipeline
+- Parallel training: one process per symbol (crash isolation), per-worker
+  TensorFlow thread limits, checkpointed queue that resumes after interruption
 """
 
 import json
 import logging
+import multiprocessing
+import os
 import time
+from multiprocessing.connection import wait as wait_for_workers
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -38,6 +43,133 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+CHECKPOINT_FILE = 'training_queue_checkpoint_{queue}.json'
+# A checkpoint older than this belongs to a previous night's run
+CHECKPOINT_MAX_AGE_HOURS = 12
+
+
+def _limit_tensorflow_threads(intra_op_threads: int, inter_op_threads: int):
+    """Cap TensorFlow/BLAS thread pools for this process (must run before TF starts)"""
+    os.environ['TF_NUM_INTRAOP_THREADS'] = str(intra_op_threads)
+    os.environ['TF_NUM_INTEROP_THREADS'] = str(inter_op_threads)
+    os.environ['OMP_NUM_THREADS'] = str(intra_op_threads)
+    try:
+        import tensorflow as tf
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+        tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+    except Exception as e:
+        logger.debug(f"TensorFlow thread limits not applied: {e}")
+
+
+def _train_symbol_process(config_path: str, symbol: str, intra_op_threads: int,
+                          inter_op_threads: int, result_conn):
+    """
+    Worker process entry point: train one symbol and send the result back
+    
+    Runs in a fresh (spawned) process, so a TensorFlow crash or leak only
+    affects this symbol.
+    """
+    try:
+        _limit_tensorflow_threads(intra_op_threads, inter_op_threads)
+        trainer = LSTMTrainer(config_path)
+        result = trainer.train_stock_model(symbol)
+    except Exception as e:
+        result = {
+            'symbol': symbol,
+            'status': 'failed',
+            'training_time': 0,
+            'error': str(e),
+            'traceback': traceback.format_exc()
+        }
+    try:
+        result_conn.send(result)
+    finally:
+        result_conn.close()
+
+
+class TrainingCheckpoint:
+    """
+    Persistent record of a training batch so an interrupted night can resume
+    
+    Successful symbols are skipped on resume; failed or unfinished symbols
+    are trained again. Each queue (market) has its own file, and a checkpoint
+    started more than max_age_hours ago is ignored.
+    """
+    
+    def __init__(self, path: Path, max_age_hours: float = CHECKPOINT_MAX_AGE_HOURS):
+        self.path = Path(path)
+        self.max_age = timedelta(hours=max_age_hours)
+        self.queue: List[str] = []
+        self.results: Dict[str, Dict] = {}
+        self.started = datetime.now()
+    
+    def load(self, queue: List[str], resume: bool = True) -> List[Dict]:
+        """
+        Start (or resume) a batch for the given queue
+        
+        Args:
+            queue: Symbols in this batch
+            resume: Reuse successful results recorded by an interrupted run
+        
+        Returns:
+            Results of symbols in the queue that already trained successfully
+        """
+        self.queue = list(queue)
+        self.results = {}
+        self.started = datetime.now()
+        if not resume:
+            self._write()
+            return []
+        try:
+            with open(self.path, 'r') as f:
+                saved = json.load(f)
+            started = datetime.fromisoformat(saved.get('started') or saved['updated'])
+            if self.started - started > self.max_age:
+                logger.info(f"Ignoring training checkpoint from a previous run ({started:%Y-%m-%d %H:%M})")
+                saved = {}
+            else:
+                self.started = started
+            self.results = {
+                symbol: result for symbol, result in saved.get('results', {}).items()
+                if symbol in self.queue and result.get('status') == 'success'
+            }
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable training checkpoint {self.path}: {e}")
+        
+        if self.results:
+            logger.info(f"[OK] Resuming training batch: {len(self.results)} symbols already trained "
+                        f"({', '.join(self.results)})")
+        self._write()
+        return list(self.results.values())
+    
+    def record(self, result: Dict):
+        """Record a finished symbol"""
+        self.results[result.get('symbol')] = result
+        self._write()
+    
+    def clear(self):
+        """Remove the checkpoint once the batch is complete"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+    
+    def _write(self):
+        try:
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'started': self.started.isoformat(),
+                    'updated': datetime.now().isoformat(),
+                    'queue': self.queue,
+                    'results': self.results
+                }, f, indent=2, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not write training checkpoint: {e}")
+
 
 class LSTMTrainer:
     """
@@ -58,6 +190,7 @@ class LSTMTrainer:
             # Use same pattern as other screening modules: parent.parent gives us pipelines/models/
             config_path = Path(__file__).resolve().parent.parent / 'config' / 'screening_config.json'
         
+        self.config_path = str(config_path)
         with open(config_path, 'r') as f:
             self.config = json.load(f)
         
@@ -72,6 +205,13 @@ class LSTMTrainer:
         self.priority_strategy = self.training_config.get('priority_strategy', 'highest_opportunity_score')
         self.lstm_sequence_length = self.training_config.get('sequence_length', 60)  # LSTM input sequence length
         
+        # Parallel training (1 worker = original in-process, one-at-a-time training)
+        self.workers = max(1, int(self.training_config.get('workers', 1)))
+        cpu_count = os.cpu_count() or 1
+        self.intra_op_threads = self.training_config.get('tf_intra_op_threads') or max(1, cpu_count // self.workers)
+        self.inter_op_threads = self.training_config.get('tf_inter_op_threads') or 2
+        self.symbol_timeout_minutes = self.training_config.get('symbol_timeout_minutes', 0)
+        
         # Paths - LSTM models are saved in finbert_v4.4.4/models/saved_models/
         self.models_dir = BASE_PATH / 'finbert_v4.4.4' / 'models' / 'saved_models'
         self.models_dir.mkdir(parents=True, exist_ok=True)
@@ -82,6 +222,9 @@ class LSTMTrainer:
         logger.info(f"LSTM Trainer initialized (enabled: {self.enabled})")
         logger.info(f"Max models per night: {self.max_models_per_night}")
         logger.info(f"Stale threshold: {self.stale_threshold_days} days")
+        if self.workers > 1:
+            logger.info(f"Training workers: {self.workers} "
+                        f"(TF threads per worker: intra={self.intra_op_threads}, inter={self.inter_op_threads})")
     
     def check_stale_models(self, stocks: List[str]) -> List[str]:
         """
@@ -323,7 +466,10 @@ class LSTMTrainer:
     def train_batch(
         self,
         training_queue: List[Dict],
-        max_stocks: Optional[int] = None
+        max_stocks: Optional[int] = None,
+        workers: Optional[int] = None,
+        resume: bool = True,
+        queue_name: str = 'default'
     ) -> Dict:
         """
         Train multiple stock models in batch.
@@ -331,6 +477,9 @@ class LSTMTrainer:
         Args:
             training_queue: List of stocks to train (from create_training_queue)
             max_stocks: Maximum number of stocks to train (default: config value)
+            workers: Parallel training processes (default: config 'workers', 1 = sequential)
+            resume: Skip symbols already trained by an interrupted run of this queue
+            queue_name: Checkpoint key (e.g. market code), so queues never resume each other
         
         Returns:
             Batch training results dictionary
@@ -356,21 +505,25 @@ class LSTMTrainer:
         logger.info("="*80)
         
         batch_start_time = time.time()
-        results = []
         
-        for i, stock_info in enumerate(training_queue, 1):
-            symbol = stock_info.get('symbol')
-            logger.info(f"\n[{i}/{len(training_queue)}] Training {symbol}...")
-            
-            result = self.train_stock_model(symbol)
-            results.append(result)
-            
-            # Log progress
-            elapsed = time.time() - batch_start_time
-            avg_time = elapsed / i
-            remaining = (len(training_queue) - i) * avg_time
-            
-            logger.info(f"Progress: {i}/{len(training_queue)} - Elapsed: {elapsed/60:.1f}m, ETA: {remaining/60:.1f}m")
+        symbols = [stock_info.get('symbol') for stock_info in training_queue if stock_info.get('symbol')]
+        checkpoint = TrainingCheckpoint(self.training_logs_dir / CHECKPOINT_FILE.format(queue=queue_name.lower()))
+        results = checkpoint.load(symbols, resume=resume)
+        done = {r.get('symbol') for r in results}
+        remaining_symbols = [symbol for symbol in symbols if symbol not in done]
+        
+        workers = max(1, int(workers or self.workers))
+        if workers > 1 and len(remaining_symbols) > 1:
+            results.extend(self._train_parallel(remaining_symbols, workers, checkpoint, len(symbols)))
+        else:
+            for i, symbol in enumerate(remaining_symbols, len(done) + 1):
+                logger.info(f"\n[{i}/{len(symbols)}] Training {symbol}...")
+                
+                result = self.train_stock_model(symbol)
+                results.append(result)
+                checkpoint.record(result)
+                
+                self._log_progress(i - len(done), len(remaining_symbols), batch_start_time)
         
         total_time = time.time() - batch_start_time
         
@@ -383,7 +536,7 @@ class LSTMTrainer:
         logger.info(f"  Total Time: {total_time/60:.1f} minutes")
         logger.info(f"  Trained: {trained_count}/{len(training_queue)}")
         logger.info(f"  Failed: {failed_count}/{len(training_queue)}")
-        logger.info(f"  Success Rate: {trained_count/len(training_queue)*100:.1f}%")
+        logger.info(f"  Success Rate: {trained_count/max(len(training_queue), 1)*100:.1f}%")
         logger.info("="*80)
         
         # FIX v1.3.15.169: Save model registry for dashboard use
@@ -393,6 +546,8 @@ class LSTMTrainer:
         else:
             logger.warning("No models trained successfully, skipping registry save")
         
+        checkpoint.clear()
+        
         return {
             'status': 'completed',
             'trained_count': trained_count,
@@ -402,6 +557,113 @@ class LSTMTrainer:
             'results': results
         }
     
+    @staticmethod
+    def _log_progress(completed: int, total: int, start_time: float):
+        """Log batch progress with an ETA based on the average time per symbol"""
+        elapsed = time.time() - start_time
+        avg_time = elapsed / max(completed, 1)
+        remaining = (total - completed) * avg_time
+        
+        logger.info(f"Progress: {completed}/{total} - Elapsed: {elapsed/60:.1f}m, ETA: {remaining/60:.1f}m")
+    
+    def _train_parallel(
+        self,
+        symbols: List[str],
+        workers: int,
+        checkpoint: TrainingCheckpoint,
+        queue_size: int
+    ) -> List[Dict]:
+        """
+        Train symbols in parallel, one spawned process per symbol
+        
+        A process per symbol (rather than a reused pool worker) gives crash
+        isolation - a segfault or OOM kill fails only that symbol - and
+        returns all TensorFlow memory to the OS between models.
+        
+        Args:
+            symbols: Symbols still to train
+            workers: Maximum concurrent training processes
+            checkpoint: Batch checkpoint, updated as each symbol finishes
+            queue_size: Size of the full queue (for progress numbering)
+        
+        Returns:
+            List of per-symbol training results
+        """
+        logger.info(f"Parallel training: {len(symbols)} symbols on {workers} workers "
+                    f"(TF threads per worker: intra={self.intra_op_threads}, inter={self.inter_op_threads})")
+        
+        ctx = multiprocessing.get_context('spawn')
+        timeout = self.symbol_timeout_minutes * 60 if self.symbol_timeout_minutes else None
+        start_time = time.time()
+        pending = list(symbols)
+        running: Dict[str, Tuple] = {}
+        results = []
+        
+        def finish(symbol: str, result: Dict):
+            process, conn, _ = running.pop(symbol)
+            conn.close()
+            process.join(timeout=10)
+            results.append(result)
+            checkpoint.record(result)
+            status = '[OK]' if result.get('status') == 'success' else '[X]'
+            logger.info(f"{status} [{queue_size - len(symbols) + len(results)}/{queue_size}] {symbol}: "
+                        f"{result.get('status')} in {result.get('training_time', 0):.1f}s")
+            self._log_progress(len(results), len(symbols), start_time)
+        
+        def failure(symbol: str, error: str, started: float) -> Dict:
+            return {
+                'symbol': symbol,
+                'status': 'failed',
+                'training_time': time.time() - started,
+                'error': error
+            }
+        
+        try:
+            while pending or running:
+                while pending and len(running) < workers:
+                    symbol = pending.pop(0)
+                    parent_conn, child_conn = ctx.Pipe(duplex=False)
+                    process = ctx.Process(
+                        target=_train_symbol_process,
+                        args=(self.config_path, symbol, self.intra_op_threads,
+                              self.inter_op_threads, child_conn),
+                        name=f'lstm-train-{symbol}'
+                    )
+                    process.start()
+                    child_conn.close()
+                    running[symbol] = (process, parent_conn, time.time())
+                    logger.info(f"Started training {symbol} (pid {process.pid})")
+                
+                handles = [conn for _, conn, _ in running.values()]
+                handles += [process.sentinel for process, _, _ in running.values()]
+                wait_for_workers(handles, timeout=30)
+                
+                for symbol, (process, conn, started) in list(running.items()):
+                    if conn.poll():
+                        try:
+                            finish(symbol, conn.recv())
+                        except (EOFError, OSError):
+                            process.join(timeout=10)
+                            finish(symbol, failure(
+                                symbol, f"Worker crashed (exit code {process.exitcode})", started))
+                    elif not process.is_alive():
+                        finish(symbol, failure(
+                            symbol, f"Worker crashed (exit code {process.exitcode})", started))
+                    elif timeout and time.time() - started > timeout:
+                        logger.error(f"[X] {symbol}: Training exceeded {self.symbol_timeout_minutes} minutes, terminating")
+                        process.terminate()
+                        finish(symbol, failure(
+                            symbol, f"Training timed out after {self.symbol_timeout_minutes} minutes", started))
+        finally:
+            # Interrupted: stop workers; the checkpoint lets the next run resume
+            for symbol, (process, conn, _) in list(running.items()):
+                logger.warning(f"Stopping unfinished training for {symbol}")
+                process.terminate()
+                process.join(timeout=10)
+                conn.close()
+        
+        return results
+    
     def get_training_stats(self) -> Dict:
         """
         Get statistics about LSTM model training.
@@ -484,11 +746,28 @@ class LSTMTrainer:
         """
         Save registry of trained LSTM models for dashboard use.
         
+        New results are merged into the existing registry, so models trained
+        on earlier nights (or by a resumed batch) stay registered.
+        
         Args:
             training_results: List of training result dictionaries from train_batch()
         """
         try:
+            registry_path = self.models_dir / 'lstm_models_registry.json'
             registry = {}
+            try:
+                with open(registry_path, 'r') as f:
+                    existing = json.load(f).get('models', {})
+                registry = {
+                    symbol: entry for symbol, entry in existing.items()
+                    if (self.models_dir / entry.get('model_path', '')).is_file()
+                }
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not read existing model registry, rebuilding: {e}")
+            
+            trained = []
             current_time = datetime.now(self.timezone)
             
             # Build registry from training results
@@ -530,13 +809,13 @@ class LSTMTrainer:
                     'data_range_start': result.get('data_start'),
                     'data_range_end': result.get('data_end')
                 }
+                trained.append(symbol)
             
-            if not registry:
+            if not trained:
                 logger.warning("No successful models to save in registry")
                 return
             
             # Save registry to JSON
-            registry_path = self.models_dir / 'lstm_models_registry.json'
             
             # Add metadata
             registry_data = {
@@ -551,14 +830,16 @@ class LSTMTrainer:
                 'models': registry
             }
             
-            with open(registry_path, 'w') as f:
+            tmp_path = registry_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
                 json.dump(registry_data, f, indent=2)
+            os.replace(tmp_path, registry_path)
             
             logger.info("="*80)
             logger.info("MODEL REGISTRY SAVED")
             logger.info(f"  Registry Path: {registry_path}")
             logger.info(f"  Total Models: {len(registry)}")
-            logger.info(f"  Models: {', '.join(registry.keys())}")
+            logger.info(f"  Updated: {', '.join(trained)}")
             logger.info("="*80)
             
         except Exception as e:
@@ -597,6 +878,8 @@ def main():
     parser.add_argument('--symbols', nargs='+', help='Stock symbols to train')
     parser.add_argument('--max-stocks', type=int, help='Maximum stocks to train')
     parser.add_argument('--force', action='store_true', help='Force training even for fresh models')
+    parser.add_argument('--workers', type=int, help='Parallel training processes (default: config value)')
+    parser.add_argument('--no-resume', action='store_true', help='Ignore the checkpoint of an interrupted batch')
     
     args = parser.parse_args()
     
@@ -713,7 +996,8 @@ def main():
                 print()
         
         # Train batch
-        results = trainer.train_batch(training_queue, args.max_stocks)
+        results = trainer.train_batch(training_queue, args.max_stocks,
+                                      workers=args.workers, resume=not args.no_resume)
         
         print("\n" + "="*80)
         print("TRAINING RESULTS")
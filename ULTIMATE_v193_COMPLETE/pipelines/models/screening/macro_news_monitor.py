@@ -6,23 +6,31 @@ Monitors and analyzes government/central bank announcements that impact market s
 - Reserve Bank of Australia: Cash rate decisions, RBA speeches, board minutes
 - Economic indicators: CPI, GDP, unemployment
 - Integrates with FinBERT for sentiment analysis
+- Fetches all sources and articles concurrently (per-host politeness,
+  conditional GET and a shared on-disk response cache)
 
 This module enhances market sentiment scoring with macro economic context.
 """
 
 import logging
-import time
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-import requests
 from bs4 import BeautifulSoup
 import re
 
+try:
+    from .polite_http_fetcher import PoliteHttpFetcher, FetchedPage
+except ImportError:
+    from polite_http_fetcher import PoliteHttpFetcher, FetchedPage
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Response cache shared by the AU, UK and US pipelines
+MACRO_NEWS_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / 'cache' / 'macro_news'
+
 # Import AI Market Impact Analyzer
 try:
     from .ai_market_impact_analyzer import AIMarketImpactAnalyzer
@@ -73,15 +81,19 @@ class MacroNewsMonitor:
     Monitor and analyze macro economic news that impacts market sentiment
     """
     
-    def __init__(self, market: str = 'US'):
+    def __init__(self, market: str = 'US', max_workers: int = 6,
+                 cache_dir: Optional[Path] = MACRO_NEWS_CACHE_DIR, cache_ttl: float = 300.0):
         """
         Initialize macro news monitor
         
         Args:
-            market: 'US' or 'ASX'
+            market: 'US', 'ASX' or 'UK'
+            max_workers: Concurrent page fetches (politeness delay still applies per host)
+            cache_dir: On-disk response cache (None disables it)
+            cache_ttl: Seconds a cached page is reused without revalidation
         """
         self.market = market.upper()
-        self.polite_delay = 3.0  # Respectful scraping delay (increased to 3 seconds)
+        self.polite_delay = 3.0  # Respectful scraping delay per host (increased to 3 seconds)
         self.timeout = 15  # Increased timeout to 15 seconds
         self.max_retries = 2  # Retry failed requests
         self.headers = {
@@ -91,6 +103,18 @@ class MacroNewsMonitor:
             'Connection': 'keep-alive',
         }
         
+        # Concurrent fetch engine: pooled session, per-host politeness,
+        # conditional GET + disk cache
+        self.fetcher = PoliteHttpFetcher(
+            headers=self.headers,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            host_delay=self.polite_delay,
+            max_workers=max_workers,
+            cache_dir=cache_dir,
+            fresh_ttl=cache_ttl
+        )
+        
         # US sources
         self.us_sources = {
             'FED_RELEASES': 'https://www.federalreserve.gov/newsevents/pressreleases.htm',
@@ -308,55 +332,46 @@ class MacroNewsMonitor:
         
         logger.info(f"Macro News Monitor initialized for {market} market")
     
-    def _safe_request(self, url: str, description: str = "page") -> Optional[requests.Response]:
+    def _safe_request(self, url: str, description: str = "page") -> Optional[FetchedPage]:
         """
-        Make a safe HTTP request with retries and delays
+        Make a safe HTTP request with retries and per-host politeness delays
+        
+        Served from the response cache when the page is fresh or unchanged
+        (conditional GET).
         
         Args:
             url: URL to fetch
             description: Description for logging
             
         Returns:
-            Response object or None if failed
+            Page object (.text) or None if failed
         """
-        for attempt in range(self.max_retries):
-            try:
-                if attempt > 0:
-                    wait_time = self.polite_delay * (attempt + 1)
-                    logger.info(f"    Retry {attempt + 1}/{self.max_retries} after {wait_time}s delay...")
-                    time.sleep(wait_time)
-                else:
-                    time.sleep(self.polite_delay)
-                
-                response = requests.get(url, headers=self.headers, timeout=self.timeout)
-                
-                if response.status_code == 200:
-                    return response
-                elif response.status_code == 429:  # Rate limited
-                    logger.warning(f"    Rate limited (429), waiting longer...")
-                    time.sleep(self.polite_delay * 2)
-                    continue
-                elif response.status_code >= 500:  # Server error
-                    logger.warning(f"    Server error ({response.status_code}), retrying...")
-                    continue
-                else:
-                    logger.warning(f"    HTTP {response.status_code} for {description}")
-                    return None
-                    
-            except requests.exceptions.Timeout:
-                logger.warning(f"    Timeout fetching {description}")
-                if attempt < self.max_retries - 1:
-                    continue
-            except requests.exceptions.ConnectionError:
-                logger.warning(f"    Connection error fetching {description}")
-                if attempt < self.max_retries - 1:
-                    continue
-            except Exception as e:
-                logger.warning(f"    Error fetching {description}: {e}")
-                return None
+        return self.fetcher.get(url, description)
+    
+    def _run_concurrently(self, scrapers: List) -> List[List[Dict]]:
+        """
+        Run source scrapers in parallel
         
-        logger.warning(f"  Failed to fetch {description} after {self.max_retries} attempts")
-        return None
+        Args:
+            scrapers: Callables returning a list of articles
+            
+        Returns:
+            Each scraper's articles, in the order given
+        """
+        results = self.fetcher.map(lambda scrape: scrape(), scrapers)
+        return [articles or [] for articles in results]
+    
+    def _attach_article_texts(self, articles: List[Dict]):
+        """Extract full article text for all articles concurrently (sets 'full_text')"""
+        pending = [a for a in articles if a.get('url') and 'full_text' not in a]
+        texts = self.fetcher.map(
+            lambda article: self._extract_article_text(article['url'], article.get('source', 'unknown')),
+            pending
+        )
+        for article, article_text in zip(pending, texts):
+            if article_text:
+                article['full_text'] = article_text
+                logger.debug(f"      [+] Extracted {len(article_text)} chars of article text")
     
     def _extract_article_text(self, url: str, source: str = "unknown") -> Optional[str]:
         """
@@ -458,17 +473,16 @@ class MacroNewsMonitor:
         """Fetch and analyze US Federal Reserve news and global events"""
         articles = []
         
-        # Scrape Fed Press Releases
-        fed_releases = self._scrape_fed_releases()
+        # Scrape Fed Press Releases, Fed Speeches and global news (geopolitical
+        # events, trade wars, crises) in parallel
+        # US markets are affected by global events even though US is a major driver
+        fed_releases, fed_speeches, global_news = self._run_concurrently([
+            self._scrape_fed_releases,
+            self._scrape_fed_speeches,
+            self._scrape_global_news,
+        ])
         articles.extend(fed_releases)
-        
-        # Scrape Fed Speeches
-        fed_speeches = self._scrape_fed_speeches()
         articles.extend(fed_speeches)
-        
-        # Scrape global news (geopolitical events, trade wars, crises)
-        # US markets are affected by global events even though US is a major driver
-        global_news = self._scrape_global_news()
         articles.extend(global_news)
         
         # Analyze sentiment
@@ -501,17 +515,16 @@ class MacroNewsMonitor:
         """Fetch and analyze RBA news and global events affecting ASX"""
         articles = []
         
-        # Scrape RBA Media Releases
-        rba_releases = self._scrape_rba_releases()
+        # Scrape RBA Media Releases, RBA Speeches and global news (China trade,
+        # US policies, commodities, geopolitical events) in parallel
+        # Australia is heavily impacted by global events affecting commodities and trade
+        rba_releases, rba_speeches, global_news = self._run_concurrently([
+            self._scrape_rba_releases,
+            self._scrape_rba_speeches,
+            self._scrape_global_news,
+        ])
         articles.extend(rba_releases)
-        
-        # Scrape RBA Speeches
-        rba_speeches = self._scrape_rba_speeches()
         articles.extend(rba_speeches)
-        
-        # Scrape global news (China trade, US policies, commodities, geopolitical events)
-        # Australia is heavily impacted by global events affecting commodities and trade
-        global_news = self._scrape_global_news()
         articles.extend(global_news)
         
         # Analyze sentiment
@@ -544,16 +557,15 @@ class MacroNewsMonitor:
         """Fetch and analyze UK (BoE/Treasury) and global news"""
         articles = []
         
-        # Scrape UK Bank of England news
-        boe_news = self._scrape_boe_news_rss()  # Use RSS for reliability
+        # Scrape UK Bank of England news (RSS for reliability), UK Government
+        # Treasury news and global news (wars, crises, major events) in parallel
+        boe_news, uk_gov_news, global_news = self._run_concurrently([
+            self._scrape_boe_news_rss,
+            self._scrape_uk_gov_news,
+            self._scrape_global_news,
+        ])
         articles.extend(boe_news)
-        
-        # Scrape UK Government Treasury news
-        uk_gov_news = self._scrape_uk_gov_news()
         articles.extend(uk_gov_news)
-        
-        # Scrape global news (wars, crises, major events)
-        global_news = self._scrape_global_news()
         articles.extend(global_news)
         
         # Analyze sentiment
@@ -850,9 +862,10 @@ class MacroNewsMonitor:
             
             logger.info("  Fetching Bank of England news (RSS)...")
             
-            # Parse BoE news RSS feed
+            # Parse BoE news RSS feed (fetched through the cache-aware fetcher)
             feed_url = 'https://www.bankofengland.co.uk/news.rss'
-            feed = feedparser.parse(feed_url)
+            feed_page = self._safe_request(feed_url, "BoE RSS feed")
+            feed = feedparser.parse(feed_page.text if feed_page else feed_url)
             
             if not feed.entries:
                 logger.warning(f"    No entries in BoE RSS feed")
@@ -979,8 +992,17 @@ class MacroNewsMonitor:
         try:
             logger.info("  Fetching comprehensive global news (all major global issues)...")
             
+            # Fetch all listing pages in parallel (one request per host at a time)
+            pages = self.fetcher.fetch_many({
+                'REUTERS_MARKETS': (self.global_sources['REUTERS_MARKETS'], "Reuters markets"),
+                'REUTERS_US': (self.global_sources.get('REUTERS_US', ''), "Reuters US"),
+                'BBC_BUSINESS': (self.global_sources['BBC_BUSINESS'], "BBC Business"),
+                'BBC_WORLD': (self.global_sources.get('BBC_WORLD', ''), "BBC World"),
+                'AL_JAZEERA': (self.global_sources.get('AL_JAZEERA', ''), "Al Jazeera"),
+            })
+            
             # Source 1: Reuters Markets
-            response = self._safe_request(self.global_sources['REUTERS_MARKETS'], "Reuters markets")
+            response = pages['REUTERS_MARKETS']
             
             if response:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -1008,13 +1030,6 @@ class MacroNewsMonitor:
                                 'type': 'global_event'
                             }
                             
-                            # FIX v193.9: Extract full article text for emotion analysis
-                            if url:
-                                article_text = self._extract_article_text(url, 'Reuters')
-                                if article_text:
-                                    article['full_text'] = article_text
-                                    logger.debug(f"      [+] Extracted {len(article_text)} chars of article text")
-                            
                             articles.append(article)
                             logger.info(f"    [OK] Found: {title[:60]}...")
                     
@@ -1023,7 +1038,7 @@ class MacroNewsMonitor:
                         continue
             
             # Source 2: Reuters US (for US political news)
-            response_us = self._safe_request(self.global_sources.get('REUTERS_US', ''), "Reuters US")
+            response_us = pages['REUTERS_US']
             
             if response_us:
                 soup = BeautifulSoup(response_us.text, 'html.parser')
@@ -1053,13 +1068,6 @@ class MacroNewsMonitor:
                                 'type': 'us_political'
                             }
                             
-                            # FIX v193.9: Extract full article text for emotion analysis
-                            if url:
-                                article_text = self._extract_article_text(url, 'Reuters')
-                                if article_text:
-                                    article['full_text'] = article_text
-                                    logger.debug(f"      [+] Extracted {len(article_text)} chars of article text")
-                            
                             articles.append(article)
                             logger.info(f"    [OK] Found US: {title[:60]}...")
                     
@@ -1068,7 +1076,7 @@ class MacroNewsMonitor:
                         continue
             
             # Source 3: BBC Business
-            response_bbc = self._safe_request(self.global_sources['BBC_BUSINESS'], "BBC Business")
+            response_bbc = pages['BBC_BUSINESS']
             
             if response_bbc:
                 soup = BeautifulSoup(response_bbc.text, 'html.parser')
@@ -1096,13 +1104,6 @@ class MacroNewsMonitor:
                                 'type': 'global_event'
                             }
                             
-                            # FIX v193.9: Extract full article text for emotion analysis
-                            if url:
-                                article_text = self._extract_article_text(url, 'BBC')
-                                if article_text:
-                                    article['full_text'] = article_text
-                                    logger.debug(f"      [+] Extracted {len(article_text)} chars of article text")
-                            
                             articles.append(article)
                             logger.info(f"    [OK] Found BBC: {title[:60]}...")
                     
@@ -1111,7 +1112,7 @@ class MacroNewsMonitor:
                         continue
             
             # Source 4: BBC World (for geopolitical events)
-            response_world = self._safe_request(self.global_sources.get('BBC_WORLD', ''), "BBC World")
+            response_world = pages['BBC_WORLD']
             
             if response_world:
                 soup = BeautifulSoup(response_world.text, 'html.parser')
@@ -1140,13 +1141,6 @@ class MacroNewsMonitor:
                                 'type': 'geopolitical'
                             }
                             
-                            # FIX v193.9: Extract full article text for emotion analysis
-                            if url:
-                                article_text = self._extract_article_text(url, 'BBC')
-                                if article_text:
-                                    article['full_text'] = article_text
-                                    logger.debug(f"      [+] Extracted {len(article_text)} chars of article text")
-                            
                             articles.append(article)
                             logger.info(f"    [OK] Found Geopolitical: {title[:60]}...")
                     
@@ -1155,7 +1149,7 @@ class MacroNewsMonitor:
                         continue
             
             # Source 5: Al Jazeera Economics (Middle East perspective)
-            response_aj = self._safe_request(self.global_sources.get('AL_JAZEERA', ''), "Al Jazeera")
+            response_aj = pages['AL_JAZEERA']
             
             if response_aj:
                 soup = BeautifulSoup(response_aj.text, 'html.parser')
@@ -1183,13 +1177,6 @@ class MacroNewsMonitor:
                                 'type': 'regional_event'
                             }
                             
-                            # FIX v193.9: Extract full article text for emotion analysis
-                            if url:
-                                article_text = self._extract_article_text(url, 'Al Jazeera')
-                                if article_text:
-                                    article['full_text'] = article_text
-                                    logger.debug(f"      [+] Extracted {len(article_text)} chars of article text")
-                            
                             articles.append(article)
                             logger.info(f"    [OK] Found Regional: {title[:60]}...")
                     
@@ -1197,6 +1184,10 @@ class MacroNewsMonitor:
                         logger.debug(f"Error parsing Al Jazeera: {e}")
                         continue
             
+            # FIX v193.9: Extract full article text for emotion analysis
+            # (all articles in parallel, politeness still applies per host)
+            self._attach_article_texts(articles)
+            
             logger.info(f"  [OK] Global News: {len(articles)} articles (Reuters + BBC + Al Jazeera + Geopolitical)")
         
         except Exception as e:
@@ -209,7 +209,8 @@ class OvernightPipeline:
         try:
             self.scanner = StockScanner()
             self.spi_monitor = SPIMonitor()
-            self.predictor = BatchPredictor()
+            # Predictor slices the scanner's per-run price history instead of re-fetching
+            self.predictor = BatchPredictor(price_store=self.scanner.price_store)
             self.scorer = OpportunityScorer()
             self.reporter = ReportGenerator()
             
@@ -830,15 +831,33 @@ class OvernightPipeline:
         logger.info(f"Scanning {len(sectors_to_scan)} sectors...")
         logger.info(f"Target: {stocks_per_sector} stocks per sector")
         
+        # Bulk multi-symbol download fills the price store in a few requests
+        preloaded = self.scanner.preload_history(sectors_to_scan)
+        if preloaded:
+            logger.info(f"Preloaded price history for {preloaded} stocks")
+        
         all_stocks = []
         sector_summaries = {}
         
+        # All sectors share one worker pool + rate limiter when concurrent scanning is enabled
+        concurrent_results = None
+        if self.scanner.concurrent_scan:
+            logger.info(f"Concurrent scan enabled ({self.scanner.max_workers} workers)")
+            try:
+                concurrent_results = self.scanner.scan_sectors_concurrent(sectors_to_scan, top_n=stocks_per_sector)
+            except Exception as e:
+                logger.error(f"  [X] Concurrent scan failed: {e}, falling back to serial scan")
+                concurrent_results = None
+        
         for i, sector_name in enumerate(sectors_to_scan, 1):
             logger.info(f"\n[{i}/{len(sectors_to_scan)}] Scanning {sector_name}...")
             
             try:
                 # Scan sector
-                stocks = self.scanner.scan_sector(sector_name, top_n=stocks_per_sector)
+                if concurrent_results is not None:
+                    stocks = concurrent_results.get(sector_name, [])
+                else:
+                    stocks = self.scanner.scan_sector(sector_name, top_n=stocks_per_sector, concurrent=False)
                 
                 if stocks:
                     all_stocks.extend(stocks)
@@ -884,7 +903,7 @@ class OvernightPipeline:
             tickers = [s['symbol'] for s in stocks]
             
             # Batch assess
-            results = self.event_guard.assess_batch(tickers)
+            results = self.event_guard.assess_batch(tickers, price_store=self.scanner.price_store)
             
             # Extract ticker results (filter out market_regime key)
             ticker_results = {k: v for k, v in results.items() if k != 'market_regime' and hasattr(v, 'has_upcoming_event')}
@@ -1133,7 +1152,8 @@ class OvernightPipeline:
                 logger.info(f"Training {len(training_queue)} LSTM models...")
                 training_results = self.trainer.train_batch(
                     training_queue=training_queue,
-                    max_stocks=max_models
+                    max_stocks=max_models,
+                    queue_name='AU'
                 )
                 
                 logger.info(f"[SUCCESS] LSTM Training Complete:")
@@ -0,0 +1,283 @@
+"""
+Polite HTTP Fetcher Module
+
+Concurrent, cache-aware page fetcher for the news scrapers.
+
+MacroNewsMonitor used to sleep a fixed politeness delay before every
+request and fetch each source and article one after another. The fetcher:
+
+- Shares one pooled HTTP session across worker threads
+- Applies the politeness delay per host, so different sites are fetched
+  in parallel while requests to the same site stay spaced out
+- Keeps an on-disk response cache shared by the AU, UK and US pipelines:
+  pages younger than fresh_ttl are served without a request, older ones
+  are revalidated with a conditional GET (ETag / Last-Modified) and a
+  304 reuses the cached body
+- Retries timeouts, 429s (with a longer per-host backoff) and 5xx errors
+
+Usage:
+    fetcher = PoliteHttpFetcher(headers=headers, host_delay=3.0, cache_dir=cache_dir)
+    page = fetcher.get(url, "Fed releases")
+    pages = fetcher.fetch_many({'FED': (fed_url, "Fed releases"), 'RBA': (rba_url, "RBA releases")})
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class FetchedPage:
+    """Response body plus the metadata the scrapers use (requests.Response-like)"""
+
+    def __init__(self, url: str, status_code: int, text: str, from_cache: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.from_cache = from_cache
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode('utf-8')
+
+
+class PoliteHttpFetcher:
+    """
+    Thread-safe fetcher with per-host politeness and a conditional-GET disk cache
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, timeout: float = 15,
+                 max_retries: int = 2, host_delay: float = 3.0, max_workers: int = 6,
+                 cache_dir: Optional[Path] = None, fresh_ttl: float = 300.0,
+                 session_factory: Optional[Callable] = None):
+        """
+        Initialize fetcher
+
+        Args:
+            headers: Headers sent with every request
+            timeout: Per-request timeout (seconds)
+            max_retries: Attempts per URL
+            host_delay: Minimum seconds between requests to the same host
+            max_workers: Concurrent requests in fetch_many()/map()
+            cache_dir: On-disk response cache directory (None = no cache)
+            fresh_ttl: Cached pages younger than this are served without a request
+            session_factory: Callable() -> requests.Session-like object
+                             (default: pooled requests.Session)
+        """
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.max_retries = max(1, int(max_retries))
+        self.host_delay = host_delay
+        self.max_workers = max(1, int(max_workers))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.fresh_ttl = fresh_ttl
+        self.session_factory = session_factory
+
+        self._session = None
+        self._lock = threading.Lock()
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._next_slot: Dict[str, float] = {}
+        self.stats = {'requests': 0, 'fresh_hits': 0, 'not_modified': 0, 'failures': 0}
+
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Response cache disabled ({self.cache_dir}): {e}")
+                self.cache_dir = None
+
+    # ------------------------------------------------------------------
+    # Session / politeness
+    # ------------------------------------------------------------------
+
+    def _get_session(self):
+        with self._lock:
+            if self._session is None:
+                if self.session_factory is not None:
+                    self._session = self.session_factory()
+                else:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.max_workers * 2,
+                                          pool_maxsize=self.max_workers)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    self._session = session
+            return self._session
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _host_lock(self, host: str) -> threading.Lock:
+        with self._lock:
+            if host not in self._host_locks:
+                self._host_locks[host] = threading.Lock()
+            return self._host_locks[host]
+
+    def _wait_for_host(self, host: str, extra_delay: float = 0.0):
+        """Block until the host may be contacted again, then reserve the next slot"""
+        with self._host_lock(host):
+            wait = self._next_slot.get(host, 0.0) + extra_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._next_slot[host] = time.monotonic() + self.host_delay
+
+    # ------------------------------------------------------------------
+    # Disk cache
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, url: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _load_cached(self, url: str) -> Optional[Dict]:
+        path = self._cache_path(url)
+        if path is None:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry if entry.get('url') == url else None
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+    def _store_cached(self, url: str, entry: Dict):
+        path = self._cache_path(url)
+        if path is None:
+            return
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not cache {url}: {e}")
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    def get(self, url: str, description: str = "page") -> Optional[FetchedPage]:
+        """
+        Fetch a page, from the cache when fresh or unchanged
+
+        Args:
+            url: URL to fetch
+            description: Description for logging
+
+        Returns:
+            FetchedPage, or None if the page could not be fetched
+        """
+        if not url:
+            return None
+
+        cached = self._load_cached(url)
+        if cached is not None and time.time() - cached.get('fetched_at', 0) < self.fresh_ttl:
+            self._count('fresh_hits')
+            return FetchedPage(url, 200, cached.get('text', ''), from_cache=True)
+
+        headers = dict(self.headers)
+        if cached is not None:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        host = urlparse(url).netloc
+        extra_delay = 0.0
+        for attempt in range(self.max_retries):
+            if attempt > 0:
+                logger.info(f"    Retry {attempt + 1}/{self.max_retries} for {description}...")
+                extra_delay = max(extra_delay, self.host_delay * attempt)
+            self._wait_for_host(host, extra_delay)
+
+            try:
+                self._count('requests')
+                response = self._get_session().get(url, headers=headers, timeout=self.timeout)
+            except Exception as e:
+                logger.warning(f"    Error fetching {description}: {type(e).__name__}: {e}")
+                continue
+
+            status = response.status_code
+            if status == 304 and cached is not None:
+                self._count('not_modified')
+                cached['fetched_at'] = time.time()
+                self._store_cached(url, cached)
+                return FetchedPage(url, 200, cached.get('text', ''), from_cache=True)
+            elif status == 200:
+                text = response.text
+                self._store_cached(url, {
+                    'url': url,
+                    'fetched_at': time.time(),
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'text': text,
+                })
+                return FetchedPage(url, 200, text)
+            elif status == 429:  # Rate limited - back off this host only
+                logger.warning(f"    Rate limited (429) by {host}, waiting longer...")
+                extra_delay = self.host_delay * 2
+                continue
+            elif status >= 500:  # Server error
+                logger.warning(f"    Server error ({status}), retrying...")
+                continue
+            else:
+                logger.warning(f"    HTTP {status} for {description}")
+                self._count('failures')
+                return None
+
+        self._count('failures')
+        logger.warning(f"  Failed to fetch {description} after {self.max_retries} attempts")
+        return None
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Apply fn to items concurrently (bounded by max_workers)
+
+        Returns:
+            Results in input order; an item whose call raised yields None
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        def safe(item):
+            try:
+                return fn(item)
+            except Exception as e:
+                logger.debug(f"Concurrent fetch task failed: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items)),
+                                thread_name_prefix='http-fetch') as executor:
+            return list(executor.map(safe, items))
+
+    def fetch_many(self, requests_by_key: Dict[str, Tuple[str, str]]) -> Dict[str, Optional[FetchedPage]]:
+        """
+        Fetch several pages concurrently
+
+        Args:
+            requests_by_key: Dictionary mapping key -> (url, description)
+
+        Returns:
+            Dictionary mapping key -> FetchedPage or None
+        """
+        keys = list(requests_by_key)
+        pages = self.map(lambda key: self.get(*requests_by_key[key]), keys)
+        return dict(zip(keys, pages))
+
+    def get_stats(self) -> Dict:
+        """Request / cache counters"""
+        with self._lock:
+            return dict(self.stats)
@@ -0,0 +1,296 @@
+"""
+Price History Store Module
+
+Per-run in-memory OHLCV store shared by the overnight pipeline stages.
+
+Each symbol's history is fetched once over the widest window any stage
+needs (1 year by default). Validation ('1mo'), analysis (90 days) and
+prediction ('1y') then slice that frame in memory instead of issuing
+their own upstream requests.
+
+Usage:
+    store = PriceHistoryStore(fetch_fn=scanner.download_history)
+    hist_1mo = store.get_period('CBA.AX', '1mo')
+    hist_90d = store.get_range('CBA.AX', start_date, end_date)
+    hist_1y = store.get_history('CBA.AX')
+
+A whole universe can be filled up front with preload() and a
+BulkHistoryLoader, leaving per-symbol fetches only for stragglers.
+
+When the persistent OHLCV cache (finbert_v4.4.4/models/backtesting/
+ohlcv_cache.py) is available, the store sits on top of it: only bars newer
+than the last cached date are downloaded, so a nightly run fetches about
+one bar per symbol.
+"""
+
+import importlib.util
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_CACHE_FILE = (Path(__file__).resolve().parent.parent.parent.parent
+                    / 'finbert_v4.4.4' / 'models' / 'backtesting' / 'ohlcv_cache.py')
+
+
+def load_disk_cache():
+    """
+    Load the shared persistent OHLCV cache from FinBERT v4.4.4
+
+    Loaded by file path (importlib) to avoid importing the whole
+    backtesting package and its yfinance dependency.
+
+    Returns:
+        OHLCVCache instance, or None if unavailable
+    """
+    try:
+        spec = importlib.util.spec_from_file_location("ohlcv_cache", OHLCV_CACHE_FILE)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load spec from {OHLCV_CACHE_FILE}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.get_ohlcv_cache()
+    except Exception as e:
+        logger.warning(f"Persistent OHLCV cache unavailable, using per-run fetches only: {e}")
+        return None
+
+
+# yahooquery period strings -> look-back offsets
+PERIOD_OFFSETS = {
+    '1d': pd.DateOffset(days=1),
+    '5d': pd.DateOffset(days=5),
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+    '5y': pd.DateOffset(years=5),
+}
+
+
+def normalize_history(hist: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """
+    Normalize a yahooquery history frame to a single-symbol OHLCV frame
+
+    - Drops the 'symbol' level of yahooquery's (symbol, date) MultiIndex
+    - Converts the mixed date/datetime index to naive Timestamps, keeping the
+      exchange-local wall clock of tz-aware bars (an ASX live bar at 10:00+11:00
+      stays on its own session instead of moving to the previous UTC day)
+    - Capitalizes column names (Open, High, Low, Close, Volume, ...)
+
+    Returns:
+        Normalized DataFrame, or None if empty/invalid
+    """
+    if not isinstance(hist, pd.DataFrame) or hist.empty:
+        return None
+
+    hist = hist.copy()
+    if isinstance(hist.index, pd.MultiIndex) and 'symbol' in hist.index.names:
+        hist = hist.droplevel('symbol')
+
+    # Daily bars come back as datetime.date, the live bar as tz-aware datetime
+    timestamps = [pd.Timestamp(ts) for ts in hist.index]
+    hist.index = pd.DatetimeIndex(
+        [ts.tz_localize(None) if ts.tzinfo is not None else ts for ts in timestamps]
+    )
+    hist = hist[~hist.index.duplicated(keep='last')].sort_index()
+
+    hist.columns = [str(col).capitalize() for col in hist.columns]
+    return hist
+
+
+class PriceHistoryStore:
+    """
+    Thread-safe, per-run price history store
+
+    One fetch per symbol (negative results are cached too, matching the
+    scanner's behaviour of not retrying an empty response). A per-symbol
+    lock ensures concurrent scanner/predictor workers never fetch the same
+    symbol twice.
+    """
+
+    def __init__(self, fetch_fn: Optional[Callable[..., Optional[pd.DataFrame]]] = None,
+                 period: str = '1y', disk_cache=None):
+        """
+        Initialize store
+
+        Args:
+            fetch_fn: Callable(symbol, period=None, start=None, end=None) ->
+                      raw or normalized DataFrame (default: yahooquery history)
+            period: Widest window fetched per symbol
+            disk_cache: Persistent OHLCVCache to top up incrementally
+                        (None = download the full window every run)
+        """
+        self.fetch_fn = fetch_fn or self._default_fetch
+        self.period = period
+        self.disk_cache = disk_cache
+        self._frames: Dict[str, Optional[pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self.stats = {'fetches': 0, 'hits': 0, 'preloaded': 0}
+
+    @staticmethod
+    def _default_fetch(symbol: str, period: Optional[str] = None, start=None, end=None) -> Optional[pd.DataFrame]:
+        """Fetch history with yahooquery"""
+        from yahooquery import Ticker
+        if start is not None:
+            return Ticker(symbol).history(start=start, end=end)
+        return Ticker(symbol).history(period=period)
+
+    def _fetch_range(self, symbol: str, start, end) -> Optional[pd.DataFrame]:
+        """Disk cache top-up: download bars in [start, end)"""
+        return self.fetch_fn(symbol, start=start, end=end)
+
+    def _download(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Download the store window, through the disk cache when available"""
+        if self.disk_cache is not None:
+            return self.disk_cache.get_history(symbol, period=self.period, fetch_fn=self._fetch_range)
+        return self.fetch_fn(symbol, period=self.period)
+
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            if symbol not in self._symbol_locks:
+                self._symbol_locks[symbol] = threading.Lock()
+            return self._symbol_locks[symbol]
+
+    # ------------------------------------------------------------------
+    # Population
+    # ------------------------------------------------------------------
+
+    def put(self, symbol: str, hist: Optional[pd.DataFrame]):
+        """Store an already-downloaded frame (e.g. from a bulk download)"""
+        with self._lock:
+            self._frames[symbol] = normalize_history(hist)
+            self.stats['preloaded'] += 1
+
+    def preload(self, symbols: Iterable[str], loader) -> int:
+        """
+        Bulk-load symbols not yet in the store
+
+        Args:
+            symbols: Tickers to load
+            loader: Object with load(symbols, period=None, start=None) ->
+                    {symbol: DataFrame} (e.g. BulkHistoryLoader)
+
+        Returns:
+            Number of symbols loaded. Symbols the loader could not fetch are
+            left out so get_history() falls back to a per-symbol fetch.
+        """
+        with self._lock:
+            pending = [s for s in dict.fromkeys(symbols) if s not in self._frames]
+        if not pending:
+            return 0
+
+        if self.disk_cache is None:
+            frames = loader.load(pending, period=self.period)
+            for symbol, hist in frames.items():
+                self.put(symbol, hist)
+            return len(frames)
+
+        # Only download what the disk cache is missing, grouped by fetch start
+        # (on a nightly run nearly every symbol shares the same last cached date)
+        plan = self.disk_cache.stale_symbols(pending, period=self.period)
+        groups: Dict[pd.Timestamp, list] = {}
+        for symbol, fetch_from in plan.items():
+            groups.setdefault(fetch_from, []).append(symbol)
+        for fetch_from, group in sorted(groups.items()):
+            frames = loader.load(group, start=fetch_from)
+            for symbol, hist in frames.items():
+                self.disk_cache.merge(symbol, hist, covered_from=fetch_from)
+
+        # Serve everything from disk; symbols with no cached bars are left for
+        # the per-symbol fallback in get_history()
+        loaded = 0
+        for symbol in pending:
+            hist = self.disk_cache.get_history(symbol, period=self.period)
+            if hist is not None:
+                self.put(symbol, hist)
+                loaded += 1
+        logger.info(f"Price store preload: {len(pending) - len(plan)} symbols served from disk cache, "
+                    f"{len(plan)} topped up in {len(groups)} groups")
+        return loaded
+
+    def __contains__(self, symbol: str) -> bool:
+        with self._lock:
+            return symbol in self._frames
+
+    def symbols(self) -> Iterable[str]:
+        with self._lock:
+            return list(self._frames.keys())
+
+    def clear(self):
+        """Drop all cached frames (call at the start of a new run)"""
+        with self._lock:
+            self._frames.clear()
+            self._symbol_locks.clear()
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def get_history(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Get the full stored window for a symbol, fetching it on first use
+
+        Returns:
+            DataFrame (shared - do not modify in place), or None if unavailable
+        """
+        with self._lock:
+            if symbol in self._frames:
+                self.stats['hits'] += 1
+                return self._frames[symbol]
+
+        with self._symbol_lock(symbol):
+            # Another worker may have fetched it while we waited
+            with self._lock:
+                if symbol in self._frames:
+                    self.stats['hits'] += 1
+                    return self._frames[symbol]
+
+            try:
+                hist = normalize_history(self._download(symbol))
+            except Exception as e:
+                logger.debug(f"Error fetching {symbol}: {e}")
+                hist = None
+
+            with self._lock:
+                self._frames[symbol] = hist
+                self.stats['fetches'] += 1
+            return hist
+
+    def get_period(self, symbol: str, period: str) -> Optional[pd.DataFrame]:
+        """
+        Slice the stored history to a yahooquery-style period ('1mo', '3mo', ...)
+
+        Periods wider than the store window return the full stored window.
+        """
+        hist = self.get_history(symbol)
+        if hist is None:
+            return None
+
+        offset = PERIOD_OFFSETS.get(period)
+        if offset is None:
+            return hist
+
+        cutoff = pd.Timestamp(datetime.now()) - offset
+        sliced = hist[hist.index >= cutoff]
+        return sliced if not sliced.empty else None
+
+    def get_range(self, symbol: str, start_date=None, end_date=None) -> Optional[pd.DataFrame]:
+        """Slice the stored history to [start_date, end_date)"""
+        hist = self.get_history(symbol)
+        if hist is None:
+            return None
+
+        mask = pd.Series(True, index=hist.index)
+        if start_date is not None:
+            mask &= hist.index >= pd.Timestamp(start_date).tz_localize(None)
+        if end_date is not None:
+            mask &= hist.index < pd.Timestamp(end_date).tz_localize(None)
+        sliced = hist[mask.values]
+        return sliced if not sliced.empty else None
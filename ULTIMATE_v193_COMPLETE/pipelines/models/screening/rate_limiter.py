@@ -0,0 +1,76 @@
+"""
+Rate Limiter Module
+
+Thread-safe token bucket used to pace upstream market data requests.
+
+Replaces the fixed time.sleep() calls between stocks: a bucket shared by
+every scanner worker allows short bursts while keeping the long-run request
+rate at or below the configured limit, regardless of how many workers run.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket rate limiter shared between worker threads.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Each upstream request consumes one token; callers block until a
+    token is available.
+    """
+
+    def __init__(self, rate: float = 4.0, capacity: Optional[float] = None):
+        """
+        Initialize rate limiter
+
+        Args:
+            rate: Sustained requests per second (<= 0 disables limiting)
+            capacity: Maximum burst size (default: max(1, rate))
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """True if the limiter actually throttles requests"""
+        return self.rate > 0
+
+    def _refill(self):
+        """Add tokens accrued since the last refill (lock must be held)"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until `tokens` are available, then consume them
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                deficit = tokens - self._tokens
+                delay = deficit / self.rate
+
+            # Sleep outside the lock so other workers can refill/consume
+            time.sleep(delay)
+            waited += delay
@@ -10,6 +10,7 @@ import logging
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from yahooquery import Ticker
 import pandas as pd
 import numpy as np
@@ -17,6 +18,15 @@ from pathlib import Path
 import sys
 import io
 
+try:
+    from .rate_limiter import TokenBucketRateLimiter
+    from .price_history_store import PriceHistoryStore, load_disk_cache
+    from .bulk_history_loader import BulkHistoryLoader
+except ImportError:
+    from rate_limiter import TokenBucketRateLimiter
+    from price_history_store import PriceHistoryStore, load_disk_cache
+    from bulk_history_loader import BulkHistoryLoader
+
 # Setup logging with UTF-8 encoding for Windows compatibility
 if sys.platform == 'win32':
     try:
@@ -70,8 +80,14 @@ class StockScanner:
     - Sector-wise scanning
     """
     
-    def __init__(self, config_path: str = None):
-        """Initialize scanner with config"""
+    def __init__(self, config_path: str = None, price_store: Optional[PriceHistoryStore] = None):
+        """
+        Initialize scanner with config
+        
+        Args:
+            config_path: Path to sectors JSON
+            price_store: Shared per-run price history store (default: scanner-owned store)
+        """
         if config_path is None:
             config_path = Path(__file__).parent.parent / "config" / "asx_sectors.json"
         
@@ -91,6 +107,38 @@ class StockScanner:
             'min_avg_volume': 100000
         })
         self.logger = logger
+        
+        # Concurrent scan settings (screening_config.json -> performance)
+        screening_config = self._load_screening_config()
+        performance = screening_config.get('performance', {})
+        self.concurrent_scan = performance.get('parallel_processing', True)
+        self.max_workers = max(1, int(performance.get('max_workers', 4)))
+        self.rate_limiter = TokenBucketRateLimiter(
+            rate=performance.get('requests_per_second', 4.0),
+            capacity=performance.get('request_burst', None)
+        )
+        
+        # Multi-symbol download path (screening_config.json -> data_fetch)
+        data_fetch = screening_config.get('data_fetch', {})
+        self.bulk_download = data_fetch.get('bulk_download', True)
+        self.bulk_loader = BulkHistoryLoader.from_config(data_fetch, rate_limiter=self.rate_limiter)
+        
+        # Per-run price history: one fetch per symbol, sliced by each stage,
+        # topped up incrementally from the persistent OHLCV cache
+        if price_store is None:
+            disk_cache = load_disk_cache() if data_fetch.get('disk_cache', True) else None
+            price_store = PriceHistoryStore(fetch_fn=self.download_history, disk_cache=disk_cache)
+        self.price_store = price_store
+    
+    def _load_screening_config(self) -> Dict:
+        """Load performance/data_fetch settings from screening_config.json"""
+        screening_config_path = Path(__file__).parent.parent / "config" / "screening_config.json"
+        try:
+            with open(screening_config_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.debug(f"Screening config unavailable, using defaults: {e}")
+            return {}
     
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON"""
@@ -112,9 +160,56 @@ class StockScanner:
     # DATA FETCHING - yahooquery ONLY
     # ========================================================================
     
+    def download_history(self, symbol: str, period: str = '1y', start=None, end=None):
+        """
+        Download raw history from yahooquery (rate limited, no caching)
+        
+        Used as the price store's fetch function; stages should call
+        fetch_stock_history() instead. When start is given (incremental
+        disk cache top-up) the period is ignored.
+        """
+        # Shared token bucket paces requests across all scan workers
+        self.rate_limiter.acquire()
+        if start is not None:
+            return Ticker(symbol).history(start=start, end=end)
+        return Ticker(symbol).history(period=period)
+    
+    def preload_history(self, sector_names: List[str] = None) -> int:
+        """
+        Bulk-download history for every stock in the given sectors
+        
+        Fills the price store in a few multi-symbol requests so the scan
+        itself is served from memory. Symbols the bulk path misses fall
+        back to per-symbol fetches during the scan.
+        
+        Args:
+            sector_names: Sectors to preload (None = all sectors)
+            
+        Returns:
+            Number of symbols loaded
+        """
+        if not self.bulk_download:
+            return 0
+        
+        if sector_names is None:
+            sector_names = list(self.sectors.keys())
+        symbols = []
+        for sector_name in sector_names:
+            if sector_name in self.sectors:
+                symbols.extend(self.sectors[sector_name].get('stocks', []))
+        
+        try:
+            return self.price_store.preload(symbols, self.bulk_loader)
+        except Exception as e:
+            logger.warning(f"Bulk history preload failed, using per-symbol fetch: {e}")
+            return 0
+    
     def fetch_stock_history(self, symbol: str, start_date=None, end_date=None, period='1mo'):
         """
-        Fetch stock history using yahooquery
+        Fetch stock history from the per-run price store
+        
+        The first call for a symbol downloads the store's full window;
+        later calls (from any stage) are sliced in memory.
         
         Args:
             symbol: Stock ticker
@@ -126,16 +221,12 @@ class StockScanner:
             DataFrame with OHLCV data, or None on error
         """
         try:
-            ticker = Ticker(symbol)
-            
             if start_date and end_date:
-                hist = ticker.history(start=start_date, end=end_date)
+                hist = self.price_store.get_range(symbol, start_date, end_date)
             else:
-                hist = ticker.history(period=period)
+                hist = self.price_store.get_period(symbol, period)
             
             if isinstance(hist, pd.DataFrame) and not hist.empty:
-                # Normalize column names
-                hist.columns = [col.capitalize() for col in hist.columns]
                 return hist
             else:
                 return None
@@ -382,13 +473,48 @@ class StockScanner:
     # SECTOR SCANNING
     # ========================================================================
     
-    def scan_sector(self, sector_name: str, top_n: int = 10) -> List[Dict]:
+    def _scan_symbol(self, symbol: str, sector_weight: float, position: str) -> Optional[Dict]:
+        """
+        Validate and analyze a single symbol
+        
+        Args:
+            symbol: Stock ticker symbol
+            sector_weight: Weight multiplier for sector importance
+            position: Progress label for logging (e.g. "3/30")
+            
+        Returns:
+            Stock dictionary with score, or None if rejected
+        """
+        logger.info(f"[{position}] Processing {symbol}...")
+        
+        # Validate with verbose output
+        if not self.validate_stock(symbol, verbose=True):
+            logger.info(f"  [X] {symbol}: Failed validation")
+            return None
+        
+        # Analyze
+        stock_data = self.analyze_stock(symbol, sector_weight)
+        
+        if stock_data:
+            logger.info(f"  [OK] {symbol}: Score {stock_data['score']:.0f}/100")
+        else:
+            logger.info(f"  [X] {symbol}: Analysis failed")
+        
+        return stock_data
+    
+    def _rank_stocks(self, stocks: List[Dict], top_n: int) -> List[Dict]:
+        """Sort stocks by score (stable, ties keep config order) and return top N"""
+        stocks.sort(key=lambda x: x['score'], reverse=True)
+        return stocks[:top_n]
+    
+    def scan_sector(self, sector_name: str, top_n: int = 10, concurrent: Optional[bool] = None) -> List[Dict]:
         """
         Scan stocks in a specific sector
         
         Args:
             sector_name: Name of sector to scan
             top_n: Number of top stocks to return
+            concurrent: Use the worker pool (default: performance.parallel_processing)
             
         Returns:
             List of stock dictionaries sorted by score
@@ -397,6 +523,11 @@ class StockScanner:
             logger.error(f"Unknown sector: {sector_name}")
             return []
         
+        if concurrent is None:
+            concurrent = self.concurrent_scan
+        if concurrent:
+            return self.scan_sectors_concurrent([sector_name], top_n).get(sector_name, [])
+        
         sector_data = self.sectors[sector_name]
         symbols = sector_data['stocks']
         sector_weight = sector_data.get('weight', 1.0)  # Default weight = 1.0 if not specified
@@ -413,21 +544,10 @@ class StockScanner:
                 if i > 0:
                     time.sleep(0.5)
                 
-                logger.info(f"[{i+1}/{len(symbols)}] Processing {symbol}...")
-                
-                # Validate with verbose output
-                if not self.validate_stock(symbol, verbose=True):
-                    logger.info(f"  [X] {symbol}: Failed validation")
-                    continue
-                
-                # Analyze
-                stock_data = self.analyze_stock(symbol, sector_weight)
+                stock_data = self._scan_symbol(symbol, sector_weight, f"{i+1}/{len(symbols)}")
                 
                 if stock_data:
                     valid_stocks.append(stock_data)
-                    logger.info(f"  [OK] {symbol}: Score {stock_data['score']:.0f}/100")
-                else:
-                    logger.info(f"  [X] {symbol}: Analysis failed")
                     
             except KeyboardInterrupt:
                 logger.info("\n\nScan interrupted by user")
@@ -436,14 +556,77 @@ class StockScanner:
                 logger.error(f"  [X] {symbol}: Error - {e}")
                 continue
         
+        logger.info(f"\n{'='*80}")
+        logger.info(f"Sector Summary: {len(valid_stocks)} stocks validated")
+        logger.info(f"{'='*80}\n")
+        
         # Sort by score and return top N
-        valid_stocks.sort(key=lambda x: x['score'], reverse=True)
+        return self._rank_stocks(valid_stocks, top_n)
+    
+    def scan_sectors_concurrent(self, sector_names: List[str], top_n: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Scan several sectors at once on a bounded worker pool
+        
+        All symbols from all requested sectors share one pool of
+        performance.max_workers threads. Upstream requests are paced by
+        the shared token bucket instead of fixed sleeps. Results are
+        collected in config order before ranking, so the output matches
+        the serial scan_sector() path.
+        
+        Args:
+            sector_names: Sectors to scan (unknown names are skipped)
+            top_n: Number of top stocks to return per sector
+            
+        Returns:
+            Dictionary mapping sector names to ranked stock lists
+        """
+        tasks = []
+        for sector_name in sector_names:
+            if sector_name not in self.sectors:
+                logger.error(f"Unknown sector: {sector_name}")
+                continue
+            sector_data = self.sectors[sector_name]
+            symbols = sector_data['stocks']
+            sector_weight = sector_data.get('weight', 1.0)
+            for i, symbol in enumerate(symbols):
+                tasks.append((sector_name, i, symbol, sector_weight, f"{sector_name} {i+1}/{len(symbols)}"))
         
         logger.info(f"\n{'='*80}")
-        logger.info(f"Sector Summary: {len(valid_stocks)} stocks validated")
+        logger.info(f"Concurrent scan: {len(tasks)} stocks across {len(sector_names)} sectors "
+                    f"({self.max_workers} workers, {self.rate_limiter.rate:g} req/s)")
         logger.info(f"{'='*80}\n")
         
-        return valid_stocks[:top_n]
+        # Slot results by (sector, config position) so ranking ties match the serial path
+        slots: Dict[str, Dict[int, Dict]] = {name: {} for name in sector_names if name in self.sectors}
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        future_to_task = {}
+        try:
+            for sector_name, i, symbol, weight, position in tasks:
+                future = executor.submit(self._scan_symbol, symbol, weight, position)
+                future_to_task[future] = (sector_name, i, symbol)
+            for future in as_completed(future_to_task):
+                sector_name, i, symbol = future_to_task[future]
+                try:
+                    stock_data = future.result()
+                    if stock_data:
+                        slots[sector_name][i] = stock_data
+                except Exception as e:
+                    logger.error(f"  [X] {symbol}: Error - {e}")
+        except KeyboardInterrupt:
+            logger.info("\n\nScan interrupted by user")
+            for future in future_to_task:
+                future.cancel()
+        finally:
+            executor.shutdown(wait=True)
+        
+        results = {}
+        for sector_name, sector_slots in slots.items():
+            valid_stocks = [sector_slots[i] for i in sorted(sector_slots)]
+            logger.info(f"Sector Summary: {sector_name} - {len(valid_stocks)} stocks validated")
+            results[sector_name] = self._rank_stocks(valid_stocks, top_n)
+        
+        return results
     
     def scan_all_sectors(self, top_n_per_sector: int = 10) -> Dict[str, List[Dict]]:
         """
@@ -461,9 +644,12 @@ class StockScanner:
         logger.info(f"FULL MARKET SCAN - {len(self.sectors)} SECTORS")
         logger.info(f"{'#'*80}\n")
         
-        for sector_name in self.sectors:
-            stocks = self.scan_sector(sector_name, top_n_per_sector)
-            results[sector_name] = stocks
+        if self.concurrent_scan:
+            results = self.scan_sectors_concurrent(list(self.sectors.keys()), top_n_per_sector)
+        else:
+            for sector_name in self.sectors:
+                stocks = self.scan_sector(sector_name, top_n_per_sector, concurrent=False)
+                results[sector_name] = stocks
         
         logger.info(f"\n{'#'*80}")
         logger.info(f"SCAN COMPLETE")
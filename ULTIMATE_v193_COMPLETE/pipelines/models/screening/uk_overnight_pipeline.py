@@ -144,7 +144,8 @@ class UKOvernightPipeline:
             # FIX v1.3.15.118.4: Config file is in pipelines/config/
             uk_config_path = BASE_PATH / 'pipelines' / 'config' / 'uk_sectors.json'
             self.scanner = StockScanner(config_path=str(uk_config_path))
-            self.predictor = BatchPredictor()
+            # Predictor slices the scanner's per-run price history instead of re-fetching
+            self.predictor = BatchPredictor(price_store=self.scanner.price_store)
             self.scorer = OpportunityScorer()
             self.reporter = ReportGenerator()
             
@@ -852,14 +853,32 @@ class UKOvernightPipeline:
         logger.info(f"Target: {stocks_per_sector} stocks per sector (~{total_expected} total stocks)")
         logger.info("")
         
+        # Bulk multi-symbol download fills the price store in a few requests
+        preloaded = self.scanner.preload_history(sectors_to_scan)
+        if preloaded:
+            logger.info(f"Preloaded price history for {preloaded} stocks")
+        
         all_stocks = []
         total_processed = 0
         
+        # All sectors share one worker pool + rate limiter when concurrent scanning is enabled
+        concurrent_results = None
+        if self.scanner.concurrent_scan:
+            logger.info(f"Concurrent scan enabled ({self.scanner.max_workers} workers)")
+            try:
+                concurrent_results = self.scanner.scan_sectors_concurrent(sectors_to_scan, top_n=stocks_per_sector)
+            except Exception as e:
+                logger.error(f"  [X] Concurrent scan failed: {e}, falling back to serial scan")
+                concurrent_results = None
+        
         for i, sector_name in enumerate(sectors_to_scan, 1):
             logger.info(f"[{i}/{len(sectors_to_scan)}] Scanning {sector_name}...")
             
             try:
-                stocks = self.scanner.scan_sector(sector_name, top_n=stocks_per_sector)
+                if concurrent_results is not None:
+                    stocks = concurrent_results.get(sector_name, [])
+                else:
+                    stocks = self.scanner.scan_sector(sector_name, top_n=stocks_per_sector, concurrent=False)
                 
                 if stocks:
                     all_stocks.extend(stocks)
@@ -898,7 +917,7 @@ class UKOvernightPipeline:
         
         try:
             tickers = [s['symbol'] for s in stocks]
-            results = self.event_guard.assess_batch(tickers)
+            results = self.event_guard.assess_batch(tickers, price_store=self.scanner.price_store)
             
             # Extract ticker results (filter out market_regime key)
             ticker_results = {k: v for k, v in results.items() if k != 'market_regime' and hasattr(v, 'has_upcoming_event')}
@@ -1056,7 +1075,8 @@ class UKOvernightPipeline:
                 logger.info(f"Training {len(training_queue)} LSTM models...")
                 training_results = self.trainer.train_batch(
                     training_queue=training_queue,
-                    max_stocks=max_models
+                    max_stocks=max_models,
+                    queue_name='UK'
                 )
                 
                 logger.info(f"[SUCCESS] LSTM Training Complete:")
@@ -163,7 +163,8 @@ class USOvernightPipeline:
                 self.regime_analyzer = None
                 logger.info("[OK] US Market Regime Engine enabled (HMM only)")
             
-            self.predictor = BatchPredictor()
+            # Predictor slices the scanner's per-run price history instead of re-fetching
+            self.predictor = BatchPredictor(price_store=self.scanner.price_store)
             self.scorer = OpportunityScorer()
             self.reporter = ReportGenerator()
             
@@ -729,6 +730,11 @@ class USOvernightPipeline:
         logger.info(f"Target: {stocks_per_sector} stocks per sector (~{total_expected} total stocks)")
         logger.info("")
         
+        # Bulk multi-symbol download fills the price store in a few requests
+        preloaded = self.scanner.preload_history(sectors_to_scan, max_stocks=stocks_per_sector)
+        if preloaded:
+            logger.info(f"Preloaded price history for {preloaded} stocks")
+        
         all_stocks = []
         total_processed = 0
         
@@ -772,7 +778,7 @@ class USOvernightPipeline:
         
         try:
             tickers = [s['symbol'] for s in stocks]
-            results = self.event_guard.assess_batch(tickers)
+            results = self.event_guard.assess_batch(tickers, price_store=self.scanner.price_store)
             
             total_events = sum(1 for r in results.values() if hasattr(r, 'has_upcoming_event') and r.has_upcoming_event)
             sit_outs = sum(1 for r in results.values() if hasattr(r, 'skip_trading') and r.skip_trading)
@@ -893,7 +899,8 @@ class USOvernightPipeline:
                 logger.info(f"Training {len(training_queue)} LSTM models...")
                 training_results = self.trainer.train_batch(
                     training_queue=training_queue,
-                    max_stocks=max_models
+                    max_stocks=max_models,
+                    queue_name='US'
                 )
                 
                 logger.info(f"[SUCCESS] LSTM Training Complete:")
@@ -21,6 +21,13 @@ from pathlib import Path
 import sys
 import io
 
+try:
+    from .price_history_store import PriceHistoryStore, load_disk_cache
+    from .bulk_history_loader import BulkHistoryLoader
+except ImportError:
+    from price_history_store import PriceHistoryStore, load_disk_cache
+    from bulk_history_loader import BulkHistoryLoader
+
 # Setup logging with UTF-8 encoding for Windows compatibility
 if sys.platform == 'win32':
     try:
@@ -65,8 +72,14 @@ class USStockScanner:
     - Sector-wise scanning for US markets
     """
     
-    def __init__(self, config_path: str = None):
-        """Initialize US scanner with config"""
+    def __init__(self, config_path: str = None, price_store: Optional[PriceHistoryStore] = None):
+        """
+        Initialize US scanner with config
+        
+        Args:
+            config_path: Path to sectors JSON
+            price_store: Shared per-run price history store (default: scanner-owned store)
+        """
         if config_path is None:
             config_path = Path(__file__).parent.parent / "config" / "us_sectors.json"
         
@@ -86,8 +99,30 @@ class USStockScanner:
             'min_market_cap': 2000000000
         })
         self.logger = logger
+        
+        # Multi-symbol download path (screening_config.json -> data_fetch)
+        data_fetch = self._load_data_fetch_config()
+        self.bulk_download = data_fetch.get('bulk_download', True)
+        self.bulk_loader = BulkHistoryLoader.from_config(data_fetch)
+        
+        # Per-run price history: one fetch per symbol, sliced by each stage,
+        # topped up incrementally from the persistent OHLCV cache
+        if price_store is None:
+            disk_cache = load_disk_cache() if data_fetch.get('disk_cache', True) else None
+            price_store = PriceHistoryStore(fetch_fn=self.download_history, disk_cache=disk_cache)
+        self.price_store = price_store
         logger.info(f"US Stock Scanner initialized with {len(self.sectors)} sectors")
     
+    def _load_data_fetch_config(self) -> Dict:
+        """Load data_fetch settings from screening_config.json"""
+        screening_config_path = Path(__file__).parent.parent / "config" / "screening_config.json"
+        try:
+            with open(screening_config_path, 'r') as f:
+                return json.load(f).get('data_fetch', {})
+        except Exception as e:
+            logger.debug(f"Screening config unavailable, using defaults: {e}")
+            return {}
+    
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON"""
         try:
@@ -108,9 +143,48 @@ class USStockScanner:
     # DATA FETCHING - yahooquery ONLY
     # ========================================================================
     
+    def download_history(self, symbol: str, period: str = '1y', start=None, end=None):
+        """
+        Download raw history from yahooquery (no caching)
+        
+        Used as the price store's fetch function; stages should call
+        fetch_stock_history() instead. When start is given (incremental
+        disk cache top-up) the period is ignored.
+        """
+        if start is not None:
+            return Ticker(symbol).history(start=start, end=end)
+        return Ticker(symbol).history(period=period)
+    
+    def preload_history(self, sector_names: List[str] = None, max_stocks: int = 30) -> int:
+        """
+        Bulk-download history for the stocks scan_sector() will visit
+        
+        Args:
+            sector_names: Sectors to preload (None = all sectors)
+            max_stocks: Stocks per sector (matches scan_sector's max_stocks)
+            
+        Returns:
+            Number of symbols loaded
+        """
+        if not self.bulk_download:
+            return 0
+        
+        if sector_names is None:
+            sector_names = list(self.sectors.keys())
+        symbols = []
+        for sector_name in sector_names:
+            if sector_name in self.sectors:
+                symbols.extend(self.sectors[sector_name].get('stocks', [])[:max_stocks])
+        
+        try:
+            return self.price_store.preload(symbols, self.bulk_loader)
+        except Exception as e:
+            logger.warning(f"Bulk history preload failed, using per-symbol fetch: {e}")
+            return 0
+    
     def fetch_stock_history(self, symbol: str, start_date=None, end_date=None, period='1mo'):
         """
-        Fetch US stock history using yahooquery
+        Fetch US stock history from the per-run price store
         
         Args:
             symbol: Stock ticker (no suffix needed for US stocks)
@@ -122,16 +196,12 @@ class USStockScanner:
             DataFrame with OHLCV data, or None on error
         """
         try:
-            ticker = Ticker(symbol)
-            
             if start_date and end_date:
-                hist = ticker.history(start=start_date, end=end_date)
+                hist = self.price_store.get_range(symbol, start_date, end_date)
             else:
-                hist = ticker.history(period=period)
+                hist = self.price_store.get_period(symbol, period)
             
             if isinstance(hist, pd.DataFrame) and not hist.empty:
-                # Normalize column names
-                hist.columns = [col.capitalize() for col in hist.columns]
                 return hist
             else:
                 return None
@@ -0,0 +1,114 @@
+"""
+Test Suite for JobQueue
+
+Verifies background execution, progress, cancellation, failure payloads and
+restart recovery of the FinBERT API job queue.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add FinBERT models to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'finbert_v4.4.4' / 'models'))
+
+from job_queue import JobQueue, JobFailed, COMPLETED, CANCELLED, FAILED, INTERRUPTED
+
+
+def _wait(job, timeout=5.0):
+    deadline = time.time() + timeout
+    while job.status not in (COMPLETED, CANCELLED, FAILED) and time.time() < deadline:
+        time.sleep(0.01)
+    return job.status
+
+
+def test_job_runs_in_background_with_progress():
+    """submit() returns immediately; the result is recorded with the job"""
+    release = threading.Event()
+
+    def work(job):
+        job.report(50, 'Halfway')
+        release.wait(5)
+        return {'total_return_pct': 12.5}
+
+    with tempfile.TemporaryDirectory() as jobs_dir:
+        queue = JobQueue(jobs_dir, max_workers=1)
+        job = queue.submit('backtest', work, params={'symbol': 'AAPL'})
+        time.sleep(0.1)
+        assert job.status == 'running'
+        assert job.progress == 50 and job.message == 'Halfway'
+
+        release.set()
+        assert _wait(job) == COMPLETED
+        assert queue.get(job.job_id).to_dict()['result'] == {'total_return_pct': 12.5}
+        queue.shutdown(wait=True)
+
+
+def test_cancel_queued_and_running_jobs():
+    """Queued jobs never start; running jobs stop at their next checkpoint"""
+    started = threading.Event()
+
+    def slow(job):
+        started.set()
+        for i in range(500):
+            job.report(i / 5, 'Working')
+            time.sleep(0.01)
+        return {}
+
+    with tempfile.TemporaryDirectory() as jobs_dir:
+        queue = JobQueue(jobs_dir, max_workers=1)
+        running = queue.submit('optimize', slow)
+        waiting = queue.submit('optimize', slow)
+        started.wait(5)
+
+        assert queue.cancel(waiting.job_id)
+        assert waiting.status == CANCELLED
+        assert queue.cancel(running.job_id)
+        assert _wait(running) == CANCELLED
+        queue.shutdown(wait=True)
+        assert not queue.cancel(running.job_id)
+
+
+def test_failed_job_keeps_payload():
+    """JobFailed fails the job and keeps the structured error payload"""
+    def failing(job):
+        raise JobFailed('No data available', {'error': 'No data available'})
+
+    with tempfile.TemporaryDirectory() as jobs_dir:
+        queue = JobQueue(jobs_dir, max_workers=1)
+        job = queue.submit('backtest', failing)
+        assert _wait(job) == FAILED
+        assert job.error == 'No data available'
+        assert job.result == {'error': 'No data available'}
+        queue.shutdown(wait=True)
+
+
+def test_restart_marks_unfinished_jobs_interrupted():
+    """Persisted jobs reload after a restart; unfinished ones are interrupted"""
+    release = threading.Event()
+
+    with tempfile.TemporaryDirectory() as jobs_dir:
+        queue = JobQueue(jobs_dir, max_workers=1)
+        done = queue.submit('train', lambda job: {'ok': True})
+        _wait(done)
+        stuck = queue.submit('train', lambda job: release.wait(5))
+        time.sleep(0.1)
+
+        restarted = JobQueue(jobs_dir, max_workers=1)
+        assert restarted.get(done.job_id).status == COMPLETED
+        assert restarted.get(stuck.job_id).status == INTERRUPTED
+
+        # Let the worker finish saving the job before the directory is removed
+        release.set()
+        queue.shutdown(wait=True)
+
+
+if __name__ == '__main__':
+    test_job_runs_in_background_with_progress()
+    test_cancel_queued_and_running_jobs()
+    test_failed_job_keeps_payload()
+    test_restart_marks_unfinished_jobs_interrupted()
+    print("[OK] ALL TESTS PASSED")
@@ -0,0 +1,143 @@
+"""
+Test Suite for LSTMModelRegistry
+
+Verifies model discovery, LRU eviction, shared generic predictor and
+hit/miss/eviction accounting with a lightweight stand-in predictor.
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add screening modules to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'pipelines' / 'models' / 'screening'))
+
+from lstm_model_registry import LSTMModelRegistry, GENERIC_KEY
+
+
+class FakePredictor:
+    """Stand-in for StockLSTMPredictor (no TensorFlow needed)"""
+
+    def __init__(self, sequence_length=60, features=None, symbol=None):
+        self.sequence_length = sequence_length
+        self.features = features
+        self.symbol = symbol
+        self.model = None
+        self.model_path = None
+        self.scaler_path = None
+
+    def load_model(self):
+        return False
+
+
+def _make_models_dir(tmp: Path, symbols):
+    models_dir = tmp / 'saved_models'
+    models_dir.mkdir()
+    registry = {'models': {}}
+    for symbol in symbols:
+        (models_dir / f'{symbol}_lstm_model.h5').write_bytes(b'')
+        (models_dir / f'{symbol}_lstm_scaler.pkl').write_bytes(b'')
+        registry['models'][symbol] = {
+            'model_path': f'{symbol}_lstm_model.h5',
+            'scaler_path': f'{symbol}_lstm_scaler.pkl',
+        }
+    (models_dir / 'lstm_models_registry.json').write_text(json.dumps(registry))
+    (tmp / 'lstm_AAA_metadata.json').write_text(json.dumps({'features': ['close'], 'sequence_length': 30}))
+    return models_dir
+
+
+def test_discovery_uses_registry_and_metadata():
+    with tempfile.TemporaryDirectory() as tmp:
+        models_dir = _make_models_dir(Path(tmp), ['AAA', 'BBB'])
+        registry = LSTMModelRegistry(FakePredictor, models_dir)
+
+        predictor = registry.get('AAA')
+        assert predictor.symbol == 'AAA'
+        assert predictor.model_path.endswith('AAA_lstm_model.h5')
+        assert predictor.features == ['close']
+        assert predictor.sequence_length == 30
+
+
+def test_symbols_without_models_share_generic_predictor():
+    with tempfile.TemporaryDirectory() as tmp:
+        models_dir = _make_models_dir(Path(tmp), [])
+        registry = LSTMModelRegistry(FakePredictor, models_dir)
+
+        assert registry.get('XXX') is registry.get('YYY')
+        assert len(registry) == 1
+        assert registry.get_stats()['hits'] == 1
+
+
+def test_lru_eviction_respects_count_budget():
+    with tempfile.TemporaryDirectory() as tmp:
+        models_dir = _make_models_dir(Path(tmp), ['AAA', 'BBB', 'CCC'])
+        registry = LSTMModelRegistry(FakePredictor, models_dir, max_models=2)
+
+        registry.get('AAA')
+        registry.get('BBB')
+        registry.get('AAA')   # AAA is now most recently used
+        registry.get('CCC')   # evicts BBB
+
+        stats = registry.get_stats()
+        assert stats['loaded'] == 2
+        assert stats['evictions'] == 1
+        assert 'AAA' in registry and 'CCC' in registry and 'BBB' not in registry
+
+
+def test_warm_start_loads_most_used():
+    with tempfile.TemporaryDirectory() as tmp:
+        models_dir = _make_models_dir(Path(tmp), ['AAA', 'BBB'])
+        (models_dir / 'lstm_model_usage.json').write_text(json.dumps({'BBB': 5, 'AAA': 1}))
+        registry = LSTMModelRegistry(FakePredictor, models_dir)
+
+        registry.warm_start(1)
+        assert 'BBB' in registry
+        assert GENERIC_KEY in registry._predictors
+        assert 'AAA' not in registry
+
+
+def test_cold_load_does_not_block_other_symbols():
+    """A slow model load does not block cached lookups and is shared by same-key callers"""
+    release = threading.Event()
+    loads = []
+
+    class SlowPredictor(FakePredictor):
+        def load_model(self):
+            loads.append(self.symbol)
+            if self.symbol == 'BBB':
+                release.wait(5)
+            return False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        models_dir = _make_models_dir(Path(tmp), ['AAA', 'BBB'])
+        registry = LSTMModelRegistry(SlowPredictor, models_dir)
+        cached = registry.get('AAA')
+
+        results = []
+        loaders = [threading.Thread(target=lambda: results.append(registry.get('BBB'))) for _ in range(2)]
+        for loader in loaders:
+            loader.start()
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        assert registry.get('AAA') is cached
+        assert time.monotonic() - start < 0.5
+
+        release.set()
+        for loader in loaders:
+            loader.join(5)
+        assert loads.count('BBB') == 1
+        assert results[0] is results[1]
+
+
+if __name__ == '__main__':
+    test_discovery_uses_registry_and_metadata()
+    test_symbols_without_models_share_generic_predictor()
+    test_lru_eviction_respects_count_budget()
+    test_warm_start_loads_most_used()
+    test_cold_load_does_not_block_other_symbols()
+    print("[OK] ALL TESTS PASSED")
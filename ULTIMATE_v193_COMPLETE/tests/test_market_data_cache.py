@@ -0,0 +1,153 @@
+"""
+Test Suite for MarketDataCache
+
+Verifies that dashboard reads never hit upstream directly, that one refresh
+serves every reader, and that per-type TTLs and idle expiry are honoured.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add core modules to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'core'))
+
+from market_data_cache import MarketDataCache, QUOTE, INTRADAY
+
+
+class CountingFetcher:
+    """Fake upstream recording every call"""
+
+    def __init__(self, price=100.0):
+        self.calls = []
+        self.price = price
+
+    def __call__(self, symbols):
+        self.calls.append(list(symbols))
+        return {symbol: self.price for symbol in symbols}
+
+
+def _cache(**kwargs):
+    quotes = CountingFetcher()
+    charts = CountingFetcher(price='bars')
+    cache = MarketDataCache(fetchers={QUOTE: quotes, INTRADAY: charts}, **kwargs)
+    # Drive refreshes by hand instead of the background thread
+    cache._thread = object()
+    return cache, quotes, charts
+
+
+def test_readers_share_one_bulk_refresh():
+    """Many readers of many symbols cost one upstream call per data type"""
+    cache, quotes, _ = _cache()
+    for _ in range(5):  # five viewers
+        for symbol in ('CBA.AX', 'BHP.AX', 'AAPL'):
+            assert cache.get_quote(symbol) is None
+    assert quotes.calls == []
+
+    cache.refresh_due()
+    assert len(quotes.calls) == 1
+    assert sorted(quotes.calls[0]) == ['AAPL', 'BHP.AX', 'CBA.AX']
+    assert cache.get_quote('CBA.AX') == 100.0
+    assert cache.age(QUOTE) is not None
+
+
+def test_ttl_per_data_type():
+    """Entries refresh only after their own TTL expires"""
+    cache, quotes, charts = _cache(ttls={QUOTE: 0.05, INTRADAY: 60})
+    cache.get_quote('CBA.AX')
+    cache.get_intraday('^GSPC')
+    cache.refresh_due()
+    time.sleep(0.1)
+    cache.refresh_due()
+    assert len(quotes.calls) == 2
+    assert len(charts.calls) == 1
+    assert cache.get_intraday('^GSPC') == 'bars'
+
+
+def test_failed_refresh_keeps_stale_value():
+    """Upstream errors leave the last good value in place"""
+    cache, quotes, _ = _cache(ttls={QUOTE: 0})
+    cache.get_quote('CBA.AX')
+    cache.refresh_due()
+
+    def failing(symbols):
+        raise ConnectionError('upstream down')
+
+    cache.fetchers[QUOTE] = failing
+    cache.refresh_due()
+    assert cache.get_quote('CBA.AX') == 100.0
+    assert cache.stats['failures'] == 1
+
+
+def test_idle_symbols_are_dropped():
+    """Symbols nobody asks for any more stop being refreshed"""
+    cache, quotes, _ = _cache(ttls={QUOTE: 0}, idle_expiry=0.05)
+    cache.get_quote('CBA.AX')
+    cache.refresh_due()
+    time.sleep(0.1)
+    cache.refresh_due()
+    assert len(quotes.calls) == 1
+    assert cache.get_stats()['tracked'] == 0
+
+
+def test_version_changes_only_on_refresh():
+    """Views keyed on version() are rebuilt only after a refresh lands"""
+    cache, _, _ = _cache(ttls={INTRADAY: 0})
+    before = cache.version(INTRADAY, ['^GSPC', '^FTSE'])
+    assert before == cache.version(INTRADAY, ['^GSPC', '^FTSE'])
+    cache.refresh_due()
+    after = cache.version(INTRADAY, ['^GSPC', '^FTSE'])
+    assert after != before
+    assert after == cache.version(INTRADAY, ['^GSPC', '^FTSE'])
+
+
+def test_fetch_quote_for_order_entry():
+    """fetch_quote fetches an unseen symbol immediately, then serves it from cache"""
+    cache, quotes, _ = _cache()
+    assert cache.fetch_quote('CBA.AX') == 100.0
+    assert quotes.calls == [['CBA.AX']]
+
+    assert cache.get_quote('CBA.AX') == 100.0
+    assert cache.fetch_quote('CBA.AX') == 100.0
+    assert len(quotes.calls) == 1
+
+
+def test_fetch_quote_never_overlaps_refresher():
+    """Upstream calls from fetch_quote and the refresher are serialized"""
+    state = {'active': 0, 'max_active': 0}
+    state_lock = threading.Lock()
+
+    def slow_quotes(symbols):
+        with state_lock:
+            state['active'] += 1
+            state['max_active'] = max(state['max_active'], state['active'])
+        time.sleep(0.05)
+        with state_lock:
+            state['active'] -= 1
+        return {symbol: 50.0 for symbol in symbols}
+
+    cache = MarketDataCache(fetchers={QUOTE: slow_quotes})
+    cache._thread = object()
+    cache.get_quote('BHP.AX')
+
+    refresher = threading.Thread(target=cache.refresh_due)
+    refresher.start()
+    time.sleep(0.01)
+    assert cache.fetch_quote('CBA.AX') == 50.0
+    refresher.join()
+
+    assert state['max_active'] == 1
+    assert cache.get_stats()['upstream_calls'] == 2
+
+
+if __name__ == '__main__':
+    test_readers_share_one_bulk_refresh()
+    test_ttl_per_data_type()
+    test_failed_refresh_keeps_stale_value()
+    test_idle_symbols_are_dropped()
+    test_version_changes_only_on_refresh()
+    test_fetch_quote_for_order_entry()
+    test_fetch_quote_never_overlaps_refresher()
+    print("[OK] ALL TESTS PASSED")
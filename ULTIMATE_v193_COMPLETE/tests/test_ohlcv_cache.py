@@ -0,0 +1,105 @@
+"""
+Test Suite for OHLCVCache
+
+Verifies exchange-local bar dates for tz-aware frames (directly and through
+the pipelines' bulk preload) and that cache instances sharing one directory
+(separate processes) keep each other's index entries.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# Add backtesting models to path (the cache is loadable by file path)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'finbert_v4.4.4' / 'models' / 'backtesting'))
+sys.path.insert(0, str(project_root / 'pipelines' / 'models' / 'screening'))
+
+from ohlcv_cache import OHLCVCache, canonicalize_ohlcv
+from bulk_history_loader import BulkHistoryLoader
+from price_history_store import PriceHistoryStore
+
+
+def make_bars(index):
+    return pd.DataFrame({
+        'Open': range(len(index)),
+        'High': range(len(index)),
+        'Low': range(len(index)),
+        'Close': range(len(index)),
+        'Volume': range(len(index)),
+    }, index=index)
+
+
+def test_tz_aware_bars_keep_exchange_local_date():
+    """ASX bars stamped at local midnight (previous day in UTC) stay on their session"""
+    sydney = pd.DatetimeIndex(['2024-03-04 00:00', '2024-03-05 00:00'], tz='Australia/Sydney')
+    plain = pd.DatetimeIndex(['2024-03-04', '2024-03-05'])
+
+    from_yfinance = canonicalize_ohlcv(make_bars(sydney))
+    from_yahooquery = canonicalize_ohlcv(make_bars(plain))
+
+    assert list(from_yfinance.index) == list(plain)
+    assert from_yfinance.index.tz is None
+    assert from_yfinance.index.equals(from_yahooquery.index)
+
+
+class FakeTicker:
+    """yahooquery Ticker stand-in returning a fixed history result"""
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def history(self, **kwargs):
+        return self.raw
+
+
+def test_bulk_preload_keeps_asx_live_bar_on_its_session():
+    """A tz-aware ASX live bar must not overwrite the previous session in the disk cache"""
+    previous = (pd.Timestamp.now() - pd.Timedelta(days=10)).normalize()
+    session = previous + pd.Timedelta(days=1)
+    live_bar = pd.Timestamp(f"{session.date()} 10:00", tz='Australia/Sydney')
+
+    # yahooquery: daily bars as datetime.date, today's live bar as a tz-aware datetime
+    raw = pd.DataFrame(
+        {'open': [100.0, 105.0], 'high': [100.0, 105.0], 'low': [100.0, 105.0],
+         'close': [100.0, 105.0], 'volume': [1000, 500]},
+        index=pd.MultiIndex.from_tuples(
+            [('CBA.AX', previous.date()), ('CBA.AX', live_bar)], names=['symbol', 'date']
+        )
+    )
+    loader = BulkHistoryLoader(retry_attempts=1, ticker_factory=lambda symbols: FakeTicker(raw))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        disk_cache = OHLCVCache(cache_dir=cache_dir)
+        store = PriceHistoryStore(fetch_fn=lambda *args, **kwargs: None, disk_cache=disk_cache)
+        assert store.preload(['CBA.AX'], loader) == 1
+
+        closes = disk_cache.read('CBA.AX')['Close']
+        assert closes[previous] == 100.0
+        assert closes[session] == 105.0
+
+
+def test_index_entries_survive_other_instances():
+    """Two caches on one directory (e.g. pipeline and trainer) merge their index writes"""
+    bars = make_bars(pd.date_range('2024-01-01', periods=3))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        pipeline = OHLCVCache(cache_dir=cache_dir)
+        trainer = OHLCVCache(cache_dir=cache_dir)
+
+        pipeline.merge('CBA.AX', bars)
+        trainer.merge('BHP.AX', bars)
+
+        assert set(OHLCVCache(cache_dir=cache_dir)._load_index()) == {'CBA.AX', 'BHP.AX'}
+
+        pipeline.invalidate('BHP.AX')
+        assert set(OHLCVCache(cache_dir=cache_dir)._load_index()) == {'CBA.AX'}
+        assert not list(Path(cache_dir).glob('*.tmp'))
+
+
+if __name__ == '__main__':
+    test_tz_aware_bars_keep_exchange_local_date()
+    test_bulk_preload_keeps_asx_live_bar_on_its_session()
+    test_index_entries_survive_other_instances()
+    print("[OK] ALL TESTS PASSED")
@@ -0,0 +1,108 @@
+"""
+Test Suite for PoliteHttpFetcher
+
+Verifies per-host politeness with cross-host concurrency, the fresh-cache
+shortcut, conditional GET revalidation and 429 retry handling.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add screening models to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'pipelines' / 'models' / 'screening'))
+
+from polite_http_fetcher import PoliteHttpFetcher
+
+
+class FakeResponse:
+    def __init__(self, status_code, text='', headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+class FakeSession:
+    """Records requests; responds from a per-URL queue (last response repeats)"""
+
+    def __init__(self, responses, latency=0.0):
+        self.responses = responses
+        self.latency = latency
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=None):
+        with self._lock:
+            self.calls.append((url, dict(headers or {}), time.monotonic()))
+            queue = self.responses[url]
+            response = queue.pop(0) if len(queue) > 1 else queue[0]
+        time.sleep(self.latency)
+        return response
+
+
+def test_per_host_politeness_with_parallel_hosts():
+    """Same-host requests are spaced by host_delay; other hosts run in parallel"""
+    urls = ['https://a.example/1', 'https://a.example/2', 'https://b.example/1', 'https://c.example/1']
+    session = FakeSession({url: [FakeResponse(200, url)] for url in urls}, latency=0.05)
+    fetcher = PoliteHttpFetcher(host_delay=0.3, max_workers=4, session_factory=lambda: session)
+
+    start = time.monotonic()
+    pages = fetcher.fetch_many({url: (url, url) for url in urls})
+    elapsed = time.monotonic() - start
+
+    assert all(pages[url].text == url for url in urls)
+    a_times = sorted(t for url, _, t in session.calls if 'a.example' in url)
+    assert a_times[1] - a_times[0] >= 0.29
+    # Serial fetching with a global delay would take >= 4 * 0.3s
+    assert elapsed < 0.9, elapsed
+
+
+def test_fresh_cache_and_conditional_get():
+    """Fresh pages skip the network; stale pages revalidate and reuse the body on 304"""
+    url = 'https://fed.example/releases'
+    session = FakeSession({url: [
+        FakeResponse(200, 'v1', {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+        FakeResponse(304),
+    ]})
+    with tempfile.TemporaryDirectory() as cache_dir:
+        fetcher = PoliteHttpFetcher(host_delay=0, fresh_ttl=60, cache_dir=Path(cache_dir),
+                                    session_factory=lambda: session)
+        assert fetcher.get(url).text == 'v1'
+        assert fetcher.get(url).from_cache
+        assert len(session.calls) == 1
+
+        # Another pipeline process with revalidation forced (stale cache)
+        other = PoliteHttpFetcher(host_delay=0, fresh_ttl=0, cache_dir=Path(cache_dir),
+                                  session_factory=lambda: session)
+        page = other.get(url)
+        assert page.text == 'v1' and page.from_cache
+        sent = session.calls[-1][1]
+        assert sent['If-None-Match'] == '"abc"'
+        assert sent['If-Modified-Since'].startswith('Mon, 01 Jan 2024')
+        assert other.get_stats()['not_modified'] == 1
+
+
+def test_retry_after_rate_limit_and_client_error():
+    """429 is retried with backoff; 404 fails without retrying"""
+    ok_url = 'https://rba.example/media'
+    missing_url = 'https://rba.example/missing'
+    session = FakeSession({
+        ok_url: [FakeResponse(429), FakeResponse(200, 'ok')],
+        missing_url: [FakeResponse(404)],
+    })
+    fetcher = PoliteHttpFetcher(host_delay=0.01, max_retries=2, session_factory=lambda: session)
+
+    assert fetcher.get(ok_url).text == 'ok'
+    assert fetcher.get(missing_url) is None
+    assert [url for url, _, _ in session.calls] == [ok_url, ok_url, missing_url]
+    assert fetcher.get('') is None
+
+
+if __name__ == '__main__':
+    test_per_host_politeness_with_parallel_hosts()
+    test_fresh_cache_and_conditional_get()
+    test_retry_after_rate_limit_and_client_error()
+    print("[OK] ALL TESTS PASSED")
@@ -0,0 +1,114 @@
+"""
+Test Suite for PredictionDatabase
+
+Verifies bulk prediction ingest, snapshot outcome validation and the
+SQL-aggregated accuracy statistics.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add FinBERT trading models to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'finbert_v4.4.4' / 'models' / 'trading'))
+
+from prediction_database import PredictionDatabase
+
+TODAY = datetime.now().strftime('%Y-%m-%d')
+YESTERDAY = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+
+
+def _prediction(symbol, predicted_price, prediction='BUY', day=YESTERDAY, target=TODAY,
+                timeframe='DAILY_EOD', confidence=70.0):
+    return {
+        'symbol': symbol,
+        'prediction_date': f'{day}T09:00:00',
+        'target_date': f'{target}T16:00:00-04:00',
+        'timeframe': timeframe,
+        'current_price': 100.0,
+        'predicted_price': predicted_price,
+        'predicted_change_percent': predicted_price - 100.0,
+        'prediction': prediction,
+        'confidence': confidence,
+    }
+
+
+def test_store_predictions_bulk_and_duplicates():
+    """Bulk ingest returns IDs in order, reusing IDs of existing rows"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = PredictionDatabase(os.path.join(tmp_dir, 'trading.db'))
+        first = db.store_predictions([_prediction('aapl', 101.0), _prediction('MSFT', 99.0)])
+        assert len(first) == 2 and first[0] != first[1]
+
+        again = db.store_predictions([_prediction('MSFT', 50.0), _prediction('NVDA', 100.0)])
+        assert again[0] == first[1]
+        assert len(db.get_active_predictions()) == 3
+        assert db.store_predictions([]) == []
+
+
+def test_resolve_pending_predictions_snapshot():
+    """One snapshot resolves every due prediction; others stay active"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = PredictionDatabase(os.path.join(tmp_dir, 'trading.db'))
+        future = (datetime.now() + timedelta(days=3)).strftime('%Y-%m-%d')
+        db.store_predictions([
+            _prediction('AAPL', 101.0),
+            _prediction('MSFT', 110.0, prediction='SELL'),
+            _prediction('AAPL', 105.0, day=TODAY, target=future),
+        ])
+
+        validated = db.resolve_pending_predictions({'AAPL': 102.0, 'MSFT': 100.0, 'NVDA': 5.0})
+        assert validated == 2
+
+        active = db.get_active_predictions()
+        assert len(active) == 1 and active[0]['target_date'].startswith(future)
+
+        aapl = db.get_prediction_history('AAPL', days=5)
+        done = [p for p in aapl if p['status'] == 'COMPLETED'][0]
+        assert done['actual_price'] == 102.0
+        assert abs(done['actual_change_percent'] - 2.0) < 1e-9
+        assert done['prediction_correct'] == 1
+        msft = db.get_prediction_history('MSFT', days=5)[0]
+        assert msft['prediction_correct'] == 0
+
+
+def test_accuracy_stats_aggregated_in_sql():
+    """Live stats and the stored stats table agree for every symbol/timeframe"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'trading.db')
+        db = PredictionDatabase(db_path)
+        db.store_predictions([
+            _prediction('AAPL', 101.0),
+            _prediction('AAPL', 120.0, prediction='SELL', timeframe='WEEKLY'),
+            _prediction('MSFT', 100.5, prediction='HOLD'),
+        ])
+        db.resolve_pending_predictions({'AAPL': 101.5, 'MSFT': 100.0})
+
+        stats = db.calculate_accuracy_stats('AAPL', days=30)
+        assert stats['total_predictions'] == 2
+        assert stats['correct_predictions'] == 1
+        assert stats['buy_accuracy'] == 100 and stats['sell_accuracy'] == 0
+        assert db.calculate_accuracy_stats('NONE')['total_predictions'] == 0
+
+        assert db.refresh_accuracy_stats(period_days=30) == 3
+        assert db.update_accuracy_stats('MSFT', timeframe='DAILY_EOD') is True
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute('''
+            SELECT symbol, timeframe, total_predictions, correct_predictions, hold_correct
+            FROM prediction_accuracy_stats ORDER BY symbol, timeframe
+        ''').fetchall()
+        conn.close()
+        assert rows == [('AAPL', 'DAILY_EOD', 1, 1, 0), ('AAPL', 'WEEKLY', 1, 0, 0),
+                        ('MSFT', 'DAILY_EOD', 1, 1, 1)]
+
+
+if __name__ == '__main__':
+    test_store_predictions_bulk_and_duplicates()
+    test_resolve_pending_predictions_snapshot()
+    test_accuracy_stats_aggregated_in_sql()
+    print("[OK] ALL TESTS PASSED")
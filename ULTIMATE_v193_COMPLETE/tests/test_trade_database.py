@@ -0,0 +1,127 @@
+"""
+Test Suite for TradingDatabase
+
+Verifies the shared WAL connection, indexes, batched position/trade writes
+and transaction rollback of the paper trading database.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add FinBERT trading models to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'finbert_v4.4.4' / 'models' / 'trading'))
+
+from trade_database import TradingDatabase
+
+
+def _db(tmp_dir):
+    return TradingDatabase(os.path.join(tmp_dir, 'trading.db'))
+
+
+def test_wal_and_indexes():
+    """The shared connection runs in WAL mode with symbol/status indexes"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = _db(tmp_dir)
+        with db.transaction() as conn:
+            mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+            indexes = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert mode.lower() == 'wal'
+        for name in ('idx_trades_symbol_status', 'idx_trades_status',
+                     'idx_orders_symbol_status', 'idx_orders_status'):
+            assert name in indexes, name
+        db.close()
+
+
+def test_update_position_prices_many():
+    """One call prices every position and computes P&L in SQL"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = _db(tmp_dir)
+        db.upsert_position('AAPL', 10, 100.0)
+        db.upsert_position('MSFT', 5, 200.0)
+
+        updated = db.update_position_prices_many({'AAPL': 110.0, 'MSFT': 190.0, 'NONE': 1.0})
+        assert updated == 2
+
+        aapl = db.get_position('AAPL')
+        assert aapl['market_value'] == 1100.0
+        assert aapl['unrealized_pnl'] == 100.0
+        assert abs(aapl['unrealized_pnl_percent'] - 10.0) < 1e-9
+        assert db.get_position('MSFT')['unrealized_pnl'] == -50.0
+        assert db.get_position('NONE') is None
+        db.close()
+
+
+def test_create_trades_many_and_filters():
+    """Batched trades are returned in order and filtered by symbol/status"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = _db(tmp_dir)
+        ids = db.create_trades_many([
+            {'symbol': 'AAPL', 'side': 'BUY', 'quantity': 10, 'entry_price': 100.0},
+            {'symbol': 'MSFT', 'side': 'BUY', 'quantity': 5, 'entry_price': 200.0, 'strategy': 'test'},
+        ])
+        assert len(ids) == 2 and ids[0] < ids[1]
+
+        pnl, _ = db.close_trade(ids[0], 110.0)
+        assert pnl == 100.0
+        assert [t['symbol'] for t in db.get_trades(status='OPEN')] == ['MSFT']
+        assert db.get_trades(status='CLOSED', symbol='AAPL')[0]['trade_id'] == ids[0]
+        assert db.get_trade_statistics()['total_trades'] == 1
+        db.close()
+
+
+def test_nested_transaction_rolls_back():
+    """A failure inside an outer transaction undoes every nested write"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = _db(tmp_dir)
+        try:
+            with db.transaction():
+                db.create_trade('AAPL', 'BUY', 10, 100.0)
+                db.upsert_position('AAPL', 10, 100.0)
+                db.update_account(cash_balance=9000)
+                raise RuntimeError('fill failed')
+        except RuntimeError:
+            pass
+
+        assert db.get_trades() == []
+        assert db.get_positions() == []
+        assert db.get_account()['cash_balance'] == 10000
+        db.close()
+
+
+def test_concurrent_writers_share_connection():
+    """Threads can use the one connection concurrently"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = _db(tmp_dir)
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(20):
+                    db.create_order(f'SYM{n}', 'MARKET', 'BUY', i + 1)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert len(db.get_orders(status='PENDING')) == 80
+        assert len(db.get_orders(symbol='SYM0')) == 20
+        db.close()
+
+
+if __name__ == '__main__':
+    test_wal_and_indexes()
+    test_update_position_prices_many()
+    test_create_trades_many_and_filters()
+    test_nested_transaction_rolls_back()
+    test_concurrent_writers_share_connection()
+    print("[OK] ALL TESTS PASSED")